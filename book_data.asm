@@ -1,23 +1,23 @@
 // Auto-generated Opening Book Data
-// Source: Polyglot GM2600 opening book
+// Source: Polyglot tools/books/gm2600.bin
 // Generated by tools/generate_book.py
-// Positions: 4200 | Table: 1024 slots
+// Positions: 4078 | Table: 1024 slots
 // DO NOT EDIT - regenerate from source
 
 #importonce
 
-// Place book after code ($5B00) extending into banked BASIC area if needed
-// $5B00-$9FFF = ~18KB, $A000-$BFFF = 8KB = 26KB total available
+// Place book after code ($5B00) extending into banked BASIC area if needed,
+// up to the piece-square tables at $A4A8 (18856 bytes)
 *=$5B00 "Generated Opening Book"
 
 .const GEN_BOOK_MAGIC = $B00C
-.const GEN_BOOK_VERSION = $01
-.const GEN_BOOK_CHAIN_END = $FF
+.const GEN_BOOK_VERSION = $03
+.const GEN_BOOK_CHAIN_END = $00
 
 GeneratedBook:
   .word GEN_BOOK_MAGIC
   .byte GEN_BOOK_VERSION
-  .word 4200
+  .word 4078
   .word 1024
   .byte $00
 
@@ -28,5227 +28,5106 @@ GeneratedBookHashTable:
   .word $0006
   .word $000c
   .word $ffff
-  .word $0012
-  .word $0015
-  .word $001d
-  .word $0021
-  .word $0024
-  .word $0027
-  .word $0028
-  .word $002f
+  .word $0010
+  .word $0013
+  .word $001b
+  .word $001f
+  .word $0022
+  .word $0025
+  .word $0026
+  .word $002d
+  .word $0035
   .word $0037
-  .word $0039
-  .word $003c
-  .word $003f
-  .word $0042
+  .word $003a
+  .word $003d
+  .word $0040
+  .word $0051
   .word $0053
-  .word $0055
-  .word $005b
-  .word $005c
-  .word $0062
+  .word $0059
+  .word $005a
+  .word $0060
   .word $ffff
-  .word $0063
-  .word $0066
-  .word $006a
+  .word $0061
+  .word $0064
+  .word $0068
   .word $ffff
+  .word $006d
   .word $006f
-  .word $0071
   .word $ffff
-  .word $0074
+  .word $0072
+  .word $0076
   .word $0078
-  .word $007a
-  .word $007b
-  .word $0080
-  .word $0088
+  .word $0079
+  .word $007e
+  .word $0086
   .word $ffff
-  .word $008e
-  .word $0092
-  .word $0093
-  .word $009e
-  .word $00a4
-  .word $00a5
-  .word $00a8
-  .word $00ad
+  .word $008c
+  .word $0090
+  .word $0091
+  .word $009c
+  .word $00a2
+  .word $00a3
+  .word $00a6
+  .word $00ab
+  .word $00af
+  .word $00b0
   .word $00b1
-  .word $00b2
-  .word $00b3
-  .word $00b6
-  .word $00ba
-  .word $00c0
+  .word $00b4
+  .word $00b8
+  .word $00be
+  .word $00c5
   .word $00c7
-  .word $00c9
-  .word $00ce
-  .word $00d6
-  .word $00d9
-  .word $00dd
-  .word $00e9
-  .word $00ee
-  .word $00f1
-  .word $00f3
+  .word $00cc
+  .word $ffff
+  .word $00d4
+  .word $00d8
+  .word $00e2
+  .word $00e7
+  .word $00ea
+  .word $00ec
+  .word $00f2
   .word $00f9
-  .word $0100
-  .word $0106
-  .word $010e
-  .word $0112
-  .word $0115
+  .word $00ff
+  .word $0107
+  .word $ffff
+  .word $010b
   .word $ffff
+  .word $0114
+  .word $0117
   .word $011e
-  .word $0121
-  .word $0128
+  .word $0120
   .word $012a
-  .word $0134
-  .word $0139
-  .word $013f
+  .word $012f
+  .word $0135
   .word $ffff
-  .word $0141
-  .word $014a
-  .word $014e
-  .word $0152
-  .word $0156
+  .word $0137
+  .word $0140
+  .word $0144
+  .word $0148
+  .word $014c
+  .word $ffff
+  .word $014d
   .word $ffff
-  .word $0157
-  .word $015d
   .word $ffff
+  .word $0153
+  .word $0155
+  .word $0156
+  .word $015a
   .word $015f
-  .word $0161
-  .word $0162
   .word $0166
-  .word $016b
+  .word $0169
+  .word $016d
   .word $0172
-  .word $0175
-  .word $0179
+  .word $0173
+  .word $017d
   .word $017e
-  .word $017f
-  .word $0189
-  .word $018a
+  .word $0182
+  .word $018c
   .word $018e
-  .word $0198
-  .word $019a
+  .word $0193
+  .word $0197
+  .word $0199
+  .word $ffff
+  .word $019b
   .word $019f
+  .word $01a2
   .word $01a3
-  .word $01a5
-  .word $ffff
-  .word $01a7
-  .word $01ab
+  .word $01a8
   .word $01ae
-  .word $01af
-  .word $01b4
-  .word $01ba
-  .word $01be
+  .word $01b2
+  .word $01b7
+  .word $01b8
   .word $01c3
-  .word $01c4
+  .word $01c7
+  .word $01c9
+  .word $01cc
   .word $01cf
-  .word $01d3
-  .word $01d6
+  .word $01d2
+  .word $01d4
   .word $01d9
-  .word $01dc
   .word $01df
   .word $01e1
-  .word $01e6
+  .word $01e7
+  .word $01ea
   .word $01ec
-  .word $01ee
-  .word $01f4
+  .word $01ed
+  .word $01f1
   .word $01f7
-  .word $01f9
-  .word $01fa
+  .word $01fc
   .word $01fe
-  .word $0204
-  .word $0209
+  .word $0202
   .word $020b
-  .word $020f
-  .word $0218
-  .word $021d
-  .word $0222
-  .word $0229
+  .word $0210
+  .word $0215
+  .word $021c
+  .word $0220
+  .word $0226
+  .word $0227
   .word $022d
-  .word $0233
+  .word $0231
+  .word $ffff
   .word $0234
-  .word $023a
+  .word $0237
   .word $023e
-  .word $ffff
-  .word $0241
-  .word $0244
-  .word $024b
-  .word $024f
-  .word $0254
-  .word $0255
-  .word $025e
-  .word $0262
-  .word $0263
-  .word $0269
+  .word $0242
+  .word $0247
+  .word $0248
+  .word $024e
+  .word $0252
+  .word $0253
+  .word $0259
+  .word $025d
+  .word $025f
+  .word $0264
+  .word $0268
+  .word $026c
   .word $026d
-  .word $026f
-  .word $0276
-  .word $027a
-  .word $027e
-  .word $027f
   .word $ffff
-  .word $0283
-  .word $028b
-  .word $0295
-  .word $029d
-  .word $02a1
-  .word $02a5
-  .word $02ad
-  .word $02b1
-  .word $02bb
-  .word $02c2
-  .word $02c5
+  .word $026f
+  .word $0277
+  .word $0281
+  .word $0289
+  .word $028d
+  .word $028f
+  .word $0297
+  .word $029a
+  .word $02a4
+  .word $02ab
+  .word $02ae
+  .word $02b4
+  .word $02b7
+  .word $02bc
+  .word $02bd
+  .word $02be
+  .word $02c6
+  .word $02c8
   .word $02cb
-  .word $02ce
+  .word $ffff
   .word $02d3
-  .word $02d4
-  .word $02d5
-  .word $02dd
-  .word $02df
+  .word $02d6
+  .word $02d9
+  .word $02da
+  .word $02dc
   .word $02e2
   .word $ffff
-  .word $02ea
-  .word $02ed
-  .word $02f0
-  .word $02f1
-  .word $02f3
-  .word $02f9
+  .word $02e5
+  .word $02eb
   .word $ffff
+  .word $02f0
+  .word $02f7
+  .word $02f8
   .word $02fc
+  .word $02fe
   .word $0302
-  .word $ffff
-  .word $0307
-  .word $030e
+  .word $0305
+  .word $0309
+  .word $030b
   .word $030f
-  .word $0313
-  .word $0315
+  .word $ffff
   .word $0319
-  .word $031c
-  .word $0320
+  .word $031a
   .word $0322
-  .word $0326
-  .word $ffff
-  .word $0330
+  .word $0328
+  .word $032e
   .word $0331
-  .word $0339
-  .word $033f
+  .word $0332
+  .word $0335
+  .word $033e
   .word $0345
   .word $0348
-  .word $0349
-  .word $034c
+  .word $034d
+  .word $0351
   .word $0358
-  .word $035f
-  .word $0362
-  .word $0367
+  .word $0363
   .word $036b
+  .word $0371
   .word $0372
-  .word $037d
+  .word $0374
+  .word $0379
+  .word $037c
+  .word $0380
+  .word $0382
+  .word $0384
   .word $0385
+  .word $0386
   .word $038b
-  .word $038c
   .word $038e
-  .word $0393
+  .word $0394
   .word $0396
-  .word $039d
-  .word $039f
-  .word $03a1
-  .word $03a4
-  .word $03a5
-  .word $03aa
+  .word $039a
+  .word $03a0
+  .word $03a7
   .word $03ad
-  .word $03b3
-  .word $03b5
+  .word $03b1
+  .word $03b8
   .word $03bc
-  .word $03c2
+  .word $03c4
   .word $03c9
-  .word $03cf
-  .word $03d3
+  .word $03d0
+  .word $ffff
+  .word $03d7
   .word $03da
-  .word $03de
+  .word $03df
   .word $03e6
+  .word $03ea
   .word $03eb
-  .word $03f2
-  .word $ffff
-  .word $03f9
-  .word $03fc
-  .word $0401
-  .word $0408
-  .word $040c
+  .word $03ee
+  .word $03f4
+  .word $03f8
+  .word $03fd
+  .word $0407
+  .word $040a
   .word $040d
-  .word $0410
-  .word $0416
-  .word $041a
-  .word $041f
-  .word $0429
-  .word $042c
-  .word $042f
-  .word $0435
-  .word $0439
-  .word $043d
-  .word $0440
-  .word $0446
-  .word $044d
-  .word $0455
-  .word $0459
-  .word $0460
+  .word $0413
+  .word $0417
   .word $ffff
-  .word $0463
-  .word $0467
-  .word $0468
+  .word $041b
+  .word $0421
+  .word $0428
+  .word $0430
+  .word $0434
+  .word $043b
   .word $ffff
+  .word $043e
+  .word $0442
+  .word $0443
+  .word $ffff
+  .word $0444
+  .word $044a
+  .word $044e
+  .word $0453
+  .word $0456
+  .word $045b
+  .word $0465
   .word $0469
-  .word $046f
+  .word $0472
   .word $0473
-  .word $0478
-  .word $047b
-  .word $0480
-  .word $048a
-  .word $048e
-  .word $0497
-  .word $0498
+  .word $0479
+  .word $047c
+  .word $0484
+  .word $048b
+  .word $048c
+  .word $ffff
+  .word $0495
+  .word $0496
   .word $049e
-  .word $04a1
-  .word $04a9
+  .word $04a2
+  .word $04a5
+  .word $04a8
+  .word $04aa
+  .word $04ad
   .word $04b0
-  .word $04b1
-  .word $ffff
+  .word $04b6
   .word $04ba
-  .word $04bb
+  .word $04c0
   .word $04c3
-  .word $04c7
-  .word $04ca
+  .word $04cb
   .word $04cd
-  .word $04cf
-  .word $04d2
-  .word $04d5
+  .word $ffff
+  .word $ffff
+  .word $04ce
+  .word $04d0
+  .word $04d3
   .word $04db
+  .word $04dd
   .word $04df
-  .word $04e5
+  .word $04e1
   .word $04e8
-  .word $04f0
-  .word $04f2
+  .word $04ef
+  .word $04f8
   .word $ffff
+  .word $04fb
+  .word $04ff
   .word $ffff
-  .word $04f3
-  .word $04f5
-  .word $04f8
-  .word $0500
-  .word $0502
+  .word $0501
   .word $0504
-  .word $0506
-  .word $050d
-  .word $0514
-  .word $051d
-  .word $ffff
+  .word $050e
+  .word $0515
+  .word $0519
+  .word $051c
   .word $0520
-  .word $0524
+  .word $0523
+  .word $052d
+  .word $0531
+  .word $0535
+  .word $0536
+  .word $0538
+  .word $053d
   .word $ffff
-  .word $0526
-  .word $0529
-  .word $0533
-  .word $053a
   .word $053e
-  .word $0541
   .word $0545
-  .word $0548
-  .word $0552
-  .word $0556
-  .word $055a
-  .word $055b
-  .word $055d
-  .word $0564
+  .word $054b
+  .word $0550
+  .word $0558
+  .word $0562
+  .word $0568
+  .word $0569
+  .word $0570
+  .word $0572
+  .word $057a
+  .word $057f
+  .word $0582
+  .word $0586
   .word $ffff
-  .word $0565
-  .word $056e
-  .word $0574
-  .word $0579
-  .word $0581
-  .word $058b
-  .word $0591
-  .word $0592
-  .word $0599
-  .word $059b
-  .word $05a3
+  .word $0587
+  .word $058e
+  .word $0594
+  .word $059a
+  .word $059c
+  .word $05a4
   .word $05a8
-  .word $05ab
-  .word $05af
+  .word $05ad
   .word $ffff
-  .word $05b0
-  .word $05b7
-  .word $05bd
-  .word $05c3
-  .word $05c5
-  .word $05cd
+  .word $05b1
+  .word $05b5
+  .word $05be
+  .word $05c2
+  .word $05c7
+  .word $05cb
+  .word $05ce
   .word $05d1
-  .word $05d6
+  .word $05d5
   .word $ffff
-  .word $05da
   .word $05de
-  .word $05e7
-  .word $05eb
+  .word $05e5
+  .word $05ea
+  .word $05ec
+  .word $05ed
   .word $05f0
-  .word $05f4
   .word $05f7
-  .word $05fa
+  .word $05fc
   .word $05fe
-  .word $ffff
-  .word $0607
+  .word $0604
+  .word $060a
   .word $060e
-  .word $0613
-  .word $0618
+  .word $0615
+  .word $0616
   .word $0619
-  .word $061c
+  .word $061a
+  .word $061e
+  .word $0620
   .word $0623
-  .word $062a
-  .word $062c
+  .word $0626
+  .word $062e
   .word $0632
-  .word $0638
-  .word $063c
-  .word $0643
-  .word $0644
-  .word $0647
+  .word $ffff
+  .word $0639
+  .word $0640
+  .word $0642
   .word $0648
-  .word $064c
+  .word $0649
   .word $064e
-  .word $0651
-  .word $0654
-  .word $065c
-  .word $0660
+  .word $0655
+  .word $0659
   .word $ffff
+  .word $065e
+  .word $0660
+  .word $0661
+  .word $0663
   .word $0667
-  .word $066e
-  .word $0670
-  .word $0676
-  .word $0677
-  .word $067c
-  .word $0683
-  .word $0687
+  .word $066c
+  .word $066f
+  .word $0671
+  .word $0672
+  .word $0678
   .word $ffff
-  .word $068c
-  .word $068e
-  .word $068f
-  .word $0691
-  .word $0695
-  .word $069a
+  .word $ffff
+  .word $067b
+  .word $0684
+  .word $0685
+  .word $068b
+  .word $0690
+  .word $0692
+  .word $0693
+  .word $0694
+  .word $069b
   .word $069d
-  .word $069f
   .word $06a0
-  .word $06a6
-  .word $ffff
-  .word $ffff
-  .word $06a9
-  .word $06b2
-  .word $06b3
+  .word $06a4
+  .word $06aa
+  .word $06af
+  .word $06b4
   .word $06b9
-  .word $06be
-  .word $06c0
-  .word $06c1
-  .word $06c2
+  .word $06bf
   .word $06c9
-  .word $06ce
-  .word $06d1
-  .word $06d5
-  .word $06db
-  .word $06e0
-  .word $06e5
-  .word $06ea
-  .word $06f0
-  .word $06fa
   .word $ffff
-  .word $0700
+  .word $06cf
   .word $ffff
-  .word $0706
+  .word $06d1
   .word $ffff
-  .word $070b
-  .word $070c
-  .word $070e
-  .word $0715
+  .word $06d6
+  .word $06d7
+  .word $06d9
+  .word $06de
   .word $ffff
-  .word $0719
-  .word $071a
-  .word $071e
-  .word $0726
-  .word $0729
-  .word $072e
-  .word $0730
+  .word $06e2
+  .word $06e3
+  .word $06e7
+  .word $06ef
+  .word $06f2
+  .word $06f7
+  .word $06f9
   .word $ffff
-  .word $0733
+  .word $06fc
   .word $ffff
-  .word $0739
-  .word $0740
-  .word $0744
-  .word $0747
-  .word $074b
+  .word $0700
+  .word $0705
+  .word $0709
+  .word $070c
+  .word $0710
   .word $ffff
   .word $ffff
-  .word $074c
+  .word $0711
   .word $ffff
-  .word $074e
-  .word $0753
-  .word $0758
-  .word $075d
-  .word $075e
+  .word $0713
+  .word $0718
+  .word $071d
+  .word $0722
+  .word $0723
   .word $ffff
-  .word $0762
+  .word $0727
   .word $ffff
-  .word $0767
+  .word $072c
+  .word $072d
+  .word $0734
+  .word $0737
+  .word $0739
+  .word $073b
+  .word $073d
+  .word $0747
+  .word $0748
+  .word $075a
+  .word $0761
   .word $0768
-  .word $076f
-  .word $0772
-  .word $0774
-  .word $0776
+  .word $ffff
+  .word $0770
   .word $0778
-  .word $0782
+  .word $0781
   .word $0783
-  .word $0795
-  .word $079c
-  .word $07a3
-  .word $ffff
-  .word $07ab
-  .word $07b3
-  .word $07bc
-  .word $07be
-  .word $07c4
-  .word $07ca
-  .word $07d5
+  .word $0789
+  .word $078f
+  .word $079a
+  .word $07a5
+  .word $07ae
+  .word $07b0
+  .word $07b5
+  .word $07ba
+  .word $07bb
+  .word $07bf
+  .word $07c3
+  .word $07c7
+  .word $07cb
+  .word $07cf
+  .word $07d3
+  .word $07d4
+  .word $07d8
+  .word $07db
   .word $07e0
+  .word $07e2
+  .word $07e5
+  .word $07e6
   .word $07e9
-  .word $07eb
   .word $07f0
+  .word $ffff
+  .word $07f2
   .word $07f5
-  .word $07f6
   .word $07fa
-  .word $07fe
-  .word $0802
-  .word $0806
-  .word $080a
-  .word $080e
-  .word $080f
-  .word $0813
-  .word $0818
+  .word $0800
+  .word $0808
+  .word $080c
+  .word $080d
+  .word $0812
+  .word $0815
+  .word $ffff
+  .word $0819
+  .word $081e
   .word $0820
+  .word $0821
   .word $0822
-  .word $0825
-  .word $0826
-  .word $0829
-  .word $0830
-  .word $ffff
-  .word $0832
-  .word $0835
+  .word $0827
+  .word $082e
+  .word $082f
+  .word $0836
   .word $083a
-  .word $0840
-  .word $0848
-  .word $084c
-  .word $084d
+  .word $083e
+  .word $0842
+  .word $0843
+  .word $0845
+  .word $ffff
+  .word $0849
+  .word $084a
+  .word $ffff
   .word $0852
   .word $0855
-  .word $ffff
+  .word $0856
   .word $0859
-  .word $085e
-  .word $0860
-  .word $0861
   .word $0862
-  .word $0867
-  .word $086e
-  .word $086f
+  .word $0868
+  .word $086b
+  .word $0870
+  .word $0873
+  .word $0874
   .word $0876
   .word $087a
-  .word $087e
-  .word $0882
-  .word $0883
-  .word $0887
+  .word $087d
+  .word $0884
   .word $ffff
-  .word $088b
-  .word $088c
-  .word $ffff
-  .word $0894
+  .word $0886
+  .word $0889
+  .word $088a
+  .word $0892
   .word $0897
-  .word $0898
-  .word $089b
-  .word $08a4
-  .word $08aa
-  .word $08ad
-  .word $08b2
-  .word $08b5
-  .word $08b6
-  .word $08b8
-  .word $08bc
-  .word $08c1
-  .word $08c8
+  .word $089c
+  .word $089e
+  .word $089f
+  .word $ffff
+  .word $08a3
+  .word $08a7
+  .word $08a9
+  .word $08ab
+  .word $08ae
+  .word $08b3
+  .word $08b7
   .word $ffff
-  .word $08ca
-  .word $08cd
+  .word $08bf
+  .word $08c0
+  .word $08c5
+  .word $08c7
   .word $08ce
+  .word $ffff
+  .word $08d0
   .word $08d6
-  .word $08db
-  .word $08e0
+  .word $08d8
+  .word $08df
+  .word $08e1
   .word $08e2
-  .word $08e3
-  .word $ffff
   .word $08e7
-  .word $08eb
-  .word $08ed
-  .word $08ef
-  .word $08f2
-  .word $08fa
-  .word $08fe
-  .word $ffff
-  .word $0906
-  .word $0907
-  .word $090c
-  .word $090e
-  .word $0915
-  .word $ffff
-  .word $0917
+  .word $08f0
+  .word $08f8
+  .word $08f9
+  .word $08fd
+  .word $0903
+  .word $0908
+  .word $0916
   .word $091d
-  .word $0923
-  .word $092a
+  .word $091e
+  .word $0927
+  .word $0929
   .word $092c
   .word $092d
-  .word $0932
+  .word $0930
+  .word $0936
+  .word $0938
   .word $093b
+  .word $ffff
+  .word $093e
+  .word $0941
   .word $0943
-  .word $0944
-  .word $0948
+  .word $0945
+  .word $094d
   .word $094e
-  .word $0953
+  .word $0954
+  .word $0957
+  .word $ffff
+  .word $095a
+  .word $095d
   .word $0961
-  .word $0968
-  .word $0969
-  .word $0972
-  .word $0974
-  .word $0977
-  .word $0978
-  .word $097b
-  .word $0981
+  .word $096a
+  .word $096b
+  .word $0970
+  .word $0976
+  .word $097a
   .word $0983
-  .word $0986
-  .word $ffff
-  .word $0989
   .word $098c
-  .word $098e
-  .word $0990
-  .word $0998
-  .word $0999
-  .word $099f
-  .word $09a2
+  .word $0991
+  .word $0992
+  .word $0996
+  .word $099a
   .word $ffff
-  .word $09a5
+  .word $09a1
+  .word $09a4
   .word $09a8
-  .word $09ac
-  .word $09b5
-  .word $09b9
-  .word $09be
-  .word $09c4
-  .word $09c8
-  .word $09d1
-  .word $09da
-  .word $09df
-  .word $09e0
-  .word $09e4
-  .word $09e8
+  .word $09aa
+  .word $09ae
+  .word $09b0
+  .word $09b1
+  .word $09b4
+  .word $09bb
+  .word $ffff
   .word $ffff
-  .word $09ef
-  .word $09f2
+  .word $09bf
+  .word $09c6
+  .word $09ca
+  .word $09cf
+  .word $09d9
+  .word $09e1
+  .word $09e2
+  .word $09e4
+  .word $09e5
+  .word $09e9
   .word $09f6
-  .word $09f8
-  .word $09fc
-  .word $09fe
   .word $09ff
-  .word $0a02
-  .word $0a09
-  .word $ffff
-  .word $ffff
-  .word $0a0d
-  .word $0a14
-  .word $0a18
-  .word $0a1d
-  .word $0a27
-  .word $0a2f
-  .word $0a30
+  .word $0a04
+  .word $0a0b
+  .word $0a0c
+  .word $0a11
+  .word $0a16
+  .word $0a19
+  .word $0a1e
+  .word $0a24
+  .word $0a29
+  .word $0a2c
+  .word $0a31
   .word $0a32
-  .word $0a33
-  .word $0a37
+  .word $0a3a
+  .word $0a3f
+  .word $0a40
+  .word $ffff
   .word $0a44
-  .word $0a4d
-  .word $0a52
-  .word $0a59
-  .word $0a5a
-  .word $0a5f
-  .word $0a64
-  .word $0a67
-  .word $0a6c
+  .word $0a46
+  .word $0a4f
+  .word $0a51
+  .word $0a57
+  .word $0a5d
+  .word $0a63
+  .word $0a6a
+  .word $0a6f
   .word $0a72
-  .word $0a77
-  .word $0a7a
-  .word $0a7f
-  .word $0a80
-  .word $0a88
-  .word $0a8d
-  .word $0a8e
-  .word $ffff
-  .word $0a92
-  .word $0a94
-  .word $0a9d
-  .word $0a9f
+  .word $0a74
+  .word $0a76
+  .word $0a79
+  .word $0a7d
+  .word $0a86
+  .word $0a87
+  .word $0a89
+  .word $0a95
+  .word $0a96
+  .word $0a97
+  .word $0a9c
   .word $0aa5
-  .word $0aab
-  .word $0ab1
-  .word $0ab8
+  .word $0aaf
+  .word $0ab5
+  .word $0ab6
   .word $0abd
-  .word $0ac0
-  .word $0ac2
-  .word $0ac4
-  .word $0ac7
-  .word $0acb
-  .word $0ad4
-  .word $0ad5
+  .word $0ac3
+  .word $0acc
+  .word $0ad1
+  .word $0ad2
   .word $0ad7
-  .word $0ae3
-  .word $0ae4
-  .word $0ae5
-  .word $0aea
-  .word $0af3
-  .word $0afd
-  .word $0b03
-  .word $0b04
-  .word $0b0b
-  .word $0b11
-  .word $0b1a
+  .word $0ad8
+  .word $0ada
+  .word $ffff
+  .word $0add
+  .word $0adf
+  .word $0ae1
+  .word $0ae8
+  .word $0aef
+  .word $0af5
+  .word $0afb
+  .word $0b00
+  .word $0b06
+  .word $0b09
+  .word $0b0e
+  .word $0b15
+  .word $0b18
+  .word $0b1b
   .word $0b1f
-  .word $0b20
-  .word $0b25
   .word $0b26
-  .word $0b28
-  .word $ffff
-  .word $0b2b
-  .word $0b2d
+  .word $0b2a
+  .word $0b2c
   .word $0b2f
-  .word $0b36
+  .word $0b35
+  .word $0b38
   .word $0b3f
+  .word $ffff
+  .word $0b43
+  .word $0b44
+  .word $0b47
   .word $0b48
-  .word $0b4e
-  .word $0b53
-  .word $0b59
-  .word $0b5c
-  .word $0b61
-  .word $0b68
-  .word $0b6b
-  .word $0b6e
-  .word $0b72
+  .word $0b4a
+  .word $0b50
+  .word $0b51
+  .word $0b57
+  .word $0b5b
+  .word $0b60
+  .word $ffff
+  .word $0b63
+  .word $0b66
+  .word $ffff
+  .word $0b67
+  .word $0b71
+  .word $0b74
   .word $0b79
+  .word $ffff
   .word $0b7d
-  .word $0b7f
-  .word $0b82
+  .word $0b7e
+  .word $0b80
+  .word $0b87
   .word $0b88
+  .word $0b8a
   .word $0b8b
-  .word $0b92
-  .word $ffff
-  .word $0b96
-  .word $0b97
+  .word $0b8d
+  .word $0b90
+  .word $0b93
+  .word $0b94
   .word $0b9a
+  .word $ffff
   .word $0b9b
-  .word $0b9d
-  .word $0ba3
-  .word $0ba5
-  .word $0bab
-  .word $0baf
+  .word $0b9c
+  .word $0b9e
+  .word $0ba0
+  .word $0baa
+  .word $0bae
   .word $0bb4
-  .word $ffff
-  .word $0bb7
-  .word $0bba
-  .word $ffff
   .word $0bbb
+  .word $0bbf
   .word $0bc8
   .word $0bcb
   .word $0bd0
+  .word $0bd1
+  .word $0bd2
   .word $ffff
-  .word $0bd4
   .word $0bd5
-  .word $0bd7
-  .word $0bde
-  .word $0bdf
-  .word $0be1
-  .word $0be2
-  .word $0be4
+  .word $0bda
+  .word $0be3
   .word $0be7
-  .word $0bea
-  .word $0beb
-  .word $0bf1
   .word $ffff
+  .word $0be9
+  .word $ffff
+  .word $0bee
   .word $0bf2
-  .word $0bf3
-  .word $0bf5
   .word $0bf7
+  .word $0bf8
+  .word $0bfb
   .word $0c01
-  .word $0c05
-  .word $0c0b
-  .word $0c12
-  .word $0c16
-  .word $0c1f
-  .word $0c22
+  .word $0c04
+  .word $0c0c
+  .word $ffff
+  .word $0c0e
+  .word $0c10
+  .word $0c17
+  .word $0c18
+  .word $ffff
+  .word $0c1d
+  .word $0c21
   .word $0c27
-  .word $0c28
-  .word $0c29
   .word $0c2c
-  .word $0c2f
-  .word $0c34
-  .word $0c3d
-  .word $0c41
-  .word $ffff
+  .word $0c30
+  .word $0c39
+  .word $0c3f
   .word $0c43
-  .word $ffff
   .word $0c48
-  .word $0c4c
-  .word $0c51
-  .word $0c52
-  .word $0c55
-  .word $0c5b
-  .word $0c5e
-  .word $0c66
-  .word $ffff
-  .word $0c68
-  .word $0c6a
-  .word $0c71
-  .word $0c72
+  .word $0c4d
+  .word $0c54
+  .word $0c57
+  .word $0c5d
+  .word $0c63
+  .word $0c65
+  .word $0c6d
+  .word $0c6e
+  .word $0c75
   .word $ffff
-  .word $0c77
+  .word $0c78
   .word $0c7b
-  .word $0c81
-  .word $0c86
-  .word $0c8a
-  .word $0c93
-  .word $0c99
-  .word $0c9d
-  .word $0ca4
-  .word $0ca9
+  .word $0c7f
+  .word $0c85
+  .word $0c87
+  .word $0c8d
+  .word $0c92
+  .word $0c9a
+  .word $0c9f
+  .word $0ca6
+  .word $0ca7
+  .word $0cab
   .word $0cb0
-  .word $0cb3
-  .word $0cb9
-  .word $0cbf
-  .word $0cc3
-  .word $0ccb
-  .word $0ccc
-  .word $0cd3
   .word $ffff
-  .word $0cd6
-  .word $0cd9
-  .word $0cdd
-  .word $0ce3
-  .word $0ce5
-  .word $0ceb
-  .word $0cf0
-  .word $0cf8
-  .word $0cfd
-  .word $0d04
-  .word $0d05
-  .word $0d09
-  .word $0d0e
   .word $ffff
+  .word $0cb3
+  .word $0cb7
+  .word $0cba
+  .word $0cbd
+  .word $0cc0
+  .word $0cc7
+  .word $0cc9
+  .word $0cd0
+  .word $0cd6
+  .word $0cdf
+  .word $0ce0
+  .word $0ce6
+  .word $0cee
   .word $ffff
-  .word $0d11
-  .word $0d15
+  .word $0cef
+  .word $0cf5
+  .word $0cfa
+  .word $0cff
+  .word $0d03
+  .word $0d05
+  .word $0d06
+  .word $0d08
+  .word $0d14
   .word $0d18
-  .word $0d1b
-  .word $0d1e
-  .word $0d25
-  .word $0d27
-  .word $0d2e
+  .word $0d1c
+  .word $0d21
+  .word $0d22
+  .word $0d26
+  .word $ffff
+  .word $0d2c
+  .word $0d32
   .word $0d34
+  .word $0d37
+  .word $0d3c
   .word $0d3d
-  .word $0d3e
-  .word $0d48
-  .word $0d50
+  .word $0d45
+  .word $0d4b
+  .word $0d4c
   .word $ffff
-  .word $0d51
-  .word $0d57
+  .word $0d4f
+  .word $0d55
   .word $0d5c
-  .word $0d61
+  .word $0d5d
+  .word $0d62
   .word $0d65
-  .word $0d67
-  .word $0d68
-  .word $0d6a
+  .word $0d69
+  .word $0d71
   .word $0d76
-  .word $0d7a
-  .word $0d7e
-  .word $0d83
+  .word $0d7f
   .word $0d84
-  .word $0d88
-  .word $ffff
-  .word $0d8e
-  .word $0d94
-  .word $0d96
-  .word $0d99
-  .word $0d9e
-  .word $0d9f
+  .word $0d86
+  .word $0d8b
+  .word $0d8f
+  .word $0d90
+  .word $0d9c
+  .word $0da1
+  .word $0da6
   .word $0da7
-  .word $0dad
-  .word $0dae
-  .word $ffff
-  .word $0db1
-  .word $0db7
-  .word $0dbe
-  .word $0dc2
+  .word $0dab
+  .word $0db3
+  .word $0db9
+  .word $0dba
+  .word $0dbd
+  .word $0dc4
   .word $0dc7
-  .word $0dca
-  .word $0dce
-  .word $0dd6
-  .word $0ddb
+  .word $ffff
+  .word $0dcb
+  .word $ffff
+  .word $0dcf
+  .word $0dd3
+  .word $0dd5
+  .word $0ddd
+  .word $0ddf
   .word $0de4
-  .word $0de9
-  .word $0deb
-  .word $0df0
-  .word $0df4
-  .word $0df5
+  .word $0de5
+  .word $0de6
+  .word $0ded
+  .word $0dee
+  .word $0df6
+  .word $0dfb
   .word $0e01
-  .word $0e06
-  .word $0e0b
-  .word $0e0c
-  .word $0e10
-  .word $0e18
-  .word $0e1e
-  .word $0e1f
-  .word $0e22
-  .word $0e29
-  .word $0e2c
-  .word $0e30
-  .word $0e31
-  .word $0e38
+  .word $0e04
+  .word $0e08
+  .word $0e0d
+  .word $0e12
+  .word $0e17
+  .word $0e1c
+  .word $0e2a
+  .word $0e2f
+  .word $0e39
   .word $0e3b
-  .word $0e3f
-  .word $0e41
-  .word $0e49
-  .word $0e4b
-  .word $0e50
-  .word $0e51
-  .word $0e52
-  .word $0e59
-  .word $0e5a
+  .word $0e40
+  .word $0e48
+  .word $0e54
+  .word $ffff
+  .word $0e55
+  .word $0e57
+  .word $0e5b
+  .word $0e5f
+  .word $0e60
   .word $0e62
-  .word $0e69
-  .word $0e6f
-  .word $0e72
-  .word $0e76
+  .word $0e65
+  .word $0e6a
+  .word $0e6c
+  .word $0e70
+  .word $0e71
+  .word $ffff
+  .word $0e78
+  .word $0e79
   .word $0e7b
-  .word $0e80
+  .word $0e7d
+  .word $0e82
   .word $0e85
-  .word $0e8a
-  .word $0e98
-  .word $0e9d
-  .word $0ea7
-  .word $0ea9
+  .word $0e86
+  .word $0e88
+  .word $0e8f
+  .word $0e92
+  .word $0e9c
+  .word $0ea5
+  .word $0ead
   .word $0eae
-  .word $0eb6
-  .word $0ec2
+  .word $0eb2
+  .word $0eb4
+  .word $0eba
+  .word $0ebd
+  .word $0ebe
+  .word $0ec4
+  .word $0eca
+  .word $0ed1
   .word $ffff
-  .word $0ec3
-  .word $0ec5
-  .word $0ec9
-  .word $0ecd
-  .word $0ece
-  .word $0ed0
-  .word $0ed3
-  .word $0ed8
+  .word $0ed7
   .word $0eda
-  .word $0ee0
-  .word $0ee1
+  .word $0edb
+  .word $ffff
+  .word $0edd
+  .word $0edf
+  .word $0ee2
+  .word $0eea
+  .word $0eec
   .word $ffff
-  .word $0ee8
-  .word $0ee9
-  .word $0eeb
-  .word $0eed
-  .word $0ef2
-  .word $0ef5
-  .word $0ef6
+  .word $0eef
   .word $0ef8
-  .word $0eff
-  .word $0f02
-  .word $0f0c
+  .word $ffff
+  .word $0efe
+  .word $0f06
+  .word $0f0e
+  .word $0f11
   .word $0f15
-  .word $0f1f
-  .word $0f20
+  .word $0f16
+  .word $0f1a
+  .word $0f1e
   .word $0f24
   .word $0f26
-  .word $0f2c
-  .word $0f2f
+  .word $0f2d
   .word $0f30
   .word $0f36
-  .word $0f3c
+  .word $0f37
+  .word $0f3b
+  .word $0f3f
   .word $0f43
-  .word $ffff
-  .word $0f49
-  .word $0f4f
-  .word $0f50
-  .word $ffff
-  .word $0f52
+  .word $0f48
+  .word $0f4d
+  .word $0f51
+  .word $0f53
   .word $0f54
   .word $0f57
-  .word $0f5f
-  .word $0f61
+  .word $0f5d
+  .word $0f60
+  .word $0f63
   .word $ffff
-  .word $0f64
+  .word $0f69
+  .word $0f6b
   .word $0f6d
-  .word $ffff
-  .word $0f73
-  .word $0f7b
+  .word $0f6e
+  .word $0f72
+  .word $0f74
+  .word $0f75
+  .word $0f7a
+  .word $0f7e
   .word $0f83
+  .word $0f84
+  .word $0f85
   .word $0f86
   .word $0f8a
-  .word $0f8b
-  .word $0f8f
-  .word $0f93
+  .word $0f8e
+  .word $0f94
+  .word $ffff
+  .word $0f95
+  .word $0f96
   .word $0f99
-  .word $0f9b
-  .word $0fa2
-  .word $0fa5
-  .word $0fab
-  .word $0fac
+  .word $0f9f
+  .word $0fa6
+  .word $0fad
   .word $0fb0
   .word $0fb4
-  .word $0fb8
-  .word $0fbd
-  .word $0fc2
-  .word $0fc6
-  .word $0fc8
-  .word $0fc9
-  .word $0fcc
-  .word $0fd2
-  .word $0fd5
-  .word $0fd8
+  .word $0fba
+  .word $0fbe
+  .word $0fc3
+  .word $0fca
+  .word $0fce
+  .word $0fd6
   .word $ffff
+  .word $0fda
   .word $0fde
-  .word $0fe0
-  .word $0fe2
-  .word $0fe3
-  .word $0fe7
-  .word $0fe9
-  .word $0fea
-  .word $0fef
-  .word $0ff3
-  .word $0ff8
-  .word $0ff9
-  .word $0ffa
-  .word $0ffb
-  .word $0fff
-  .word $1003
-  .word $1009
-  .word $ffff
-  .word $100a
-  .word $100d
-  .word $1010
-  .word $1016
-  .word $1020
-  .word $1027
-  .word $102a
-  .word $102e
-  .word $1034
-  .word $1038
-  .word $103d
-  .word $1044
-  .word $1048
-  .word $1050
-  .word $ffff
-  .word $1054
-  .word $1058
-  .word $105e
+  .word $0fe4
 
-// Entries (4200 * 4 = 16800 bytes)
+// Entries (4078 * 4 = 16312 bytes)
+// Format: HashHi, From (0x88), To (0x88), Next (entries left in bucket)
 GeneratedBookEntries:
-  .byte $dc, $75, $66, 1
+  .byte $dc, $75, $66, 3
   .byte $08, $44, $34, 2
-  .byte $9c, $32, $43, 3
+  .byte $9c, $32, $43, 1
   .byte $ec, $46, $55, GEN_BOOK_CHAIN_END
-  .byte $ac, $42, $33, 5
+  .byte $ac, $42, $33, 1
   .byte $5c, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $10, $05, $16, 7
-  .byte $30, $06, $25, 8
-  .byte $9c, $16, $26, 9
-  .byte $9c, $06, $25, 10
-  .byte $64, $71, $52, 11
+  .byte $10, $05, $16, 5
+  .byte $30, $06, $25, 4
+  .byte $9c, $16, $26, 3
+  .byte $9c, $06, $25, 2
+  .byte $64, $71, $52, 1
   .byte $bc, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $18, $06, $25, 13
-  .byte $18, $01, $22, 14
-  .byte $18, $12, $22, 15
-  .byte $54, $06, $25, 16
-  .byte $30, $75, $66, 17
-  .byte $30, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $54, $05, $16, 19
-  .byte $64, $71, $63, 20
+  .byte $18, $06, $25, 3
+  .byte $18, $01, $22, 2
+  .byte $18, $12, $22, 1
+  .byte $54, $06, $25, GEN_BOOK_CHAIN_END
+  .byte $54, $05, $16, 2
+  .byte $64, $71, $63, 1
   .byte $6c, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $b8, $71, $52, 22
-  .byte $b8, $76, $55, 23
-  .byte $b8, $72, $45, 24
-  .byte $38, $76, $55, 25
-  .byte $38, $66, $56, 26
-  .byte $44, $63, $43, 27
-  .byte $44, $76, $55, 28
+  .byte $b8, $71, $52, 7
+  .byte $b8, $76, $55, 6
+  .byte $b8, $72, $45, 5
+  .byte $38, $76, $55, 4
+  .byte $38, $66, $56, 3
+  .byte $44, $63, $43, 2
+  .byte $44, $76, $55, 1
   .byte $44, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $dc, $06, $25, 30
-  .byte $dc, $12, $22, 31
-  .byte $dc, $33, $42, 32
+  .byte $dc, $06, $25, 3
+  .byte $dc, $12, $22, 2
+  .byte $dc, $33, $42, 1
   .byte $f8, $33, $44, GEN_BOOK_CHAIN_END
-  .byte $44, $14, $24, 34
-  .byte $44, $12, $22, 35
+  .byte $44, $14, $24, 2
+  .byte $44, $12, $22, 1
   .byte $18, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $64, $13, $33, 37
-  .byte $64, $06, $25, 38
+  .byte $64, $13, $33, 2
+  .byte $64, $06, $25, 1
   .byte $64, $13, $23, GEN_BOOK_CHAIN_END
   .byte $dc, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $5c, $14, $24, 41
-  .byte $c0, $12, $32, 42
-  .byte $88, $12, $32, 43
-  .byte $88, $13, $33, 44
-  .byte $88, $06, $25, 45
-  .byte $b0, $76, $55, 46
+  .byte $5c, $14, $24, 6
+  .byte $c0, $12, $32, 5
+  .byte $88, $12, $32, 4
+  .byte $88, $13, $33, 3
+  .byte $88, $06, $25, 2
+  .byte $b0, $76, $55, 1
   .byte $98, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $0c, $72, $61, 48
-  .byte $14, $05, $16, 49
-  .byte $14, $12, $22, 50
-  .byte $4c, $64, $54, 51
-  .byte $90, $71, $63, 52
-  .byte $90, $62, $52, 53
-  .byte $90, $75, $53, 54
+  .byte $0c, $72, $61, 7
+  .byte $14, $05, $16, 6
+  .byte $14, $12, $22, 5
+  .byte $4c, $64, $54, 4
+  .byte $90, $71, $63, 3
+  .byte $90, $62, $52, 2
+  .byte $90, $75, $53, 1
   .byte $80, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $1c, $01, $22, 56
+  .byte $1c, $01, $22, 1
   .byte $1c, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $90, $75, $42, 58
-  .byte $94, $71, $52, 59
+  .byte $90, $75, $42, 2
+  .byte $94, $71, $52, 1
   .byte $e4, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $50, $12, $32, 61
-  .byte $7c, $63, $41, 62
+  .byte $50, $12, $32, 2
+  .byte $7c, $63, $41, 1
   .byte $7c, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $58, $76, $55, 64
-  .byte $58, $66, $56, 65
+  .byte $58, $76, $55, 2
+  .byte $58, $66, $56, 1
   .byte $58, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $cc, $63, $43, 67
-  .byte $cc, $64, $44, 68
-  .byte $cc, $76, $55, 69
-  .byte $08, $75, $66, 70
-  .byte $08, $76, $55, 71
-  .byte $74, $75, $66, 72
-  .byte $b0, $76, $55, 73
-  .byte $34, $32, $43, 74
-  .byte $34, $01, $22, 75
-  .byte $34, $03, $12, 76
-  .byte $20, $14, $24, 77
-  .byte $20, $01, $22, 78
-  .byte $28, $14, $24, 79
-  .byte $28, $12, $32, 80
-  .byte $28, $16, $26, 81
-  .byte $38, $76, $55, 82
+  .byte $cc, $63, $43, 16
+  .byte $cc, $64, $44, 15
+  .byte $cc, $76, $55, 14
+  .byte $08, $75, $66, 13
+  .byte $08, $76, $55, 12
+  .byte $74, $75, $66, 11
+  .byte $b0, $76, $55, 10
+  .byte $34, $32, $43, 9
+  .byte $34, $01, $22, 8
+  .byte $34, $03, $12, 7
+  .byte $20, $14, $24, 6
+  .byte $20, $01, $22, 5
+  .byte $28, $14, $24, 4
+  .byte $28, $12, $32, 3
+  .byte $28, $16, $26, 2
+  .byte $38, $76, $55, 1
   .byte $38, $73, $40, GEN_BOOK_CHAIN_END
-  .byte $b4, $55, $43, 84
+  .byte $b4, $55, $43, 1
   .byte $cc, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $b8, $06, $25, 86
-  .byte $b8, $13, $33, 87
-  .byte $b8, $12, $32, 88
-  .byte $b0, $75, $31, 89
-  .byte $b0, $75, $42, 90
+  .byte $b8, $06, $25, 5
+  .byte $b8, $13, $33, 4
+  .byte $b8, $12, $32, 3
+  .byte $b0, $75, $31, 2
+  .byte $b0, $75, $42, 1
   .byte $b0, $63, $43, GEN_BOOK_CHAIN_END
   .byte $fc, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $30, $14, $24, 93
-  .byte $30, $16, $26, 94
-  .byte $30, $12, $32, 95
-  .byte $3c, $75, $53, 96
-  .byte $38, $04, $07, 97
+  .byte $30, $14, $24, 5
+  .byte $30, $16, $26, 4
+  .byte $30, $12, $32, 3
+  .byte $3c, $75, $53, 2
+  .byte $38, $04, $07, 1
   .byte $38, $11, $21, GEN_BOOK_CHAIN_END
   .byte $bc, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $d8, $76, $55, 100
-  .byte $dc, $14, $24, 101
+  .byte $d8, $76, $55, 2
+  .byte $dc, $14, $24, 1
   .byte $54, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $20, $13, $33, 103
-  .byte $38, $75, $53, 104
-  .byte $38, $71, $52, 105
+  .byte $20, $13, $33, 3
+  .byte $38, $75, $53, 2
+  .byte $38, $71, $52, 1
   .byte $38, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $50, $05, $16, 107
-  .byte $50, $01, $22, 108
-  .byte $68, $76, $55, 109
-  .byte $80, $75, $42, 110
+  .byte $50, $05, $16, 4
+  .byte $50, $01, $22, 3
+  .byte $68, $76, $55, 2
+  .byte $80, $75, $42, 1
   .byte $80, $75, $31, GEN_BOOK_CHAIN_END
-  .byte $5c, $63, $53, 112
+  .byte $5c, $63, $53, 1
   .byte $24, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $04, $13, $33, 114
-  .byte $04, $06, $25, 115
+  .byte $04, $13, $33, 2
+  .byte $04, $06, $25, 1
   .byte $14, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $a0, $15, $35, 117
-  .byte $a0, $02, $46, 118
-  .byte $6c, $76, $55, 119
+  .byte $a0, $15, $35, 3
+  .byte $a0, $02, $46, 2
+  .byte $6c, $76, $55, 1
   .byte $dc, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $30, $15, $35, 121
+  .byte $30, $15, $35, 1
   .byte $30, $01, $22, GEN_BOOK_CHAIN_END
   .byte $e8, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $fc, $05, $32, 124
-  .byte $fc, $13, $33, 125
-  .byte $34, $23, $33, 126
-  .byte $8c, $13, $23, 127
+  .byte $fc, $05, $32, 4
+  .byte $fc, $13, $33, 3
+  .byte $34, $23, $33, 2
+  .byte $8c, $13, $23, 1
   .byte $bc, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $00, $65, $45, 129
-  .byte $00, $66, $56, 130
-  .byte $00, $76, $55, 131
-  .byte $8c, $32, $43, 132
-  .byte $8c, $13, $33, 133
-  .byte $58, $01, $22, 134
-  .byte $7c, $55, $43, 135
+  .byte $00, $65, $45, 7
+  .byte $00, $66, $56, 6
+  .byte $00, $76, $55, 5
+  .byte $8c, $32, $43, 4
+  .byte $8c, $13, $33, 3
+  .byte $58, $01, $22, 2
+  .byte $7c, $55, $43, 1
   .byte $b0, $36, $25, GEN_BOOK_CHAIN_END
-  .byte $88, $17, $27, 137
-  .byte $9c, $12, $22, 138
-  .byte $9c, $16, $26, 139
-  .byte $98, $06, $25, 140
-  .byte $98, $14, $34, 141
+  .byte $88, $17, $27, 5
+  .byte $9c, $12, $22, 4
+  .byte $9c, $16, $26, 3
+  .byte $98, $06, $25, 2
+  .byte $98, $14, $34, 1
   .byte $98, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $9c, $76, $55, 143
-  .byte $68, $02, $46, 144
-  .byte $b8, $31, $40, 145
+  .byte $9c, $76, $55, 3
+  .byte $68, $02, $46, 2
+  .byte $b8, $31, $40, 1
   .byte $b8, $31, $22, GEN_BOOK_CHAIN_END
   .byte $e8, $43, $32, GEN_BOOK_CHAIN_END
-  .byte $78, $64, $44, 148
-  .byte $78, $62, $42, 149
-  .byte $78, $76, $55, 150
-  .byte $2c, $63, $43, 151
-  .byte $2c, $64, $44, 152
-  .byte $2c, $76, $55, 153
-  .byte $5c, $06, $25, 154
-  .byte $14, $04, $07, 155
-  .byte $94, $14, $34, 156
-  .byte $d0, $76, $55, 157
+  .byte $78, $64, $44, 10
+  .byte $78, $62, $42, 9
+  .byte $78, $76, $55, 8
+  .byte $2c, $63, $43, 7
+  .byte $2c, $64, $44, 6
+  .byte $2c, $76, $55, 5
+  .byte $5c, $06, $25, 4
+  .byte $14, $04, $07, 3
+  .byte $94, $14, $34, 2
+  .byte $d0, $76, $55, 1
   .byte $d0, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $18, $01, $13, 159
-  .byte $18, $16, $26, 160
-  .byte $18, $02, $46, 161
-  .byte $48, $33, $42, 162
-  .byte $48, $05, $14, 163
+  .byte $18, $01, $13, 5
+  .byte $18, $16, $26, 4
+  .byte $18, $02, $46, 3
+  .byte $48, $33, $42, 2
+  .byte $48, $05, $14, 1
   .byte $48, $05, $41, GEN_BOOK_CHAIN_END
   .byte $ec, $61, $52, GEN_BOOK_CHAIN_END
-  .byte $0c, $03, $30, 166
-  .byte $fc, $04, $07, 167
+  .byte $0c, $03, $30, 2
+  .byte $fc, $04, $07, 1
   .byte $fc, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $10, $72, $61, 169
-  .byte $84, $05, $16, 170
-  .byte $84, $12, $32, 171
-  .byte $00, $14, $24, 172
+  .byte $10, $72, $61, 4
+  .byte $84, $05, $16, 3
+  .byte $84, $12, $32, 2
+  .byte $00, $14, $24, 1
   .byte $00, $14, $34, GEN_BOOK_CHAIN_END
-  .byte $e4, $64, $44, 174
-  .byte $e4, $76, $55, 175
-  .byte $e4, $62, $42, 176
+  .byte $e4, $64, $44, 3
+  .byte $e4, $76, $55, 2
+  .byte $e4, $62, $42, 1
   .byte $cc, $71, $52, GEN_BOOK_CHAIN_END
   .byte $08, $05, $16, GEN_BOOK_CHAIN_END
   .byte $c8, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $28, $06, $25, 180
-  .byte $28, $14, $24, 181
+  .byte $28, $06, $25, 2
+  .byte $28, $14, $24, 1
   .byte $28, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $a0, $75, $66, 183
-  .byte $34, $01, $13, 184
-  .byte $34, $34, $44, 185
+  .byte $a0, $75, $66, 3
+  .byte $34, $01, $13, 2
+  .byte $34, $34, $44, 1
   .byte $c8, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $70, $13, $33, 187
-  .byte $24, $32, $43, 188
-  .byte $d4, $55, $43, 189
-  .byte $e0, $62, $52, 190
-  .byte $e0, $64, $54, 191
+  .byte $70, $13, $33, 5
+  .byte $24, $32, $43, 4
+  .byte $d4, $55, $43, 3
+  .byte $e0, $62, $52, 2
+  .byte $e0, $64, $54, 1
   .byte $e0, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $34, $02, $11, 193
-  .byte $ec, $73, $40, 194
-  .byte $ec, $64, $54, 195
-  .byte $ec, $60, $50, 196
-  .byte $d0, $75, $53, 197
-  .byte $d0, $76, $64, 198
+  .byte $34, $02, $11, 6
+  .byte $ec, $73, $40, 5
+  .byte $ec, $64, $54, 4
+  .byte $ec, $60, $50, 3
+  .byte $d0, $75, $53, 2
+  .byte $d0, $76, $64, 1
   .byte $d0, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $34, $53, $44, 200
+  .byte $34, $53, $44, 1
   .byte $8c, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $80, $16, $26, 202
-  .byte $80, $02, $11, 203
-  .byte $80, $31, $41, 204
-  .byte $0c, $25, $44, 205
+  .byte $80, $16, $26, 4
+  .byte $80, $02, $11, 3
+  .byte $80, $31, $41, 2
+  .byte $0c, $25, $44, 1
   .byte $0c, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $e4, $36, $47, 207
-  .byte $9c, $42, $33, 208
-  .byte $9c, $76, $55, 209
-  .byte $e0, $71, $52, 210
-  .byte $e0, $76, $55, 211
-  .byte $e0, $76, $57, 212
-  .byte $b8, $67, $57, 213
+  .byte $e4, $36, $47, 7
+  .byte $9c, $42, $33, 6
+  .byte $9c, $76, $55, 5
+  .byte $e0, $71, $52, 4
+  .byte $e0, $76, $55, 3
+  .byte $e0, $76, $57, 2
+  .byte $b8, $67, $57, 1
   .byte $84, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $34, $76, $55, 215
-  .byte $34, $66, $56, 216
-  .byte $34, $65, $45, GEN_BOOK_CHAIN_END
-  .byte $60, $31, $13, 218
-  .byte $60, $73, $64, 219
-  .byte $60, $62, $42, 220
+  .byte $60, $31, $13, 3
+  .byte $60, $73, $64, 2
+  .byte $60, $62, $42, 1
   .byte $68, $33, $44, GEN_BOOK_CHAIN_END
-  .byte $d0, $62, $42, 222
-  .byte $d0, $76, $55, 223
-  .byte $d0, $64, $44, 224
-  .byte $68, $75, $66, 225
-  .byte $30, $06, $25, 226
-  .byte $30, $13, $23, 227
-  .byte $30, $12, $32, 228
-  .byte $88, $33, $30, 229
-  .byte $28, $01, $22, 230
-  .byte $28, $16, $26, 231
-  .byte $88, $75, $66, 232
+  .byte $d0, $62, $42, 9
+  .byte $d0, $76, $55, 8
+  .byte $d0, $64, $44, 7
+  .byte $68, $75, $66, 6
+  .byte $30, $06, $25, 5
+  .byte $30, $13, $23, 4
+  .byte $30, $12, $32, 3
+  .byte $28, $01, $22, 2
+  .byte $28, $16, $26, 1
   .byte $58, $64, $52, GEN_BOOK_CHAIN_END
-  .byte $3c, $76, $55, 234
-  .byte $3c, $64, $44, 235
-  .byte $3c, $64, $54, 236
-  .byte $28, $04, $07, 237
+  .byte $3c, $76, $55, 4
+  .byte $3c, $64, $44, 3
+  .byte $3c, $64, $54, 2
+  .byte $28, $04, $07, 1
   .byte $dc, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $20, $05, $16, 239
-  .byte $20, $06, $25, 240
+  .byte $20, $05, $16, 2
+  .byte $20, $06, $25, 1
   .byte $28, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $50, $75, $66, 242
+  .byte $50, $75, $66, 1
   .byte $50, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $5c, $17, $27, 244
-  .byte $2c, $11, $21, 245
-  .byte $2c, $13, $33, 246
-  .byte $2c, $05, $41, 247
-  .byte $bc, $06, $25, 248
+  .byte $5c, $17, $27, 5
+  .byte $2c, $11, $21, 4
+  .byte $2c, $13, $33, 3
+  .byte $2c, $05, $41, 2
+  .byte $bc, $06, $25, 1
   .byte $e4, $00, $01, GEN_BOOK_CHAIN_END
-  .byte $c0, $14, $34, 250
-  .byte $cc, $43, $33, 251
-  .byte $cc, $76, $55, 252
-  .byte $cc, $64, $54, 253
-  .byte $38, $05, $16, 254
-  .byte $d4, $71, $52, GEN_BOOK_CHAIN_END
+  .byte $c0, $14, $34, 6
+  .byte $cc, $43, $33, 5
+  .byte $cc, $76, $55, 4
+  .byte $cc, $64, $54, 3
+  .byte $38, $05, $16, 2
+  .byte $d4, $71, $52, 1
   .byte $d4, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $58, $62, $42, 257
-  .byte $58, $76, $55, 258
-  .byte $58, $72, $36, 259
-  .byte $9c, $75, $66, 260
-  .byte $9c, $76, $55, 261
+  .byte $58, $62, $42, 5
+  .byte $58, $76, $55, 4
+  .byte $58, $72, $36, 3
+  .byte $9c, $75, $66, 2
+  .byte $9c, $76, $55, 1
   .byte $ac, $73, $40, GEN_BOOK_CHAIN_END
-  .byte $d4, $06, $25, 263
-  .byte $d8, $75, $42, 264
-  .byte $3c, $71, $52, 265
-  .byte $3c, $64, $54, 266
-  .byte $3c, $76, $55, 267
-  .byte $40, $75, $66, 268
-  .byte $60, $75, $53, 269
+  .byte $d4, $06, $25, 7
+  .byte $d8, $75, $42, 6
+  .byte $3c, $71, $52, 5
+  .byte $3c, $64, $54, 4
+  .byte $3c, $76, $55, 3
+  .byte $40, $75, $66, 2
+  .byte $60, $75, $53, 1
   .byte $e0, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $4c, $66, $56, 271
-  .byte $4c, $64, $44, 272
-  .byte $78, $63, $43, 273
+  .byte $4c, $66, $56, 3
+  .byte $4c, $64, $44, 2
+  .byte $78, $63, $43, 1
   .byte $78, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $c0, $71, $63, 275
-  .byte $c0, $62, $52, 276
-  .byte $c0, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $38, $14, $24, 278
-  .byte $38, $06, $25, 279
-  .byte $c8, $64, $44, 280
-  .byte $c8, $64, $54, 281
-  .byte $c8, $73, $40, 282
-  .byte $84, $64, $44, 283
-  .byte $84, $66, $56, 284
-  .byte $84, $72, $36, 285
+  .byte $38, $14, $24, 8
+  .byte $38, $06, $25, 7
+  .byte $c8, $64, $44, 6
+  .byte $c8, $64, $54, 5
+  .byte $c8, $73, $40, 4
+  .byte $84, $64, $44, 3
+  .byte $84, $66, $56, 2
+  .byte $84, $72, $36, 1
   .byte $80, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $54, $04, $07, 287
-  .byte $54, $12, $22, 288
+  .byte $54, $04, $07, 2
+  .byte $54, $12, $22, 1
   .byte $54, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $5c, $16, $26, 290
-  .byte $4c, $06, $25, 291
-  .byte $4c, $13, $23, 292
-  .byte $f4, $02, $46, 293
-  .byte $50, $75, $42, 294
-  .byte $b0, $64, $54, 295
+  .byte $5c, $16, $26, 6
+  .byte $4c, $06, $25, 5
+  .byte $4c, $13, $23, 4
+  .byte $f4, $02, $46, 3
+  .byte $50, $75, $42, 2
+  .byte $b0, $64, $54, 1
   .byte $2c, $40, $51, GEN_BOOK_CHAIN_END
-  .byte $34, $72, $61, 297
+  .byte $34, $72, $61, 1
   .byte $c8, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $48, $63, $43, 299
-  .byte $48, $71, $52, 300
-  .byte $48, $63, $53, 301
-  .byte $fc, $02, $46, 302
-  .byte $24, $63, $44, 303
-  .byte $a0, $75, $66, 304
-  .byte $e0, $64, $44, 305
-  .byte $e0, $66, $56, 306
-  .byte $e0, $72, $63, 307
+  .byte $48, $63, $43, 9
+  .byte $48, $71, $52, 8
+  .byte $48, $63, $53, 7
+  .byte $fc, $02, $46, 6
+  .byte $24, $63, $44, 5
+  .byte $a0, $75, $66, 4
+  .byte $e0, $64, $44, 3
+  .byte $e0, $66, $56, 2
+  .byte $e0, $72, $63, 1
   .byte $f0, $76, $64, GEN_BOOK_CHAIN_END
-  .byte $7c, $13, $33, 309
-  .byte $7c, $05, $14, 310
-  .byte $f8, $62, $52, 311
-  .byte $f8, $71, $52, 312
+  .byte $7c, $13, $33, 4
+  .byte $7c, $05, $14, 3
+  .byte $f8, $62, $52, 2
+  .byte $f8, $71, $52, 1
   .byte $f8, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $2c, $73, $51, 314
-  .byte $a4, $17, $27, 315
-  .byte $a4, $12, $32, 316
-  .byte $64, $44, $33, 317
-  .byte $64, $43, $32, 318
+  .byte $2c, $73, $51, 5
+  .byte $a4, $17, $27, 4
+  .byte $a4, $12, $32, 3
+  .byte $64, $44, $33, 2
+  .byte $64, $43, $32, 1
   .byte $64, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $40, $36, $54, 320
+  .byte $40, $36, $54, 1
   .byte $84, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $50, $16, $26, 322
-  .byte $cc, $71, $52, 323
-  .byte $cc, $72, $45, 324
-  .byte $cc, $76, $55, 325
-  .byte $84, $63, $43, 326
-  .byte $3c, $02, $11, 327
-  .byte $3c, $12, $32, 328
-  .byte $9c, $61, $52, 329
+  .byte $50, $16, $26, 8
+  .byte $cc, $71, $52, 7
+  .byte $cc, $72, $45, 6
+  .byte $cc, $76, $55, 5
+  .byte $84, $63, $43, 4
+  .byte $3c, $02, $11, 3
+  .byte $3c, $12, $32, 2
+  .byte $9c, $61, $52, 1
   .byte $24, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $7c, $75, $66, 331
-  .byte $7c, $62, $42, 332
-  .byte $58, $44, $56, 333
+  .byte $7c, $75, $66, 3
+  .byte $7c, $62, $42, 2
+  .byte $58, $44, $56, 1
   .byte $58, $44, $32, GEN_BOOK_CHAIN_END
-  .byte $c0, $61, $52, 335
-  .byte $40, $05, $16, 336
-  .byte $b4, $73, $51, 337
+  .byte $c0, $61, $52, 3
+  .byte $40, $05, $16, 2
+  .byte $b4, $73, $51, 1
   .byte $b4, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $6c, $06, $25, 339
-  .byte $6c, $22, $43, 340
-  .byte $6c, $16, $26, 341
+  .byte $6c, $06, $25, 3
+  .byte $6c, $22, $43, 2
+  .byte $6c, $16, $26, 1
   .byte $58, $36, $25, GEN_BOOK_CHAIN_END
   .byte $f4, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $1c, $06, $25, 344
-  .byte $1c, $01, $22, 345
-  .byte $1c, $05, $23, 346
-  .byte $38, $73, $63, 347
-  .byte $18, $64, $44, 348
+  .byte $1c, $06, $25, 5
+  .byte $1c, $01, $22, 4
+  .byte $1c, $05, $23, 3
+  .byte $38, $73, $63, 2
+  .byte $18, $64, $44, 1
   .byte $f8, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $0c, $75, $66, 350
-  .byte $0c, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $d4, $74, $77, 352
+  .byte $d4, $74, $77, 1
   .byte $d4, $62, $42, GEN_BOOK_CHAIN_END
   .byte $e4, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $10, $14, $24, 355
-  .byte $d4, $05, $16, 356
-  .byte $34, $42, $33, 357
+  .byte $10, $14, $24, 3
+  .byte $d4, $05, $16, 2
+  .byte $34, $42, $33, 1
   .byte $34, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $e0, $63, $43, 359
-  .byte $e0, $62, $42, 360
-  .byte $e0, $62, $52, 361
-  .byte $5c, $75, $66, 362
+  .byte $e0, $63, $43, 4
+  .byte $e0, $62, $42, 3
+  .byte $e0, $62, $52, 2
+  .byte $5c, $75, $66, 1
   .byte $48, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $94, $75, $66, 364
-  .byte $94, $62, $42, 365
-  .byte $b4, $76, $55, 366
-  .byte $b4, $75, $42, 367
-  .byte $b4, $65, $45, 368
-  .byte $c8, $42, $32, 369
+  .byte $94, $75, $66, 6
+  .byte $94, $62, $42, 5
+  .byte $b4, $76, $55, 4
+  .byte $b4, $75, $42, 3
+  .byte $b4, $65, $45, 2
+  .byte $c8, $42, $32, 1
   .byte $50, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $e4, $06, $25, 371
-  .byte $e4, $14, $24, 372
+  .byte $e4, $06, $25, 2
+  .byte $e4, $14, $24, 1
   .byte $e4, $33, $42, GEN_BOOK_CHAIN_END
-  .byte $7c, $63, $43, 374
-  .byte $7c, $75, $31, 375
-  .byte $7c, $62, $52, 376
+  .byte $7c, $63, $43, 3
+  .byte $7c, $75, $31, 2
+  .byte $7c, $62, $52, 1
   .byte $50, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $74, $16, $26, 378
-  .byte $74, $11, $31, 379
-  .byte $74, $14, $24, 380
-  .byte $48, $16, $26, 381
+  .byte $74, $16, $26, 4
+  .byte $74, $11, $31, 3
+  .byte $74, $14, $24, 2
+  .byte $48, $16, $26, 1
   .byte $48, $12, $22, GEN_BOOK_CHAIN_END
   .byte $4c, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $b0, $16, $26, 384
-  .byte $98, $13, $23, 385
-  .byte $ec, $13, $33, 386
-  .byte $ec, $12, $22, 387
-  .byte $ec, $01, $22, 388
-  .byte $78, $64, $44, 389
-  .byte $bc, $63, $53, 390
-  .byte $bc, $75, $66, 391
-  .byte $74, $16, $26, 392
+  .byte $b0, $16, $26, 9
+  .byte $98, $13, $23, 8
+  .byte $ec, $13, $33, 7
+  .byte $ec, $12, $22, 6
+  .byte $ec, $01, $22, 5
+  .byte $78, $64, $44, 4
+  .byte $bc, $63, $53, 3
+  .byte $bc, $75, $66, 2
+  .byte $74, $16, $26, 1
   .byte $c0, $42, $33, GEN_BOOK_CHAIN_END
   .byte $60, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $20, $75, $66, 395
-  .byte $60, $16, $26, 396
-  .byte $60, $13, $23, 397
+  .byte $20, $75, $66, 3
+  .byte $60, $16, $26, 2
+  .byte $60, $13, $23, 1
   .byte $60, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $78, $06, $25, 399
-  .byte $78, $16, $26, 400
-  .byte $78, $13, $23, 401
-  .byte $04, $06, $25, 402
-  .byte $04, $12, $22, 403
-  .byte $04, $14, $24, 404
-  .byte $c0, $13, $33, 405
-  .byte $c0, $11, $21, 406
-  .byte $c0, $10, $20, 407
+  .byte $78, $06, $25, 9
+  .byte $78, $16, $26, 8
+  .byte $78, $13, $23, 7
+  .byte $04, $06, $25, 6
+  .byte $04, $12, $22, 5
+  .byte $04, $14, $24, 4
+  .byte $c0, $13, $33, 3
+  .byte $c0, $11, $21, 2
+  .byte $c0, $10, $20, 1
   .byte $d8, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $b8, $16, $25, 409
+  .byte $b8, $16, $25, 1
   .byte $48, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $6c, $73, $51, 411
-  .byte $6c, $42, $33, 412
-  .byte $6c, $72, $36, 413
-  .byte $fc, $76, $55, 414
+  .byte $6c, $73, $51, 4
+  .byte $6c, $42, $33, 3
+  .byte $6c, $72, $36, 2
+  .byte $fc, $76, $55, 1
   .byte $fc, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $00, $71, $52, 416
-  .byte $20, $06, $25, 417
-  .byte $20, $14, $24, 418
+  .byte $00, $71, $52, 3
+  .byte $20, $06, $25, 2
+  .byte $20, $14, $24, 1
   .byte $20, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $4c, $75, $42, 420
+  .byte $4c, $75, $42, 1
   .byte $34, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $a8, $75, $66, 422
+  .byte $a8, $75, $66, 1
   .byte $cc, $72, $45, GEN_BOOK_CHAIN_END
-  .byte $88, $44, $33, 424
-  .byte $ac, $66, $56, 425
-  .byte $ac, $64, $54, 426
+  .byte $88, $44, $33, 3
+  .byte $ac, $66, $56, 2
+  .byte $ac, $64, $54, 1
   .byte $ac, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $10, $05, $16, 428
-  .byte $64, $23, $34, 429
+  .byte $10, $05, $16, 2
+  .byte $64, $23, $34, 1
   .byte $cc, $60, $40, GEN_BOOK_CHAIN_END
   .byte $80, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $cc, $75, $42, 432
-  .byte $cc, $66, $56, 433
-  .byte $cc, $76, $55, 434
-  .byte $30, $52, $44, 435
+  .byte $cc, $75, $42, 4
+  .byte $cc, $66, $56, 3
+  .byte $cc, $76, $55, 2
+  .byte $30, $52, $44, 1
   .byte $20, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $9c, $01, $22, 437
-  .byte $e0, $01, $22, 438
-  .byte $48, $66, $56, 439
-  .byte $48, $63, $43, 440
-  .byte $ac, $73, $63, 441
+  .byte $9c, $01, $22, 5
+  .byte $e0, $01, $22, 4
+  .byte $48, $66, $56, 3
+  .byte $48, $63, $43, 2
+  .byte $ac, $73, $63, 1
   .byte $ac, $65, $55, GEN_BOOK_CHAIN_END
-  .byte $b0, $13, $33, 443
-  .byte $b0, $12, $32, 444
-  .byte $88, $46, $55, 445
+  .byte $b0, $13, $33, 3
+  .byte $b0, $12, $32, 2
+  .byte $88, $46, $55, 1
   .byte $88, $46, $37, GEN_BOOK_CHAIN_END
-  .byte $d8, $62, $42, 447
-  .byte $d8, $66, $56, 448
-  .byte $d8, $72, $36, 449
-  .byte $00, $63, $43, 450
+  .byte $d8, $62, $42, 4
+  .byte $d8, $66, $56, 3
+  .byte $d8, $72, $36, 2
+  .byte $00, $63, $43, 1
   .byte $54, $34, $43, GEN_BOOK_CHAIN_END
   .byte $d4, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $40, $75, $66, 453
-  .byte $e0, $62, $42, 454
-  .byte $e0, $61, $51, 455
-  .byte $e0, $74, $77, 456
-  .byte $54, $66, $56, 457
-  .byte $54, $76, $55, 458
-  .byte $d8, $03, $21, 459
-  .byte $e8, $65, $55, 460
-  .byte $e8, $76, $55, 461
-  .byte $e8, $75, $64, 462
+  .byte $40, $75, $66, 10
+  .byte $e0, $62, $42, 9
+  .byte $e0, $61, $51, 8
+  .byte $e0, $74, $77, 7
+  .byte $54, $66, $56, 6
+  .byte $54, $76, $55, 5
+  .byte $d8, $03, $21, 4
+  .byte $e8, $65, $55, 3
+  .byte $e8, $76, $55, 2
+  .byte $e8, $75, $64, 1
   .byte $b4, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $e8, $71, $52, 464
-  .byte $e8, $43, $32, 465
-  .byte $14, $44, $35, 466
+  .byte $e8, $71, $52, 3
+  .byte $e8, $43, $32, 2
+  .byte $14, $44, $35, 1
   .byte $88, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $68, $05, $16, 468
-  .byte $68, $12, $22, 469
-  .byte $00, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $48, $13, $23, 471
-  .byte $74, $64, $54, 472
+  .byte $68, $05, $16, 1
+  .byte $68, $12, $22, GEN_BOOK_CHAIN_END
+  .byte $48, $13, $23, 2
+  .byte $74, $64, $54, 1
   .byte $74, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $64, $10, $20, 474
-  .byte $64, $01, $13, 475
+  .byte $64, $10, $20, 2
+  .byte $64, $01, $13, 1
   .byte $58, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $00, $75, $66, 477
-  .byte $40, $05, $16, 478
+  .byte $00, $75, $66, 2
+  .byte $40, $05, $16, 1
   .byte $64, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $d4, $43, $55, 480
+  .byte $d4, $43, $55, 1
   .byte $54, $40, $42, GEN_BOOK_CHAIN_END
-  .byte $dc, $06, $25, 482
-  .byte $dc, $01, $22, 483
-  .byte $40, $63, $43, 484
-  .byte $40, $74, $77, 485
+  .byte $dc, $06, $25, 4
+  .byte $dc, $01, $22, 3
+  .byte $40, $63, $43, 2
+  .byte $40, $74, $77, 1
   .byte $74, $34, $43, GEN_BOOK_CHAIN_END
-  .byte $7c, $63, $43, 487
-  .byte $7c, $66, $56, 488
-  .byte $00, $62, $42, 489
-  .byte $00, $74, $77, 490
-  .byte $3c, $64, $44, 491
+  .byte $7c, $63, $43, 5
+  .byte $7c, $66, $56, 4
+  .byte $00, $62, $42, 3
+  .byte $00, $74, $77, 2
+  .byte $3c, $64, $44, 1
   .byte $dc, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $54, $25, $13, 493
+  .byte $54, $25, $13, 1
   .byte $54, $25, $44, GEN_BOOK_CHAIN_END
-  .byte $b8, $05, $14, 495
-  .byte $b8, $12, $22, 496
-  .byte $b8, $01, $13, 497
-  .byte $6c, $41, $14, 498
-  .byte $6c, $03, $14, 499
+  .byte $b8, $05, $14, 5
+  .byte $b8, $12, $22, 4
+  .byte $b8, $01, $13, 3
+  .byte $6c, $41, $14, 2
+  .byte $6c, $03, $14, 1
   .byte $6c, $10, $30, GEN_BOOK_CHAIN_END
-  .byte $dc, $01, $13, 501
-  .byte $dc, $02, $13, 502
+  .byte $dc, $01, $13, 2
+  .byte $dc, $02, $13, 1
   .byte $7c, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $6c, $42, $33, 504
+  .byte $6c, $42, $33, 1
   .byte $6c, $63, $43, GEN_BOOK_CHAIN_END
   .byte $b8, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $8c, $16, $26, 507
-  .byte $94, $05, $16, 508
-  .byte $b4, $66, $56, 509
+  .byte $8c, $16, $26, 3
+  .byte $94, $05, $16, 2
+  .byte $b4, $66, $56, 1
   .byte $90, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $70, $76, $55, 511
-  .byte $70, $66, $56, 512
-  .byte $68, $67, $57, 513
-  .byte $ac, $05, $16, 514
-  .byte $3c, $74, $77, 515
+  .byte $70, $76, $55, 5
+  .byte $70, $66, $56, 4
+  .byte $68, $67, $57, 3
+  .byte $ac, $05, $16, 2
+  .byte $3c, $74, $77, 1
   .byte $78, $44, $33, GEN_BOOK_CHAIN_END
-  .byte $a0, $13, $33, 517
-  .byte $18, $75, $42, 518
-  .byte $e4, $11, $21, 519
-  .byte $e4, $04, $07, 520
+  .byte $a0, $13, $33, 4
+  .byte $18, $75, $42, 3
+  .byte $e4, $11, $21, 2
+  .byte $e4, $04, $07, 1
   .byte $e4, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $18, $14, $24, 522
+  .byte $18, $14, $24, 1
   .byte $48, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $78, $64, $44, 524
-  .byte $98, $75, $31, 525
-  .byte $98, $63, $43, 526
+  .byte $78, $64, $44, 3
+  .byte $98, $75, $31, 2
+  .byte $98, $63, $43, 1
   .byte $98, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $70, $14, $24, 528
-  .byte $70, $02, $11, 529
-  .byte $94, $04, $07, 530
-  .byte $94, $13, $33, 531
-  .byte $94, $12, $32, 532
-  .byte $8c, $06, $14, 533
-  .byte $40, $63, $53, 534
-  .byte $40, $61, $41, 535
+  .byte $70, $14, $24, 8
+  .byte $70, $02, $11, 7
+  .byte $94, $04, $07, 6
+  .byte $94, $13, $33, 5
+  .byte $94, $12, $32, 4
+  .byte $8c, $06, $14, 3
+  .byte $40, $63, $53, 2
+  .byte $40, $61, $41, 1
   .byte $40, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $fc, $05, $32, 537
-  .byte $fc, $06, $25, 538
-  .byte $fc, $05, $41, 539
-  .byte $94, $05, $16, 540
+  .byte $fc, $05, $32, 4
+  .byte $fc, $06, $25, 3
+  .byte $fc, $05, $41, 2
+  .byte $94, $05, $16, 1
   .byte $b0, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $f8, $76, $55, 542
-  .byte $e0, $15, $25, 543
-  .byte $e0, $16, $26, 544
-  .byte $fc, $02, $11, 545
+  .byte $f8, $76, $55, 4
+  .byte $e0, $15, $25, 3
+  .byte $e0, $16, $26, 2
+  .byte $fc, $02, $11, 1
   .byte $40, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $a4, $74, $77, 547
-  .byte $a4, $63, $53, 548
-  .byte $a4, $73, $64, 549
-  .byte $90, $75, $42, 550
-  .byte $e8, $16, $26, 551
-  .byte $e8, $02, $46, 552
+  .byte $a4, $74, $77, 6
+  .byte $a4, $63, $53, 5
+  .byte $a4, $73, $64, 4
+  .byte $90, $75, $42, 3
+  .byte $e8, $16, $26, 2
+  .byte $e8, $02, $46, 1
   .byte $e8, $23, $34, GEN_BOOK_CHAIN_END
-  .byte $e0, $62, $42, 554
-  .byte $e0, $75, $66, 555
-  .byte $fc, $75, $66, 556
+  .byte $e0, $62, $42, 3
+  .byte $e0, $75, $66, 2
+  .byte $fc, $75, $66, 1
   .byte $0c, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $94, $71, $52, 558
-  .byte $a0, $06, $25, 559
-  .byte $50, $25, $33, 560
-  .byte $20, $73, $40, 561
-  .byte $20, $64, $44, 562
+  .byte $94, $71, $52, 5
+  .byte $a0, $06, $25, 4
+  .byte $50, $25, $33, 3
+  .byte $20, $73, $40, 2
+  .byte $20, $64, $44, 1
   .byte $20, $66, $56, GEN_BOOK_CHAIN_END
   .byte $08, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $1c, $12, $22, 565
-  .byte $1c, $14, $24, 566
-  .byte $1c, $14, $34, 567
-  .byte $9c, $76, $55, 568
-  .byte $b4, $75, $64, 569
+  .byte $1c, $12, $22, 5
+  .byte $1c, $14, $24, 4
+  .byte $1c, $14, $34, 3
+  .byte $9c, $76, $55, 2
+  .byte $b4, $75, $64, 1
   .byte $b4, $67, $57, GEN_BOOK_CHAIN_END
-  .byte $cc, $64, $44, 571
-  .byte $cc, $76, $55, 572
-  .byte $0c, $63, $43, 573
+  .byte $cc, $64, $44, 3
+  .byte $cc, $76, $55, 2
+  .byte $0c, $63, $43, 1
   .byte $e0, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $94, $13, $33, 575
-  .byte $94, $06, $25, 576
+  .byte $94, $13, $33, 2
+  .byte $94, $06, $25, 1
   .byte $00, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $f4, $05, $16, 578
-  .byte $f4, $06, $25, 579
+  .byte $f4, $05, $16, 2
+  .byte $f4, $06, $25, 1
   .byte $44, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $b4, $35, $71, 581
-  .byte $84, $62, $52, 582
-  .byte $84, $63, $43, 583
-  .byte $84, $74, $77, 584
-  .byte $f4, $44, $33, 585
-  .byte $b8, $02, $13, 586
+  .byte $b4, $35, $71, 6
+  .byte $84, $62, $52, 5
+  .byte $84, $63, $43, 4
+  .byte $84, $74, $77, 3
+  .byte $f4, $44, $33, 2
+  .byte $b8, $02, $13, 1
   .byte $b8, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $40, $02, $35, 588
-  .byte $84, $74, $77, 589
-  .byte $94, $74, $77, 590
+  .byte $40, $02, $35, 3
+  .byte $84, $74, $77, 2
+  .byte $94, $74, $77, 1
   .byte $48, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $e4, $06, $25, 592
-  .byte $a8, $14, $24, 593
-  .byte $a8, $12, $22, 594
-  .byte $b4, $14, $24, 595
+  .byte $e4, $06, $25, 4
+  .byte $a8, $14, $24, 3
+  .byte $a8, $12, $22, 2
+  .byte $b4, $14, $24, 1
   .byte $b4, $16, $26, GEN_BOOK_CHAIN_END
   .byte $14, $73, $43, GEN_BOOK_CHAIN_END
-  .byte $ec, $05, $14, 598
-  .byte $ec, $06, $25, 599
-  .byte $ec, $12, $22, 600
-  .byte $b8, $63, $43, 601
-  .byte $18, $71, $52, 602
-  .byte $90, $75, $31, 603
-  .byte $84, $02, $11, 604
-  .byte $18, $62, $42, 605
-  .byte $18, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $94, $06, $25, 607
-  .byte $18, $63, $43, 608
-  .byte $7c, $76, $55, 609
+  .byte $ec, $05, $14, 5
+  .byte $ec, $06, $25, 4
+  .byte $ec, $12, $22, 3
+  .byte $b8, $63, $43, 2
+  .byte $90, $75, $31, 1
+  .byte $84, $02, $11, GEN_BOOK_CHAIN_END
+  .byte $94, $06, $25, 3
+  .byte $18, $63, $43, 2
+  .byte $7c, $76, $55, 1
   .byte $24, $05, $16, GEN_BOOK_CHAIN_END
   .byte $e8, $12, $22, GEN_BOOK_CHAIN_END
-  .byte $50, $66, $56, 612
-  .byte $50, $76, $55, 613
-  .byte $a8, $16, $26, 614
-  .byte $fc, $10, $20, 615
-  .byte $fc, $12, $32, 616
+  .byte $50, $66, $56, 5
+  .byte $50, $76, $55, 4
+  .byte $a8, $16, $26, 3
+  .byte $fc, $10, $20, 2
+  .byte $fc, $12, $32, 1
   .byte $fc, $05, $14, GEN_BOOK_CHAIN_END
-  .byte $14, $32, $43, 618
-  .byte $e4, $76, $55, 619
-  .byte $e4, $73, $43, 620
+  .byte $14, $32, $43, 3
+  .byte $e4, $76, $55, 2
+  .byte $e4, $73, $43, 1
   .byte $e4, $52, $43, GEN_BOOK_CHAIN_END
-  .byte $54, $75, $66, 622
+  .byte $54, $75, $66, 1
   .byte $54, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $20, $14, $24, 624
-  .byte $80, $12, $22, 625
-  .byte $d0, $32, $43, 626
-  .byte $48, $14, $24, 627
-  .byte $74, $64, $54, 628
-  .byte $54, $64, $54, 629
-  .byte $20, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $bc, $06, $25, 631
-  .byte $d0, $01, $22, 632
-  .byte $90, $62, $42, 633
+  .byte $80, $12, $22, 4
+  .byte $d0, $32, $43, 3
+  .byte $48, $14, $24, 2
+  .byte $74, $64, $54, 1
+  .byte $54, $64, $54, GEN_BOOK_CHAIN_END
+  .byte $bc, $06, $25, 3
+  .byte $d0, $01, $22, 2
+  .byte $90, $62, $42, 1
   .byte $90, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $3c, $05, $16, 635
-  .byte $3c, $12, $22, 636
-  .byte $a8, $71, $52, 637
+  .byte $3c, $05, $16, 3
+  .byte $3c, $12, $22, 2
+  .byte $a8, $71, $52, 1
   .byte $68, $06, $25, GEN_BOOK_CHAIN_END
   .byte $d4, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $24, $01, $22, 640
-  .byte $20, $06, $25, 641
-  .byte $24, $05, $16, 642
+  .byte $20, $06, $25, 1
   .byte $5c, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $a0, $16, $26, 644
-  .byte $a0, $13, $23, 645
-  .byte $a0, $14, $24, 646
-  .byte $00, $41, $52, 647
-  .byte $58, $12, $32, 648
-  .byte $e8, $66, $56, 649
-  .byte $e8, $64, $54, 650
+  .byte $a0, $16, $26, 7
+  .byte $a0, $13, $23, 6
+  .byte $a0, $14, $24, 5
+  .byte $00, $41, $52, 4
+  .byte $58, $12, $32, 3
+  .byte $e8, $66, $56, 2
+  .byte $e8, $64, $54, 1
   .byte $e8, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $1c, $34, $44, 652
-  .byte $1c, $01, $13, 653
-  .byte $1c, $34, $43, 654
-  .byte $88, $75, $53, 655
-  .byte $fc, $43, $34, 656
-  .byte $fc, $43, $33, 657
-  .byte $fc, $76, $64, 658
-  .byte $60, $64, $54, 659
-  .byte $60, $42, $33, 660
+  .byte $1c, $34, $44, 9
+  .byte $1c, $01, $13, 8
+  .byte $1c, $34, $43, 7
+  .byte $88, $75, $53, 6
+  .byte $fc, $43, $34, 5
+  .byte $fc, $43, $33, 4
+  .byte $fc, $76, $64, 3
+  .byte $60, $64, $54, 2
+  .byte $60, $42, $33, 1
   .byte $cc, $52, $44, GEN_BOOK_CHAIN_END
-  .byte $0c, $32, $43, 662
-  .byte $0c, $05, $16, 663
-  .byte $40, $76, $55, 664
-  .byte $40, $66, $56, 665
-  .byte $fc, $55, $43, 666
-  .byte $70, $05, $32, 667
-  .byte $98, $71, $52, 668
+  .byte $0c, $32, $43, 7
+  .byte $0c, $05, $16, 6
+  .byte $40, $76, $55, 5
+  .byte $40, $66, $56, 4
+  .byte $fc, $55, $43, 3
+  .byte $70, $05, $32, 2
+  .byte $98, $71, $52, 1
   .byte $c0, $67, $57, GEN_BOOK_CHAIN_END
-  .byte $00, $13, $33, 670
-  .byte $00, $05, $41, 671
-  .byte $00, $12, $32, 672
+  .byte $00, $13, $33, 3
+  .byte $00, $05, $41, 2
+  .byte $00, $12, $32, 1
   .byte $e0, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $a8, $05, $14, 674
-  .byte $20, $75, $66, 675
-  .byte $fc, $75, $66, 676
-  .byte $fc, $52, $33, GEN_BOOK_CHAIN_END
-  .byte $fc, $02, $35, 678
-  .byte $64, $06, $25, 679
-  .byte $64, $13, $23, 680
-  .byte $64, $11, $31, 681
-  .byte $f8, $35, $44, 682
-  .byte $78, $75, $53, 683
-  .byte $78, $42, $33, 684
+  .byte $a8, $05, $14, 1
+  .byte $20, $75, $66, GEN_BOOK_CHAIN_END
+  .byte $fc, $02, $35, 7
+  .byte $64, $06, $25, 6
+  .byte $64, $13, $23, 5
+  .byte $64, $11, $31, 4
+  .byte $f8, $35, $44, 3
+  .byte $78, $75, $53, 2
+  .byte $78, $42, $33, 1
   .byte $78, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $74, $75, $66, 686
-  .byte $28, $06, $25, 687
-  .byte $f4, $64, $44, 688
-  .byte $58, $34, $25, GEN_BOOK_CHAIN_END
-  .byte $c4, $05, $16, 690
-  .byte $e0, $75, $66, 691
-  .byte $28, $01, $22, 692
-  .byte $d4, $71, $52, 693
-  .byte $d4, $64, $54, 694
-  .byte $5c, $72, $54, 695
-  .byte $5c, $75, $42, 696
-  .byte $5c, $60, $40, 697
-  .byte $00, $75, $66, 698
+  .byte $74, $75, $66, 2
+  .byte $28, $06, $25, 1
+  .byte $f4, $64, $44, GEN_BOOK_CHAIN_END
+  .byte $c4, $05, $16, 9
+  .byte $e0, $75, $66, 8
+  .byte $28, $01, $22, 7
+  .byte $d4, $71, $52, 6
+  .byte $d4, $64, $54, 5
+  .byte $5c, $72, $54, 4
+  .byte $5c, $75, $42, 3
+  .byte $5c, $60, $40, 2
+  .byte $00, $75, $66, 1
   .byte $00, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $6c, $43, $33, 700
-  .byte $6c, $64, $54, 701
-  .byte $fc, $06, $25, 702
-  .byte $dc, $43, $51, 703
-  .byte $dc, $71, $52, 704
-  .byte $74, $75, $64, 705
+  .byte $6c, $43, $33, 6
+  .byte $6c, $64, $54, 5
+  .byte $fc, $06, $25, 4
+  .byte $dc, $43, $51, 3
+  .byte $dc, $71, $52, 2
+  .byte $74, $75, $64, 1
   .byte $74, $67, $57, GEN_BOOK_CHAIN_END
-  .byte $18, $13, $22, 707
-  .byte $18, $11, $22, 708
+  .byte $18, $13, $22, 2
+  .byte $18, $11, $22, 1
   .byte $80, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $00, $12, $32, 710
-  .byte $00, $06, $25, 711
-  .byte $00, $14, $34, 712
-  .byte $40, $05, $16, 713
-  .byte $34, $62, $42, 714
+  .byte $00, $12, $32, 5
+  .byte $00, $06, $25, 4
+  .byte $00, $14, $34, 3
+  .byte $40, $05, $16, 2
+  .byte $34, $62, $42, 1
   .byte $34, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $50, $74, $77, 716
-  .byte $50, $62, $42, 717
+  .byte $50, $74, $77, 2
+  .byte $50, $62, $42, 1
   .byte $28, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $70, $43, $33, 719
-  .byte $70, $64, $44, 720
-  .byte $84, $11, $22, 721
-  .byte $10, $71, $52, 722
+  .byte $70, $43, $33, 4
+  .byte $70, $64, $44, 3
+  .byte $84, $11, $22, 2
+  .byte $10, $71, $52, 1
   .byte $10, $65, $55, GEN_BOOK_CHAIN_END
   .byte $f8, $63, $43, GEN_BOOK_CHAIN_END
   .byte $ec, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $0c, $72, $45, 726
-  .byte $0c, $72, $36, 727
-  .byte $0c, $64, $44, 728
-  .byte $c8, $75, $66, 729
-  .byte $60, $76, $55, 730
-  .byte $8c, $75, $42, 731
-  .byte $68, $74, $77, 732
+  .byte $0c, $72, $45, 7
+  .byte $0c, $72, $36, 6
+  .byte $0c, $64, $44, 5
+  .byte $c8, $75, $66, 4
+  .byte $60, $76, $55, 3
+  .byte $8c, $75, $42, 2
+  .byte $68, $74, $77, 1
   .byte $68, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $34, $65, $55, 734
+  .byte $34, $65, $55, 1
   .byte $28, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $3c, $16, $26, 736
-  .byte $f0, $34, $23, 737
+  .byte $3c, $16, $26, 2
+  .byte $f0, $34, $23, 1
   .byte $bc, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $20, $14, $34, 739
-  .byte $20, $13, $23, 740
-  .byte $a8, $05, $16, 741
-  .byte $a8, $12, $22, 742
-  .byte $a8, $12, $32, 743
-  .byte $48, $05, $16, 744
-  .byte $48, $01, $22, 745
+  .byte $20, $14, $34, 7
+  .byte $20, $13, $23, 6
+  .byte $a8, $05, $16, 5
+  .byte $a8, $12, $22, 4
+  .byte $a8, $12, $32, 3
+  .byte $48, $05, $16, 2
+  .byte $48, $01, $22, 1
   .byte $bc, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $d8, $33, $44, 747
-  .byte $48, $64, $44, 748
+  .byte $d8, $33, $44, 2
+  .byte $48, $64, $44, 1
   .byte $2c, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $2c, $32, $43, 750
-  .byte $2c, $14, $24, 751
+  .byte $2c, $32, $43, 2
+  .byte $2c, $14, $24, 1
   .byte $dc, $55, $43, GEN_BOOK_CHAIN_END
   .byte $20, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $80, $06, $25, 754
+  .byte $80, $06, $25, 1
   .byte $14, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $04, $64, $44, 756
-  .byte $04, $63, $43, 757
-  .byte $f8, $06, $25, 758
-  .byte $f8, $15, $35, 759
-  .byte $b0, $11, $22, 760
+  .byte $04, $64, $44, 5
+  .byte $04, $63, $43, 4
+  .byte $f8, $06, $25, 3
+  .byte $f8, $15, $35, 2
+  .byte $b0, $11, $22, 1
   .byte $24, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $68, $06, $25, 762
-  .byte $a0, $64, $54, 763
+  .byte $68, $06, $25, 2
+  .byte $a0, $64, $54, 1
   .byte $f0, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $6c, $64, $54, 765
-  .byte $58, $75, $66, 766
-  .byte $58, $70, $71, 767
-  .byte $f8, $43, $33, 768
-  .byte $f8, $64, $54, 769
+  .byte $6c, $64, $54, 5
+  .byte $58, $75, $66, 4
+  .byte $58, $70, $71, 3
+  .byte $f8, $43, $33, 2
+  .byte $f8, $64, $54, 1
   .byte $28, $57, $45, GEN_BOOK_CHAIN_END
-  .byte $74, $04, $07, 771
-  .byte $74, $13, $23, 772
-  .byte $74, $11, $21, 773
-  .byte $88, $60, $50, 774
+  .byte $74, $04, $07, 4
+  .byte $74, $13, $23, 3
+  .byte $74, $11, $21, 2
+  .byte $88, $60, $50, 1
   .byte $88, $72, $63, GEN_BOOK_CHAIN_END
-  .byte $3c, $72, $36, 776
-  .byte $3c, $62, $42, 777
-  .byte $c4, $75, $66, 778
-  .byte $c4, $76, $55, 779
-  .byte $90, $06, $25, 780
-  .byte $24, $75, $42, 781
+  .byte $3c, $72, $36, 6
+  .byte $3c, $62, $42, 5
+  .byte $c4, $75, $66, 4
+  .byte $c4, $76, $55, 3
+  .byte $90, $06, $25, 2
+  .byte $24, $75, $42, 1
   .byte $04, $62, $42, GEN_BOOK_CHAIN_END
   .byte $c0, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $40, $44, $33, 784
-  .byte $40, $42, $33, 785
-  .byte $d4, $02, $11, 786
+  .byte $40, $44, $33, 3
+  .byte $40, $42, $33, 2
+  .byte $d4, $02, $11, 1
   .byte $28, $05, $41, GEN_BOOK_CHAIN_END
-  .byte $78, $72, $36, 788
+  .byte $78, $72, $36, 1
   .byte $78, $72, $45, GEN_BOOK_CHAIN_END
-  .byte $b0, $62, $42, 790
-  .byte $b0, $66, $56, 791
-  .byte $b0, $71, $52, 792
+  .byte $b0, $62, $42, 3
+  .byte $b0, $66, $56, 2
+  .byte $b0, $71, $52, 1
   .byte $88, $14, $34, GEN_BOOK_CHAIN_END
-  .byte $d0, $05, $16, 794
-  .byte $d0, $06, $25, 795
+  .byte $d0, $05, $16, 2
+  .byte $d0, $06, $25, 1
   .byte $28, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $80, $63, $43, 797
-  .byte $d8, $14, $34, 798
-  .byte $d8, $06, $25, 799
+  .byte $80, $63, $43, 3
+  .byte $d8, $14, $34, 2
+  .byte $d8, $06, $25, 1
   .byte $d8, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $98, $14, $34, 801
+  .byte $98, $14, $34, 1
   .byte $98, $46, $55, GEN_BOOK_CHAIN_END
-  .byte $4c, $14, $34, 803
-  .byte $4c, $06, $25, 804
-  .byte $4c, $15, $35, 805
+  .byte $4c, $14, $34, 3
+  .byte $4c, $06, $25, 2
+  .byte $4c, $15, $35, 1
   .byte $b8, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $2c, $62, $42, 807
-  .byte $2c, $66, $56, 808
-  .byte $2c, $72, $36, 809
-  .byte $78, $71, $52, 810
-  .byte $78, $63, $43, 811
-  .byte $78, $61, $51, 812
-  .byte $b8, $62, $52, 813
-  .byte $b8, $74, $77, 814
-  .byte $84, $34, $43, 815
+  .byte $2c, $62, $42, 9
+  .byte $2c, $66, $56, 8
+  .byte $2c, $72, $36, 7
+  .byte $78, $71, $52, 6
+  .byte $78, $63, $43, 5
+  .byte $78, $61, $51, 4
+  .byte $b8, $62, $52, 3
+  .byte $b8, $74, $77, 2
+  .byte $84, $34, $43, 1
   .byte $84, $05, $41, GEN_BOOK_CHAIN_END
   .byte $3c, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $dc, $63, $43, 818
-  .byte $dc, $66, $56, 819
-  .byte $04, $33, $44, 820
-  .byte $04, $05, $14, 821
-  .byte $04, $05, $41, 822
-  .byte $20, $02, $46, 823
-  .byte $20, $02, $35, 824
+  .byte $dc, $63, $43, 7
+  .byte $dc, $66, $56, 6
+  .byte $04, $33, $44, 5
+  .byte $04, $05, $14, 4
+  .byte $04, $05, $41, 3
+  .byte $20, $02, $46, 2
+  .byte $20, $02, $35, 1
   .byte $58, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $70, $62, $52, 826
-  .byte $70, $76, $55, 827
-  .byte $d4, $24, $33, 828
-  .byte $cc, $14, $24, 829
-  .byte $cc, $33, $42, 830
+  .byte $70, $62, $52, 5
+  .byte $70, $76, $55, 4
+  .byte $d4, $24, $33, 3
+  .byte $cc, $14, $24, 2
+  .byte $cc, $33, $42, 1
   .byte $cc, $10, $20, GEN_BOOK_CHAIN_END
-  .byte $54, $44, $34, 832
-  .byte $54, $63, $43, 833
-  .byte $54, $66, $56, 834
-  .byte $b0, $73, $63, 835
-  .byte $b0, $60, $40, 836
+  .byte $54, $44, $34, 5
+  .byte $54, $63, $43, 4
+  .byte $54, $66, $56, 3
+  .byte $b0, $73, $63, 2
+  .byte $b0, $60, $40, 1
   .byte $b0, $65, $45, GEN_BOOK_CHAIN_END
-  .byte $98, $72, $61, 838
-  .byte $58, $60, $40, 839
+  .byte $98, $72, $61, 2
+  .byte $58, $60, $40, 1
   .byte $e4, $73, $63, GEN_BOOK_CHAIN_END
   .byte $20, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $38, $54, $43, 842
-  .byte $b4, $75, $66, 843
+  .byte $38, $54, $43, 2
+  .byte $b4, $75, $66, 1
   .byte $b4, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $48, $22, $33, 845
-  .byte $c8, $75, $66, 846
-  .byte $c8, $63, $43, 847
-  .byte $c8, $61, $51, 848
-  .byte $f0, $64, $44, 849
-  .byte $f0, $66, $56, 850
-  .byte $f0, $63, $43, 851
-  .byte $dc, $63, $43, 852
-  .byte $dc, $74, $77, 853
-  .byte $cc, $05, $14, 854
-  .byte $f8, $73, $40, 855
+  .byte $48, $22, $33, 8
+  .byte $f0, $64, $44, 7
+  .byte $f0, $66, $56, 6
+  .byte $f0, $63, $43, 5
+  .byte $dc, $63, $43, 4
+  .byte $dc, $74, $77, 3
+  .byte $cc, $05, $14, 2
+  .byte $f8, $73, $40, 1
   .byte $1c, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $bc, $71, $52, 857
-  .byte $bc, $71, $63, 858
-  .byte $bc, $44, $34, 859
-  .byte $50, $75, $66, 860
-  .byte $50, $63, $43, 861
-  .byte $50, $76, $55, 862
+  .byte $bc, $71, $52, 6
+  .byte $bc, $71, $63, 5
+  .byte $bc, $44, $34, 4
+  .byte $50, $75, $66, 3
+  .byte $50, $63, $43, 2
+  .byte $50, $76, $55, 1
   .byte $64, $64, $55, GEN_BOOK_CHAIN_END
-  .byte $78, $06, $25, 864
-  .byte $78, $13, $33, 865
+  .byte $78, $06, $25, 2
+  .byte $78, $13, $33, 1
   .byte $78, $15, $35, GEN_BOOK_CHAIN_END
-  .byte $c0, $13, $33, 867
-  .byte $4c, $76, $55, 868
-  .byte $e0, $64, $54, 869
-  .byte $e0, $64, $44, 870
+  .byte $c0, $13, $33, 4
+  .byte $4c, $76, $55, 3
+  .byte $e0, $64, $54, 2
+  .byte $e0, $64, $44, 1
   .byte $e0, $73, $40, GEN_BOOK_CHAIN_END
-  .byte $f0, $14, $24, 872
-  .byte $f0, $16, $26, 873
-  .byte $f0, $12, $32, 874
+  .byte $f0, $14, $24, 3
+  .byte $f0, $16, $26, 2
+  .byte $f0, $12, $32, 1
   .byte $f8, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $90, $62, $42, 876
-  .byte $90, $66, $56, 877
-  .byte $90, $64, $44, 878
-  .byte $68, $64, $54, 879
-  .byte $68, $71, $52, 880
-  .byte $68, $73, $40, 881
+  .byte $90, $62, $42, 6
+  .byte $90, $66, $56, 5
+  .byte $90, $64, $44, 4
+  .byte $68, $64, $54, 3
+  .byte $68, $71, $52, 2
+  .byte $68, $73, $40, 1
   .byte $60, $51, $42, GEN_BOOK_CHAIN_END
-  .byte $7c, $01, $22, 883
-  .byte $7c, $16, $26, 884
-  .byte $98, $16, $26, 885
-  .byte $84, $62, $42, 886
-  .byte $84, $66, $56, 887
-  .byte $84, $72, $36, 888
-  .byte $24, $62, $52, 889
-  .byte $64, $04, $07, 890
-  .byte $64, $13, $33, 891
-  .byte $64, $13, $23, 892
+  .byte $7c, $01, $22, 10
+  .byte $7c, $16, $26, 9
+  .byte $98, $16, $26, 8
+  .byte $84, $62, $42, 7
+  .byte $84, $66, $56, 6
+  .byte $84, $72, $36, 5
+  .byte $24, $62, $52, 4
+  .byte $64, $04, $07, 3
+  .byte $64, $13, $33, 2
+  .byte $64, $13, $23, 1
   .byte $fc, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $7c, $16, $26, 894
-  .byte $7c, $01, $13, 895
-  .byte $e0, $02, $46, 896
-  .byte $e0, $06, $25, 897
-  .byte $10, $43, $33, 898
-  .byte $10, $64, $54, 899
-  .byte $10, $71, $52, 900
+  .byte $7c, $16, $26, 7
+  .byte $7c, $01, $13, 6
+  .byte $e0, $02, $46, 5
+  .byte $e0, $06, $25, 4
+  .byte $10, $43, $33, 3
+  .byte $10, $64, $54, 2
+  .byte $10, $71, $52, 1
   .byte $48, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $c4, $06, $25, 902
-  .byte $7c, $36, $25, 903
-  .byte $a8, $64, $54, 904
-  .byte $a8, $76, $55, 905
-  .byte $a8, $42, $33, 906
+  .byte $c4, $06, $25, 5
+  .byte $7c, $36, $25, 4
+  .byte $a8, $64, $54, 3
+  .byte $a8, $76, $55, 2
+  .byte $a8, $42, $33, 1
   .byte $10, $44, $33, GEN_BOOK_CHAIN_END
   .byte $90, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $7c, $05, $16, 909
+  .byte $7c, $05, $16, 1
   .byte $0c, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $80, $14, $34, 911
-  .byte $80, $13, $33, 912
-  .byte $9c, $02, $11, 913
-  .byte $9c, $12, $32, 914
+  .byte $80, $14, $34, 4
+  .byte $80, $13, $33, 3
+  .byte $9c, $02, $11, 2
+  .byte $9c, $12, $32, 1
   .byte $9c, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $9c, $75, $66, 916
-  .byte $9c, $62, $42, 917
+  .byte $9c, $75, $66, 2
+  .byte $9c, $62, $42, 1
   .byte $08, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $08, $13, $33, 919
-  .byte $e8, $63, $43, 920
-  .byte $78, $16, $26, 921
-  .byte $08, $75, $66, 922
-  .byte $08, $43, $33, 923
-  .byte $e4, $72, $45, 924
+  .byte $e8, $63, $43, 3
+  .byte $78, $16, $26, 2
+  .byte $e4, $72, $45, 1
   .byte $e4, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $60, $34, $43, 926
+  .byte $60, $34, $43, 1
   .byte $1c, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $ec, $25, $33, 928
+  .byte $ec, $25, $33, 1
   .byte $e0, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $f4, $62, $42, 930
-  .byte $64, $64, $55, 931
-  .byte $f4, $75, $64, GEN_BOOK_CHAIN_END
+  .byte $64, $64, $55, GEN_BOOK_CHAIN_END
   .byte $c0, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $48, $06, $25, 934
-  .byte $48, $01, $22, 935
-  .byte $48, $13, $23, 936
-  .byte $f4, $76, $55, 937
+  .byte $48, $06, $25, 4
+  .byte $48, $01, $22, 3
+  .byte $48, $13, $23, 2
+  .byte $f4, $76, $55, 1
   .byte $e0, $34, $43, GEN_BOOK_CHAIN_END
-  .byte $ec, $62, $42, 939
-  .byte $ec, $74, $77, 940
+  .byte $ec, $62, $42, 2
+  .byte $ec, $74, $77, 1
   .byte $ec, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $94, $12, $22, 942
-  .byte $44, $72, $61, 943
-  .byte $dc, $04, $07, 944
-  .byte $dc, $13, $33, 945
-  .byte $dc, $12, $32, 946
+  .byte $94, $12, $22, 5
+  .byte $44, $72, $61, 4
+  .byte $dc, $04, $07, 3
+  .byte $dc, $13, $33, 2
+  .byte $dc, $12, $32, 1
   .byte $5c, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $7c, $75, $66, 948
+  .byte $7c, $75, $66, 1
   .byte $7c, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $88, $75, $66, 950
-  .byte $b0, $76, $55, 951
-  .byte $b0, $71, $52, 952
-  .byte $28, $75, $66, 953
-  .byte $a4, $75, $53, 954
-  .byte $28, $60, $50, 955
-  .byte $28, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $a8, $16, $26, 957
-  .byte $a8, $14, $34, 958
-  .byte $a8, $12, $22, 959
-  .byte $68, $76, $55, 960
-  .byte $4c, $76, $55, 961
+  .byte $88, $75, $66, 3
+  .byte $b0, $76, $55, 2
+  .byte $b0, $71, $52, 1
+  .byte $a4, $75, $53, GEN_BOOK_CHAIN_END
+  .byte $a8, $16, $26, 5
+  .byte $a8, $14, $34, 4
+  .byte $a8, $12, $22, 3
+  .byte $68, $76, $55, 2
+  .byte $4c, $76, $55, 1
   .byte $24, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $fc, $64, $54, 963
-  .byte $fc, $62, $42, 964
-  .byte $f4, $01, $22, 965
-  .byte $f4, $05, $32, 966
-  .byte $88, $05, $14, 967
-  .byte $88, $33, $42, 968
+  .byte $fc, $64, $54, 6
+  .byte $fc, $62, $42, 5
+  .byte $f4, $01, $22, 4
+  .byte $f4, $05, $32, 3
+  .byte $88, $05, $14, 2
+  .byte $88, $33, $42, 1
   .byte $88, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $b8, $63, $43, 970
-  .byte $b8, $64, $44, 971
-  .byte $b8, $62, $42, 972
-  .byte $20, $32, $43, 973
-  .byte $d0, $55, $43, 974
+  .byte $b8, $63, $43, 5
+  .byte $b8, $64, $44, 4
+  .byte $b8, $62, $42, 3
+  .byte $20, $32, $43, 2
+  .byte $d0, $55, $43, 1
   .byte $10, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $3c, $04, $07, 976
-  .byte $3c, $13, $33, 977
-  .byte $3c, $12, $32, 978
+  .byte $3c, $04, $07, 3
+  .byte $3c, $13, $33, 2
+  .byte $3c, $12, $32, 1
   .byte $dc, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $b8, $76, $55, 980
-  .byte $90, $06, $25, 981
-  .byte $90, $12, $22, 982
-  .byte $90, $12, $32, 983
-  .byte $a8, $71, $52, 984
-  .byte $78, $44, $33, 985
+  .byte $b8, $76, $55, 6
+  .byte $90, $06, $25, 5
+  .byte $90, $12, $22, 4
+  .byte $90, $12, $32, 3
+  .byte $a8, $71, $52, 2
+  .byte $78, $44, $33, 1
   .byte $78, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $24, $63, $43, 987
-  .byte $24, $66, $56, 988
-  .byte $24, $64, $44, 989
+  .byte $24, $63, $43, 3
+  .byte $24, $66, $56, 2
+  .byte $24, $64, $44, 1
   .byte $34, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $e4, $42, $33, 991
-  .byte $98, $71, $52, 992
-  .byte $10, $33, $42, 993
-  .byte $c8, $16, $26, 994
-  .byte $c8, $13, $33, 995
-  .byte $20, $71, $52, 996
-  .byte $44, $42, $33, 997
+  .byte $e4, $42, $33, 7
+  .byte $98, $71, $52, 6
+  .byte $10, $33, $42, 5
+  .byte $c8, $16, $26, 4
+  .byte $c8, $13, $33, 3
+  .byte $20, $71, $52, 2
+  .byte $44, $42, $33, 1
   .byte $44, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $10, $12, $32, 999
-  .byte $10, $06, $25, 1000
-  .byte $10, $10, $20, 1001
-  .byte $cc, $36, $47, 1002
+  .byte $10, $12, $32, 4
+  .byte $10, $06, $25, 3
+  .byte $10, $10, $20, 2
+  .byte $cc, $36, $47, 1
   .byte $fc, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $dc, $63, $43, 1004
-  .byte $dc, $71, $52, 1005
-  .byte $5c, $76, $55, 1006
-  .byte $5c, $73, $43, 1007
-  .byte $c8, $72, $61, 1008
-  .byte $10, $72, $36, 1009
+  .byte $dc, $63, $43, 6
+  .byte $dc, $71, $52, 5
+  .byte $5c, $76, $55, 4
+  .byte $5c, $73, $43, 3
+  .byte $c8, $72, $61, 2
+  .byte $10, $72, $36, 1
   .byte $10, $72, $54, GEN_BOOK_CHAIN_END
-  .byte $88, $05, $16, 1011
-  .byte $88, $12, $22, 1012
-  .byte $70, $14, $34, 1013
-  .byte $5c, $74, $77, 1014
-  .byte $60, $75, $53, 1015
-  .byte $60, $63, $53, 1016
+  .byte $88, $05, $16, 6
+  .byte $88, $12, $22, 5
+  .byte $70, $14, $34, 4
+  .byte $5c, $74, $77, 3
+  .byte $60, $75, $53, 2
+  .byte $60, $63, $53, 1
   .byte $60, $73, $64, GEN_BOOK_CHAIN_END
-  .byte $08, $75, $66, 1018
-  .byte $a4, $71, $52, 1019
+  .byte $08, $75, $66, 2
+  .byte $a4, $71, $52, 1
   .byte $78, $52, $33, GEN_BOOK_CHAIN_END
-  .byte $b0, $71, $52, 1021
-  .byte $80, $02, $20, 1022
-  .byte $80, $02, $11, 1023
-  .byte $80, $05, $41, 1024
+  .byte $b0, $71, $52, 4
+  .byte $80, $02, $20, 3
+  .byte $80, $02, $11, 2
+  .byte $80, $05, $41, 1
   .byte $98, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $78, $72, $61, 1026
-  .byte $6c, $06, $25, 1027
-  .byte $6c, $16, $26, 1028
-  .byte $6c, $14, $34, 1029
-  .byte $94, $72, $61, 1030
-  .byte $40, $05, $16, 1031
+  .byte $78, $72, $61, 6
+  .byte $6c, $06, $25, 5
+  .byte $6c, $16, $26, 4
+  .byte $6c, $14, $34, 3
+  .byte $94, $72, $61, 2
+  .byte $40, $05, $16, 1
   .byte $1c, $25, $33, GEN_BOOK_CHAIN_END
-  .byte $f4, $43, $32, 1033
-  .byte $3c, $44, $33, 1034
-  .byte $3c, $44, $34, 1035
+  .byte $f4, $43, $32, 3
+  .byte $3c, $44, $33, 2
+  .byte $3c, $44, $34, 1
   .byte $1c, $67, $57, GEN_BOOK_CHAIN_END
   .byte $c0, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $80, $76, $55, 1038
-  .byte $5c, $42, $33, 1039
+  .byte $80, $76, $55, 2
+  .byte $5c, $42, $33, 1
   .byte $5c, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $10, $66, $56, 1041
-  .byte $10, $62, $42, 1042
-  .byte $f0, $12, $32, 1043
-  .byte $f0, $06, $25, 1044
-  .byte $f0, $13, $23, 1045
+  .byte $10, $66, $56, 5
+  .byte $10, $62, $42, 4
+  .byte $f0, $12, $32, 3
+  .byte $f0, $06, $25, 2
+  .byte $f0, $13, $23, 1
   .byte $c0, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $a0, $44, $33, 1047
-  .byte $84, $66, $56, 1048
-  .byte $84, $71, $52, 1049
+  .byte $a0, $44, $33, 3
+  .byte $84, $66, $56, 2
+  .byte $84, $71, $52, 1
   .byte $28, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $64, $06, $25, 1051
-  .byte $64, $14, $34, 1052
-  .byte $64, $14, $24, 1053
-  .byte $ec, $23, $34, 1054
+  .byte $64, $06, $25, 4
+  .byte $64, $14, $34, 3
+  .byte $64, $14, $24, 2
+  .byte $ec, $23, $34, 1
   .byte $e8, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $fc, $64, $54, 1056
-  .byte $fc, $71, $50, 1057
-  .byte $fc, $73, $40, 1058
-  .byte $50, $71, $52, 1059
-  .byte $f0, $74, $77, 1060
-  .byte $1c, $36, $47, 1061
-  .byte $74, $74, $77, 1062
-  .byte $74, $62, $42, 1063
-  .byte $14, $74, $77, 1064
+  .byte $fc, $64, $54, 9
+  .byte $fc, $71, $50, 8
+  .byte $fc, $73, $40, 7
+  .byte $50, $71, $52, 6
+  .byte $f0, $74, $77, 5
+  .byte $1c, $36, $47, 4
+  .byte $74, $74, $77, 3
+  .byte $74, $62, $42, 2
+  .byte $14, $74, $77, 1
   .byte $14, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $08, $36, $47, 1066
-  .byte $78, $01, $13, 1067
+  .byte $08, $36, $47, 2
+  .byte $78, $01, $13, 1
   .byte $78, $02, $13, GEN_BOOK_CHAIN_END
-  .byte $84, $71, $52, 1069
-  .byte $ec, $25, $33, 1070
+  .byte $84, $71, $52, 2
+  .byte $ec, $25, $33, 1
   .byte $34, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $98, $62, $42, 1072
-  .byte $98, $66, $56, 1073
-  .byte $98, $63, $43, 1074
-  .byte $88, $63, $43, 1075
-  .byte $c0, $05, $23, 1076
+  .byte $98, $62, $42, 5
+  .byte $98, $66, $56, 4
+  .byte $98, $63, $43, 3
+  .byte $88, $63, $43, 2
+  .byte $c0, $05, $23, 1
   .byte $48, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $0c, $71, $52, 1078
-  .byte $0c, $66, $56, 1079
-  .byte $0c, $63, $43, 1080
+  .byte $0c, $71, $52, 3
+  .byte $0c, $66, $56, 2
+  .byte $0c, $63, $43, 1
   .byte $a8, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $ad, $42, $33, 1082
-  .byte $ad, $71, $52, 1083
-  .byte $29, $12, $32, 1084
+  .byte $ad, $42, $33, 3
+  .byte $ad, $71, $52, 2
+  .byte $29, $12, $32, 1
   .byte $b5, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $99, $75, $64, 1086
-  .byte $99, $71, $52, 1087
-  .byte $99, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $7d, $13, $23, 1089
-  .byte $7d, $14, $24, 1090
-  .byte $7d, $01, $22, 1091
-  .byte $f5, $76, $55, 1092
-  .byte $f5, $71, $52, 1093
+  .byte $7d, $13, $23, 5
+  .byte $7d, $14, $24, 4
+  .byte $7d, $01, $22, 3
+  .byte $f5, $76, $55, 2
+  .byte $f5, $71, $52, 1
   .byte $09, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $a9, $06, $25, 1095
-  .byte $8d, $63, $43, 1096
-  .byte $8d, $75, $31, 1097
-  .byte $8d, $66, $56, 1098
-  .byte $e9, $03, $02, 1099
-  .byte $09, $05, $16, 1100
+  .byte $a9, $06, $25, 6
+  .byte $8d, $63, $43, 5
+  .byte $8d, $75, $31, 4
+  .byte $8d, $66, $56, 3
+  .byte $e9, $03, $02, 2
+  .byte $09, $05, $16, 1
   .byte $09, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $99, $25, $44, 1102
-  .byte $99, $05, $32, 1103
-  .byte $99, $05, $14, 1104
-  .byte $85, $04, $07, 1105
-  .byte $85, $13, $33, 1106
-  .byte $85, $12, $32, 1107
-  .byte $7d, $72, $63, 1108
+  .byte $99, $25, $44, 7
+  .byte $99, $05, $32, 6
+  .byte $99, $05, $14, 5
+  .byte $85, $04, $07, 4
+  .byte $85, $13, $33, 3
+  .byte $85, $12, $32, 2
+  .byte $7d, $72, $63, 1
   .byte $7d, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $61, $13, $23, 1110
-  .byte $cd, $16, $26, 1111
-  .byte $cd, $13, $23, 1112
+  .byte $61, $13, $23, 3
+  .byte $cd, $16, $26, 2
+  .byte $cd, $13, $23, 1
   .byte $4d, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $69, $14, $24, 1114
-  .byte $71, $05, $14, 1115
-  .byte $95, $02, $24, 1116
-  .byte $95, $16, $26, 1117
-  .byte $31, $05, $16, 1118
-  .byte $09, $72, $45, 1119
+  .byte $69, $14, $24, 6
+  .byte $71, $05, $14, 5
+  .byte $95, $02, $24, 4
+  .byte $95, $16, $26, 3
+  .byte $31, $05, $16, 2
+  .byte $09, $72, $45, 1
   .byte $09, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $b1, $74, $77, 1121
-  .byte $b1, $31, $22, 1122
+  .byte $b1, $74, $77, 2
+  .byte $b1, $31, $22, 1
   .byte $b1, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $b5, $62, $42, 1124
-  .byte $e1, $63, $43, 1125
-  .byte $e1, $71, $52, 1126
+  .byte $b5, $62, $42, 3
+  .byte $e1, $63, $43, 2
+  .byte $e1, $71, $52, 1
   .byte $e1, $64, $44, GEN_BOOK_CHAIN_END
   .byte $c1, $05, $16, GEN_BOOK_CHAIN_END
   .byte $d5, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $c9, $01, $22, 1130
-  .byte $c9, $13, $33, 1131
-  .byte $85, $52, $44, 1132
-  .byte $c5, $73, $46, 1133
-  .byte $c5, $60, $50, 1134
+  .byte $c9, $01, $22, 5
+  .byte $c9, $13, $33, 4
+  .byte $85, $52, $44, 3
+  .byte $c5, $73, $46, 2
+  .byte $c5, $60, $50, 1
   .byte $c5, $72, $63, GEN_BOOK_CHAIN_END
-  .byte $59, $12, $22, 1136
-  .byte $59, $06, $25, 1137
-  .byte $59, $14, $34, 1138
+  .byte $59, $12, $22, 3
+  .byte $59, $06, $25, 2
+  .byte $59, $14, $34, 1
   .byte $c1, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $d1, $75, $66, 1140
-  .byte $e5, $05, $16, 1141
-  .byte $e5, $06, $25, 1142
-  .byte $39, $06, $25, 1143
+  .byte $d1, $75, $66, 4
+  .byte $e5, $05, $16, 3
+  .byte $e5, $06, $25, 2
+  .byte $39, $06, $25, 1
   .byte $e9, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $49, $43, $34, 1145
-  .byte $e1, $63, $53, 1146
+  .byte $49, $43, $34, 2
+  .byte $e1, $63, $53, 1
   .byte $e1, $44, $33, GEN_BOOK_CHAIN_END
-  .byte $a5, $72, $36, 1148
-  .byte $a5, $73, $51, 1149
-  .byte $a5, $64, $54, 1150
-  .byte $95, $42, $33, 1151
+  .byte $a5, $72, $36, 4
+  .byte $a5, $73, $51, 3
+  .byte $a5, $64, $54, 2
+  .byte $95, $42, $33, 1
   .byte $95, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $51, $75, $66, 1153
-  .byte $f5, $13, $33, 1154
-  .byte $f5, $12, $32, 1155
-  .byte $09, $16, $26, 1156
-  .byte $09, $13, $23, 1157
-  .byte $09, $14, $24, 1158
-  .byte $75, $16, $26, 1159
-  .byte $25, $63, $43, 1160
-  .byte $25, $75, $31, 1161
+  .byte $51, $75, $66, 9
+  .byte $f5, $13, $33, 8
+  .byte $f5, $12, $32, 7
+  .byte $09, $16, $26, 6
+  .byte $09, $13, $23, 5
+  .byte $09, $14, $24, 4
+  .byte $75, $16, $26, 3
+  .byte $25, $63, $43, 2
+  .byte $25, $75, $31, 1
   .byte $21, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $85, $74, $77, 1163
-  .byte $85, $31, $22, 1164
-  .byte $85, $62, $52, 1165
+  .byte $85, $74, $77, 3
+  .byte $85, $31, $22, 2
+  .byte $85, $62, $52, 1
   .byte $b9, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $81, $06, $25, 1167
-  .byte $fd, $05, $14, 1168
-  .byte $fd, $06, $25, 1169
-  .byte $fd, $12, $22, 1170
-  .byte $19, $05, $16, 1171
-  .byte $ad, $14, $24, 1172
-  .byte $29, $05, $41, 1173
-  .byte $29, $16, $26, 1174
+  .byte $81, $06, $25, 8
+  .byte $fd, $05, $14, 7
+  .byte $fd, $06, $25, 6
+  .byte $fd, $12, $22, 5
+  .byte $19, $05, $16, 4
+  .byte $ad, $14, $24, 3
+  .byte $29, $05, $41, 2
+  .byte $29, $16, $26, 1
   .byte $29, $05, $32, GEN_BOOK_CHAIN_END
   .byte $71, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $19, $74, $77, 1177
-  .byte $19, $31, $22, 1178
-  .byte $19, $62, $52, 1179
-  .byte $45, $05, $41, 1180
-  .byte $45, $13, $33, 1181
+  .byte $19, $74, $77, 5
+  .byte $19, $31, $22, 4
+  .byte $19, $62, $52, 3
+  .byte $45, $05, $41, 2
+  .byte $45, $13, $33, 1
   .byte $45, $05, $32, GEN_BOOK_CHAIN_END
-  .byte $d9, $13, $23, 1183
-  .byte $b9, $63, $43, 1184
+  .byte $d9, $13, $23, 2
+  .byte $b9, $63, $43, 1
   .byte $99, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $49, $71, $52, 1186
-  .byte $49, $76, $55, 1187
-  .byte $49, $66, $56, 1188
-  .byte $f1, $75, $66, 1189
-  .byte $bd, $10, $20, 1190
-  .byte $bd, $06, $14, 1191
-  .byte $39, $14, $24, 1192
+  .byte $49, $71, $52, 7
+  .byte $49, $76, $55, 6
+  .byte $49, $66, $56, 5
+  .byte $f1, $75, $66, 4
+  .byte $bd, $10, $20, 3
+  .byte $bd, $06, $14, 2
+  .byte $39, $14, $24, 1
   .byte $c1, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $5d, $43, $33, 1194
-  .byte $25, $14, $24, 1195
-  .byte $25, $16, $26, 1196
-  .byte $25, $10, $20, 1197
-  .byte $f9, $64, $44, 1198
-  .byte $f9, $66, $56, 1199
+  .byte $5d, $43, $33, 6
+  .byte $25, $14, $24, 5
+  .byte $25, $16, $26, 4
+  .byte $25, $10, $20, 3
+  .byte $f9, $64, $44, 2
+  .byte $f9, $66, $56, 1
   .byte $f9, $72, $36, GEN_BOOK_CHAIN_END
   .byte $3d, $14, $34, GEN_BOOK_CHAIN_END
-  .byte $a9, $06, $25, 1202
-  .byte $a9, $01, $22, 1203
-  .byte $a9, $16, $26, 1204
-  .byte $d1, $64, $44, 1205
-  .byte $2d, $76, $55, 1206
-  .byte $2d, $76, $57, 1207
-  .byte $49, $75, $74, 1208
-  .byte $49, $62, $52, 1209
+  .byte $a9, $06, $25, 8
+  .byte $a9, $01, $22, 7
+  .byte $a9, $16, $26, 6
+  .byte $d1, $64, $44, 5
+  .byte $2d, $76, $55, 4
+  .byte $2d, $76, $57, 3
+  .byte $49, $75, $74, 2
+  .byte $49, $62, $52, 1
   .byte $49, $31, $22, GEN_BOOK_CHAIN_END
   .byte $a5, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $c1, $71, $52, 1212
-  .byte $c1, $76, $55, 1213
-  .byte $c1, $66, $56, 1214
-  .byte $f1, $65, $45, 1215
-  .byte $f1, $52, $64, 1216
-  .byte $f1, $76, $55, 1217
-  .byte $dd, $73, $55, 1218
+  .byte $c1, $71, $52, 7
+  .byte $c1, $76, $55, 6
+  .byte $c1, $66, $56, 5
+  .byte $f1, $65, $45, 4
+  .byte $f1, $52, $64, 3
+  .byte $f1, $76, $55, 2
+  .byte $dd, $73, $55, 1
   .byte $3d, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $b1, $16, $26, 1220
-  .byte $b1, $06, $25, 1221
-  .byte $a5, $75, $66, 1222
+  .byte $b1, $16, $26, 3
+  .byte $b1, $06, $25, 2
+  .byte $a5, $75, $66, 1
   .byte $71, $72, $45, GEN_BOOK_CHAIN_END
-  .byte $19, $71, $52, 1224
-  .byte $0d, $64, $54, 1225
+  .byte $19, $71, $52, 2
+  .byte $0d, $64, $54, 1
   .byte $2d, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $ad, $64, $54, 1227
-  .byte $0d, $05, $16, 1228
+  .byte $ad, $64, $54, 2
+  .byte $0d, $05, $16, 1
   .byte $05, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $e9, $71, $52, 1230
+  .byte $e9, $71, $52, 1
   .byte $e9, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $7d, $62, $42, 1232
-  .byte $7d, $63, $53, 1233
+  .byte $7d, $62, $42, 2
+  .byte $7d, $63, $53, 1
   .byte $7d, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $fd, $01, $13, 1235
-  .byte $2d, $72, $61, 1236
+  .byte $fd, $01, $13, 2
+  .byte $2d, $72, $61, 1
   .byte $cd, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $75, $63, $43, 1238
-  .byte $19, $75, $42, 1239
-  .byte $a1, $60, $50, 1240
-  .byte $a1, $76, $55, 1241
-  .byte $a1, $72, $36, 1242
+  .byte $75, $63, $43, 5
+  .byte $19, $75, $42, 4
+  .byte $a1, $60, $50, 3
+  .byte $a1, $76, $55, 2
+  .byte $a1, $72, $36, 1
   .byte $d5, $60, $40, GEN_BOOK_CHAIN_END
-  .byte $55, $44, $34, 1244
-  .byte $55, $44, $33, 1245
-  .byte $55, $76, $64, 1246
+  .byte $55, $44, $34, 3
+  .byte $55, $44, $33, 2
+  .byte $55, $76, $64, 1
   .byte $01, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $75, $71, $52, 1248
-  .byte $75, $76, $55, 1249
-  .byte $75, $66, $56, 1250
-  .byte $79, $06, $25, 1251
-  .byte $79, $01, $22, 1252
+  .byte $75, $71, $52, 5
+  .byte $75, $76, $55, 4
+  .byte $75, $66, $56, 3
+  .byte $79, $06, $25, 2
+  .byte $79, $01, $22, 1
   .byte $79, $12, $22, GEN_BOOK_CHAIN_END
-  .byte $b9, $04, $07, 1254
-  .byte $3d, $66, $56, 1255
+  .byte $b9, $04, $07, 2
+  .byte $3d, $66, $56, 1
   .byte $3d, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $ad, $06, $25, 1257
-  .byte $ad, $13, $33, 1258
-  .byte $ad, $14, $24, 1259
-  .byte $09, $01, $22, 1260
-  .byte $a9, $62, $42, 1261
-  .byte $a9, $66, $56, 1262
-  .byte $8d, $32, $43, 1263
+  .byte $ad, $06, $25, 7
+  .byte $ad, $13, $33, 6
+  .byte $ad, $14, $24, 5
+  .byte $09, $01, $22, 4
+  .byte $a9, $62, $42, 3
+  .byte $a9, $66, $56, 2
+  .byte $8d, $32, $43, 1
   .byte $81, $25, $33, GEN_BOOK_CHAIN_END
-  .byte $61, $32, $43, 1265
+  .byte $61, $32, $43, 1
   .byte $e5, $75, $66, GEN_BOOK_CHAIN_END
   .byte $8d, $24, $33, GEN_BOOK_CHAIN_END
-  .byte $39, $76, $55, 1268
+  .byte $39, $76, $55, 1
   .byte $39, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $81, $13, $23, 1270
-  .byte $e9, $13, $23, 1271
+  .byte $81, $13, $23, 2
+  .byte $e9, $13, $23, 1
   .byte $e9, $04, $07, GEN_BOOK_CHAIN_END
-  .byte $2d, $64, $54, 1273
-  .byte $2d, $76, $55, 1274
-  .byte $a5, $13, $33, 1275
-  .byte $b1, $14, $24, 1276
-  .byte $ad, $13, $33, 1277
-  .byte $ad, $05, $14, 1278
-  .byte $95, $44, $33, 1279
+  .byte $2d, $64, $54, 7
+  .byte $2d, $76, $55, 6
+  .byte $a5, $13, $33, 5
+  .byte $b1, $14, $24, 4
+  .byte $ad, $13, $33, 3
+  .byte $ad, $05, $14, 2
+  .byte $95, $44, $33, 1
   .byte $95, $75, $31, GEN_BOOK_CHAIN_END
-  .byte $c1, $43, $33, 1281
+  .byte $c1, $43, $33, 1
   .byte $c1, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $9d, $05, $23, 1283
+  .byte $9d, $05, $23, 1
   .byte $cd, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $19, $06, $25, 1285
+  .byte $19, $06, $25, 1
   .byte $09, $55, $34, GEN_BOOK_CHAIN_END
-  .byte $d9, $25, $44, 1287
-  .byte $d9, $14, $24, 1288
-  .byte $d9, $13, $33, 1289
-  .byte $49, $16, $26, 1290
-  .byte $49, $13, $33, 1291
-  .byte $55, $02, $11, 1292
+  .byte $d9, $25, $44, 6
+  .byte $d9, $14, $24, 5
+  .byte $d9, $13, $33, 4
+  .byte $49, $16, $26, 3
+  .byte $49, $13, $33, 2
+  .byte $55, $02, $11, 1
   .byte $61, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $c9, $71, $52, 1294
-  .byte $3d, $32, $43, 1295
-  .byte $3d, $14, $24, 1296
-  .byte $45, $05, $16, 1297
-  .byte $45, $13, $23, 1298
-  .byte $a5, $34, $23, 1299
+  .byte $c9, $71, $52, 6
+  .byte $3d, $32, $43, 5
+  .byte $3d, $14, $24, 4
+  .byte $45, $05, $16, 3
+  .byte $45, $13, $23, 2
+  .byte $a5, $34, $23, 1
   .byte $a5, $65, $45, GEN_BOOK_CHAIN_END
-  .byte $19, $75, $66, 1301
-  .byte $19, $76, $55, 1302
-  .byte $dd, $76, $55, 1303
-  .byte $dd, $71, $52, 1304
-  .byte $dd, $66, $56, 1305
-  .byte $f5, $02, $46, 1306
-  .byte $95, $05, $23, 1307
-  .byte $95, $01, $13, 1308
+  .byte $19, $75, $66, 8
+  .byte $19, $76, $55, 7
+  .byte $dd, $76, $55, 6
+  .byte $dd, $71, $52, 5
+  .byte $dd, $66, $56, 4
+  .byte $f5, $02, $46, 3
+  .byte $95, $05, $23, 2
+  .byte $95, $01, $13, 1
   .byte $29, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $b5, $63, $43, 1310
-  .byte $b5, $76, $55, 1311
+  .byte $b5, $63, $43, 2
+  .byte $b5, $76, $55, 1
   .byte $9d, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $89, $42, $33, 1313
-  .byte $91, $76, $55, 1314
-  .byte $c9, $02, $35, 1315
+  .byte $89, $42, $33, 3
+  .byte $91, $76, $55, 2
+  .byte $c9, $02, $35, 1
   .byte $15, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $25, $05, $16, 1317
+  .byte $25, $05, $16, 1
   .byte $25, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $9d, $06, $25, 1319
-  .byte $c5, $75, $66, 1320
+  .byte $9d, $06, $25, 2
+  .byte $c5, $75, $66, 1
   .byte $7d, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $b1, $63, $43, 1322
-  .byte $3d, $06, $25, 1323
-  .byte $3d, $01, $22, 1324
-  .byte $a5, $36, $47, 1325
-  .byte $c5, $75, $66, 1326
-  .byte $59, $12, $22, 1327
-  .byte $2d, $03, $21, 1328
-  .byte $55, $06, $25, 1329
-  .byte $55, $14, $34, 1330
+  .byte $b1, $63, $43, 9
+  .byte $3d, $06, $25, 8
+  .byte $3d, $01, $22, 7
+  .byte $a5, $36, $47, 6
+  .byte $c5, $75, $66, 5
+  .byte $59, $12, $22, 4
+  .byte $2d, $03, $21, 3
+  .byte $55, $06, $25, 2
+  .byte $55, $14, $34, 1
   .byte $55, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $dd, $71, $52, 1332
-  .byte $dd, $66, $56, 1333
-  .byte $dd, $76, $55, 1334
-  .byte $ad, $75, $66, 1335
-  .byte $59, $72, $63, 1336
-  .byte $59, $71, $63, 1337
+  .byte $dd, $71, $52, 6
+  .byte $dd, $66, $56, 5
+  .byte $dd, $76, $55, 4
+  .byte $ad, $75, $66, 3
+  .byte $59, $72, $63, 2
+  .byte $59, $71, $63, 1
   .byte $59, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $b9, $16, $26, 1339
-  .byte $81, $64, $44, 1340
-  .byte $ad, $75, $66, 1341
+  .byte $b9, $16, $26, 3
+  .byte $81, $64, $44, 2
+  .byte $ad, $75, $66, 1
   .byte $d9, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $4d, $05, $16, 1343
-  .byte $a1, $63, $43, 1344
+  .byte $4d, $05, $16, 2
+  .byte $a1, $63, $43, 1
   .byte $a1, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $25, $64, $54, 1346
-  .byte $25, $73, $62, 1347
-  .byte $25, $76, $55, 1348
+  .byte $25, $64, $54, 3
+  .byte $25, $73, $62, 2
+  .byte $25, $76, $55, 1
   .byte $d1, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $b9, $75, $66, 1350
-  .byte $b9, $63, $43, 1351
+  .byte $b9, $75, $66, 2
+  .byte $b9, $63, $43, 1
   .byte $29, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $e1, $06, $25, 1353
-  .byte $59, $11, $31, 1354
-  .byte $59, $11, $21, 1355
-  .byte $59, $13, $33, 1356
-  .byte $69, $46, $55, 1357
-  .byte $69, $14, $34, 1358
-  .byte $f9, $75, $66, 1359
-  .byte $6d, $63, $43, 1360
-  .byte $6d, $42, $33, 1361
+  .byte $e1, $06, $25, 9
+  .byte $59, $11, $31, 8
+  .byte $59, $11, $21, 7
+  .byte $59, $13, $33, 6
+  .byte $69, $46, $55, 5
+  .byte $69, $14, $34, 4
+  .byte $f9, $75, $66, 3
+  .byte $6d, $63, $43, 2
+  .byte $6d, $42, $33, 1
   .byte $bd, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $29, $13, $23, 1363
-  .byte $29, $04, $07, 1364
-  .byte $29, $12, $32, 1365
+  .byte $29, $13, $23, 3
+  .byte $29, $04, $07, 2
+  .byte $29, $12, $32, 1
   .byte $85, $22, $43, GEN_BOOK_CHAIN_END
-  .byte $a5, $06, $25, 1367
-  .byte $c9, $06, $25, 1368
-  .byte $59, $05, $16, 1369
+  .byte $a5, $06, $25, 3
+  .byte $c9, $06, $25, 2
+  .byte $59, $05, $16, 1
   .byte $5d, $43, $31, GEN_BOOK_CHAIN_END
   .byte $81, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $11, $72, $61, 1372
+  .byte $11, $72, $61, 1
   .byte $65, $60, $40, GEN_BOOK_CHAIN_END
-  .byte $c9, $66, $56, 1374
-  .byte $cd, $06, $25, 1375
-  .byte $cd, $02, $35, 1376
-  .byte $cd, $14, $24, 1377
-  .byte $c9, $75, $42, 1378
-  .byte $55, $32, $43, 1379
+  .byte $cd, $06, $25, 4
+  .byte $cd, $02, $35, 3
+  .byte $cd, $14, $24, 2
+  .byte $55, $32, $43, 1
   .byte $a5, $64, $43, GEN_BOOK_CHAIN_END
   .byte $89, $33, $42, GEN_BOOK_CHAIN_END
-  .byte $59, $25, $46, 1382
-  .byte $dd, $14, $24, 1383
-  .byte $dd, $33, $42, 1384
-  .byte $dd, $10, $20, 1385
-  .byte $cd, $01, $22, 1386
-  .byte $09, $71, $52, 1387
-  .byte $09, $76, $55, 1388
-  .byte $d9, $43, $33, 1389
-  .byte $cd, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $65, $05, $32, 1391
-  .byte $65, $06, $25, 1392
-  .byte $65, $05, $14, 1393
-  .byte $b9, $01, $13, 1394
-  .byte $b9, $02, $35, 1395
+  .byte $59, $25, $46, 6
+  .byte $dd, $14, $24, 5
+  .byte $dd, $33, $42, 4
+  .byte $dd, $10, $20, 3
+  .byte $09, $71, $52, 2
+  .byte $09, $76, $55, 1
+  .byte $d9, $43, $33, GEN_BOOK_CHAIN_END
+  .byte $65, $05, $32, 5
+  .byte $65, $06, $25, 4
+  .byte $65, $05, $14, 3
+  .byte $b9, $01, $13, 2
+  .byte $b9, $02, $35, 1
   .byte $b9, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $55, $06, $25, 1397
-  .byte $55, $33, $42, 1398
-  .byte $55, $15, $35, 1399
-  .byte $c9, $32, $43, 1400
+  .byte $55, $06, $25, 4
+  .byte $55, $33, $42, 3
+  .byte $55, $15, $35, 2
+  .byte $c9, $32, $43, 1
   .byte $39, $64, $43, GEN_BOOK_CHAIN_END
-  .byte $41, $66, $56, 1402
-  .byte $41, $71, $52, 1403
-  .byte $41, $63, $43, 1404
-  .byte $79, $60, $50, 1405
-  .byte $79, $64, $54, 1406
-  .byte $21, $74, $77, 1407
-  .byte $21, $42, $51, 1408
+  .byte $41, $66, $56, 7
+  .byte $41, $71, $52, 6
+  .byte $41, $63, $43, 5
+  .byte $79, $60, $50, 4
+  .byte $79, $64, $54, 3
+  .byte $21, $74, $77, 2
+  .byte $21, $42, $51, 1
   .byte $21, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $15, $05, $16, 1410
-  .byte $d9, $13, $33, 1411
-  .byte $d9, $11, $21, 1412
-  .byte $d9, $32, $43, 1413
-  .byte $81, $06, $25, 1414
-  .byte $81, $15, $35, 1415
-  .byte $75, $64, $54, 1416
-  .byte $75, $62, $52, 1417
-  .byte $e5, $76, $55, 1418
+  .byte $15, $05, $16, 9
+  .byte $d9, $13, $33, 8
+  .byte $d9, $11, $21, 7
+  .byte $d9, $32, $43, 6
+  .byte $81, $06, $25, 5
+  .byte $81, $15, $35, 4
+  .byte $75, $64, $54, 3
+  .byte $75, $62, $52, 2
+  .byte $e5, $76, $55, 1
   .byte $f1, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $e1, $13, $33, 1420
-  .byte $d9, $75, $66, 1421
-  .byte $d9, $63, $43, 1422
-  .byte $d9, $61, $51, 1423
-  .byte $a1, $05, $14, 1424
+  .byte $e1, $13, $33, 5
+  .byte $d9, $75, $66, 4
+  .byte $d9, $63, $43, 3
+  .byte $d9, $61, $51, 2
+  .byte $a1, $05, $14, 1
   .byte $91, $64, $54, GEN_BOOK_CHAIN_END
   .byte $45, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $f1, $05, $16, 1427
-  .byte $f1, $13, $33, 1428
-  .byte $f1, $12, $32, 1429
-  .byte $a5, $13, $33, 1430
-  .byte $85, $54, $43, 1431
-  .byte $11, $76, $55, 1432
+  .byte $f1, $05, $16, 6
+  .byte $f1, $13, $33, 5
+  .byte $f1, $12, $32, 4
+  .byte $a5, $13, $33, 3
+  .byte $85, $54, $43, 2
+  .byte $11, $76, $55, 1
   .byte $2d, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $59, $01, $22, 1434
+  .byte $59, $01, $22, 1
   .byte $e1, $14, $34, GEN_BOOK_CHAIN_END
-  .byte $f1, $24, $33, 1436
-  .byte $f1, $13, $23, 1437
-  .byte $f1, $11, $31, 1438
-  .byte $e1, $02, $46, 1439
-  .byte $35, $25, $33, 1440
-  .byte $11, $64, $44, 1441
-  .byte $d9, $75, $66, 1442
+  .byte $f1, $24, $33, 7
+  .byte $f1, $13, $23, 6
+  .byte $f1, $11, $31, 5
+  .byte $e1, $02, $46, 4
+  .byte $35, $25, $33, 3
+  .byte $11, $64, $44, 2
+  .byte $d9, $75, $66, 1
   .byte $d9, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $01, $14, $24, 1444
-  .byte $09, $66, $56, 1445
-  .byte $99, $75, $66, 1446
-  .byte $75, $64, $44, 1447
+  .byte $01, $14, $24, 4
+  .byte $09, $66, $56, 3
+  .byte $99, $75, $66, 2
+  .byte $75, $64, $44, 1
   .byte $75, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $75, $04, $07, 1449
-  .byte $75, $13, $33, 1450
+  .byte $75, $04, $07, 2
+  .byte $75, $13, $33, 1
   .byte $75, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $c5, $75, $66, 1452
-  .byte $6d, $16, $26, 1453
-  .byte $6d, $01, $13, 1454
+  .byte $c5, $75, $66, 3
+  .byte $6d, $16, $26, 2
+  .byte $6d, $01, $13, 1
   .byte $a9, $10, $20, GEN_BOOK_CHAIN_END
   .byte $d1, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $f9, $02, $11, 1457
-  .byte $35, $71, $52, 1458
-  .byte $e9, $32, $43, 1459
-  .byte $19, $64, $43, 1460
-  .byte $75, $63, $43, 1461
-  .byte $75, $73, $64, 1462
+  .byte $f9, $02, $11, 6
+  .byte $35, $71, $52, 5
+  .byte $e9, $32, $43, 4
+  .byte $19, $64, $43, 3
+  .byte $75, $63, $43, 2
+  .byte $75, $73, $64, 1
   .byte $75, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $1d, $73, $62, 1464
-  .byte $1d, $73, $51, 1465
-  .byte $1d, $64, $54, 1466
-  .byte $ad, $73, $72, 1467
-  .byte $ad, $71, $63, 1468
+  .byte $1d, $73, $62, 5
+  .byte $1d, $73, $51, 4
+  .byte $1d, $64, $54, 3
+  .byte $ad, $73, $72, 2
+  .byte $ad, $71, $63, 1
   .byte $41, $73, $63, GEN_BOOK_CHAIN_END
-  .byte $f5, $62, $42, 1470
-  .byte $f5, $75, $53, 1471
-  .byte $f5, $62, $52, 1472
-  .byte $61, $32, $43, 1473
-  .byte $91, $64, $43, 1474
+  .byte $f5, $62, $42, 5
+  .byte $f5, $75, $53, 4
+  .byte $f5, $62, $52, 3
+  .byte $61, $32, $43, 2
+  .byte $91, $64, $43, 1
   .byte $ed, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $29, $76, $55, 1476
+  .byte $29, $76, $55, 1
   .byte $59, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $35, $01, $22, 1478
-  .byte $d9, $02, $11, 1479
-  .byte $71, $34, $43, 1480
-  .byte $65, $42, $31, 1481
-  .byte $65, $76, $55, 1482
-  .byte $65, $71, $63, 1483
-  .byte $19, $64, $54, 1484
+  .byte $35, $01, $22, 7
+  .byte $d9, $02, $11, 6
+  .byte $71, $34, $43, 5
+  .byte $65, $42, $31, 4
+  .byte $65, $76, $55, 3
+  .byte $65, $71, $63, 2
+  .byte $19, $64, $54, 1
   .byte $79, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $65, $76, $55, 1486
-  .byte $65, $63, $43, 1487
-  .byte $01, $01, $22, 1488
+  .byte $65, $76, $55, 3
+  .byte $65, $63, $43, 2
+  .byte $01, $01, $22, 1
   .byte $49, $43, $63, GEN_BOOK_CHAIN_END
-  .byte $6d, $75, $42, 1490
-  .byte $0d, $44, $34, 1491
-  .byte $d1, $14, $24, 1492
-  .byte $5d, $76, $55, 1493
+  .byte $6d, $75, $42, 4
+  .byte $0d, $44, $34, 3
+  .byte $d1, $14, $24, 2
+  .byte $5d, $76, $55, 1
   .byte $5d, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $a5, $05, $16, 1495
-  .byte $a1, $12, $32, 1496
-  .byte $a1, $06, $25, 1497
+  .byte $a5, $05, $16, 3
+  .byte $a1, $12, $32, 2
+  .byte $a1, $06, $25, 1
   .byte $31, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $1d, $42, $33, 1499
-  .byte $6d, $13, $23, 1500
-  .byte $c9, $71, $52, 1501
+  .byte $1d, $42, $33, 3
+  .byte $6d, $13, $23, 2
+  .byte $c9, $71, $52, 1
   .byte $c9, $43, $31, GEN_BOOK_CHAIN_END
-  .byte $d5, $16, $26, 1503
-  .byte $d5, $01, $22, 1504
-  .byte $d5, $06, $25, 1505
-  .byte $59, $25, $44, 1506
-  .byte $59, $02, $11, 1507
-  .byte $f9, $16, $36, 1508
-  .byte $cd, $04, $07, 1509
-  .byte $cd, $13, $33, 1510
+  .byte $d5, $16, $26, 8
+  .byte $d5, $01, $22, 7
+  .byte $d5, $06, $25, 6
+  .byte $59, $25, $44, 5
+  .byte $59, $02, $11, 4
+  .byte $f9, $16, $36, 3
+  .byte $cd, $04, $07, 2
+  .byte $cd, $13, $33, 1
   .byte $cd, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $29, $75, $66, 1512
-  .byte $21, $03, $25, 1513
-  .byte $55, $47, $56, 1514
+  .byte $29, $75, $66, 3
+  .byte $21, $03, $25, 2
+  .byte $55, $47, $56, 1
   .byte $41, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $6d, $76, $55, 1516
-  .byte $6d, $66, $56, 1517
-  .byte $5d, $66, $56, 1518
-  .byte $5d, $60, $50, 1519
+  .byte $6d, $76, $55, 4
+  .byte $6d, $66, $56, 3
+  .byte $5d, $66, $56, 2
+  .byte $5d, $60, $50, 1
   .byte $5d, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $29, $14, $24, 1521
-  .byte $29, $10, $20, 1522
-  .byte $45, $14, $24, 1523
+  .byte $29, $14, $24, 3
+  .byte $29, $10, $20, 2
+  .byte $45, $14, $24, 1
   .byte $45, $03, $21, GEN_BOOK_CHAIN_END
-  .byte $99, $75, $66, 1525
-  .byte $ed, $13, $33, 1526
+  .byte $99, $75, $66, 2
+  .byte $ed, $13, $33, 1
   .byte $ed, $05, $41, GEN_BOOK_CHAIN_END
-  .byte $cd, $71, $52, 1528
-  .byte $01, $13, $33, 1529
+  .byte $cd, $71, $52, 2
+  .byte $01, $13, $33, 1
   .byte $21, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $d1, $11, $21, 1531
-  .byte $d1, $13, $33, 1532
-  .byte $d1, $01, $22, 1533
+  .byte $d1, $11, $21, 3
+  .byte $d1, $13, $33, 2
+  .byte $d1, $01, $22, 1
   .byte $21, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $45, $16, $26, 1535
-  .byte $45, $13, $33, 1536
-  .byte $45, $11, $21, 1537
-  .byte $fd, $06, $25, 1538
-  .byte $81, $06, $25, 1539
-  .byte $81, $12, $22, 1540
-  .byte $81, $12, $32, 1541
-  .byte $11, $05, $16, 1542
+  .byte $45, $16, $26, 8
+  .byte $45, $13, $33, 7
+  .byte $45, $11, $21, 6
+  .byte $fd, $06, $25, 5
+  .byte $81, $06, $25, 4
+  .byte $81, $12, $22, 3
+  .byte $81, $12, $32, 2
+  .byte $11, $05, $16, 1
   .byte $55, $05, $32, GEN_BOOK_CHAIN_END
-  .byte $cd, $11, $21, 1544
-  .byte $cd, $11, $31, 1545
-  .byte $cd, $13, $33, 1546
-  .byte $a9, $64, $54, 1547
-  .byte $75, $16, $26, 1548
-  .byte $75, $14, $24, 1549
+  .byte $cd, $11, $21, 6
+  .byte $cd, $11, $31, 5
+  .byte $cd, $13, $33, 4
+  .byte $a9, $64, $54, 3
+  .byte $75, $16, $26, 2
+  .byte $75, $14, $24, 1
   .byte $5d, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $c1, $32, $43, 1551
-  .byte $31, $55, $43, 1552
-  .byte $11, $73, $64, 1553
-  .byte $11, $66, $56, 1554
+  .byte $c1, $32, $43, 4
+  .byte $31, $55, $43, 3
+  .byte $11, $73, $64, 2
+  .byte $11, $66, $56, 1
   .byte $11, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $b1, $75, $66, 1556
-  .byte $b1, $73, $51, 1557
-  .byte $b1, $64, $44, 1558
-  .byte $0d, $71, $63, 1559
+  .byte $0d, $71, $63, 1
   .byte $71, $71, $63, GEN_BOOK_CHAIN_END
   .byte $e5, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $f9, $76, $55, 1562
-  .byte $c9, $75, $66, 1563
+  .byte $f9, $76, $55, 2
+  .byte $c9, $75, $66, 1
   .byte $c9, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $69, $06, $25, 1565
-  .byte $79, $44, $33, 1566
-  .byte $79, $44, $34, 1567
-  .byte $09, $75, $66, 1568
-  .byte $09, $63, $43, 1569
-  .byte $61, $62, $42, 1570
+  .byte $69, $06, $25, 6
+  .byte $79, $44, $33, 5
+  .byte $79, $44, $34, 4
+  .byte $09, $75, $66, 3
+  .byte $09, $63, $43, 2
+  .byte $61, $62, $42, 1
   .byte $61, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $e9, $05, $16, 1572
-  .byte $15, $25, $33, 1573
-  .byte $ad, $60, $40, 1574
-  .byte $ad, $64, $54, 1575
-  .byte $ad, $64, $44, 1576
-  .byte $0d, $75, $66, 1577
-  .byte $e9, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $85, $71, $52, 1579
+  .byte $15, $25, $33, 4
+  .byte $ad, $60, $40, 3
+  .byte $ad, $64, $54, 2
+  .byte $ad, $64, $44, 1
+  .byte $0d, $75, $66, GEN_BOOK_CHAIN_END
+  .byte $85, $71, $52, 1
   .byte $85, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $25, $60, $40, 1581
-  .byte $25, $72, $36, 1582
-  .byte $b9, $43, $51, 1583
-  .byte $b9, $43, $31, 1584
-  .byte $11, $72, $54, 1585
+  .byte $25, $60, $40, 5
+  .byte $25, $72, $36, 4
+  .byte $b9, $43, $51, 3
+  .byte $b9, $43, $31, 2
+  .byte $11, $72, $54, 1
   .byte $11, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $71, $01, $13, 1587
-  .byte $71, $06, $25, 1588
-  .byte $05, $03, $30, 1589
-  .byte $05, $32, $43, 1590
-  .byte $05, $01, $22, 1591
+  .byte $71, $01, $13, 5
+  .byte $71, $06, $25, 4
+  .byte $05, $03, $30, 3
+  .byte $05, $32, $43, 2
+  .byte $05, $01, $22, 1
   .byte $f5, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $41, $72, $61, 1593
-  .byte $41, $64, $54, 1594
-  .byte $fd, $71, $52, 1595
+  .byte $41, $72, $61, 3
+  .byte $41, $64, $54, 2
+  .byte $fd, $71, $52, 1
   .byte $fd, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $95, $71, $52, 1597
-  .byte $41, $63, $44, 1598
-  .byte $f1, $71, $63, 1599
-  .byte $a1, $75, $66, 1600
-  .byte $65, $55, $34, 1601
-  .byte $65, $42, $33, 1602
+  .byte $95, $71, $52, 6
+  .byte $41, $63, $44, 5
+  .byte $f1, $71, $63, 4
+  .byte $a1, $75, $66, 3
+  .byte $65, $55, $34, 2
+  .byte $65, $42, $33, 1
   .byte $65, $61, $51, GEN_BOOK_CHAIN_END
   .byte $f9, $14, $34, GEN_BOOK_CHAIN_END
-  .byte $2d, $64, $54, 1605
-  .byte $2d, $70, $72, 1606
+  .byte $2d, $64, $54, 2
+  .byte $2d, $70, $72, 1
   .byte $65, $75, $66, GEN_BOOK_CHAIN_END
   .byte $05, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $45, $06, $25, 1609
-  .byte $65, $05, $16, 1610
-  .byte $01, $76, $55, 1611
+  .byte $45, $06, $25, 3
+  .byte $65, $05, $16, 2
+  .byte $01, $76, $55, 1
   .byte $8d, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $41, $71, $52, 1613
+  .byte $41, $71, $52, 1
   .byte $35, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $e5, $72, $54, 1615
-  .byte $e5, $65, $45, 1616
+  .byte $e5, $72, $54, 2
+  .byte $e5, $65, $45, 1
   .byte $e5, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $11, $13, $23, 1618
-  .byte $11, $14, $34, 1619
+  .byte $11, $13, $23, 2
+  .byte $11, $14, $34, 1
   .byte $d9, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $e5, $73, $62, 1621
-  .byte $e5, $66, $56, 1622
-  .byte $e5, $73, $51, 1623
-  .byte $a5, $25, $13, 1624
-  .byte $6d, $01, $22, 1625
-  .byte $85, $64, $54, 1626
-  .byte $85, $71, $63, 1627
+  .byte $e5, $73, $62, 7
+  .byte $e5, $66, $56, 6
+  .byte $e5, $73, $51, 5
+  .byte $a5, $25, $13, 4
+  .byte $6d, $01, $22, 3
+  .byte $85, $64, $54, 2
+  .byte $85, $71, $63, 1
   .byte $7d, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $39, $16, $26, 1629
-  .byte $39, $14, $34, 1630
-  .byte $69, $14, $24, 1631
+  .byte $39, $16, $26, 3
+  .byte $39, $14, $34, 2
+  .byte $69, $14, $24, 1
   .byte $65, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $79, $75, $66, 1633
-  .byte $9d, $76, $64, 1634
-  .byte $9d, $75, $53, 1635
-  .byte $9d, $65, $55, 1636
-  .byte $ad, $76, $55, 1637
-  .byte $a5, $74, $77, 1638
+  .byte $79, $75, $66, 6
+  .byte $9d, $76, $64, 5
+  .byte $9d, $75, $53, 4
+  .byte $9d, $65, $55, 3
+  .byte $ad, $76, $55, 2
+  .byte $a5, $74, $77, 1
   .byte $a5, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $11, $13, $33, 1640
-  .byte $11, $16, $26, 1641
-  .byte $11, $14, $34, 1642
-  .byte $01, $16, $26, 1643
-  .byte $01, $15, $35, 1644
-  .byte $01, $13, $23, 1645
+  .byte $11, $13, $33, 6
+  .byte $11, $16, $26, 5
+  .byte $11, $14, $34, 4
+  .byte $01, $16, $26, 3
+  .byte $01, $15, $35, 2
+  .byte $01, $13, $23, 1
   .byte $d5, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $05, $76, $55, 1647
+  .byte $05, $76, $55, 1
   .byte $e1, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $d1, $36, $25, 1649
-  .byte $d1, $64, $54, 1650
-  .byte $d1, $71, $63, 1651
-  .byte $41, $44, $33, 1652
-  .byte $c9, $16, $36, 1653
+  .byte $d1, $36, $25, 5
+  .byte $d1, $64, $54, 4
+  .byte $d1, $71, $63, 3
+  .byte $41, $44, $33, 2
+  .byte $c9, $16, $36, 1
   .byte $c9, $05, $14, GEN_BOOK_CHAIN_END
   .byte $11, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $0d, $75, $66, 1656
-  .byte $61, $76, $55, 1657
-  .byte $61, $64, $44, 1658
-  .byte $61, $63, $43, 1659
+  .byte $0d, $75, $66, 4
+  .byte $61, $76, $55, 3
+  .byte $61, $64, $44, 2
+  .byte $61, $63, $43, 1
   .byte $f9, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $09, $71, $52, 1661
-  .byte $09, $60, $50, 1662
-  .byte $09, $64, $44, 1663
-  .byte $0d, $06, $25, 1664
-  .byte $f1, $02, $11, 1665
-  .byte $9d, $36, $45, 1666
+  .byte $09, $71, $52, 6
+  .byte $09, $60, $50, 5
+  .byte $09, $64, $44, 4
+  .byte $0d, $06, $25, 3
+  .byte $f1, $02, $11, 2
+  .byte $9d, $36, $45, 1
   .byte $9d, $36, $47, GEN_BOOK_CHAIN_END
-  .byte $05, $05, $14, 1668
-  .byte $c9, $74, $77, 1669
-  .byte $c9, $63, $43, 1670
+  .byte $05, $05, $14, 3
+  .byte $c9, $74, $77, 2
+  .byte $c9, $63, $43, 1
   .byte $c9, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $81, $14, $24, 1672
-  .byte $81, $01, $22, 1673
-  .byte $81, $13, $33, 1674
-  .byte $d1, $51, $42, 1675
+  .byte $81, $14, $24, 4
+  .byte $81, $01, $22, 3
+  .byte $81, $13, $33, 2
+  .byte $d1, $51, $42, 1
   .byte $39, $65, $45, GEN_BOOK_CHAIN_END
-  .byte $09, $06, $25, 1677
+  .byte $09, $06, $25, 1
   .byte $79, $06, $25, GEN_BOOK_CHAIN_END
   .byte $85, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $65, $76, $55, 1680
+  .byte $65, $76, $55, 1
   .byte $65, $72, $45, GEN_BOOK_CHAIN_END
-  .byte $f5, $42, $33, 1682
-  .byte $45, $75, $66, 1683
-  .byte $45, $76, $55, 1684
+  .byte $f5, $42, $33, 3
+  .byte $45, $75, $66, 2
+  .byte $45, $76, $55, 1
   .byte $c5, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $b5, $24, $33, 1686
-  .byte $d5, $55, $43, 1687
-  .byte $b1, $75, $64, 1688
-  .byte $b1, $67, $57, 1689
+  .byte $b5, $24, $33, 4
+  .byte $d5, $55, $43, 3
+  .byte $b1, $75, $64, 2
+  .byte $b1, $67, $57, 1
   .byte $b1, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $11, $13, $33, 1691
-  .byte $dd, $76, $55, 1692
+  .byte $11, $13, $33, 2
+  .byte $dd, $76, $55, 1
   .byte $dd, $43, $34, GEN_BOOK_CHAIN_END
-  .byte $11, $12, $22, 1694
+  .byte $11, $12, $22, 1
   .byte $99, $06, $25, GEN_BOOK_CHAIN_END
   .byte $cd, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $2d, $63, $43, 1697
-  .byte $2d, $75, $31, 1698
-  .byte $2d, $71, $52, 1699
-  .byte $a9, $66, $56, 1700
-  .byte $a9, $71, $52, 1701
+  .byte $2d, $63, $43, 5
+  .byte $2d, $75, $31, 4
+  .byte $2d, $71, $52, 3
+  .byte $a9, $66, $56, 2
+  .byte $a9, $71, $52, 1
   .byte $e1, $75, $31, GEN_BOOK_CHAIN_END
-  .byte $59, $75, $66, 1703
-  .byte $59, $62, $52, 1704
+  .byte $59, $75, $66, 2
+  .byte $59, $62, $52, 1
   .byte $0d, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $f5, $06, $25, 1706
-  .byte $c9, $64, $44, 1707
-  .byte $c9, $66, $56, 1708
-  .byte $c9, $63, $43, 1709
-  .byte $b9, $13, $22, 1710
-  .byte $9d, $72, $63, 1711
-  .byte $9d, $71, $63, 1712
-  .byte $9d, $71, $52, 1713
+  .byte $f5, $06, $25, 8
+  .byte $c9, $64, $44, 7
+  .byte $c9, $66, $56, 6
+  .byte $c9, $63, $43, 5
+  .byte $b9, $13, $22, 4
+  .byte $9d, $72, $63, 3
+  .byte $9d, $71, $63, 2
+  .byte $9d, $71, $52, 1
   .byte $11, $75, $66, GEN_BOOK_CHAIN_END
   .byte $e9, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $a5, $44, $33, 1716
-  .byte $a5, $63, $53, 1717
-  .byte $89, $06, $25, 1718
-  .byte $55, $35, $44, 1719
-  .byte $15, $32, $41, 1720
+  .byte $a5, $44, $33, 5
+  .byte $a5, $63, $53, 4
+  .byte $89, $06, $25, 3
+  .byte $55, $35, $44, 2
+  .byte $15, $32, $41, 1
   .byte $15, $32, $21, GEN_BOOK_CHAIN_END
-  .byte $55, $63, $43, 1722
-  .byte $a1, $05, $16, 1723
-  .byte $f9, $64, $44, 1724
-  .byte $f9, $64, $54, 1725
+  .byte $55, $63, $43, 4
+  .byte $a1, $05, $16, 3
+  .byte $f9, $64, $44, 2
+  .byte $f9, $64, $54, 1
   .byte $51, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $69, $06, $25, 1727
+  .byte $69, $06, $25, 1
   .byte $c5, $42, $51, GEN_BOOK_CHAIN_END
   .byte $ad, $64, $44, GEN_BOOK_CHAIN_END
   .byte $15, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $11, $75, $66, 1731
-  .byte $11, $73, $53, 1732
-  .byte $11, $72, $36, 1733
-  .byte $65, $74, $77, 1734
-  .byte $65, $62, $42, 1735
-  .byte $65, $62, $52, 1736
+  .byte $11, $75, $66, 6
+  .byte $11, $73, $53, 5
+  .byte $11, $72, $36, 4
+  .byte $65, $74, $77, 3
+  .byte $65, $62, $42, 2
+  .byte $65, $62, $52, 1
   .byte $61, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $15, $63, $43, 1738
-  .byte $15, $71, $52, 1739
-  .byte $15, $76, $55, 1740
-  .byte $11, $15, $35, 1741
+  .byte $11, $15, $35, 1
   .byte $11, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $e9, $13, $33, 1743
-  .byte $65, $75, $66, 1744
+  .byte $e9, $13, $33, 2
+  .byte $65, $75, $66, 1
   .byte $2d, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $9d, $32, $43, 1746
-  .byte $9d, $13, $33, 1747
-  .byte $ad, $01, $22, 1748
+  .byte $9d, $32, $43, 3
+  .byte $9d, $13, $33, 2
+  .byte $ad, $01, $22, 1
   .byte $21, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $89, $06, $25, 1750
-  .byte $89, $14, $34, 1751
-  .byte $89, $14, $24, 1752
-  .byte $71, $75, $53, 1753
-  .byte $71, $62, $42, 1754
+  .byte $89, $06, $25, 5
+  .byte $89, $14, $34, 4
+  .byte $89, $14, $24, 3
+  .byte $71, $75, $53, 2
+  .byte $71, $62, $42, 1
   .byte $4d, $44, $33, GEN_BOOK_CHAIN_END
-  .byte $e1, $64, $44, 1756
-  .byte $25, $13, $23, 1757
-  .byte $3d, $31, $20, 1758
-  .byte $3d, $65, $55, 1759
+  .byte $e1, $64, $44, 4
+  .byte $25, $13, $23, 3
+  .byte $3d, $31, $20, 2
+  .byte $3d, $65, $55, 1
   .byte $3d, $31, $21, GEN_BOOK_CHAIN_END
-  .byte $05, $16, $26, 1761
-  .byte $c5, $15, $35, 1762
-  .byte $c5, $06, $25, 1763
-  .byte $6d, $14, $24, 1764
+  .byte $05, $16, $26, 4
+  .byte $c5, $15, $35, 3
+  .byte $c5, $06, $25, 2
+  .byte $6d, $14, $24, 1
   .byte $e9, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $1d, $64, $54, 1766
-  .byte $99, $02, $35, 1767
-  .byte $99, $14, $24, 1768
-  .byte $99, $16, $26, 1769
+  .byte $1d, $64, $54, 4
+  .byte $99, $02, $35, 3
+  .byte $99, $14, $24, 2
+  .byte $99, $16, $26, 1
   .byte $9d, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $0d, $75, $53, 1771
-  .byte $e5, $76, $55, 1772
-  .byte $e5, $64, $54, 1773
-  .byte $19, $66, $56, 1774
-  .byte $19, $71, $52, 1775
+  .byte $0d, $75, $53, 5
+  .byte $e5, $76, $55, 4
+  .byte $e5, $64, $54, 3
+  .byte $19, $66, $56, 2
+  .byte $19, $71, $52, 1
   .byte $19, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $65, $75, $66, 1777
-  .byte $79, $75, $66, 1778
-  .byte $79, $63, $43, 1779
-  .byte $25, $12, $22, 1780
-  .byte $25, $13, $33, 1781
-  .byte $25, $05, $14, 1782
-  .byte $59, $33, $42, 1783
-  .byte $59, $05, $14, 1784
-  .byte $59, $05, $41, 1785
+  .byte $65, $75, $66, 9
+  .byte $79, $75, $66, 8
+  .byte $79, $63, $43, 7
+  .byte $25, $12, $22, 6
+  .byte $25, $13, $33, 5
+  .byte $25, $05, $14, 4
+  .byte $59, $33, $42, 3
+  .byte $59, $05, $14, 2
+  .byte $59, $05, $41, 1
   .byte $11, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $85, $16, $26, 1787
-  .byte $9d, $05, $41, 1788
-  .byte $9d, $05, $14, 1789
-  .byte $9d, $13, $23, 1790
-  .byte $05, $72, $54, 1791
+  .byte $85, $16, $26, 5
+  .byte $9d, $05, $41, 4
+  .byte $9d, $05, $14, 3
+  .byte $9d, $13, $23, 2
+  .byte $05, $72, $54, 1
   .byte $05, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $0d, $12, $32, 1793
-  .byte $0d, $15, $35, 1794
-  .byte $ad, $75, $66, 1795
-  .byte $0d, $63, $43, 1796
-  .byte $7d, $76, $55, 1797
-  .byte $7d, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $f5, $76, $55, 1799
-  .byte $f5, $66, $56, 1800
-  .byte $f5, $64, $54, 1801
-  .byte $15, $03, $21, 1802
+  .byte $ad, $75, $66, 1
+  .byte $7d, $76, $55, GEN_BOOK_CHAIN_END
+  .byte $f5, $76, $55, 4
+  .byte $f5, $66, $56, 3
+  .byte $f5, $64, $54, 2
+  .byte $15, $03, $21, 1
   .byte $01, $73, $72, GEN_BOOK_CHAIN_END
   .byte $ed, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $25, $01, $13, 1805
+  .byte $25, $01, $13, 1
   .byte $25, $34, $44, GEN_BOOK_CHAIN_END
-  .byte $d9, $34, $55, 1807
-  .byte $d9, $34, $42, 1808
-  .byte $35, $32, $43, 1809
-  .byte $d5, $02, $35, 1810
-  .byte $d5, $12, $22, 1811
-  .byte $31, $25, $44, 1812
-  .byte $31, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $b9, $44, $33, 1814
-  .byte $b9, $44, $34, 1815
-  .byte $a1, $14, $24, 1816
+  .byte $d9, $34, $55, 4
+  .byte $d9, $34, $42, 3
+  .byte $35, $32, $43, 2
+  .byte $d5, $02, $35, 1
+  .byte $d5, $12, $22, GEN_BOOK_CHAIN_END
+  .byte $b9, $44, $33, 3
+  .byte $b9, $44, $34, 2
+  .byte $a1, $14, $24, 1
   .byte $a1, $33, $42, GEN_BOOK_CHAIN_END
   .byte $4d, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $89, $36, $47, 1819
-  .byte $dd, $01, $22, 1820
-  .byte $dd, $16, $26, 1821
+  .byte $89, $36, $47, 3
+  .byte $dd, $01, $22, 2
+  .byte $dd, $16, $26, 1
   .byte $5d, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $21, $66, $56, 1823
-  .byte $21, $76, $55, 1824
-  .byte $21, $75, $42, 1825
-  .byte $45, $13, $33, 1826
-  .byte $45, $12, $32, 1827
-  .byte $5d, $06, $25, 1828
-  .byte $b9, $33, $24, 1829
+  .byte $21, $66, $56, 7
+  .byte $21, $76, $55, 6
+  .byte $21, $75, $42, 5
+  .byte $45, $13, $33, 4
+  .byte $45, $12, $32, 3
+  .byte $5d, $06, $25, 2
+  .byte $b9, $33, $24, 1
   .byte $b9, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $39, $16, $26, 1831
-  .byte $8d, $05, $16, 1832
+  .byte $39, $16, $26, 2
+  .byte $8d, $05, $16, 1
   .byte $09, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $21, $06, $25, 1834
-  .byte $21, $13, $23, 1835
-  .byte $21, $12, $32, 1836
-  .byte $ad, $74, $77, 1837
+  .byte $21, $06, $25, 4
+  .byte $21, $13, $23, 3
+  .byte $21, $12, $32, 2
+  .byte $ad, $74, $77, 1
   .byte $ad, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $cd, $75, $66, 1839
+  .byte $cd, $75, $66, 1
   .byte $d9, $34, $43, GEN_BOOK_CHAIN_END
-  .byte $9d, $14, $25, 1841
-  .byte $31, $06, $25, 1842
+  .byte $9d, $14, $25, 2
+  .byte $31, $06, $25, 1
   .byte $15, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $05, $76, $55, 1844
-  .byte $2d, $11, $31, 1845
-  .byte $2d, $16, $26, 1846
-  .byte $2d, $14, $24, 1847
-  .byte $e9, $25, $33, 1848
-  .byte $05, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $a9, $06, $25, 1850
-  .byte $a9, $13, $23, 1851
-  .byte $a9, $01, $22, 1852
-  .byte $c1, $13, $23, 1853
-  .byte $c1, $71, $63, 1854
-  .byte $a5, $55, $34, 1855
+  .byte $2d, $11, $31, 3
+  .byte $2d, $16, $26, 2
+  .byte $2d, $14, $24, 1
+  .byte $e9, $25, $33, GEN_BOOK_CHAIN_END
+  .byte $a9, $06, $25, 4
+  .byte $a9, $13, $23, 3
+  .byte $a9, $01, $22, 2
+  .byte $a5, $55, $34, 1
   .byte $11, $72, $54, GEN_BOOK_CHAIN_END
-  .byte $71, $13, $33, 1857
-  .byte $71, $06, $25, 1858
-  .byte $81, $32, $43, 1859
+  .byte $71, $13, $33, 3
+  .byte $71, $06, $25, 2
+  .byte $81, $32, $43, 1
   .byte $69, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $85, $72, $36, 1861
-  .byte $85, $44, $34, 1862
+  .byte $85, $72, $36, 2
+  .byte $85, $44, $34, 1
   .byte $2d, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $25, $13, $23, 1864
-  .byte $01, $04, $07, 1865
-  .byte $01, $12, $32, 1866
+  .byte $25, $13, $23, 3
+  .byte $01, $04, $07, 2
+  .byte $01, $12, $32, 1
   .byte $41, $63, $53, GEN_BOOK_CHAIN_END
   .byte $39, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $5d, $06, $25, 1869
+  .byte $5d, $06, $25, 1
   .byte $5d, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $5d, $55, $34, 1871
-  .byte $5d, $63, $43, 1872
-  .byte $5d, $71, $52, 1873
-  .byte $2d, $05, $23, 1874
+  .byte $5d, $55, $34, 4
+  .byte $5d, $63, $43, 3
+  .byte $5d, $71, $52, 2
+  .byte $2d, $05, $23, 1
   .byte $c1, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $a1, $01, $22, 1876
-  .byte $a1, $16, $26, 1877
-  .byte $cd, $23, $34, 1878
-  .byte $11, $05, $14, 1879
+  .byte $a1, $01, $22, 4
+  .byte $a1, $16, $26, 3
+  .byte $cd, $23, $34, 2
+  .byte $11, $05, $14, 1
   .byte $4d, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $c1, $32, $43, 1881
-  .byte $31, $64, $43, 1882
-  .byte $f9, $04, $07, 1883
-  .byte $f9, $13, $33, 1884
+  .byte $c1, $32, $43, 4
+  .byte $31, $64, $43, 3
+  .byte $f9, $04, $07, 2
+  .byte $f9, $13, $33, 1
   .byte $f9, $13, $23, GEN_BOOK_CHAIN_END
   .byte $01, $22, $33, GEN_BOOK_CHAIN_END
-  .byte $ad, $05, $16, 1887
-  .byte $f5, $60, $50, 1888
-  .byte $21, $71, $52, 1889
+  .byte $ad, $05, $16, 3
+  .byte $f5, $60, $50, 2
+  .byte $21, $71, $52, 1
   .byte $21, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $11, $75, $66, 1891
-  .byte $51, $05, $16, 1892
-  .byte $45, $60, $50, 1893
-  .byte $45, $72, $63, 1894
+  .byte $11, $75, $66, 4
+  .byte $51, $05, $16, 3
+  .byte $45, $60, $50, 2
+  .byte $45, $72, $63, 1
   .byte $45, $76, $55, GEN_BOOK_CHAIN_END
   .byte $55, $02, $13, GEN_BOOK_CHAIN_END
-  .byte $41, $02, $46, 1897
-  .byte $41, $12, $32, 1898
-  .byte $0d, $72, $63, 1899
-  .byte $0d, $71, $63, 1900
-  .byte $0d, $71, $52, 1901
-  .byte $15, $13, $33, 1902
+  .byte $41, $02, $46, 6
+  .byte $41, $12, $32, 5
+  .byte $0d, $72, $63, 4
+  .byte $0d, $71, $63, 3
+  .byte $0d, $71, $52, 2
+  .byte $15, $13, $33, 1
   .byte $15, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $a9, $63, $43, 1904
-  .byte $91, $75, $66, 1905
+  .byte $a9, $63, $43, 2
+  .byte $91, $75, $66, 1
   .byte $91, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $f5, $34, $23, 1907
+  .byte $f5, $34, $23, 1
   .byte $11, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $91, $02, $11, 1909
+  .byte $91, $02, $11, 1
   .byte $45, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $85, $62, $52, 1911
+  .byte $85, $62, $52, 1
   .byte $85, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $f1, $06, $25, 1913
-  .byte $f1, $15, $35, 1914
-  .byte $f1, $05, $41, 1915
-  .byte $25, $71, $52, 1916
-  .byte $19, $17, $37, 1917
-  .byte $c5, $74, $77, 1918
-  .byte $c5, $62, $42, 1919
-  .byte $b9, $74, $77, 1920
-  .byte $b9, $62, $42, 1921
+  .byte $f1, $06, $25, 9
+  .byte $f1, $15, $35, 8
+  .byte $f1, $05, $41, 7
+  .byte $25, $71, $52, 6
+  .byte $19, $17, $37, 5
+  .byte $c5, $74, $77, 4
+  .byte $c5, $62, $42, 3
+  .byte $b9, $74, $77, 2
+  .byte $b9, $62, $42, 1
   .byte $b9, $61, $51, GEN_BOOK_CHAIN_END
   .byte $65, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $1d, $66, $56, 1924
-  .byte $1d, $64, $44, 1925
-  .byte $1d, $64, $54, 1926
-  .byte $59, $41, $14, 1927
-  .byte $59, $41, $32, 1928
-  .byte $59, $41, $30, 1929
-  .byte $e1, $64, $44, 1930
-  .byte $e1, $66, $56, 1931
-  .byte $e1, $63, $43, 1932
-  .byte $e5, $14, $24, 1933
-  .byte $e5, $16, $26, 1934
-  .byte $e5, $10, $20, 1935
-  .byte $b9, $05, $16, 1936
-  .byte $b9, $12, $22, 1937
-  .byte $ed, $33, $42, 1938
-  .byte $ed, $16, $26, 1939
-  .byte $f1, $71, $52, 1940
+  .byte $1d, $66, $56, 17
+  .byte $1d, $64, $44, 16
+  .byte $1d, $64, $54, 15
+  .byte $59, $41, $14, 14
+  .byte $59, $41, $32, 13
+  .byte $59, $41, $30, 12
+  .byte $e1, $64, $44, 11
+  .byte $e1, $66, $56, 10
+  .byte $e1, $63, $43, 9
+  .byte $e5, $14, $24, 8
+  .byte $e5, $16, $26, 7
+  .byte $e5, $10, $20, 6
+  .byte $b9, $05, $16, 5
+  .byte $b9, $12, $22, 4
+  .byte $ed, $33, $42, 3
+  .byte $ed, $16, $26, 2
+  .byte $f1, $71, $52, 1
   .byte $f1, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $4d, $75, $66, 1942
-  .byte $31, $75, $66, 1943
-  .byte $71, $14, $24, 1944
-  .byte $bd, $43, $33, 1945
-  .byte $c5, $01, $22, 1946
-  .byte $c5, $14, $24, 1947
+  .byte $4d, $75, $66, 6
+  .byte $31, $75, $66, 5
+  .byte $71, $14, $24, 4
+  .byte $bd, $43, $33, 3
+  .byte $c5, $01, $22, 2
+  .byte $c5, $14, $24, 1
   .byte $a1, $64, $55, GEN_BOOK_CHAIN_END
-  .byte $e1, $63, $43, 1949
-  .byte $e1, $75, $42, 1950
-  .byte $9d, $71, $52, 1951
-  .byte $9d, $66, $56, 1952
-  .byte $a9, $06, $25, 1953
-  .byte $e5, $75, $53, 1954
+  .byte $e1, $63, $43, 6
+  .byte $e1, $75, $42, 5
+  .byte $9d, $71, $52, 4
+  .byte $9d, $66, $56, 3
+  .byte $a9, $06, $25, 2
+  .byte $e5, $75, $53, 1
   .byte $a5, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $f5, $06, $25, 1956
-  .byte $f5, $14, $24, 1957
-  .byte $f5, $33, $42, 1958
-  .byte $f1, $64, $44, 1959
-  .byte $f1, $64, $54, 1960
-  .byte $f1, $43, $33, 1961
-  .byte $e5, $55, $43, 1962
+  .byte $f5, $06, $25, 7
+  .byte $f5, $14, $24, 6
+  .byte $f5, $33, $42, 5
+  .byte $f1, $64, $44, 4
+  .byte $f1, $64, $54, 3
+  .byte $f1, $43, $33, 2
+  .byte $e5, $55, $43, 1
   .byte $09, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $05, $12, $32, 1964
-  .byte $05, $17, $27, 1965
-  .byte $05, $05, $14, 1966
-  .byte $9d, $15, $35, 1967
-  .byte $4d, $01, $22, 1968
-  .byte $4d, $06, $25, 1969
-  .byte $59, $16, $26, 1970
+  .byte $05, $12, $32, 7
+  .byte $05, $17, $27, 6
+  .byte $05, $05, $14, 5
+  .byte $9d, $15, $35, 4
+  .byte $4d, $01, $22, 3
+  .byte $4d, $06, $25, 2
+  .byte $59, $16, $26, 1
   .byte $59, $12, $22, GEN_BOOK_CHAIN_END
-  .byte $95, $43, $33, 1972
-  .byte $95, $62, $42, 1973
-  .byte $95, $64, $54, 1974
-  .byte $75, $33, $44, 1975
-  .byte $75, $16, $26, 1976
-  .byte $d1, $76, $55, 1977
-  .byte $6d, $06, $25, 1978
-  .byte $6d, $01, $13, 1979
+  .byte $95, $43, $33, 8
+  .byte $95, $62, $42, 7
+  .byte $95, $64, $54, 6
+  .byte $75, $33, $44, 5
+  .byte $75, $16, $26, 4
+  .byte $d1, $76, $55, 3
+  .byte $6d, $06, $25, 2
+  .byte $6d, $01, $13, 1
   .byte $6d, $15, $35, GEN_BOOK_CHAIN_END
-  .byte $c5, $75, $66, 1981
+  .byte $c5, $75, $66, 1
   .byte $d1, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $f9, $75, $66, 1983
-  .byte $85, $75, $66, 1984
-  .byte $ad, $61, $51, 1985
-  .byte $ad, $75, $66, 1986
-  .byte $9d, $71, $50, 1987
+  .byte $f9, $75, $66, 5
+  .byte $85, $75, $66, 4
+  .byte $ad, $61, $51, 3
+  .byte $ad, $75, $66, 2
+  .byte $9d, $71, $50, 1
   .byte $9d, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $d9, $71, $63, 1989
-  .byte $d9, $44, $34, 1990
-  .byte $d9, $71, $52, 1991
-  .byte $0d, $12, $22, 1992
-  .byte $0d, $16, $26, 1993
+  .byte $d9, $71, $63, 5
+  .byte $d9, $44, $34, 4
+  .byte $d9, $71, $52, 3
+  .byte $0d, $12, $22, 2
+  .byte $0d, $16, $26, 1
   .byte $0d, $02, $35, GEN_BOOK_CHAIN_END
-  .byte $15, $06, $25, 1995
-  .byte $15, $12, $22, 1996
-  .byte $15, $14, $24, 1997
-  .byte $1d, $13, $33, 1998
-  .byte $69, $06, $25, 1999
-  .byte $69, $16, $26, 2000
-  .byte $69, $13, $23, 2001
-  .byte $e9, $63, $53, 2002
-  .byte $c5, $16, $26, 2003
-  .byte $09, $66, $56, 2004
+  .byte $15, $06, $25, 10
+  .byte $15, $12, $22, 9
+  .byte $15, $14, $24, 8
+  .byte $1d, $13, $33, 7
+  .byte $69, $06, $25, 6
+  .byte $69, $16, $26, 5
+  .byte $69, $13, $23, 4
+  .byte $e9, $63, $53, 3
+  .byte $c5, $16, $26, 2
+  .byte $09, $66, $56, 1
   .byte $09, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $a5, $13, $33, 2006
-  .byte $a5, $11, $21, 2007
-  .byte $a5, $12, $32, 2008
-  .byte $29, $63, $43, 2009
-  .byte $29, $71, $52, 2010
-  .byte $81, $14, $24, 2011
-  .byte $81, $33, $42, 2012
-  .byte $85, $64, $54, 2013
-  .byte $01, $63, $43, 2014
-  .byte $c1, $05, $16, 2015
+  .byte $a5, $13, $33, 10
+  .byte $a5, $11, $21, 9
+  .byte $a5, $12, $32, 8
+  .byte $29, $63, $43, 7
+  .byte $29, $71, $52, 6
+  .byte $81, $14, $24, 5
+  .byte $81, $33, $42, 4
+  .byte $85, $64, $54, 3
+  .byte $01, $63, $43, 2
+  .byte $c1, $05, $16, 1
   .byte $c1, $12, $22, GEN_BOOK_CHAIN_END
-  .byte $b5, $76, $55, 2017
-  .byte $15, $01, $22, 2018
-  .byte $89, $16, $26, 2019
-  .byte $89, $12, $32, 2020
-  .byte $7d, $73, $51, 2021
-  .byte $7d, $42, $33, 2022
-  .byte $7d, $72, $36, 2023
-  .byte $61, $60, $50, 2024
+  .byte $b5, $76, $55, 8
+  .byte $15, $01, $22, 7
+  .byte $89, $16, $26, 6
+  .byte $89, $12, $32, 5
+  .byte $7d, $73, $51, 4
+  .byte $7d, $42, $33, 3
+  .byte $7d, $72, $36, 2
+  .byte $61, $60, $50, 1
   .byte $61, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $19, $75, $66, 2026
+  .byte $19, $75, $66, 1
   .byte $ed, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $b5, $71, $52, 2028
-  .byte $b5, $66, $56, 2029
-  .byte $b5, $63, $43, 2030
-  .byte $61, $74, $77, 2031
+  .byte $b5, $71, $52, 4
+  .byte $b5, $66, $56, 3
+  .byte $b5, $63, $43, 2
+  .byte $61, $74, $77, 1
   .byte $61, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $bd, $75, $66, 2033
-  .byte $85, $12, $32, 2034
-  .byte $f1, $64, $54, 2035
-  .byte $ed, $14, $34, 2036
+  .byte $bd, $75, $66, 4
+  .byte $85, $12, $32, 3
+  .byte $f1, $64, $54, 2
+  .byte $ed, $14, $34, 1
   .byte $25, $64, $54, GEN_BOOK_CHAIN_END
   .byte $99, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $3d, $06, $25, 2039
-  .byte $71, $71, $52, 2040
-  .byte $71, $73, $51, 2041
+  .byte $3d, $06, $25, 3
+  .byte $71, $71, $52, 2
+  .byte $71, $73, $51, 1
   .byte $2d, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $51, $66, $56, 2043
-  .byte $51, $76, $64, 2044
-  .byte $51, $76, $55, 2045
+  .byte $51, $66, $56, 3
+  .byte $51, $76, $64, 2
+  .byte $51, $76, $55, 1
   .byte $01, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $c5, $14, $24, 2047
-  .byte $c5, $01, $22, 2048
-  .byte $c5, $14, $34, 2049
+  .byte $c5, $14, $24, 3
+  .byte $c5, $01, $22, 2
+  .byte $c5, $14, $34, 1
   .byte $cd, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $a1, $01, $22, 2051
-  .byte $a1, $11, $31, 2052
-  .byte $dd, $63, $43, 2053
+  .byte $a1, $01, $22, 3
+  .byte $a1, $11, $31, 2
+  .byte $dd, $63, $43, 1
   .byte $dd, $75, $74, GEN_BOOK_CHAIN_END
-  .byte $6d, $13, $33, 2055
-  .byte $75, $06, $25, 2056
-  .byte $75, $03, $33, 2057
+  .byte $6d, $13, $33, 3
+  .byte $75, $06, $25, 2
+  .byte $75, $03, $33, 1
   .byte $49, $54, $43, GEN_BOOK_CHAIN_END
-  .byte $c9, $24, $33, 2059
-  .byte $29, $13, $23, 2060
-  .byte $29, $04, $07, 2061
+  .byte $c9, $24, $33, 3
+  .byte $29, $13, $23, 2
+  .byte $29, $04, $07, 1
   .byte $29, $12, $32, GEN_BOOK_CHAIN_END
   .byte $e1, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $01, $62, $42, 2064
-  .byte $01, $66, $56, 2065
-  .byte $01, $64, $44, 2066
+  .byte $01, $62, $42, 3
+  .byte $01, $66, $56, 2
+  .byte $01, $64, $44, 1
   .byte $79, $73, $63, GEN_BOOK_CHAIN_END
-  .byte $51, $75, $66, 2068
-  .byte $2d, $75, $66, 2069
-  .byte $65, $01, $22, 2070
-  .byte $65, $13, $33, 2071
-  .byte $2d, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $0d, $05, $16, 2073
-  .byte $0d, $13, $23, 2074
-  .byte $0d, $12, $22, 2075
-  .byte $39, $65, $55, 2076
-  .byte $39, $43, $33, 2077
-  .byte $39, $75, $66, 2078
-  .byte $dd, $01, $13, 2079
+  .byte $51, $75, $66, 2
+  .byte $65, $01, $22, 1
+  .byte $65, $13, $33, GEN_BOOK_CHAIN_END
+  .byte $0d, $05, $16, 4
+  .byte $0d, $13, $23, 3
+  .byte $0d, $12, $22, 2
+  .byte $dd, $01, $13, 1
   .byte $e1, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $a1, $63, $53, 2081
+  .byte $a1, $63, $53, 1
   .byte $35, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $19, $62, $42, 2083
-  .byte $81, $71, $63, 2084
+  .byte $19, $62, $42, 2
+  .byte $81, $71, $63, 1
   .byte $e1, $71, $52, GEN_BOOK_CHAIN_END
   .byte $01, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $2d, $05, $16, 2087
-  .byte $65, $63, $43, 2088
+  .byte $2d, $05, $16, 2
+  .byte $65, $63, $43, 1
   .byte $65, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $91, $06, $25, 2090
-  .byte $91, $16, $26, 2091
-  .byte $91, $14, $34, 2092
-  .byte $1d, $71, $52, 2093
-  .byte $1d, $66, $56, 2094
-  .byte $1d, $63, $43, 2095
+  .byte $91, $06, $25, 6
+  .byte $91, $16, $26, 5
+  .byte $91, $14, $34, 4
+  .byte $1d, $71, $52, 3
+  .byte $1d, $66, $56, 2
+  .byte $1d, $63, $43, 1
   .byte $bd, $73, $03, GEN_BOOK_CHAIN_END
-  .byte $2d, $63, $43, 2097
+  .byte $2d, $63, $43, 1
   .byte $95, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $05, $02, $11, 2099
-  .byte $11, $13, $23, 2100
+  .byte $05, $02, $11, 2
+  .byte $11, $13, $23, 1
   .byte $3d, $12, $22, GEN_BOOK_CHAIN_END
-  .byte $d5, $05, $41, 2102
-  .byte $a9, $05, $14, 2103
-  .byte $a9, $12, $22, 2104
-  .byte $a9, $01, $13, 2105
+  .byte $d5, $05, $41, 4
+  .byte $a9, $05, $14, 3
+  .byte $a9, $12, $22, 2
+  .byte $a9, $01, $13, 1
   .byte $7d, $14, $34, GEN_BOOK_CHAIN_END
-  .byte $71, $71, $52, 2107
-  .byte $71, $76, $55, 2108
-  .byte $71, $62, $42, 2109
-  .byte $e5, $01, $22, 2110
-  .byte $e5, $05, $16, 2111
+  .byte $71, $71, $52, 5
+  .byte $71, $76, $55, 4
+  .byte $71, $62, $42, 3
+  .byte $e5, $01, $22, 2
+  .byte $e5, $05, $16, 1
   .byte $e5, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $05, $75, $66, 2113
-  .byte $05, $71, $52, 2114
-  .byte $7d, $13, $33, 2115
-  .byte $7d, $04, $07, 2116
-  .byte $7d, $12, $32, 2117
-  .byte $d1, $71, $52, 2118
-  .byte $d1, $42, $33, 2119
+  .byte $05, $75, $66, 7
+  .byte $05, $71, $52, 6
+  .byte $7d, $13, $33, 5
+  .byte $7d, $04, $07, 4
+  .byte $7d, $12, $32, 3
+  .byte $d1, $71, $52, 2
+  .byte $d1, $42, $33, 1
   .byte $d1, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $29, $75, $66, 2121
-  .byte $f1, $64, $54, 2122
-  .byte $e9, $32, $43, 2123
+  .byte $29, $75, $66, 3
+  .byte $f1, $64, $54, 2
+  .byte $e9, $32, $43, 1
   .byte $19, $55, $43, GEN_BOOK_CHAIN_END
   .byte $6d, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $22, $06, $25, 2126
-  .byte $22, $10, $20, 2127
-  .byte $22, $01, $22, 2128
-  .byte $a6, $63, $53, 2129
+  .byte $22, $06, $25, 4
+  .byte $22, $10, $20, 3
+  .byte $22, $01, $22, 2
+  .byte $a6, $63, $53, 1
   .byte $a6, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $9e, $63, $43, 2131
-  .byte $9e, $76, $55, 2132
+  .byte $9e, $63, $43, 2
+  .byte $9e, $76, $55, 1
   .byte $b6, $72, $54, GEN_BOOK_CHAIN_END
-  .byte $4e, $02, $11, 2134
-  .byte $ee, $72, $63, 2135
-  .byte $ee, $71, $63, 2136
+  .byte $4e, $02, $11, 3
+  .byte $ee, $72, $63, 2
+  .byte $ee, $71, $63, 1
   .byte $86, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $2e, $13, $23, 2138
-  .byte $1e, $02, $13, 2139
-  .byte $1e, $01, $22, 2140
-  .byte $1e, $01, $13, 2141
+  .byte $2e, $13, $23, 4
+  .byte $1e, $02, $13, 3
+  .byte $1e, $01, $22, 2
+  .byte $1e, $01, $13, 1
   .byte $b6, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $be, $05, $16, 2143
+  .byte $be, $05, $16, 1
   .byte $12, $04, $07, GEN_BOOK_CHAIN_END
   .byte $76, $34, $44, GEN_BOOK_CHAIN_END
   .byte $c6, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $42, $05, $16, 2147
-  .byte $da, $25, $33, 2148
-  .byte $ae, $64, $44, 2149
-  .byte $ae, $72, $36, 2150
+  .byte $42, $05, $16, 4
+  .byte $da, $25, $33, 3
+  .byte $ae, $64, $44, 2
+  .byte $ae, $72, $36, 1
   .byte $ae, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $72, $63, $43, 2152
-  .byte $72, $66, $56, 2153
-  .byte $72, $61, $51, 2154
-  .byte $ba, $06, $25, 2155
-  .byte $96, $72, $54, 2156
-  .byte $96, $43, $22, 2157
+  .byte $72, $63, $43, 6
+  .byte $72, $66, $56, 5
+  .byte $72, $61, $51, 4
+  .byte $ba, $06, $25, 3
+  .byte $96, $72, $54, 2
+  .byte $96, $43, $22, 1
   .byte $96, $43, $51, GEN_BOOK_CHAIN_END
   .byte $7e, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $5a, $05, $16, 2160
-  .byte $5a, $06, $25, 2161
-  .byte $5a, $13, $23, 2162
-  .byte $0e, $13, $33, 2163
-  .byte $c2, $43, $34, 2164
-  .byte $c2, $76, $55, 2165
+  .byte $5a, $05, $16, 6
+  .byte $5a, $06, $25, 5
+  .byte $5a, $13, $23, 4
+  .byte $0e, $13, $33, 3
+  .byte $c2, $43, $34, 2
+  .byte $c2, $76, $55, 1
   .byte $f2, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $32, $71, $52, 2167
-  .byte $32, $63, $43, 2168
-  .byte $32, $66, $56, 2169
+  .byte $32, $71, $52, 3
+  .byte $32, $63, $43, 2
+  .byte $32, $66, $56, 1
   .byte $f6, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $2a, $62, $42, 2171
-  .byte $ce, $66, $56, 2172
-  .byte $1a, $11, $21, 2173
+  .byte $2a, $62, $42, 3
+  .byte $ce, $66, $56, 2
+  .byte $1a, $11, $21, 1
   .byte $1a, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $c6, $02, $46, 2175
-  .byte $c6, $16, $26, 2176
-  .byte $c6, $06, $25, 2177
+  .byte $c6, $02, $46, 3
+  .byte $c6, $16, $26, 2
+  .byte $c6, $06, $25, 1
   .byte $0a, $76, $55, GEN_BOOK_CHAIN_END
   .byte $aa, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $66, $64, $44, 2180
-  .byte $16, $76, $55, 2181
-  .byte $ea, $06, $25, 2182
-  .byte $ea, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $36, $34, $45, 2184
-  .byte $62, $75, $66, 2185
-  .byte $92, $06, $25, 2186
+  .byte $66, $64, $44, 1
+  .byte $16, $76, $55, GEN_BOOK_CHAIN_END
+  .byte $36, $34, $45, 3
+  .byte $62, $75, $66, 2
+  .byte $92, $06, $25, 1
   .byte $92, $01, $22, GEN_BOOK_CHAIN_END
   .byte $ae, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $16, $01, $22, 2189
-  .byte $16, $10, $20, 2190
-  .byte $16, $13, $23, 2191
-  .byte $a6, $55, $36, 2192
-  .byte $a6, $55, $63, 2193
-  .byte $f6, $63, $43, 2194
-  .byte $b2, $66, $56, 2195
+  .byte $16, $01, $22, 7
+  .byte $16, $10, $20, 6
+  .byte $16, $13, $23, 5
+  .byte $a6, $55, $36, 4
+  .byte $a6, $55, $63, 3
+  .byte $f6, $63, $43, 2
+  .byte $b2, $66, $56, 1
   .byte $b2, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $ce, $13, $33, 2197
-  .byte $ce, $16, $26, 2198
+  .byte $ce, $13, $33, 2
+  .byte $ce, $16, $26, 1
   .byte $7e, $75, $66, GEN_BOOK_CHAIN_END
   .byte $0a, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $8e, $62, $42, 2201
-  .byte $8e, $72, $45, 2202
+  .byte $8e, $62, $42, 2
+  .byte $8e, $72, $45, 1
   .byte $06, $52, $33, GEN_BOOK_CHAIN_END
-  .byte $1e, $06, $25, 2204
-  .byte $1e, $10, $20, 2205
-  .byte $1e, $12, $32, 2206
-  .byte $f6, $71, $52, 2207
-  .byte $f6, $63, $43, 2208
-  .byte $f6, $63, $53, 2209
-  .byte $5a, $73, $63, 2210
-  .byte $5a, $65, $55, 2211
+  .byte $1e, $06, $25, 8
+  .byte $1e, $10, $20, 7
+  .byte $1e, $12, $32, 6
+  .byte $f6, $71, $52, 5
+  .byte $f6, $63, $43, 4
+  .byte $f6, $63, $53, 3
+  .byte $5a, $73, $63, 2
+  .byte $5a, $65, $55, 1
   .byte $5a, $67, $57, GEN_BOOK_CHAIN_END
-  .byte $f2, $06, $25, 2213
-  .byte $f2, $15, $35, 2214
-  .byte $f2, $12, $32, 2215
-  .byte $4a, $13, $23, 2216
-  .byte $4a, $16, $26, 2217
+  .byte $f2, $06, $25, 5
+  .byte $f2, $15, $35, 4
+  .byte $f2, $12, $32, 3
+  .byte $4a, $13, $23, 2
+  .byte $4a, $16, $26, 1
   .byte $52, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $96, $74, $77, 2219
-  .byte $96, $61, $51, 2220
+  .byte $96, $74, $77, 2
+  .byte $96, $61, $51, 1
   .byte $96, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $7a, $14, $24, 2222
-  .byte $7a, $16, $26, 2223
-  .byte $7a, $13, $33, 2224
-  .byte $62, $01, $22, 2225
+  .byte $7a, $14, $24, 4
+  .byte $7a, $16, $26, 3
+  .byte $7a, $13, $33, 2
+  .byte $62, $01, $22, 1
   .byte $1a, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $06, $44, $34, 2227
-  .byte $ee, $32, $43, 2228
+  .byte $06, $44, $34, 2
+  .byte $ee, $32, $43, 1
   .byte $ee, $14, $24, GEN_BOOK_CHAIN_END
   .byte $26, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $ea, $64, $54, 2231
+  .byte $ea, $64, $54, 1
   .byte $ea, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $fa, $62, $42, 2233
-  .byte $fa, $43, $32, 2234
-  .byte $4a, $32, $43, 2235
+  .byte $fa, $62, $42, 3
+  .byte $fa, $43, $32, 2
+  .byte $4a, $32, $43, 1
   .byte $ba, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $ee, $06, $25, 2237
-  .byte $56, $06, $25, 2238
-  .byte $56, $14, $24, 2239
-  .byte $2e, $60, $50, 2240
-  .byte $2e, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $fe, $64, $54, 2242
-  .byte $66, $44, $34, 2243
-  .byte $66, $75, $53, 2244
-  .byte $62, $74, $77, 2245
-  .byte $62, $72, $36, 2246
-  .byte $22, $74, $77, 2247
+  .byte $ee, $06, $25, 2
+  .byte $56, $06, $25, 1
+  .byte $56, $14, $24, GEN_BOOK_CHAIN_END
+  .byte $fe, $64, $54, 6
+  .byte $66, $44, $34, 5
+  .byte $66, $75, $53, 4
+  .byte $62, $74, $77, 3
+  .byte $62, $72, $36, 2
+  .byte $22, $74, $77, 1
   .byte $96, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $e2, $74, $77, 2249
+  .byte $e2, $74, $77, 1
   .byte $fe, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $9a, $13, $33, 2251
-  .byte $e2, $25, $44, 2252
+  .byte $9a, $13, $33, 2
+  .byte $e2, $25, $44, 1
   .byte $66, $06, $25, GEN_BOOK_CHAIN_END
   .byte $3a, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $e6, $71, $52, 2255
-  .byte $e6, $66, $56, 2256
-  .byte $e6, $72, $36, 2257
-  .byte $0e, $01, $22, 2258
-  .byte $0e, $06, $25, 2259
-  .byte $0e, $32, $43, 2260
-  .byte $8a, $64, $44, 2261
+  .byte $e6, $71, $52, 7
+  .byte $e6, $66, $56, 6
+  .byte $e6, $72, $36, 5
+  .byte $0e, $01, $22, 4
+  .byte $0e, $06, $25, 3
+  .byte $0e, $32, $43, 2
+  .byte $8a, $64, $44, 1
   .byte $4e, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $92, $13, $33, 2263
-  .byte $92, $05, $14, 2264
-  .byte $b2, $64, $44, 2265
-  .byte $b2, $66, $56, 2266
+  .byte $92, $13, $33, 4
+  .byte $92, $05, $14, 3
+  .byte $b2, $64, $44, 2
+  .byte $b2, $66, $56, 1
   .byte $b2, $43, $34, GEN_BOOK_CHAIN_END
-  .byte $7a, $72, $45, 2268
-  .byte $2e, $64, $54, 2269
-  .byte $2e, $63, $43, 2270
-  .byte $2e, $42, $33, 2271
+  .byte $7a, $72, $45, 4
+  .byte $2e, $64, $54, 3
+  .byte $2e, $63, $43, 2
+  .byte $2e, $42, $33, 1
   .byte $f2, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $5e, $05, $16, 2273
+  .byte $5e, $05, $16, 1
   .byte $a6, $63, $43, GEN_BOOK_CHAIN_END
   .byte $3e, $25, $44, GEN_BOOK_CHAIN_END
-  .byte $b2, $14, $24, 2276
-  .byte $b2, $02, $11, 2277
-  .byte $8a, $03, $30, 2278
+  .byte $b2, $14, $24, 3
+  .byte $b2, $02, $11, 2
+  .byte $8a, $03, $30, 1
   .byte $8a, $44, $25, GEN_BOOK_CHAIN_END
-  .byte $3e, $76, $55, 2280
-  .byte $3e, $66, $56, 2281
-  .byte $3e, $64, $54, 2282
+  .byte $3e, $76, $55, 3
+  .byte $3e, $66, $56, 2
+  .byte $3e, $64, $54, 1
   .byte $b6, $32, $43, GEN_BOOK_CHAIN_END
-  .byte $2e, $16, $26, 2284
+  .byte $2e, $16, $26, 1
   .byte $3a, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $d6, $13, $33, 2286
+  .byte $d6, $13, $33, 1
   .byte $d6, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $12, $43, $33, 2288
-  .byte $a2, $05, $16, 2289
+  .byte $12, $43, $33, 2
+  .byte $a2, $05, $16, 1
   .byte $5a, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $ee, $06, $25, 2291
-  .byte $ee, $13, $33, 2292
-  .byte $ee, $12, $32, 2293
-  .byte $2a, $75, $66, 2294
-  .byte $56, $13, $33, 2295
-  .byte $2a, $33, $42, 2296
-  .byte $2a, $05, $14, 2297
+  .byte $ee, $06, $25, 4
+  .byte $ee, $13, $33, 3
+  .byte $ee, $12, $32, 2
+  .byte $56, $13, $33, 1
   .byte $92, $05, $41, GEN_BOOK_CHAIN_END
-  .byte $7a, $06, $25, 2299
-  .byte $7a, $01, $22, 2300
-  .byte $7a, $16, $26, 2301
+  .byte $7a, $06, $25, 3
+  .byte $7a, $01, $22, 2
+  .byte $7a, $16, $26, 1
   .byte $2a, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $86, $64, $44, 2303
-  .byte $86, $63, $43, 2304
-  .byte $86, $66, $56, 2305
-  .byte $6a, $05, $16, 2306
-  .byte $f6, $72, $36, 2307
-  .byte $ae, $62, $52, 2308
-  .byte $ae, $75, $74, 2309
+  .byte $86, $64, $44, 7
+  .byte $86, $63, $43, 6
+  .byte $86, $66, $56, 5
+  .byte $6a, $05, $16, 4
+  .byte $f6, $72, $36, 3
+  .byte $ae, $62, $52, 2
+  .byte $ae, $75, $74, 1
   .byte $ae, $71, $52, GEN_BOOK_CHAIN_END
   .byte $9e, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $ea, $66, $56, 2312
-  .byte $ea, $76, $55, 2313
-  .byte $ea, $75, $42, 2314
-  .byte $62, $16, $26, 2315
+  .byte $ea, $66, $56, 4
+  .byte $ea, $76, $55, 3
+  .byte $ea, $75, $42, 2
+  .byte $62, $16, $26, 1
   .byte $62, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $0a, $63, $43, 2317
+  .byte $0a, $63, $43, 1
   .byte $1a, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $fa, $02, $35, 2319
-  .byte $fa, $22, $32, 2320
-  .byte $f6, $76, $55, 2321
-  .byte $f6, $66, $56, 2322
-  .byte $4a, $06, $25, 2323
-  .byte $8a, $01, $13, 2324
+  .byte $fa, $02, $35, 6
+  .byte $fa, $22, $32, 5
+  .byte $f6, $76, $55, 4
+  .byte $f6, $66, $56, 3
+  .byte $4a, $06, $25, 2
+  .byte $8a, $01, $13, 1
   .byte $26, $22, $33, GEN_BOOK_CHAIN_END
-  .byte $4e, $14, $34, 2326
+  .byte $4e, $14, $34, 1
   .byte $c2, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $82, $66, $56, 2328
-  .byte $82, $76, $55, 2329
-  .byte $82, $63, $43, 2330
-  .byte $fe, $65, $45, 2331
-  .byte $fe, $76, $55, 2332
+  .byte $82, $66, $56, 5
+  .byte $82, $76, $55, 4
+  .byte $82, $63, $43, 3
+  .byte $fe, $65, $45, 2
+  .byte $fe, $76, $55, 1
   .byte $fe, $72, $54, GEN_BOOK_CHAIN_END
-  .byte $96, $33, $44, 2334
-  .byte $96, $16, $26, 2335
-  .byte $7e, $14, $24, 2336
-  .byte $7e, $13, $33, 2337
-  .byte $7e, $16, $26, 2338
-  .byte $52, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $92, $66, $56, 2340
-  .byte $92, $63, $43, 2341
-  .byte $6a, $24, $33, 2342
-  .byte $ce, $34, $43, 2343
-  .byte $a2, $75, $53, 2344
-  .byte $a2, $76, $64, 2345
+  .byte $96, $33, $44, 1
+  .byte $96, $16, $26, GEN_BOOK_CHAIN_END
+  .byte $92, $66, $56, 6
+  .byte $92, $63, $43, 5
+  .byte $6a, $24, $33, 4
+  .byte $ce, $34, $43, 3
+  .byte $a2, $75, $53, 2
+  .byte $a2, $76, $64, 1
   .byte $a2, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $92, $64, $54, 2347
+  .byte $92, $64, $54, 1
   .byte $92, $36, $25, GEN_BOOK_CHAIN_END
   .byte $a2, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $26, $62, $42, 2350
-  .byte $26, $76, $55, 2351
-  .byte $26, $72, $36, 2352
-  .byte $e2, $75, $66, 2353
+  .byte $26, $62, $42, 4
+  .byte $26, $76, $55, 3
+  .byte $26, $72, $36, 2
+  .byte $e2, $75, $66, 1
   .byte $9a, $17, $27, GEN_BOOK_CHAIN_END
-  .byte $3e, $76, $55, 2355
-  .byte $3e, $63, $53, 2356
-  .byte $02, $11, $21, 2357
-  .byte $02, $13, $33, 2358
-  .byte $02, $01, $22, 2359
-  .byte $6a, $42, $33, 2360
-  .byte $6a, $76, $55, 2361
-  .byte $a2, $74, $77, 2362
+  .byte $3e, $76, $55, 8
+  .byte $3e, $63, $53, 7
+  .byte $02, $11, $21, 6
+  .byte $02, $13, $33, 5
+  .byte $02, $01, $22, 4
+  .byte $6a, $42, $33, 3
+  .byte $6a, $76, $55, 2
+  .byte $a2, $74, $77, 1
   .byte $a2, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $6e, $01, $13, 2364
-  .byte $6e, $46, $55, 2365
-  .byte $6e, $16, $26, 2366
-  .byte $42, $16, $26, 2367
-  .byte $66, $13, $23, 2368
-  .byte $82, $71, $52, 2369
-  .byte $82, $75, $53, 2370
+  .byte $6e, $01, $13, 7
+  .byte $6e, $46, $55, 6
+  .byte $6e, $16, $26, 5
+  .byte $42, $16, $26, 4
+  .byte $66, $13, $23, 3
+  .byte $82, $71, $52, 2
+  .byte $82, $75, $53, 1
   .byte $32, $06, $25, GEN_BOOK_CHAIN_END
   .byte $c2, $43, $54, GEN_BOOK_CHAIN_END
-  .byte $fa, $34, $43, 2373
-  .byte $a6, $16, $26, 2374
-  .byte $a6, $14, $24, 2375
+  .byte $fa, $34, $43, 3
+  .byte $a6, $16, $26, 2
+  .byte $a6, $14, $24, 1
   .byte $d6, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $fe, $75, $66, 2377
-  .byte $ba, $71, $63, 2378
-  .byte $0e, $76, $55, 2379
-  .byte $0e, $64, $44, 2380
-  .byte $6a, $71, $52, 2381
+  .byte $fe, $75, $66, 5
+  .byte $ba, $71, $63, 4
+  .byte $0e, $76, $55, 3
+  .byte $0e, $64, $44, 2
+  .byte $6a, $71, $52, 1
   .byte $56, $11, $31, GEN_BOOK_CHAIN_END
-  .byte $86, $13, $33, 2383
-  .byte $86, $13, $23, 2384
-  .byte $7e, $14, $34, 2385
-  .byte $7e, $05, $16, 2386
+  .byte $86, $13, $33, 4
+  .byte $86, $13, $23, 3
+  .byte $7e, $14, $34, 2
+  .byte $7e, $05, $16, 1
   .byte $0e, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $d6, $66, $56, 2388
-  .byte $da, $06, $25, 2389
-  .byte $da, $01, $22, 2390
-  .byte $da, $12, $22, 2391
-  .byte $d2, $06, $25, 2392
-  .byte $d2, $01, $22, 2393
-  .byte $36, $06, $25, 2394
-  .byte $e2, $05, $16, 2395
-  .byte $e6, $60, $50, 2396
-  .byte $e6, $72, $36, 2397
-  .byte $e6, $64, $54, 2398
-  .byte $4e, $75, $53, 2399
-  .byte $9a, $75, $66, 2400
+  .byte $d6, $66, $56, 13
+  .byte $da, $06, $25, 12
+  .byte $da, $01, $22, 11
+  .byte $da, $12, $22, 10
+  .byte $d2, $06, $25, 9
+  .byte $d2, $01, $22, 8
+  .byte $36, $06, $25, 7
+  .byte $e2, $05, $16, 6
+  .byte $e6, $60, $50, 5
+  .byte $e6, $72, $36, 4
+  .byte $e6, $64, $54, 3
+  .byte $4e, $75, $53, 2
+  .byte $9a, $75, $66, 1
   .byte $46, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $86, $14, $24, 2402
-  .byte $92, $24, $33, 2403
-  .byte $32, $42, $33, 2404
-  .byte $32, $76, $55, 2405
-  .byte $32, $72, $45, 2406
-  .byte $8a, $43, $22, 2407
+  .byte $86, $14, $24, 6
+  .byte $92, $24, $33, 5
+  .byte $32, $42, $33, 4
+  .byte $32, $76, $55, 3
+  .byte $32, $72, $45, 2
+  .byte $8a, $43, $22, 1
   .byte $8a, $71, $52, GEN_BOOK_CHAIN_END
   .byte $d6, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $92, $72, $61, 2410
-  .byte $ae, $43, $52, 2411
-  .byte $d2, $10, $20, 2412
-  .byte $d2, $06, $25, 2413
-  .byte $d2, $16, $26, 2414
-  .byte $e6, $06, $25, 2415
-  .byte $e6, $14, $24, 2416
-  .byte $8e, $12, $32, 2417
+  .byte $92, $72, $61, 8
+  .byte $ae, $43, $52, 7
+  .byte $d2, $10, $20, 6
+  .byte $d2, $06, $25, 5
+  .byte $d2, $16, $26, 4
+  .byte $e6, $06, $25, 3
+  .byte $e6, $14, $24, 2
+  .byte $8e, $12, $32, 1
   .byte $8e, $04, $07, GEN_BOOK_CHAIN_END
-  .byte $ca, $32, $43, 2419
+  .byte $ca, $32, $43, 1
   .byte $3a, $73, $43, GEN_BOOK_CHAIN_END
-  .byte $96, $14, $34, 2421
-  .byte $96, $23, $33, 2422
+  .byte $96, $14, $34, 2
+  .byte $96, $23, $33, 1
   .byte $96, $16, $26, GEN_BOOK_CHAIN_END
   .byte $de, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $ee, $06, $25, 2425
-  .byte $ee, $16, $26, 2426
+  .byte $ee, $06, $25, 2
+  .byte $ee, $16, $26, 1
   .byte $62, $33, $21, GEN_BOOK_CHAIN_END
-  .byte $4a, $75, $66, 2428
-  .byte $de, $60, $50, 2429
-  .byte $d2, $23, $34, 2430
-  .byte $1e, $72, $36, 2431
-  .byte $1e, $42, $33, 2432
+  .byte $4a, $75, $66, 5
+  .byte $de, $60, $50, 4
+  .byte $d2, $23, $34, 3
+  .byte $1e, $72, $36, 2
+  .byte $1e, $42, $33, 1
   .byte $1e, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $22, $04, $07, 2434
+  .byte $22, $04, $07, 1
   .byte $6e, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $ce, $12, $32, 2436
-  .byte $ce, $13, $33, 2437
+  .byte $ce, $12, $32, 2
+  .byte $ce, $13, $33, 1
   .byte $76, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $a6, $02, $11, 2439
-  .byte $be, $76, $55, 2440
+  .byte $a6, $02, $11, 2
+  .byte $be, $76, $55, 1
   .byte $be, $76, $57, GEN_BOOK_CHAIN_END
-  .byte $22, $05, $16, 2442
-  .byte $46, $02, $11, 2443
+  .byte $22, $05, $16, 2
+  .byte $46, $02, $11, 1
   .byte $46, $05, $41, GEN_BOOK_CHAIN_END
-  .byte $b6, $71, $63, 2445
+  .byte $b6, $71, $63, 1
   .byte $b6, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $4e, $05, $16, 2447
+  .byte $4e, $05, $16, 1
   .byte $ca, $73, $64, GEN_BOOK_CHAIN_END
-  .byte $6e, $22, $33, 2449
-  .byte $6e, $06, $25, 2450
-  .byte $e6, $06, $25, 2451
-  .byte $e6, $13, $33, 2452
-  .byte $9a, $42, $33, 2453
-  .byte $9a, $72, $36, 2454
-  .byte $9a, $76, $55, 2455
+  .byte $6e, $22, $33, 7
+  .byte $6e, $06, $25, 6
+  .byte $e6, $06, $25, 5
+  .byte $e6, $13, $33, 4
+  .byte $9a, $42, $33, 3
+  .byte $9a, $72, $36, 2
+  .byte $9a, $76, $55, 1
   .byte $3a, $25, $44, GEN_BOOK_CHAIN_END
   .byte $1e, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $e6, $13, $33, 2458
-  .byte $9e, $01, $13, 2459
-  .byte $56, $67, $57, 2460
-  .byte $62, $52, $44, 2461
-  .byte $5e, $71, $52, 2462
+  .byte $e6, $13, $33, 5
+  .byte $9e, $01, $13, 4
+  .byte $56, $67, $57, 3
+  .byte $62, $52, $44, 2
+  .byte $5e, $71, $52, 1
   .byte $5e, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $6a, $16, $26, 2464
-  .byte $6a, $01, $13, 2465
+  .byte $6a, $16, $26, 2
+  .byte $6a, $01, $13, 1
   .byte $6a, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $e2, $66, $56, 2467
-  .byte $be, $75, $42, 2468
+  .byte $e2, $66, $56, 2
+  .byte $be, $75, $42, 1
   .byte $be, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $4a, $64, $44, 2470
-  .byte $3a, $05, $41, 2471
+  .byte $4a, $64, $44, 2
+  .byte $3a, $05, $41, 1
   .byte $e6, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $42, $13, $23, 2473
-  .byte $06, $16, $26, 2474
-  .byte $06, $13, $33, 2475
+  .byte $42, $13, $23, 3
+  .byte $06, $16, $26, 2
+  .byte $06, $13, $33, 1
   .byte $06, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $ca, $66, $56, 2477
-  .byte $ca, $63, $43, 2478
-  .byte $ca, $62, $42, 2479
-  .byte $0e, $16, $26, 2480
-  .byte $0e, $13, $23, 2481
-  .byte $0e, $15, $35, 2482
-  .byte $fa, $63, $43, 2483
-  .byte $66, $06, $25, 2484
+  .byte $ca, $66, $56, 8
+  .byte $ca, $63, $43, 7
+  .byte $ca, $62, $42, 6
+  .byte $0e, $16, $26, 5
+  .byte $0e, $13, $23, 4
+  .byte $0e, $15, $35, 3
+  .byte $fa, $63, $43, 2
+  .byte $66, $06, $25, 1
   .byte $66, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $8e, $03, $33, 2486
-  .byte $8e, $06, $25, 2487
-  .byte $7e, $32, $43, 2488
-  .byte $8e, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $8a, $14, $24, 2490
-  .byte $5a, $34, $44, 2491
-  .byte $6e, $75, $42, 2492
-  .byte $be, $63, $43, 2493
+  .byte $7e, $32, $43, GEN_BOOK_CHAIN_END
+  .byte $8a, $14, $24, 4
+  .byte $5a, $34, $44, 3
+  .byte $6e, $75, $42, 2
+  .byte $be, $63, $43, 1
   .byte $8e, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $06, $13, $33, 2495
-  .byte $be, $06, $25, 2496
-  .byte $fa, $06, $25, 2497
-  .byte $fa, $12, $32, 2498
-  .byte $fa, $10, $20, 2499
+  .byte $06, $13, $33, 5
+  .byte $be, $06, $25, 4
+  .byte $fa, $06, $25, 3
+  .byte $fa, $12, $32, 2
+  .byte $fa, $10, $20, 1
   .byte $1e, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $96, $01, $22, 2501
-  .byte $96, $16, $26, 2502
-  .byte $8a, $71, $52, 2503
+  .byte $96, $01, $22, 3
+  .byte $96, $16, $26, 2
+  .byte $8a, $71, $52, 1
   .byte $8a, $65, $55, GEN_BOOK_CHAIN_END
-  .byte $6e, $71, $52, 2505
-  .byte $6e, $64, $44, 2506
-  .byte $6e, $76, $55, 2507
-  .byte $d6, $71, $52, 2508
-  .byte $d6, $76, $55, 2509
-  .byte $72, $14, $24, 2510
-  .byte $72, $02, $46, 2511
-  .byte $72, $10, $20, 2512
+  .byte $6e, $71, $52, 8
+  .byte $6e, $64, $44, 7
+  .byte $6e, $76, $55, 6
+  .byte $d6, $71, $52, 5
+  .byte $d6, $76, $55, 4
+  .byte $72, $14, $24, 3
+  .byte $72, $02, $46, 2
+  .byte $72, $10, $20, 1
   .byte $fa, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $9e, $12, $32, 2514
-  .byte $9e, $11, $21, 2515
-  .byte $62, $10, $20, 2516
-  .byte $62, $14, $34, 2517
-  .byte $76, $71, $52, 2518
-  .byte $76, $63, $43, 2519
-  .byte $76, $76, $55, 2520
-  .byte $9a, $75, $66, 2521
+  .byte $9e, $12, $32, 8
+  .byte $9e, $11, $21, 7
+  .byte $62, $10, $20, 6
+  .byte $62, $14, $34, 5
+  .byte $76, $71, $52, 4
+  .byte $76, $63, $43, 3
+  .byte $76, $76, $55, 2
+  .byte $9a, $75, $66, 1
   .byte $aa, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $76, $75, $66, 2523
-  .byte $0a, $13, $33, 2524
-  .byte $0a, $11, $21, 2525
-  .byte $0a, $32, $43, 2526
+  .byte $76, $75, $66, 4
+  .byte $0a, $13, $33, 3
+  .byte $0a, $11, $21, 2
+  .byte $0a, $32, $43, 1
   .byte $ea, $75, $31, GEN_BOOK_CHAIN_END
   .byte $ce, $22, $33, GEN_BOOK_CHAIN_END
-  .byte $8a, $64, $54, 2529
-  .byte $12, $74, $77, 2530
-  .byte $12, $73, $64, 2531
+  .byte $8a, $64, $54, 3
+  .byte $12, $74, $77, 2
+  .byte $12, $73, $64, 1
   .byte $12, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $5e, $76, $55, 2533
-  .byte $5e, $76, $57, 2534
-  .byte $5e, $62, $42, 2535
+  .byte $5e, $76, $55, 3
+  .byte $5e, $76, $57, 2
+  .byte $5e, $62, $42, 1
   .byte $1e, $32, $43, GEN_BOOK_CHAIN_END
-  .byte $32, $06, $25, 2537
-  .byte $12, $05, $16, 2538
-  .byte $12, $06, $25, 2539
-  .byte $f6, $11, $21, 2540
-  .byte $9a, $01, $22, 2541
-  .byte $9a, $03, $21, 2542
+  .byte $32, $06, $25, 6
+  .byte $12, $05, $16, 5
+  .byte $12, $06, $25, 4
+  .byte $f6, $11, $21, 3
+  .byte $9a, $01, $22, 2
+  .byte $9a, $03, $21, 1
   .byte $9a, $02, $13, GEN_BOOK_CHAIN_END
-  .byte $16, $63, $43, 2544
-  .byte $8a, $05, $16, 2545
+  .byte $16, $63, $43, 2
+  .byte $8a, $05, $16, 1
   .byte $fe, $02, $11, GEN_BOOK_CHAIN_END
-  .byte $e2, $76, $55, 2547
-  .byte $ee, $06, $25, 2548
-  .byte $a2, $73, $03, 2549
+  .byte $e2, $76, $55, 3
+  .byte $ee, $06, $25, 2
+  .byte $a2, $73, $03, 1
   .byte $c6, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $3a, $13, $23, 2551
+  .byte $3a, $13, $23, 1
   .byte $3a, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $3e, $76, $55, 2553
-  .byte $3e, $75, $53, 2554
-  .byte $d6, $32, $43, 2555
+  .byte $3e, $76, $55, 3
+  .byte $3e, $75, $53, 2
+  .byte $d6, $32, $43, 1
   .byte $26, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $76, $32, $43, 2557
+  .byte $76, $32, $43, 1
   .byte $86, $73, $43, GEN_BOOK_CHAIN_END
   .byte $72, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $4e, $66, $56, 2560
-  .byte $4e, $76, $55, 2561
+  .byte $4e, $66, $56, 2
+  .byte $4e, $76, $55, 1
   .byte $4a, $33, $21, GEN_BOOK_CHAIN_END
-  .byte $72, $13, $33, 2563
-  .byte $ca, $71, $52, 2564
-  .byte $52, $01, $22, 2565
-  .byte $52, $06, $25, 2566
-  .byte $52, $10, $20, 2567
-  .byte $8e, $43, $33, 2568
+  .byte $72, $13, $33, 6
+  .byte $ca, $71, $52, 5
+  .byte $52, $01, $22, 4
+  .byte $52, $06, $25, 3
+  .byte $52, $10, $20, 2
+  .byte $8e, $43, $33, 1
   .byte $8e, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $1e, $61, $51, 2570
-  .byte $4a, $32, $43, 2571
-  .byte $aa, $43, $33, 2572
+  .byte $1e, $61, $51, 3
+  .byte $4a, $32, $43, 2
+  .byte $aa, $43, $33, 1
   .byte $ba, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $c6, $76, $55, 2574
-  .byte $c6, $71, $52, 2575
-  .byte $c6, $64, $54, 2576
-  .byte $32, $34, $43, 2577
-  .byte $32, $34, $44, 2578
-  .byte $3e, $13, $23, 2579
+  .byte $c6, $76, $55, 6
+  .byte $c6, $71, $52, 5
+  .byte $c6, $64, $54, 4
+  .byte $32, $34, $43, 3
+  .byte $32, $34, $44, 2
+  .byte $3e, $13, $23, 1
   .byte $42, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $16, $14, $34, 2581
-  .byte $16, $16, $26, 2582
-  .byte $96, $13, $23, 2583
+  .byte $16, $14, $34, 3
+  .byte $16, $16, $26, 2
+  .byte $96, $13, $23, 1
   .byte $96, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $ba, $06, $25, 2585
-  .byte $ba, $13, $33, 2586
-  .byte $ba, $15, $35, 2587
-  .byte $36, $71, $52, 2588
+  .byte $ba, $06, $25, 4
+  .byte $ba, $13, $33, 3
+  .byte $ba, $15, $35, 2
+  .byte $36, $71, $52, 1
   .byte $5e, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $ba, $02, $11, 2590
-  .byte $f6, $76, $55, 2591
-  .byte $f6, $62, $42, 2592
-  .byte $f6, $76, $57, 2593
-  .byte $de, $76, $55, 2594
-  .byte $b6, $05, $16, 2595
-  .byte $b6, $32, $43, 2596
-  .byte $ae, $62, $52, 2597
-  .byte $ae, $74, $77, 2598
+  .byte $ba, $02, $11, 9
+  .byte $f6, $76, $55, 8
+  .byte $f6, $62, $42, 7
+  .byte $f6, $76, $57, 6
+  .byte $de, $76, $55, 5
+  .byte $b6, $05, $16, 4
+  .byte $b6, $32, $43, 3
+  .byte $ae, $62, $52, 2
+  .byte $ae, $74, $77, 1
   .byte $ae, $40, $22, GEN_BOOK_CHAIN_END
-  .byte $32, $14, $24, 2600
-  .byte $32, $16, $26, 2601
-  .byte $32, $12, $32, 2602
-  .byte $56, $76, $55, 2603
-  .byte $0a, $13, $23, 2604
-  .byte $22, $24, $33, 2605
-  .byte $22, $13, $23, 2606
+  .byte $32, $14, $24, 7
+  .byte $32, $16, $26, 6
+  .byte $32, $12, $32, 5
+  .byte $56, $76, $55, 4
+  .byte $0a, $13, $23, 3
+  .byte $22, $24, $33, 2
+  .byte $22, $13, $23, 1
   .byte $22, $11, $31, GEN_BOOK_CHAIN_END
   .byte $a2, $73, $51, GEN_BOOK_CHAIN_END
-  .byte $6a, $76, $55, 2609
+  .byte $6a, $76, $55, 1
   .byte $6a, $71, $52, GEN_BOOK_CHAIN_END
   .byte $4e, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $e6, $63, $43, 2612
-  .byte $e6, $66, $56, 2613
-  .byte $e6, $62, $42, 2614
+  .byte $e6, $63, $43, 3
+  .byte $e6, $66, $56, 2
+  .byte $e6, $62, $42, 1
   .byte $5e, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $56, $63, $43, 2616
-  .byte $56, $63, $53, 2617
-  .byte $56, $73, $64, 2618
-  .byte $1e, $13, $33, 2619
-  .byte $da, $01, $13, 2620
-  .byte $da, $16, $26, 2621
-  .byte $da, $02, $46, 2622
-  .byte $b6, $75, $66, 2623
-  .byte $f6, $12, $22, 2624
-  .byte $f6, $13, $33, 2625
-  .byte $f6, $05, $14, 2626
-  .byte $f2, $01, $13, 2627
+  .byte $56, $63, $43, 12
+  .byte $56, $63, $53, 11
+  .byte $56, $73, $64, 10
+  .byte $1e, $13, $33, 9
+  .byte $da, $01, $13, 8
+  .byte $da, $16, $26, 7
+  .byte $da, $02, $46, 6
+  .byte $b6, $75, $66, 5
+  .byte $f6, $12, $22, 4
+  .byte $f6, $13, $33, 3
+  .byte $f6, $05, $14, 2
+  .byte $f2, $01, $13, 1
   .byte $62, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $b6, $13, $23, 2629
-  .byte $b6, $14, $24, 2630
-  .byte $b6, $01, $22, 2631
-  .byte $de, $65, $55, 2632
-  .byte $de, $64, $54, 2633
-  .byte $de, $71, $63, 2634
-  .byte $7a, $10, $20, 2635
-  .byte $7a, $02, $13, 2636
+  .byte $b6, $13, $23, 8
+  .byte $b6, $14, $24, 7
+  .byte $b6, $01, $22, 6
+  .byte $de, $65, $55, 5
+  .byte $de, $64, $54, 4
+  .byte $de, $71, $63, 3
+  .byte $7a, $10, $20, 2
+  .byte $7a, $02, $13, 1
   .byte $7a, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $be, $71, $52, 2638
-  .byte $7a, $76, $55, 2639
-  .byte $7a, $44, $34, 2640
-  .byte $76, $75, $31, 2641
+  .byte $be, $71, $52, 4
+  .byte $7a, $76, $55, 3
+  .byte $7a, $44, $34, 2
+  .byte $76, $75, $31, 1
   .byte $76, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $fe, $02, $46, 2643
-  .byte $46, $05, $16, 2644
-  .byte $46, $12, $32, 2645
-  .byte $8e, $55, $36, 2646
-  .byte $22, $55, $47, 2647
-  .byte $ea, $62, $42, 2648
+  .byte $fe, $02, $46, 6
+  .byte $46, $05, $16, 5
+  .byte $46, $12, $32, 4
+  .byte $8e, $55, $36, 3
+  .byte $22, $55, $47, 2
+  .byte $ea, $62, $42, 1
   .byte $0a, $74, $77, GEN_BOOK_CHAIN_END
   .byte $8e, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $22, $71, $52, 2651
-  .byte $22, $62, $42, 2652
-  .byte $c6, $62, $52, 2653
-  .byte $1e, $74, $77, 2654
+  .byte $22, $71, $52, 4
+  .byte $22, $62, $42, 3
+  .byte $c6, $62, $52, 2
+  .byte $1e, $74, $77, 1
   .byte $1e, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $de, $44, $34, 2656
-  .byte $de, $71, $52, 2657
-  .byte $ae, $12, $22, 2658
-  .byte $ae, $16, $26, 2659
+  .byte $de, $44, $34, 4
+  .byte $de, $71, $52, 3
+  .byte $ae, $12, $22, 2
+  .byte $ae, $16, $26, 1
   .byte $9a, $22, $33, GEN_BOOK_CHAIN_END
-  .byte $a6, $72, $63, 2661
-  .byte $a6, $71, $63, 2662
+  .byte $a6, $72, $63, 2
+  .byte $a6, $71, $63, 1
   .byte $aa, $02, $11, GEN_BOOK_CHAIN_END
-  .byte $36, $12, $22, 2664
-  .byte $36, $10, $20, 2665
-  .byte $36, $12, $32, 2666
-  .byte $7a, $06, $14, 2667
+  .byte $36, $12, $22, 4
+  .byte $36, $10, $20, 3
+  .byte $36, $12, $32, 2
+  .byte $7a, $06, $14, 1
   .byte $c6, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $26, $06, $25, 2669
-  .byte $26, $14, $24, 2670
-  .byte $26, $14, $34, 2671
-  .byte $3a, $66, $56, 2672
-  .byte $3a, $71, $52, 2673
+  .byte $26, $06, $25, 5
+  .byte $26, $14, $24, 4
+  .byte $26, $14, $34, 3
+  .byte $3a, $66, $56, 2
+  .byte $3a, $71, $52, 1
   .byte $5e, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $3a, $64, $54, 2675
-  .byte $ca, $74, $77, 2676
-  .byte $ca, $63, $43, 2677
-  .byte $ca, $71, $52, 2678
+  .byte $3a, $64, $54, 4
+  .byte $ca, $74, $77, 3
+  .byte $ca, $63, $43, 2
+  .byte $ca, $71, $52, 1
   .byte $3e, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $32, $76, $55, 2680
-  .byte $a2, $75, $53, 2681
+  .byte $32, $76, $55, 2
+  .byte $a2, $75, $53, 1
   .byte $a2, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $e2, $05, $41, 2683
-  .byte $e2, $06, $25, 2684
-  .byte $e2, $33, $44, 2685
-  .byte $d2, $13, $23, 2686
+  .byte $e2, $05, $41, 4
+  .byte $e2, $06, $25, 3
+  .byte $e2, $33, $44, 2
+  .byte $d2, $13, $23, 1
   .byte $c2, $76, $55, GEN_BOOK_CHAIN_END
   .byte $b6, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $ae, $64, $44, 2689
-  .byte $76, $42, $33, 2690
-  .byte $46, $24, $33, 2691
-  .byte $5a, $05, $41, 2692
-  .byte $5a, $13, $33, 2693
-  .byte $5a, $22, $43, 2694
-  .byte $4e, $75, $42, 2695
+  .byte $ae, $64, $44, 7
+  .byte $76, $42, $33, 6
+  .byte $46, $24, $33, 5
+  .byte $5a, $05, $41, 4
+  .byte $5a, $13, $33, 3
+  .byte $5a, $22, $43, 2
+  .byte $4e, $75, $42, 1
   .byte $2a, $75, $74, GEN_BOOK_CHAIN_END
-  .byte $fe, $63, $43, 2697
-  .byte $1e, $75, $66, 2698
-  .byte $5e, $05, $16, 2699
-  .byte $6e, $54, $43, 2700
+  .byte $fe, $63, $43, 4
+  .byte $1e, $75, $66, 3
+  .byte $5e, $05, $16, 2
+  .byte $6e, $54, $43, 1
   .byte $8a, $75, $66, GEN_BOOK_CHAIN_END
   .byte $6a, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $02, $12, $22, 2703
-  .byte $ee, $71, $52, 2704
-  .byte $3a, $73, $64, 2705
+  .byte $02, $12, $22, 3
+  .byte $ee, $71, $52, 2
+  .byte $3a, $73, $64, 1
   .byte $e6, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $96, $06, $25, 2707
+  .byte $96, $06, $25, 1
   .byte $66, $23, $34, GEN_BOOK_CHAIN_END
-  .byte $62, $63, $43, 2709
-  .byte $62, $71, $52, 2710
-  .byte $62, $65, $45, 2711
-  .byte $2a, $12, $22, 2712
-  .byte $2a, $06, $25, 2713
-  .byte $2a, $02, $46, 2714
-  .byte $ee, $11, $21, 2715
-  .byte $ee, $13, $33, 2716
+  .byte $62, $63, $43, 8
+  .byte $62, $71, $52, 7
+  .byte $62, $65, $45, 6
+  .byte $2a, $12, $22, 5
+  .byte $2a, $06, $25, 4
+  .byte $2a, $02, $46, 3
+  .byte $ee, $11, $21, 2
+  .byte $ee, $13, $33, 1
   .byte $ee, $05, $41, GEN_BOOK_CHAIN_END
-  .byte $ae, $14, $24, 2718
+  .byte $ae, $14, $24, 1
   .byte $06, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $92, $71, $52, 2720
-  .byte $92, $64, $54, 2721
-  .byte $92, $42, $33, 2722
-  .byte $8a, $71, $52, 2723
-  .byte $8a, $62, $42, 2724
+  .byte $92, $71, $52, 5
+  .byte $92, $64, $54, 4
+  .byte $92, $42, $33, 3
+  .byte $8a, $71, $52, 2
+  .byte $8a, $62, $42, 1
   .byte $f6, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $e2, $63, $43, 2726
-  .byte $e2, $62, $42, 2727
-  .byte $e2, $66, $56, 2728
-  .byte $86, $71, $52, 2729
-  .byte $86, $66, $56, 2730
+  .byte $e2, $63, $43, 5
+  .byte $e2, $62, $42, 4
+  .byte $e2, $66, $56, 3
+  .byte $86, $71, $52, 2
+  .byte $86, $66, $56, 1
   .byte $86, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $fe, $13, $23, 2732
-  .byte $fe, $10, $20, 2733
-  .byte $c6, $64, $44, 2734
-  .byte $c6, $71, $52, 2735
-  .byte $c6, $73, $51, 2736
+  .byte $fe, $13, $23, 5
+  .byte $fe, $10, $20, 4
+  .byte $c6, $64, $44, 3
+  .byte $c6, $71, $52, 2
+  .byte $c6, $73, $51, 1
   .byte $9e, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $de, $06, $25, 2738
-  .byte $a2, $06, $25, 2739
-  .byte $a2, $06, $27, 2740
-  .byte $9a, $42, $51, 2741
-  .byte $4a, $63, $53, 2742
-  .byte $4a, $61, $51, 2743
+  .byte $de, $06, $25, 6
+  .byte $a2, $06, $25, 5
+  .byte $a2, $06, $27, 4
+  .byte $9a, $42, $51, 3
+  .byte $4a, $63, $53, 2
+  .byte $4a, $61, $51, 1
   .byte $4a, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $ea, $76, $55, 2745
-  .byte $72, $13, $33, 2746
-  .byte $26, $13, $33, 2747
-  .byte $a2, $52, $44, 2748
+  .byte $ea, $76, $55, 4
+  .byte $72, $13, $33, 3
+  .byte $26, $13, $33, 2
+  .byte $a2, $52, $44, 1
   .byte $c6, $41, $63, GEN_BOOK_CHAIN_END
-  .byte $1a, $63, $43, 2750
-  .byte $1a, $66, $56, 2751
+  .byte $1a, $63, $43, 2
+  .byte $1a, $66, $56, 1
   .byte $1a, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $b2, $76, $55, 2753
+  .byte $b2, $76, $55, 1
   .byte $9e, $05, $41, GEN_BOOK_CHAIN_END
-  .byte $22, $76, $55, 2755
+  .byte $22, $76, $55, 1
   .byte $22, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $7e, $25, $33, 2757
-  .byte $6a, $75, $53, 2758
+  .byte $7e, $25, $33, 2
+  .byte $6a, $75, $53, 1
   .byte $6a, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $b6, $02, $11, 2760
-  .byte $56, $01, $13, 2761
-  .byte $c2, $71, $52, 2762
+  .byte $b6, $02, $11, 3
+  .byte $56, $01, $13, 2
+  .byte $c2, $71, $52, 1
   .byte $c2, $43, $31, GEN_BOOK_CHAIN_END
-  .byte $0a, $66, $56, 2764
-  .byte $0a, $62, $42, 2765
-  .byte $0a, $76, $55, 2766
-  .byte $3a, $36, $47, 2767
-  .byte $3a, $36, $25, 2768
-  .byte $46, $75, $66, 2769
-  .byte $12, $74, $75, 2770
-  .byte $da, $10, $20, 2771
+  .byte $0a, $66, $56, 8
+  .byte $0a, $62, $42, 7
+  .byte $0a, $76, $55, 6
+  .byte $3a, $36, $47, 5
+  .byte $3a, $36, $25, 4
+  .byte $46, $75, $66, 3
+  .byte $12, $74, $75, 2
+  .byte $da, $10, $20, 1
   .byte $da, $12, $22, GEN_BOOK_CHAIN_END
   .byte $9e, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $de, $12, $32, 2774
+  .byte $de, $12, $32, 1
   .byte $4e, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $82, $12, $32, 2776
-  .byte $ae, $63, $43, 2777
-  .byte $ae, $71, $52, 2778
-  .byte $ae, $64, $44, 2779
-  .byte $da, $75, $66, 2780
-  .byte $ca, $76, $55, 2781
-  .byte $ca, $62, $42, 2782
-  .byte $c6, $72, $61, 2783
-  .byte $ea, $11, $21, 2784
-  .byte $ea, $06, $25, 2785
-  .byte $a2, $75, $53, 2786
+  .byte $82, $12, $32, 11
+  .byte $ae, $63, $43, 10
+  .byte $ae, $71, $52, 9
+  .byte $ae, $64, $44, 8
+  .byte $da, $75, $66, 7
+  .byte $ca, $76, $55, 6
+  .byte $ca, $62, $42, 5
+  .byte $c6, $72, $61, 4
+  .byte $ea, $11, $21, 3
+  .byte $ea, $06, $25, 2
+  .byte $a2, $75, $53, 1
   .byte $a2, $71, $52, GEN_BOOK_CHAIN_END
   .byte $16, $75, $66, GEN_BOOK_CHAIN_END
   .byte $3e, $02, $11, GEN_BOOK_CHAIN_END
-  .byte $c2, $76, $55, 2790
-  .byte $c2, $75, $42, 2791
-  .byte $c2, $71, $52, 2792
-  .byte $b2, $60, $50, 2793
+  .byte $c2, $76, $55, 4
+  .byte $c2, $75, $42, 3
+  .byte $c2, $71, $52, 2
+  .byte $b2, $60, $50, 1
   .byte $0e, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $fa, $62, $42, 2795
-  .byte $fa, $66, $56, 2796
-  .byte $c6, $62, $42, 2797
-  .byte $c6, $64, $44, 2798
-  .byte $c6, $64, $54, 2799
-  .byte $32, $63, $43, 2800
-  .byte $4e, $02, $11, 2801
-  .byte $ce, $05, $14, 2802
+  .byte $fa, $62, $42, 8
+  .byte $fa, $66, $56, 7
+  .byte $c6, $62, $42, 6
+  .byte $c6, $64, $44, 5
+  .byte $c6, $64, $54, 4
+  .byte $32, $63, $43, 3
+  .byte $4e, $02, $11, 2
+  .byte $ce, $05, $14, 1
   .byte $ce, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $aa, $75, $66, 2804
-  .byte $aa, $62, $42, 2805
-  .byte $0e, $22, $33, 2806
-  .byte $ca, $64, $54, 2807
-  .byte $5a, $66, $56, 2808
-  .byte $5a, $71, $52, 2809
-  .byte $5a, $73, $62, 2810
-  .byte $02, $62, $52, 2811
-  .byte $02, $73, $55, 2812
+  .byte $aa, $75, $66, 9
+  .byte $aa, $62, $42, 8
+  .byte $0e, $22, $33, 7
+  .byte $ca, $64, $54, 6
+  .byte $5a, $66, $56, 5
+  .byte $5a, $71, $52, 4
+  .byte $5a, $73, $62, 3
+  .byte $02, $62, $52, 2
+  .byte $02, $73, $55, 1
   .byte $02, $76, $64, GEN_BOOK_CHAIN_END
-  .byte $f2, $06, $25, 2814
-  .byte $ae, $25, $44, 2815
-  .byte $ae, $34, $43, 2816
-  .byte $82, $76, $55, 2817
-  .byte $5a, $33, $43, 2818
+  .byte $f2, $06, $25, 5
+  .byte $ae, $25, $44, 4
+  .byte $ae, $34, $43, 3
+  .byte $82, $76, $55, 2
+  .byte $5a, $33, $43, 1
   .byte $5a, $01, $22, GEN_BOOK_CHAIN_END
   .byte $9e, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $d6, $71, $52, 2821
-  .byte $d6, $62, $42, 2822
-  .byte $d6, $76, $55, 2823
-  .byte $2e, $44, $34, 2824
-  .byte $2e, $71, $52, 2825
-  .byte $c6, $75, $74, 2826
+  .byte $d6, $71, $52, 6
+  .byte $d6, $62, $42, 5
+  .byte $d6, $76, $55, 4
+  .byte $2e, $44, $34, 3
+  .byte $2e, $71, $52, 2
+  .byte $c6, $75, $74, 1
   .byte $c6, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $56, $16, $26, 2828
-  .byte $56, $01, $22, 2829
-  .byte $56, $06, $25, 2830
-  .byte $ea, $12, $32, 2831
-  .byte $ea, $16, $36, 2832
+  .byte $56, $16, $26, 5
+  .byte $56, $01, $22, 4
+  .byte $56, $06, $25, 3
+  .byte $ea, $12, $32, 2
+  .byte $ea, $16, $36, 1
   .byte $9a, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $72, $62, $42, 2834
-  .byte $72, $72, $36, 2835
-  .byte $72, $72, $45, 2836
-  .byte $0e, $66, $56, 2837
-  .byte $0e, $62, $42, 2838
-  .byte $0e, $72, $36, 2839
-  .byte $96, $75, $66, 2840
-  .byte $b6, $06, $25, 2841
+  .byte $72, $62, $42, 8
+  .byte $72, $72, $36, 7
+  .byte $72, $72, $45, 6
+  .byte $0e, $66, $56, 5
+  .byte $0e, $62, $42, 4
+  .byte $0e, $72, $36, 3
+  .byte $96, $75, $66, 2
+  .byte $b6, $06, $25, 1
   .byte $5a, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $0e, $13, $33, 2843
-  .byte $ee, $12, $22, 2844
-  .byte $ee, $14, $34, 2845
-  .byte $ee, $16, $26, 2846
+  .byte $0e, $13, $33, 4
+  .byte $ee, $12, $22, 3
+  .byte $ee, $14, $34, 2
+  .byte $ee, $16, $26, 1
   .byte $06, $75, $66, GEN_BOOK_CHAIN_END
   .byte $5a, $12, $22, GEN_BOOK_CHAIN_END
-  .byte $0a, $02, $35, 2849
-  .byte $0a, $02, $46, 2850
-  .byte $aa, $05, $16, 2851
-  .byte $c6, $05, $14, 2852
+  .byte $0a, $02, $35, 4
+  .byte $0a, $02, $46, 3
+  .byte $aa, $05, $16, 2
+  .byte $c6, $05, $14, 1
   .byte $7a, $75, $53, GEN_BOOK_CHAIN_END
   .byte $ee, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $22, $14, $24, 2855
+  .byte $22, $14, $24, 1
   .byte $12, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $aa, $63, $53, 2857
-  .byte $aa, $71, $52, 2858
+  .byte $aa, $63, $53, 2
+  .byte $aa, $71, $52, 1
   .byte $b6, $46, $37, GEN_BOOK_CHAIN_END
-  .byte $c2, $64, $55, 2860
+  .byte $c2, $64, $55, 1
   .byte $ea, $72, $45, GEN_BOOK_CHAIN_END
-  .byte $66, $62, $42, 2862
+  .byte $66, $62, $42, 1
   .byte $66, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $12, $34, $43, 2864
-  .byte $12, $06, $25, 2865
-  .byte $2e, $33, $43, 2866
-  .byte $2e, $25, $44, 2867
-  .byte $4a, $63, $43, 2868
-  .byte $4a, $66, $56, 2869
+  .byte $12, $34, $43, 6
+  .byte $12, $06, $25, 5
+  .byte $2e, $33, $43, 4
+  .byte $2e, $25, $44, 3
+  .byte $4a, $63, $43, 2
+  .byte $4a, $66, $56, 1
   .byte $4a, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $2e, $66, $56, 2871
-  .byte $06, $63, $43, 2872
-  .byte $06, $64, $54, 2873
-  .byte $06, $42, $33, 2874
-  .byte $6e, $72, $61, 2875
-  .byte $66, $05, $16, 2876
-  .byte $12, $73, $63, 2877
-  .byte $12, $65, $45, 2878
-  .byte $2e, $75, $74, GEN_BOOK_CHAIN_END
-  .byte $36, $74, $77, 2880
-  .byte $36, $61, $51, 2881
-  .byte $12, $06, $25, 2882
-  .byte $12, $01, $13, 2883
-  .byte $ee, $22, $30, 2884
-  .byte $ee, $05, $41, 2885
-  .byte $ee, $05, $32, 2886
-  .byte $12, $02, $11, 2887
+  .byte $06, $63, $43, 6
+  .byte $06, $64, $54, 5
+  .byte $06, $42, $33, 4
+  .byte $6e, $72, $61, 3
+  .byte $66, $05, $16, 2
+  .byte $12, $73, $63, 1
+  .byte $12, $65, $45, GEN_BOOK_CHAIN_END
+  .byte $36, $74, $77, 5
+  .byte $36, $61, $51, 4
+  .byte $ee, $22, $30, 3
+  .byte $ee, $05, $41, 2
+  .byte $ee, $05, $32, 1
   .byte $ae, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $f6, $71, $52, 2889
-  .byte $f6, $65, $55, 2890
-  .byte $f6, $75, $53, 2891
-  .byte $ca, $13, $23, 2892
-  .byte $36, $01, $22, 2893
+  .byte $f6, $71, $52, 5
+  .byte $f6, $65, $55, 4
+  .byte $f6, $75, $53, 3
+  .byte $ca, $13, $23, 2
+  .byte $36, $01, $22, 1
   .byte $1e, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $b2, $66, $56, 2895
-  .byte $06, $64, $54, 2896
-  .byte $9a, $16, $26, 2897
-  .byte $9a, $33, $42, 2898
+  .byte $b2, $66, $56, 4
+  .byte $06, $64, $54, 3
+  .byte $9a, $16, $26, 2
+  .byte $9a, $33, $42, 1
   .byte $56, $05, $23, GEN_BOOK_CHAIN_END
-  .byte $36, $06, $25, 2900
-  .byte $36, $12, $32, 2901
-  .byte $72, $02, $35, 2902
-  .byte $9e, $06, $25, 2903
-  .byte $9e, $14, $34, 2904
+  .byte $36, $06, $25, 5
+  .byte $36, $12, $32, 4
+  .byte $72, $02, $35, 3
+  .byte $9e, $06, $25, 2
+  .byte $9e, $14, $34, 1
   .byte $9e, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $c2, $76, $55, 2906
-  .byte $c2, $75, $42, 2907
+  .byte $c2, $76, $55, 2
+  .byte $c2, $75, $42, 1
   .byte $c2, $44, $36, GEN_BOOK_CHAIN_END
-  .byte $4a, $76, $55, 2909
-  .byte $4a, $42, $33, 2910
-  .byte $4a, $64, $54, 2911
-  .byte $aa, $63, $43, 2912
+  .byte $4a, $76, $55, 4
+  .byte $4a, $42, $33, 3
+  .byte $4a, $64, $54, 2
+  .byte $aa, $63, $43, 1
   .byte $12, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $7a, $14, $34, 2914
-  .byte $7a, $13, $33, 2915
-  .byte $7a, $06, $25, 2916
-  .byte $f6, $06, $25, 2917
-  .byte $6a, $63, $43, 2918
-  .byte $6a, $60, $50, 2919
+  .byte $7a, $14, $34, 6
+  .byte $7a, $13, $33, 5
+  .byte $7a, $06, $25, 4
+  .byte $f6, $06, $25, 3
+  .byte $6a, $63, $43, 2
+  .byte $6a, $60, $50, 1
   .byte $06, $40, $42, GEN_BOOK_CHAIN_END
-  .byte $7e, $14, $34, 2921
-  .byte $d6, $16, $26, 2922
+  .byte $7e, $14, $34, 2
+  .byte $d6, $16, $26, 1
   .byte $82, $54, $43, GEN_BOOK_CHAIN_END
-  .byte $3a, $05, $16, 2924
-  .byte $96, $32, $43, 2925
+  .byte $3a, $05, $16, 2
+  .byte $96, $32, $43, 1
   .byte $66, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $e6, $14, $24, 2927
-  .byte $e6, $02, $11, 2928
-  .byte $72, $75, $42, 2929
+  .byte $e6, $14, $24, 3
+  .byte $e6, $02, $11, 2
+  .byte $72, $75, $42, 1
   .byte $7a, $73, $64, GEN_BOOK_CHAIN_END
-  .byte $ba, $74, $77, 2931
-  .byte $6e, $06, $25, 2932
-  .byte $6e, $14, $24, 2933
-  .byte $6e, $02, $46, 2934
-  .byte $4a, $05, $16, 2935
-  .byte $6a, $71, $52, 2936
+  .byte $ba, $74, $77, 6
+  .byte $6e, $06, $25, 5
+  .byte $6e, $14, $24, 4
+  .byte $6e, $02, $46, 3
+  .byte $4a, $05, $16, 2
+  .byte $6a, $71, $52, 1
   .byte $2a, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $12, $72, $61, 2938
-  .byte $92, $05, $14, 2939
-  .byte $92, $05, $32, 2940
+  .byte $12, $72, $61, 3
+  .byte $92, $05, $14, 2
+  .byte $92, $05, $32, 1
   .byte $92, $17, $27, GEN_BOOK_CHAIN_END
-  .byte $7a, $63, $43, 2942
+  .byte $7a, $63, $43, 1
   .byte $1a, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $d6, $63, $43, 2944
-  .byte $fe, $34, $43, 2945
+  .byte $d6, $63, $43, 2
+  .byte $fe, $34, $43, 1
   .byte $c2, $72, $45, GEN_BOOK_CHAIN_END
-  .byte $b2, $71, $52, 2947
-  .byte $b2, $76, $55, 2948
-  .byte $b2, $42, $33, 2949
-  .byte $9a, $14, $24, 2950
-  .byte $46, $22, $33, 2951
+  .byte $b2, $71, $52, 5
+  .byte $b2, $76, $55, 4
+  .byte $b2, $42, $33, 3
+  .byte $9a, $14, $24, 2
+  .byte $46, $22, $33, 1
   .byte $4a, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $ee, $52, $33, 2953
-  .byte $ee, $66, $56, 2954
+  .byte $ee, $52, $33, 2
+  .byte $ee, $66, $56, 1
   .byte $d6, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $b6, $17, $27, 2956
-  .byte $b6, $12, $22, 2957
-  .byte $b6, $15, $25, 2958
-  .byte $9e, $12, $22, 2959
-  .byte $d6, $62, $52, 2960
-  .byte $7e, $63, $43, 2961
+  .byte $b6, $17, $27, 6
+  .byte $b6, $12, $22, 5
+  .byte $b6, $15, $25, 4
+  .byte $9e, $12, $22, 3
+  .byte $d6, $62, $52, 2
+  .byte $7e, $63, $43, 1
   .byte $7e, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $aa, $76, $55, 2963
-  .byte $aa, $63, $43, 2964
-  .byte $8a, $14, $24, 2965
+  .byte $aa, $76, $55, 3
+  .byte $aa, $63, $43, 2
+  .byte $8a, $14, $24, 1
   .byte $9e, $67, $57, GEN_BOOK_CHAIN_END
   .byte $f2, $61, $41, GEN_BOOK_CHAIN_END
-  .byte $ca, $06, $25, 2968
-  .byte $5e, $75, $42, 2969
+  .byte $ca, $06, $25, 2
+  .byte $5e, $75, $42, 1
   .byte $5e, $63, $43, GEN_BOOK_CHAIN_END
   .byte $d6, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $7a, $75, $66, 2972
+  .byte $7a, $75, $66, 1
   .byte $5e, $55, $34, GEN_BOOK_CHAIN_END
-  .byte $0e, $72, $36, 2974
-  .byte $72, $72, $36, 2975
-  .byte $62, $44, $34, 2976
-  .byte $8a, $61, $51, 2977
-  .byte $8a, $71, $63, 2978
+  .byte $0e, $72, $36, 5
+  .byte $72, $72, $36, 4
+  .byte $62, $44, $34, 3
+  .byte $8a, $61, $51, 2
+  .byte $8a, $71, $63, 1
   .byte $8a, $73, $40, GEN_BOOK_CHAIN_END
-  .byte $22, $62, $42, 2980
-  .byte $d2, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $4e, $05, $16, 2982
-  .byte $4e, $14, $34, 2983
-  .byte $4e, $12, $32, 2984
-  .byte $1a, $06, $25, 2985
-  .byte $46, $45, $34, 2986
+  .byte $22, $62, $42, GEN_BOOK_CHAIN_END
+  .byte $4e, $05, $16, 5
+  .byte $4e, $14, $34, 4
+  .byte $4e, $12, $32, 3
+  .byte $1a, $06, $25, 2
+  .byte $46, $45, $34, 1
   .byte $d6, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $a2, $11, $21, 2988
-  .byte $a2, $13, $33, 2989
-  .byte $a2, $01, $22, 2990
+  .byte $a2, $11, $21, 3
+  .byte $a2, $13, $33, 2
+  .byte $a2, $01, $22, 1
   .byte $76, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $ca, $14, $24, 2992
-  .byte $b2, $16, $26, 2993
-  .byte $e2, $13, $33, 2994
-  .byte $da, $05, $16, 2995
+  .byte $ca, $14, $24, 4
+  .byte $b2, $16, $26, 3
+  .byte $e2, $13, $33, 2
+  .byte $da, $05, $16, 1
   .byte $de, $60, $40, GEN_BOOK_CHAIN_END
-  .byte $a2, $66, $56, 2997
-  .byte $a2, $71, $52, 2998
+  .byte $a2, $66, $56, 2
+  .byte $a2, $71, $52, 1
   .byte $a2, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $26, $72, $63, 3000
-  .byte $26, $71, $63, 3001
+  .byte $26, $72, $63, 2
+  .byte $26, $71, $63, 1
   .byte $aa, $52, $43, GEN_BOOK_CHAIN_END
   .byte $ca, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $d2, $66, $56, 3004
-  .byte $d2, $63, $43, 3005
-  .byte $d2, $76, $55, 3006
-  .byte $3e, $05, $16, 3007
-  .byte $8a, $14, $24, 3008
-  .byte $8a, $16, $26, 3009
-  .byte $fa, $22, $43, 3010
-  .byte $fa, $05, $41, 3011
-  .byte $a2, $42, $33, 3012
-  .byte $d6, $71, $52, 3013
-  .byte $12, $64, $54, 3014
-  .byte $d6, $74, $77, 3015
-  .byte $d6, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $6e, $16, $26, 3017
-  .byte $6e, $14, $24, 3018
+  .byte $d2, $66, $56, 9
+  .byte $d2, $63, $43, 8
+  .byte $d2, $76, $55, 7
+  .byte $3e, $05, $16, 6
+  .byte $8a, $14, $24, 5
+  .byte $8a, $16, $26, 4
+  .byte $fa, $22, $43, 3
+  .byte $fa, $05, $41, 2
+  .byte $a2, $42, $33, 1
+  .byte $12, $64, $54, GEN_BOOK_CHAIN_END
+  .byte $6e, $16, $26, 2
+  .byte $6e, $14, $24, 1
   .byte $8a, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $fa, $66, $56, 3020
-  .byte $fa, $61, $41, 3021
-  .byte $fa, $64, $54, 3022
-  .byte $02, $06, $25, 3023
+  .byte $fa, $66, $56, 4
+  .byte $fa, $61, $41, 3
+  .byte $fa, $64, $54, 2
+  .byte $02, $06, $25, 1
   .byte $e2, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $46, $71, $52, 3025
-  .byte $3a, $75, $66, 3026
-  .byte $d6, $23, $33, 3027
+  .byte $46, $71, $52, 3
+  .byte $3a, $75, $66, 2
+  .byte $d6, $23, $33, 1
   .byte $d6, $01, $22, GEN_BOOK_CHAIN_END
   .byte $02, $25, $33, GEN_BOOK_CHAIN_END
-  .byte $ba, $06, $25, 3030
+  .byte $ba, $06, $25, 1
   .byte $a2, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $7e, $74, $77, 3032
-  .byte $0e, $24, $33, 3033
-  .byte $16, $12, $32, 3034
-  .byte $16, $11, $21, 3035
-  .byte $16, $04, $07, 3036
-  .byte $de, $64, $44, 3037
+  .byte $7e, $74, $77, 6
+  .byte $0e, $24, $33, 5
+  .byte $16, $12, $32, 4
+  .byte $16, $11, $21, 3
+  .byte $16, $04, $07, 2
+  .byte $de, $64, $44, 1
   .byte $66, $64, $54, GEN_BOOK_CHAIN_END
   .byte $22, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $a6, $71, $52, 3040
+  .byte $a6, $71, $52, 1
   .byte $2a, $63, $43, GEN_BOOK_CHAIN_END
   .byte $f2, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $82, $05, $16, 3043
+  .byte $82, $05, $16, 1
   .byte $fe, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $16, $05, $16, 3045
-  .byte $fa, $64, $44, 3046
+  .byte $16, $05, $16, 2
+  .byte $fa, $64, $44, 1
   .byte $fa, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $ee, $76, $55, 3048
-  .byte $ee, $64, $54, 3049
+  .byte $ee, $76, $55, 2
+  .byte $ee, $64, $54, 1
   .byte $ee, $42, $33, GEN_BOOK_CHAIN_END
   .byte $8a, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $92, $05, $41, 3052
-  .byte $92, $13, $33, 3053
-  .byte $92, $12, $32, 3054
-  .byte $ee, $75, $31, 3055
-  .byte $d2, $04, $07, 3056
+  .byte $92, $05, $41, 5
+  .byte $92, $13, $33, 4
+  .byte $92, $12, $32, 3
+  .byte $ee, $75, $31, 2
+  .byte $d2, $04, $07, 1
   .byte $d2, $12, $32, GEN_BOOK_CHAIN_END
   .byte $7e, $64, $44, GEN_BOOK_CHAIN_END
   .byte $9a, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $0e, $03, $12, 3060
+  .byte $0e, $03, $12, 1
   .byte $d6, $42, $31, GEN_BOOK_CHAIN_END
-  .byte $da, $16, $26, 3062
+  .byte $da, $16, $26, 1
   .byte $0e, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $36, $13, $33, 3064
-  .byte $36, $14, $34, 3065
-  .byte $d2, $66, $56, 3066
-  .byte $6e, $24, $34, 3067
-  .byte $0a, $42, $33, 3068
-  .byte $0a, $75, $66, 3069
-  .byte $62, $13, $33, 3070
-  .byte $be, $01, $22, 3071
-  .byte $3e, $33, $42, 3072
+  .byte $36, $13, $33, 9
+  .byte $36, $14, $34, 8
+  .byte $d2, $66, $56, 7
+  .byte $6e, $24, $34, 6
+  .byte $0a, $42, $33, 5
+  .byte $0a, $75, $66, 4
+  .byte $62, $13, $33, 3
+  .byte $be, $01, $22, 2
+  .byte $3e, $33, $42, 1
   .byte $3e, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $a6, $25, $33, 3074
-  .byte $86, $05, $23, 3075
-  .byte $ca, $76, $55, 3076
+  .byte $a6, $25, $33, 3
+  .byte $86, $05, $23, 2
+  .byte $ca, $76, $55, 1
   .byte $ca, $67, $47, GEN_BOOK_CHAIN_END
-  .byte $72, $34, $44, 3078
-  .byte $da, $04, $07, 3079
-  .byte $46, $60, $50, 3080
-  .byte $46, $64, $54, 3081
-  .byte $46, $66, $56, 3082
+  .byte $72, $34, $44, 5
+  .byte $da, $04, $07, 4
+  .byte $46, $60, $50, 3
+  .byte $46, $64, $54, 2
+  .byte $46, $66, $56, 1
   .byte $aa, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $8e, $66, $56, 3084
-  .byte $26, $06, $25, 3085
-  .byte $26, $14, $24, 3086
-  .byte $26, $33, $42, 3087
-  .byte $22, $64, $44, 3088
-  .byte $22, $64, $54, 3089
+  .byte $8e, $66, $56, 6
+  .byte $26, $06, $25, 5
+  .byte $26, $14, $24, 4
+  .byte $26, $33, $42, 3
+  .byte $22, $64, $44, 2
+  .byte $22, $64, $54, 1
   .byte $22, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $b2, $13, $33, 3091
-  .byte $b2, $14, $34, 3092
-  .byte $c2, $63, $53, 3093
+  .byte $b2, $13, $33, 3
+  .byte $b2, $14, $34, 2
+  .byte $c2, $63, $53, 1
   .byte $c2, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $1e, $06, $25, 3095
-  .byte $8e, $72, $45, 3096
-  .byte $8e, $62, $42, 3097
-  .byte $8e, $66, $56, 3098
-  .byte $b2, $33, $44, 3099
-  .byte $46, $64, $44, 3100
-  .byte $46, $66, $56, 3101
-  .byte $46, $76, $55, 3102
+  .byte $1e, $06, $25, 8
+  .byte $8e, $72, $45, 7
+  .byte $8e, $62, $42, 6
+  .byte $8e, $66, $56, 5
+  .byte $b2, $33, $44, 4
+  .byte $46, $64, $44, 3
+  .byte $46, $66, $56, 2
+  .byte $46, $76, $55, 1
   .byte $4a, $44, $33, GEN_BOOK_CHAIN_END
-  .byte $36, $36, $25, 3104
-  .byte $36, $43, $33, 3105
+  .byte $36, $36, $25, 2
+  .byte $36, $43, $33, 1
   .byte $aa, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $de, $32, $43, 3107
-  .byte $2e, $55, $43, 3108
-  .byte $0e, $03, $13, 3109
-  .byte $0e, $01, $13, 3110
+  .byte $de, $32, $43, 4
+  .byte $2e, $55, $43, 3
+  .byte $0e, $03, $13, 2
+  .byte $0e, $01, $13, 1
   .byte $56, $63, $43, GEN_BOOK_CHAIN_END
   .byte $e6, $22, $33, GEN_BOOK_CHAIN_END
   .byte $9a, $13, $33, GEN_BOOK_CHAIN_END
-  .byte $3e, $03, $47, 3114
-  .byte $96, $71, $63, 3115
+  .byte $3e, $03, $47, 2
+  .byte $96, $71, $63, 1
   .byte $d6, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $3a, $05, $16, 3117
-  .byte $3a, $13, $33, 3118
-  .byte $3a, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $56, $02, $46, 3120
-  .byte $56, $33, $44, 3121
-  .byte $5e, $71, $52, 3122
-  .byte $5e, $66, $56, 3123
+  .byte $56, $02, $46, 4
+  .byte $56, $33, $44, 3
+  .byte $5e, $71, $52, 2
+  .byte $5e, $66, $56, 1
   .byte $66, $73, $55, GEN_BOOK_CHAIN_END
-  .byte $ca, $01, $22, 3125
-  .byte $ca, $13, $23, 3126
-  .byte $ca, $14, $24, 3127
-  .byte $d6, $02, $11, 3128
-  .byte $7a, $13, $23, 3129
-  .byte $7a, $02, $11, 3130
-  .byte $12, $62, $52, 3131
-  .byte $12, $75, $53, 3132
+  .byte $ca, $01, $22, 8
+  .byte $ca, $13, $23, 7
+  .byte $ca, $14, $24, 6
+  .byte $d6, $02, $11, 5
+  .byte $7a, $13, $23, 4
+  .byte $7a, $02, $11, 3
+  .byte $12, $62, $52, 2
+  .byte $12, $75, $53, 1
   .byte $12, $65, $45, GEN_BOOK_CHAIN_END
-  .byte $a6, $01, $13, 3134
-  .byte $a6, $14, $34, 3135
-  .byte $a6, $16, $26, 3136
+  .byte $a6, $01, $13, 3
+  .byte $a6, $14, $34, 2
+  .byte $a6, $16, $26, 1
   .byte $6e, $24, $33, GEN_BOOK_CHAIN_END
-  .byte $2a, $06, $25, 3138
+  .byte $2a, $06, $25, 1
   .byte $62, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $cb, $01, $13, 3140
-  .byte $cb, $16, $26, 3141
-  .byte $cb, $02, $46, 3142
-  .byte $0b, $13, $33, 3143
+  .byte $cb, $01, $13, 4
+  .byte $cb, $16, $26, 3
+  .byte $cb, $02, $46, 2
+  .byte $0b, $13, $33, 1
   .byte $d7, $36, $47, GEN_BOOK_CHAIN_END
-  .byte $8b, $03, $33, 3145
-  .byte $b3, $76, $55, 3146
-  .byte $bb, $61, $51, 3147
+  .byte $8b, $03, $33, 3
+  .byte $b3, $76, $55, 2
+  .byte $bb, $61, $51, 1
   .byte $bb, $73, $40, GEN_BOOK_CHAIN_END
-  .byte $2b, $01, $22, 3149
-  .byte $2b, $06, $25, 3150
-  .byte $2b, $13, $23, 3151
-  .byte $57, $05, $16, 3152
+  .byte $2b, $01, $22, 4
+  .byte $2b, $06, $25, 3
+  .byte $2b, $13, $23, 2
+  .byte $57, $05, $16, 1
   .byte $57, $12, $32, GEN_BOOK_CHAIN_END
   .byte $23, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $47, $64, $54, 3155
-  .byte $6b, $02, $11, 3156
+  .byte $47, $64, $54, 2
+  .byte $6b, $02, $11, 1
   .byte $af, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $df, $66, $56, 3158
-  .byte $d3, $63, $43, 3159
-  .byte $b3, $11, $31, 3160
-  .byte $af, $43, $31, 3161
-  .byte $af, $43, $62, 3162
+  .byte $df, $66, $56, 5
+  .byte $d3, $63, $43, 4
+  .byte $b3, $11, $31, 3
+  .byte $af, $43, $31, 2
+  .byte $af, $43, $62, 1
   .byte $e3, $55, $45, GEN_BOOK_CHAIN_END
-  .byte $e3, $42, $33, 3164
-  .byte $e3, $73, $40, 3165
+  .byte $e3, $42, $33, 2
+  .byte $e3, $73, $40, 1
   .byte $e3, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $9f, $12, $32, 3167
-  .byte $9f, $11, $21, 3168
-  .byte $ab, $22, $34, 3169
-  .byte $eb, $42, $33, 3170
-  .byte $4f, $11, $31, 3171
-  .byte $c7, $13, $33, 3172
-  .byte $c7, $16, $26, 3173
+  .byte $9f, $12, $32, 7
+  .byte $9f, $11, $21, 6
+  .byte $ab, $22, $34, 5
+  .byte $eb, $42, $33, 4
+  .byte $4f, $11, $31, 3
+  .byte $c7, $13, $33, 2
+  .byte $c7, $16, $26, 1
   .byte $c7, $11, $21, GEN_BOOK_CHAIN_END
-  .byte $93, $73, $63, 3175
+  .byte $93, $73, $63, 1
   .byte $43, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $07, $44, $34, 3177
+  .byte $07, $44, $34, 1
   .byte $1b, $46, $55, GEN_BOOK_CHAIN_END
-  .byte $f3, $05, $41, 3179
-  .byte $f3, $06, $25, 3180
-  .byte $f3, $33, $44, 3181
-  .byte $3f, $13, $23, 3182
-  .byte $a7, $63, $43, 3183
-  .byte $5b, $12, $32, 3184
+  .byte $f3, $05, $41, 6
+  .byte $f3, $06, $25, 5
+  .byte $f3, $33, $44, 4
+  .byte $3f, $13, $23, 3
+  .byte $a7, $63, $43, 2
+  .byte $5b, $12, $32, 1
   .byte $1b, $05, $16, GEN_BOOK_CHAIN_END
   .byte $03, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $3f, $05, $16, 3187
-  .byte $3f, $06, $25, 3188
-  .byte $bb, $32, $43, 3189
-  .byte $4b, $55, $43, 3190
+  .byte $3f, $05, $16, 4
+  .byte $3f, $06, $25, 3
+  .byte $bb, $32, $43, 2
+  .byte $4b, $55, $43, 1
   .byte $0f, $75, $64, GEN_BOOK_CHAIN_END
-  .byte $0b, $73, $62, 3192
-  .byte $0b, $71, $52, 3193
-  .byte $0b, $64, $54, 3194
+  .byte $0b, $73, $62, 3
+  .byte $0b, $71, $52, 2
+  .byte $0b, $64, $54, 1
   .byte $3b, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $1f, $02, $11, 3196
-  .byte $1f, $12, $32, 3197
-  .byte $1b, $76, $55, 3198
-  .byte $1b, $61, $51, 3199
-  .byte $3b, $76, $55, 3200
+  .byte $1f, $02, $11, 5
+  .byte $1f, $12, $32, 4
+  .byte $1b, $76, $55, 3
+  .byte $1b, $61, $51, 2
+  .byte $3b, $76, $55, 1
   .byte $13, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $0f, $03, $21, 3202
-  .byte $8f, $76, $55, 3203
-  .byte $f3, $33, $43, 3204
-  .byte $3b, $63, $43, 3205
+  .byte $0f, $03, $21, 4
+  .byte $8f, $76, $55, 3
+  .byte $f3, $33, $43, 2
+  .byte $3b, $63, $43, 1
   .byte $3b, $75, $42, GEN_BOOK_CHAIN_END
-  .byte $97, $02, $11, 3207
-  .byte $17, $73, $40, 3208
-  .byte $17, $71, $52, 3209
+  .byte $97, $02, $11, 3
+  .byte $17, $73, $40, 2
+  .byte $17, $71, $52, 1
   .byte $33, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $47, $06, $25, 3211
-  .byte $47, $16, $26, 3212
-  .byte $d7, $71, $52, 3213
-  .byte $d7, $76, $55, 3214
-  .byte $ff, $11, $21, 3215
-  .byte $ff, $13, $33, 3216
-  .byte $ff, $05, $41, 3217
-  .byte $3f, $01, $22, 3218
+  .byte $47, $06, $25, 8
+  .byte $47, $16, $26, 7
+  .byte $d7, $71, $52, 6
+  .byte $d7, $76, $55, 5
+  .byte $ff, $11, $21, 4
+  .byte $ff, $13, $33, 3
+  .byte $ff, $05, $41, 2
+  .byte $3f, $01, $22, 1
   .byte $3f, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $33, $66, $56, 3220
-  .byte $c7, $01, $22, 3221
-  .byte $0b, $36, $46, 3222
-  .byte $17, $76, $55, 3223
-  .byte $ff, $72, $45, 3224
+  .byte $33, $66, $56, 5
+  .byte $c7, $01, $22, 4
+  .byte $0b, $36, $46, 3
+  .byte $17, $76, $55, 2
+  .byte $ff, $72, $45, 1
   .byte $df, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $83, $71, $52, 3226
-  .byte $83, $64, $54, 3227
-  .byte $83, $42, $33, 3228
+  .byte $83, $71, $52, 3
+  .byte $83, $64, $54, 2
+  .byte $83, $42, $33, 1
   .byte $07, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $e7, $75, $66, 3230
-  .byte $33, $75, $64, 3231
-  .byte $33, $75, $53, 3232
-  .byte $eb, $25, $33, 3233
-  .byte $4b, $76, $55, 3234
-  .byte $4b, $43, $32, 3235
-  .byte $e7, $64, $55, GEN_BOOK_CHAIN_END
-  .byte $eb, $71, $52, 3237
-  .byte $4b, $63, $43, 3238
-  .byte $73, $75, $66, 3239
-  .byte $17, $16, $26, 3240
+  .byte $33, $75, $64, 4
+  .byte $33, $75, $53, 3
+  .byte $eb, $25, $33, 2
+  .byte $4b, $76, $55, 1
+  .byte $4b, $43, $32, GEN_BOOK_CHAIN_END
+  .byte $eb, $71, $52, 4
+  .byte $4b, $63, $43, 3
+  .byte $73, $75, $66, 2
+  .byte $17, $16, $26, 1
   .byte $e3, $25, $33, GEN_BOOK_CHAIN_END
-  .byte $37, $76, $55, 3242
-  .byte $87, $66, $56, 3243
-  .byte $87, $64, $54, 3244
-  .byte $87, $63, $43, 3245
-  .byte $cf, $06, $25, 3246
-  .byte $b3, $06, $25, 3247
+  .byte $37, $76, $55, 6
+  .byte $87, $66, $56, 5
+  .byte $87, $64, $54, 4
+  .byte $87, $63, $43, 3
+  .byte $cf, $06, $25, 2
+  .byte $b3, $06, $25, 1
   .byte $b3, $06, $27, GEN_BOOK_CHAIN_END
-  .byte $8f, $32, $43, 3249
-  .byte $eb, $04, $07, 3250
+  .byte $8f, $32, $43, 2
+  .byte $eb, $04, $07, 1
   .byte $7f, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $67, $03, $25, 3252
-  .byte $13, $24, $33, 3253
-  .byte $13, $03, $33, 3254
-  .byte $8b, $05, $16, 3255
-  .byte $ef, $74, $77, 3256
+  .byte $67, $03, $25, 5
+  .byte $13, $24, $33, 4
+  .byte $13, $03, $33, 3
+  .byte $8b, $05, $16, 2
+  .byte $ef, $74, $77, 1
   .byte $ef, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $33, $65, $45, 3258
-  .byte $67, $63, $43, 3259
-  .byte $53, $16, $26, 3260
-  .byte $53, $02, $11, 3261
-  .byte $53, $31, $41, 3262
+  .byte $33, $65, $45, 5
+  .byte $67, $63, $43, 4
+  .byte $53, $16, $26, 3
+  .byte $53, $02, $11, 2
+  .byte $53, $31, $41, 1
   .byte $47, $14, $34, GEN_BOOK_CHAIN_END
-  .byte $6f, $75, $66, 3264
-  .byte $6f, $03, $33, 3265
-  .byte $0f, $76, $55, 3266
+  .byte $0f, $76, $55, 1
   .byte $0f, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $5f, $76, $55, 3268
-  .byte $5f, $42, $33, 3269
-  .byte $5f, $72, $45, 3270
-  .byte $e7, $04, $07, 3271
-  .byte $e7, $12, $22, 3272
-  .byte $e7, $13, $33, 3273
-  .byte $9f, $06, $25, 3274
+  .byte $5f, $76, $55, 7
+  .byte $5f, $42, $33, 6
+  .byte $5f, $72, $45, 5
+  .byte $e7, $04, $07, 4
+  .byte $e7, $12, $22, 3
+  .byte $e7, $13, $33, 2
+  .byte $9f, $06, $25, 1
   .byte $1b, $75, $66, GEN_BOOK_CHAIN_END
   .byte $87, $55, $34, GEN_BOOK_CHAIN_END
-  .byte $1f, $13, $23, 3277
-  .byte $3b, $66, $56, 3278
-  .byte $3b, $71, $52, 3279
-  .byte $3b, $64, $54, 3280
-  .byte $03, $71, $52, 3281
-  .byte $03, $75, $31, 3282
+  .byte $1f, $13, $23, 6
+  .byte $3b, $66, $56, 5
+  .byte $3b, $71, $52, 4
+  .byte $3b, $64, $54, 3
+  .byte $03, $71, $52, 2
+  .byte $03, $75, $31, 1
   .byte $03, $73, $40, GEN_BOOK_CHAIN_END
-  .byte $c7, $10, $30, 3284
-  .byte $c7, $03, $14, 3285
+  .byte $c7, $10, $30, 2
+  .byte $c7, $03, $14, 1
   .byte $c7, $41, $63, GEN_BOOK_CHAIN_END
-  .byte $ef, $06, $25, 3287
-  .byte $cb, $12, $32, 3288
+  .byte $ef, $06, $25, 2
+  .byte $cb, $12, $32, 1
   .byte $c7, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $4b, $72, $61, 3290
-  .byte $bf, $76, $55, 3291
-  .byte $bf, $75, $31, 3292
+  .byte $4b, $72, $61, 3
+  .byte $bf, $76, $55, 2
+  .byte $bf, $75, $31, 1
   .byte $4f, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $ab, $13, $33, 3294
-  .byte $ab, $11, $21, 3295
-  .byte $ab, $12, $32, 3296
-  .byte $b7, $60, $40, 3297
-  .byte $b7, $42, $32, 3298
+  .byte $ab, $13, $33, 5
+  .byte $ab, $11, $21, 4
+  .byte $ab, $12, $32, 3
+  .byte $b7, $60, $40, 2
+  .byte $b7, $42, $32, 1
   .byte $b7, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $f3, $13, $33, 3300
+  .byte $f3, $13, $33, 1
   .byte $f3, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $f7, $13, $33, 3302
-  .byte $f7, $16, $26, 3303
-  .byte $eb, $62, $42, 3304
-  .byte $eb, $66, $56, 3305
-  .byte $a3, $05, $14, 3306
+  .byte $f7, $13, $33, 5
+  .byte $f7, $16, $26, 4
+  .byte $eb, $62, $42, 3
+  .byte $eb, $66, $56, 2
+  .byte $a3, $05, $14, 1
   .byte $d3, $43, $32, GEN_BOOK_CHAIN_END
-  .byte $6f, $06, $25, 3308
-  .byte $6f, $16, $26, 3309
-  .byte $7f, $42, $33, 3310
-  .byte $a7, $73, $43, 3311
+  .byte $6f, $06, $25, 4
+  .byte $6f, $16, $26, 3
+  .byte $7f, $42, $33, 2
+  .byte $a7, $73, $43, 1
   .byte $47, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $9f, $12, $22, 3313
-  .byte $9f, $14, $24, 3314
-  .byte $9f, $33, $42, 3315
-  .byte $c3, $05, $16, 3316
-  .byte $bb, $32, $43, 3317
-  .byte $4b, $55, $43, 3318
-  .byte $67, $74, $77, 3319
+  .byte $9f, $12, $22, 7
+  .byte $9f, $14, $24, 6
+  .byte $9f, $33, $42, 5
+  .byte $c3, $05, $16, 4
+  .byte $bb, $32, $43, 3
+  .byte $4b, $55, $43, 2
+  .byte $67, $74, $77, 1
   .byte $67, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $cb, $06, $25, 3321
-  .byte $cb, $01, $22, 3322
-  .byte $cb, $12, $22, 3323
-  .byte $f3, $74, $77, 3324
+  .byte $cb, $06, $25, 4
+  .byte $cb, $01, $22, 3
+  .byte $cb, $12, $22, 2
+  .byte $f3, $74, $77, 1
   .byte $97, $24, $33, GEN_BOOK_CHAIN_END
-  .byte $f3, $05, $16, 3326
-  .byte $ff, $44, $33, 3327
-  .byte $ff, $76, $55, 3328
-  .byte $67, $05, $14, 3329
-  .byte $67, $33, $42, 3330
-  .byte $67, $17, $27, 3331
+  .byte $f3, $05, $16, 6
+  .byte $ff, $44, $33, 5
+  .byte $ff, $76, $55, 4
+  .byte $67, $05, $14, 3
+  .byte $67, $33, $42, 2
+  .byte $67, $17, $27, 1
   .byte $e3, $11, $31, GEN_BOOK_CHAIN_END
   .byte $eb, $52, $44, GEN_BOOK_CHAIN_END
-  .byte $63, $62, $42, 3334
-  .byte $63, $72, $36, 3335
-  .byte $63, $72, $45, 3336
+  .byte $63, $62, $42, 3
+  .byte $63, $72, $36, 2
+  .byte $63, $72, $45, 1
   .byte $b3, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $53, $24, $33, 3338
-  .byte $db, $34, $43, 3339
-  .byte $db, $05, $41, 3340
-  .byte $cf, $76, $55, 3341
+  .byte $53, $24, $33, 4
+  .byte $db, $34, $43, 3
+  .byte $db, $05, $41, 2
+  .byte $cf, $76, $55, 1
   .byte $1b, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $fb, $75, $66, 3343
-  .byte $ff, $04, $07, 3344
+  .byte $fb, $75, $66, 2
+  .byte $ff, $04, $07, 1
   .byte $93, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $17, $05, $16, 3346
-  .byte $17, $13, $23, 3347
-  .byte $17, $12, $32, 3348
+  .byte $17, $05, $16, 3
+  .byte $17, $13, $23, 2
+  .byte $17, $12, $32, 1
   .byte $47, $25, $44, GEN_BOOK_CHAIN_END
-  .byte $b7, $66, $56, 3350
-  .byte $c3, $63, $53, 3351
+  .byte $b7, $66, $56, 2
+  .byte $c3, $63, $53, 1
   .byte $c3, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $93, $14, $24, 3353
-  .byte $2b, $71, $63, 3354
+  .byte $93, $14, $24, 2
+  .byte $2b, $71, $63, 1
   .byte $2b, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $8b, $06, $25, 3356
-  .byte $9b, $36, $47, 3357
+  .byte $8b, $06, $25, 2
+  .byte $9b, $36, $47, 1
   .byte $a3, $64, $44, GEN_BOOK_CHAIN_END
-  .byte $03, $05, $16, 3359
-  .byte $1b, $12, $32, 3360
-  .byte $7f, $05, $16, 3361
-  .byte $7f, $17, $27, 3362
-  .byte $7f, $12, $22, 3363
-  .byte $ab, $76, $64, 3364
+  .byte $03, $05, $16, 6
+  .byte $1b, $12, $32, 5
+  .byte $7f, $05, $16, 4
+  .byte $7f, $17, $27, 3
+  .byte $7f, $12, $22, 2
+  .byte $ab, $76, $64, 1
   .byte $0b, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $03, $34, $43, 3366
+  .byte $03, $34, $43, 1
   .byte $03, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $17, $63, $43, 3368
-  .byte $17, $64, $54, 3369
-  .byte $17, $42, $33, 3370
-  .byte $93, $62, $52, 3371
-  .byte $93, $74, $77, 3372
-  .byte $1f, $41, $52, 3373
+  .byte $17, $63, $43, 6
+  .byte $17, $64, $54, 5
+  .byte $17, $42, $33, 4
+  .byte $93, $62, $52, 3
+  .byte $93, $74, $77, 2
+  .byte $1f, $41, $52, 1
   .byte $0b, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $5b, $62, $42, 3375
-  .byte $5b, $74, $77, 3376
-  .byte $c3, $50, $42, 3377
-  .byte $1f, $66, $56, 3378
-  .byte $03, $02, $11, 3379
+  .byte $5b, $62, $42, 5
+  .byte $5b, $74, $77, 4
+  .byte $c3, $50, $42, 3
+  .byte $1f, $66, $56, 2
+  .byte $03, $02, $11, 1
   .byte $03, $05, $41, GEN_BOOK_CHAIN_END
-  .byte $6b, $06, $25, 3381
-  .byte $6b, $13, $33, 3382
-  .byte $6b, $12, $32, 3383
-  .byte $d3, $16, $26, 3384
-  .byte $13, $32, $43, 3385
-  .byte $e3, $55, $43, 3386
-  .byte $1b, $76, $55, 3387
-  .byte $1b, $71, $52, 3388
+  .byte $6b, $06, $25, 8
+  .byte $6b, $13, $33, 7
+  .byte $6b, $12, $32, 6
+  .byte $d3, $16, $26, 5
+  .byte $13, $32, $43, 4
+  .byte $e3, $55, $43, 3
+  .byte $1b, $76, $55, 2
+  .byte $1b, $71, $52, 1
   .byte $1b, $67, $47, GEN_BOOK_CHAIN_END
   .byte $7b, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $e3, $14, $24, 3391
-  .byte $e3, $16, $26, 3392
-  .byte $e3, $12, $32, 3393
-  .byte $5b, $06, $25, 3394
-  .byte $1b, $46, $55, 3395
-  .byte $cb, $13, $23, 3396
-  .byte $cb, $03, $30, 3397
-  .byte $87, $71, $63, 3398
-  .byte $87, $73, $64, 3399
-  .byte $3f, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $8f, $32, $43, 3401
-  .byte $8f, $06, $25, 3402
-  .byte $7f, $55, $43, 3403
-  .byte $7f, $73, $43, 3404
-  .byte $d3, $44, $34, 3405
-  .byte $ab, $62, $42, 3406
-  .byte $ab, $63, $53, 3407
+  .byte $5b, $06, $25, 5
+  .byte $1b, $46, $55, 4
+  .byte $cb, $13, $23, 3
+  .byte $cb, $03, $30, 2
+  .byte $87, $71, $63, 1
+  .byte $87, $73, $64, GEN_BOOK_CHAIN_END
+  .byte $8f, $32, $43, 7
+  .byte $8f, $06, $25, 6
+  .byte $7f, $55, $43, 5
+  .byte $7f, $73, $43, 4
+  .byte $d3, $44, $34, 3
+  .byte $ab, $62, $42, 2
+  .byte $ab, $63, $53, 1
   .byte $ab, $61, $51, GEN_BOOK_CHAIN_END
   .byte $c7, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $7f, $66, $56, 3410
-  .byte $7f, $64, $54, 3411
-  .byte $7f, $63, $43, 3412
-  .byte $63, $32, $43, 3413
-  .byte $b7, $44, $34, 3414
+  .byte $7f, $66, $56, 5
+  .byte $7f, $64, $54, 4
+  .byte $7f, $63, $43, 3
+  .byte $63, $32, $43, 2
+  .byte $b7, $44, $34, 1
   .byte $0f, $44, $25, GEN_BOOK_CHAIN_END
-  .byte $9f, $14, $24, 3416
-  .byte $9f, $14, $34, 3417
-  .byte $9f, $12, $32, 3418
-  .byte $b3, $25, $44, 3419
+  .byte $9f, $14, $24, 4
+  .byte $9f, $14, $34, 3
+  .byte $9f, $12, $32, 2
+  .byte $b3, $25, $44, 1
   .byte $b3, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $43, $13, $33, 3421
-  .byte $43, $01, $22, 3422
-  .byte $0b, $60, $50, 3423
-  .byte $37, $60, $50, 3424
+  .byte $43, $13, $33, 4
+  .byte $43, $01, $22, 3
+  .byte $0b, $60, $50, 2
+  .byte $37, $60, $50, 1
   .byte $37, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $17, $13, $33, 3426
-  .byte $17, $06, $25, 3427
-  .byte $17, $05, $41, 3428
+  .byte $17, $13, $33, 3
+  .byte $17, $06, $25, 2
+  .byte $17, $05, $41, 1
   .byte $87, $75, $53, GEN_BOOK_CHAIN_END
-  .byte $7b, $71, $52, 3430
+  .byte $7b, $71, $52, 1
   .byte $7b, $61, $51, GEN_BOOK_CHAIN_END
   .byte $7b, $43, $33, GEN_BOOK_CHAIN_END
-  .byte $ef, $64, $44, 3433
+  .byte $ef, $64, $44, 1
   .byte $87, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $67, $75, $66, 3435
-  .byte $a3, $71, $52, 3436
-  .byte $a3, $76, $55, 3437
-  .byte $a3, $42, $33, 3438
-  .byte $27, $01, $22, 3439
-  .byte $27, $12, $32, 3440
-  .byte $33, $75, $66, 3441
-  .byte $33, $76, $55, 3442
-  .byte $e3, $43, $34, 3443
-  .byte $e3, $64, $54, 3444
-  .byte $77, $71, $52, 3445
+  .byte $67, $75, $66, 11
+  .byte $a3, $71, $52, 10
+  .byte $a3, $76, $55, 9
+  .byte $a3, $42, $33, 8
+  .byte $27, $01, $22, 7
+  .byte $27, $12, $32, 6
+  .byte $33, $75, $66, 5
+  .byte $33, $76, $55, 4
+  .byte $e3, $43, $34, 3
+  .byte $e3, $64, $54, 2
+  .byte $77, $71, $52, 1
   .byte $77, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $f3, $75, $66, 3447
-  .byte $73, $06, $25, 3448
-  .byte $73, $12, $32, 3449
+  .byte $f3, $75, $66, 3
+  .byte $73, $06, $25, 2
+  .byte $73, $12, $32, 1
   .byte $ef, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $db, $17, $27, 3451
-  .byte $df, $13, $33, 3452
-  .byte $47, $05, $16, 3453
+  .byte $db, $17, $27, 3
+  .byte $df, $13, $33, 2
+  .byte $47, $05, $16, 1
   .byte $27, $75, $31, GEN_BOOK_CHAIN_END
-  .byte $bb, $76, $55, 3455
-  .byte $bb, $63, $43, 3456
-  .byte $63, $13, $23, 3457
-  .byte $d7, $43, $34, 3458
+  .byte $bb, $76, $55, 4
+  .byte $bb, $63, $43, 3
+  .byte $63, $13, $23, 2
+  .byte $d7, $43, $34, 1
   .byte $97, $75, $53, GEN_BOOK_CHAIN_END
   .byte $57, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $0f, $01, $22, 3461
-  .byte $0f, $16, $26, 3462
-  .byte $0f, $13, $33, 3463
+  .byte $0f, $01, $22, 3
+  .byte $0f, $16, $26, 2
+  .byte $0f, $13, $33, 1
   .byte $53, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $57, $66, $56, 3465
-  .byte $57, $71, $52, 3466
-  .byte $57, $76, $55, 3467
-  .byte $0f, $06, $25, 3468
-  .byte $0f, $14, $34, 3469
+  .byte $57, $66, $56, 5
+  .byte $57, $71, $52, 4
+  .byte $57, $76, $55, 3
+  .byte $0f, $06, $25, 2
+  .byte $0f, $14, $34, 1
   .byte $0f, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $8f, $43, $32, 3471
-  .byte $d7, $63, $43, 3472
-  .byte $d7, $64, $44, 3473
-  .byte $d7, $66, $56, 3474
-  .byte $87, $02, $11, 3475
+  .byte $8f, $43, $32, 5
+  .byte $d7, $63, $43, 4
+  .byte $d7, $64, $44, 3
+  .byte $d7, $66, $56, 2
+  .byte $87, $02, $11, 1
   .byte $27, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $1f, $72, $36, 3477
+  .byte $1f, $72, $36, 1
   .byte $47, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $bb, $43, $34, 3479
-  .byte $db, $06, $25, 3480
+  .byte $bb, $43, $34, 2
+  .byte $db, $06, $25, 1
   .byte $13, $43, $55, GEN_BOOK_CHAIN_END
-  .byte $67, $71, $52, 3482
-  .byte $1b, $05, $14, 3483
-  .byte $1b, $01, $13, 3484
-  .byte $1b, $12, $22, 3485
+  .byte $67, $71, $52, 4
+  .byte $1b, $05, $14, 3
+  .byte $1b, $01, $13, 2
+  .byte $1b, $12, $22, 1
   .byte $9f, $11, $31, GEN_BOOK_CHAIN_END
   .byte $b3, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $83, $76, $55, 3488
-  .byte $bf, $05, $16, 3489
-  .byte $bf, $12, $32, 3490
-  .byte $bf, $06, $25, 3491
-  .byte $b7, $14, $25, 3492
-  .byte $13, $71, $52, 3493
-  .byte $13, $42, $33, 3494
+  .byte $83, $76, $55, 7
+  .byte $bf, $05, $16, 6
+  .byte $bf, $12, $32, 5
+  .byte $bf, $06, $25, 4
+  .byte $b7, $14, $25, 3
+  .byte $13, $71, $52, 2
+  .byte $13, $42, $33, 1
   .byte $13, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $03, $42, $33, 3496
-  .byte $03, $64, $54, 3497
-  .byte $63, $14, $34, 3498
-  .byte $17, $72, $63, 3499
-  .byte $17, $76, $55, 3500
+  .byte $03, $42, $33, 5
+  .byte $03, $64, $54, 4
+  .byte $63, $14, $34, 3
+  .byte $17, $72, $63, 2
+  .byte $17, $76, $55, 1
   .byte $17, $60, $50, GEN_BOOK_CHAIN_END
   .byte $ff, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $ab, $24, $33, 3503
-  .byte $4b, $32, $43, 3504
+  .byte $ab, $24, $33, 2
+  .byte $4b, $32, $43, 1
   .byte $4b, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $9b, $13, $33, 3506
-  .byte $9b, $14, $34, 3507
-  .byte $9b, $14, $24, 3508
-  .byte $2f, $71, $52, 3509
-  .byte $cb, $71, $52, 3510
+  .byte $9b, $13, $33, 5
+  .byte $9b, $14, $34, 4
+  .byte $9b, $14, $24, 3
+  .byte $2f, $71, $52, 2
+  .byte $cb, $71, $52, 1
   .byte $6f, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $bb, $05, $16, 3512
-  .byte $bb, $12, $22, 3513
-  .byte $ef, $06, $14, 3514
-  .byte $ef, $22, $43, 3515
-  .byte $03, $64, $54, 3516
-  .byte $7f, $36, $25, 3517
+  .byte $bb, $05, $16, 6
+  .byte $bb, $12, $22, 5
+  .byte $ef, $06, $14, 4
+  .byte $ef, $22, $43, 3
+  .byte $03, $64, $54, 2
+  .byte $7f, $36, $25, 1
   .byte $b7, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $33, $76, $55, 3519
-  .byte $33, $63, $43, 3520
-  .byte $f3, $14, $24, 3521
-  .byte $33, $41, $52, GEN_BOOK_CHAIN_END
-  .byte $d7, $06, $25, 3523
-  .byte $c7, $06, $25, 3524
-  .byte $c7, $02, $46, 3525
-  .byte $c7, $10, $20, 3526
+  .byte $f3, $14, $24, GEN_BOOK_CHAIN_END
+  .byte $d7, $06, $25, 4
+  .byte $c7, $06, $25, 3
+  .byte $c7, $02, $46, 2
+  .byte $c7, $10, $20, 1
   .byte $83, $73, $03, GEN_BOOK_CHAIN_END
-  .byte $6f, $41, $52, 3528
-  .byte $17, $02, $46, 3529
+  .byte $6f, $41, $52, 2
+  .byte $17, $02, $46, 1
   .byte $17, $02, $35, GEN_BOOK_CHAIN_END
-  .byte $47, $75, $66, 3531
-  .byte $57, $71, $52, 3532
-  .byte $df, $75, $53, 3533
+  .byte $47, $75, $66, 3
+  .byte $57, $71, $52, 2
+  .byte $df, $75, $53, 1
   .byte $ef, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $23, $71, $52, 3535
-  .byte $9b, $13, $33, 3536
-  .byte $9b, $04, $07, 3537
-  .byte $0b, $25, $06, 3538
-  .byte $bf, $76, $55, 3539
-  .byte $bf, $75, $64, 3540
-  .byte $bf, $72, $54, 3541
+  .byte $23, $71, $52, 7
+  .byte $9b, $13, $33, 6
+  .byte $9b, $04, $07, 5
+  .byte $0b, $25, $06, 4
+  .byte $bf, $76, $55, 3
+  .byte $bf, $75, $64, 2
+  .byte $bf, $72, $54, 1
   .byte $1b, $70, $71, GEN_BOOK_CHAIN_END
-  .byte $63, $71, $52, 3543
-  .byte $ef, $43, $33, 3544
-  .byte $ef, $76, $55, 3545
-  .byte $07, $71, $52, 3546
+  .byte $63, $71, $52, 4
+  .byte $ef, $43, $33, 3
+  .byte $ef, $76, $55, 2
+  .byte $07, $71, $52, 1
   .byte $43, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $ab, $14, $34, 3548
-  .byte $ab, $13, $33, 3549
-  .byte $07, $12, $32, 3550
-  .byte $07, $11, $21, 3551
-  .byte $07, $04, $07, 3552
-  .byte $b7, $44, $33, 3553
-  .byte $b7, $43, $32, 3554
-  .byte $b7, $62, $52, 3555
+  .byte $ab, $14, $34, 8
+  .byte $ab, $13, $33, 7
+  .byte $07, $12, $32, 6
+  .byte $07, $11, $21, 5
+  .byte $07, $04, $07, 4
+  .byte $b7, $44, $33, 3
+  .byte $b7, $43, $32, 2
+  .byte $b7, $62, $52, 1
   .byte $97, $72, $63, GEN_BOOK_CHAIN_END
-  .byte $6f, $75, $66, 3557
-  .byte $e7, $71, $52, 3558
-  .byte $3b, $74, $77, 3559
-  .byte $3b, $63, $43, 3560
+  .byte $6f, $75, $66, 4
+  .byte $e7, $71, $52, 3
+  .byte $3b, $74, $77, 2
+  .byte $3b, $63, $43, 1
   .byte $3b, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $b7, $06, $25, 3562
+  .byte $b7, $06, $25, 1
   .byte $b7, $12, $22, GEN_BOOK_CHAIN_END
-  .byte $13, $06, $25, 3564
-  .byte $13, $32, $43, 3565
-  .byte $0f, $12, $32, 3566
-  .byte $a3, $76, $55, 3567
+  .byte $13, $06, $25, 4
+  .byte $13, $32, $43, 3
+  .byte $0f, $12, $32, 2
+  .byte $a3, $76, $55, 1
   .byte $a3, $62, $52, GEN_BOOK_CHAIN_END
-  .byte $53, $16, $26, 3569
-  .byte $7b, $71, $52, 3570
-  .byte $7b, $76, $55, 3571
+  .byte $53, $16, $26, 3
+  .byte $7b, $71, $52, 2
+  .byte $7b, $76, $55, 1
   .byte $6b, $16, $26, GEN_BOOK_CHAIN_END
   .byte $0b, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $7b, $62, $42, 3574
-  .byte $7b, $75, $66, 3575
-  .byte $0b, $71, $52, 3576
-  .byte $0b, $66, $56, 3577
-  .byte $ff, $76, $55, 3578
-  .byte $ff, $64, $54, 3579
-  .byte $ff, $42, $33, 3580
-  .byte $fb, $36, $25, 3581
-  .byte $73, $64, $54, 3582
-  .byte $ef, $71, $52, 3583
-  .byte $ef, $64, $54, 3584
+  .byte $7b, $62, $42, 11
+  .byte $7b, $75, $66, 10
+  .byte $0b, $71, $52, 9
+  .byte $0b, $66, $56, 8
+  .byte $ff, $76, $55, 7
+  .byte $ff, $64, $54, 6
+  .byte $ff, $42, $33, 5
+  .byte $fb, $36, $25, 4
+  .byte $73, $64, $54, 3
+  .byte $ef, $71, $52, 2
+  .byte $ef, $64, $54, 1
   .byte $ef, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $7b, $63, $43, 3586
-  .byte $7b, $62, $42, 3587
-  .byte $97, $05, $16, 3588
-  .byte $9f, $31, $40, 3589
+  .byte $7b, $63, $43, 4
+  .byte $7b, $62, $42, 3
+  .byte $97, $05, $16, 2
+  .byte $9f, $31, $40, 1
   .byte $9f, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $83, $05, $41, 3591
-  .byte $83, $13, $33, 3592
-  .byte $83, $12, $32, 3593
-  .byte $2b, $06, $25, 3594
+  .byte $83, $05, $41, 4
+  .byte $83, $13, $33, 3
+  .byte $83, $12, $32, 2
+  .byte $2b, $06, $25, 1
   .byte $b3, $71, $52, GEN_BOOK_CHAIN_END
   .byte $d7, $75, $31, GEN_BOOK_CHAIN_END
-  .byte $13, $13, $23, 3597
-  .byte $8b, $13, $33, 3598
-  .byte $17, $63, $43, 3599
+  .byte $13, $13, $23, 3
+  .byte $8b, $13, $33, 2
+  .byte $17, $63, $43, 1
   .byte $17, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $8b, $75, $66, 3601
-  .byte $53, $71, $52, 3602
-  .byte $87, $04, $07, 3603
-  .byte $87, $12, $22, 3604
-  .byte $87, $12, $32, 3605
-  .byte $67, $75, $53, 3606
-  .byte $67, $71, $63, 3607
+  .byte $8b, $75, $66, 7
+  .byte $53, $71, $52, 6
+  .byte $87, $04, $07, 5
+  .byte $87, $12, $22, 4
+  .byte $87, $12, $32, 3
+  .byte $67, $75, $53, 2
+  .byte $67, $71, $63, 1
   .byte $67, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $9f, $06, $25, 3609
-  .byte $9f, $13, $23, 3610
-  .byte $77, $64, $54, 3611
-  .byte $77, $76, $55, 3612
-  .byte $77, $64, $44, 3613
+  .byte $9f, $06, $25, 5
+  .byte $9f, $13, $23, 4
+  .byte $77, $64, $54, 3
+  .byte $77, $76, $55, 2
+  .byte $77, $64, $44, 1
   .byte $5b, $64, $54, GEN_BOOK_CHAIN_END
   .byte $47, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $47, $76, $55, 3616
-  .byte $3f, $74, $77, 3617
+  .byte $47, $76, $55, 2
+  .byte $3f, $74, $77, 1
   .byte $3f, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $33, $63, $43, 3619
-  .byte $33, $62, $42, 3620
-  .byte $33, $62, $52, 3621
-  .byte $87, $76, $55, 3622
-  .byte $87, $75, $66, 3623
-  .byte $87, $61, $51, 3624
+  .byte $33, $63, $43, 6
+  .byte $33, $62, $42, 5
+  .byte $33, $62, $52, 4
+  .byte $87, $76, $55, 3
+  .byte $87, $75, $66, 2
+  .byte $87, $61, $51, 1
   .byte $43, $34, $43, GEN_BOOK_CHAIN_END
-  .byte $8f, $03, $21, 3626
-  .byte $9b, $61, $51, 3627
+  .byte $8f, $03, $21, 2
+  .byte $9b, $61, $51, 1
   .byte $9b, $73, $72, GEN_BOOK_CHAIN_END
-  .byte $3f, $06, $25, 3629
-  .byte $3f, $13, $33, 3630
-  .byte $3f, $14, $24, 3631
+  .byte $3f, $06, $25, 3
+  .byte $3f, $13, $33, 2
+  .byte $3f, $14, $24, 1
   .byte $df, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $57, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $ab, $76, $55, 3634
-  .byte $9f, $72, $45, 3635
-  .byte $9f, $62, $42, 3636
-  .byte $9f, $66, $56, 3637
-  .byte $d7, $25, $44, 3638
-  .byte $d7, $31, $40, 3639
-  .byte $d7, $31, $42, GEN_BOOK_CHAIN_END
-  .byte $df, $71, $63, 3641
-  .byte $df, $73, $64, 3642
-  .byte $df, $03, $30, GEN_BOOK_CHAIN_END
-  .byte $d3, $71, $52, 3644
-  .byte $c3, $72, $54, 3645
-  .byte $c3, $76, $55, 3646
+  .byte $ab, $76, $55, 3
+  .byte $9f, $72, $45, 2
+  .byte $9f, $62, $42, 1
+  .byte $9f, $66, $56, GEN_BOOK_CHAIN_END
+  .byte $d3, $71, $52, 3
+  .byte $c3, $72, $54, 2
+  .byte $c3, $76, $55, 1
   .byte $6b, $02, $46, GEN_BOOK_CHAIN_END
-  .byte $9b, $02, $11, 3648
+  .byte $9b, $02, $11, 1
   .byte $33, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $ef, $75, $66, 3650
-  .byte $f7, $22, $33, 3651
-  .byte $17, $02, $11, 3652
-  .byte $17, $02, $20, 3653
-  .byte $17, $12, $32, 3654
-  .byte $5f, $66, $56, 3655
-  .byte $5f, $72, $36, 3656
+  .byte $ef, $75, $66, 7
+  .byte $f7, $22, $33, 6
+  .byte $17, $02, $11, 5
+  .byte $17, $02, $20, 4
+  .byte $17, $12, $32, 3
+  .byte $5f, $66, $56, 2
+  .byte $5f, $72, $36, 1
   .byte $5f, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $07, $66, $56, 3658
+  .byte $07, $66, $56, 1
   .byte $7b, $54, $43, GEN_BOOK_CHAIN_END
-  .byte $57, $06, $25, 3660
-  .byte $57, $01, $22, 3661
-  .byte $2b, $05, $16, 3662
-  .byte $2b, $13, $33, 3663
+  .byte $57, $06, $25, 4
+  .byte $57, $01, $22, 3
+  .byte $2b, $05, $16, 2
+  .byte $2b, $13, $33, 1
   .byte $2b, $13, $23, GEN_BOOK_CHAIN_END
   .byte $cf, $71, $52, GEN_BOOK_CHAIN_END
   .byte $53, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $b7, $01, $13, 3667
-  .byte $b7, $14, $34, 3668
-  .byte $b7, $16, $26, 3669
-  .byte $13, $02, $11, 3670
-  .byte $67, $12, $32, 3671
-  .byte $67, $06, $14, 3672
+  .byte $b7, $01, $13, 6
+  .byte $b7, $14, $34, 5
+  .byte $b7, $16, $26, 4
+  .byte $13, $02, $11, 3
+  .byte $67, $12, $32, 2
+  .byte $67, $06, $14, 1
   .byte $67, $11, $21, GEN_BOOK_CHAIN_END
   .byte $a7, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $93, $66, $56, 3675
-  .byte $93, $71, $52, 3676
-  .byte $93, $63, $43, 3677
-  .byte $37, $17, $27, 3678
-  .byte $13, $63, $53, 3679
-  .byte $13, $55, $36, 3680
-  .byte $13, $63, $43, 3681
+  .byte $93, $66, $56, 7
+  .byte $93, $71, $52, 6
+  .byte $93, $63, $43, 5
+  .byte $37, $17, $27, 4
+  .byte $13, $63, $53, 3
+  .byte $13, $55, $36, 2
+  .byte $13, $63, $43, 1
   .byte $cf, $44, $25, GEN_BOOK_CHAIN_END
-  .byte $6f, $12, $32, 3683
-  .byte $6f, $05, $14, 3684
-  .byte $23, $64, $54, 3685
-  .byte $23, $72, $36, 3686
-  .byte $23, $42, $33, 3687
-  .byte $3b, $73, $62, 3688
-  .byte $3b, $52, $33, GEN_BOOK_CHAIN_END
-  .byte $37, $02, $11, 3690
-  .byte $d3, $12, $32, 3691
-  .byte $d3, $06, $25, 3692
-  .byte $d3, $14, $34, 3693
-  .byte $33, $71, $52, 3694
+  .byte $6f, $12, $32, 4
+  .byte $6f, $05, $14, 3
+  .byte $23, $64, $54, 2
+  .byte $23, $72, $36, 1
+  .byte $23, $42, $33, GEN_BOOK_CHAIN_END
+  .byte $37, $02, $11, 5
+  .byte $d3, $12, $32, 4
+  .byte $d3, $06, $25, 3
+  .byte $d3, $14, $34, 2
+  .byte $33, $71, $52, 1
   .byte $83, $72, $63, GEN_BOOK_CHAIN_END
-  .byte $c7, $76, $55, 3696
-  .byte $f7, $63, $43, 3697
+  .byte $c7, $76, $55, 2
+  .byte $f7, $63, $43, 1
   .byte $f7, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $bb, $71, $52, 3699
-  .byte $bb, $75, $53, 3700
-  .byte $bb, $76, $55, 3701
+  .byte $bb, $71, $52, 3
+  .byte $bb, $75, $53, 2
+  .byte $bb, $76, $55, 1
   .byte $7b, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $37, $62, $42, 3703
-  .byte $37, $64, $44, 3704
-  .byte $37, $66, $56, 3705
-  .byte $d7, $13, $23, 3706
+  .byte $37, $62, $42, 4
+  .byte $37, $64, $44, 3
+  .byte $37, $66, $56, 2
+  .byte $d7, $13, $23, 1
   .byte $b7, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $2f, $74, $77, 3708
-  .byte $2f, $62, $42, 3709
-  .byte $2f, $63, $43, 3710
-  .byte $c3, $05, $16, 3711
+  .byte $2f, $74, $77, 4
+  .byte $2f, $62, $42, 3
+  .byte $2f, $63, $43, 2
+  .byte $c3, $05, $16, 1
   .byte $c3, $02, $35, GEN_BOOK_CHAIN_END
-  .byte $23, $05, $14, 3713
-  .byte $23, $03, $21, 3714
-  .byte $23, $13, $33, 3715
-  .byte $bb, $74, $77, 3716
+  .byte $23, $05, $14, 4
+  .byte $23, $03, $21, 3
+  .byte $23, $13, $33, 2
+  .byte $bb, $74, $77, 1
   .byte $bb, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $cf, $24, $33, 3718
-  .byte $4b, $43, $33, 3719
-  .byte $f3, $62, $52, 3720
-  .byte $f3, $55, $34, 3721
+  .byte $cf, $24, $33, 4
+  .byte $4b, $43, $33, 3
+  .byte $f3, $62, $52, 2
+  .byte $f3, $55, $34, 1
   .byte $f3, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $47, $76, $55, 3723
-  .byte $47, $71, $52, 3724
-  .byte $47, $62, $52, 3725
-  .byte $63, $63, $43, 3726
-  .byte $63, $66, $56, 3727
-  .byte $63, $61, $51, 3728
-  .byte $d3, $64, $54, 3729
-  .byte $f3, $75, $66, 3730
-  .byte $bf, $76, $55, 3731
-  .byte $bf, $60, $50, 3732
-  .byte $43, $14, $24, 3733
-  .byte $c3, $72, $36, 3734
-  .byte $c3, $42, $33, 3735
+  .byte $47, $76, $55, 13
+  .byte $47, $71, $52, 12
+  .byte $47, $62, $52, 11
+  .byte $63, $63, $43, 10
+  .byte $63, $66, $56, 9
+  .byte $63, $61, $51, 8
+  .byte $d3, $64, $54, 7
+  .byte $f3, $75, $66, 6
+  .byte $bf, $76, $55, 5
+  .byte $bf, $60, $50, 4
+  .byte $43, $14, $24, 3
+  .byte $c3, $72, $36, 2
+  .byte $c3, $42, $33, 1
   .byte $c3, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $43, $67, $47, 3737
-  .byte $4b, $75, $66, 3738
-  .byte $4b, $73, $40, 3739
-  .byte $3b, $71, $52, 3740
+  .byte $43, $67, $47, 4
+  .byte $4b, $75, $66, 3
+  .byte $4b, $73, $40, 2
+  .byte $3b, $71, $52, 1
   .byte $f7, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $4b, $05, $16, 3742
-  .byte $4b, $06, $25, 3743
-  .byte $4b, $13, $23, 3744
-  .byte $7b, $01, $13, 3745
-  .byte $7b, $12, $22, 3746
-  .byte $67, $06, $25, 3747
-  .byte $ab, $55, $43, 3748
-  .byte $d3, $63, $43, 3749
-  .byte $c7, $16, $26, 3750
+  .byte $4b, $05, $16, 9
+  .byte $4b, $06, $25, 8
+  .byte $4b, $13, $23, 7
+  .byte $7b, $01, $13, 6
+  .byte $7b, $12, $22, 5
+  .byte $67, $06, $25, 4
+  .byte $ab, $55, $43, 3
+  .byte $d3, $63, $43, 2
+  .byte $c7, $16, $26, 1
   .byte $47, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $3b, $75, $66, 3752
+  .byte $3b, $75, $66, 1
   .byte $d7, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $53, $06, $25, 3754
-  .byte $2f, $32, $43, 3755
-  .byte $cf, $12, $22, 3756
-  .byte $cf, $01, $22, 3757
+  .byte $53, $06, $25, 4
+  .byte $2f, $32, $43, 3
+  .byte $cf, $12, $22, 2
+  .byte $cf, $01, $22, 1
   .byte $cf, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $d7, $02, $46, 3759
-  .byte $d7, $16, $26, 3760
-  .byte $d7, $06, $25, 3761
-  .byte $53, $71, $52, 3762
-  .byte $53, $72, $36, 3763
-  .byte $a7, $76, $55, 3764
-  .byte $a7, $75, $53, 3765
+  .byte $d7, $02, $46, 7
+  .byte $d7, $16, $26, 6
+  .byte $d7, $06, $25, 5
+  .byte $53, $71, $52, 4
+  .byte $53, $72, $36, 3
+  .byte $a7, $76, $55, 2
+  .byte $a7, $75, $53, 1
   .byte $a7, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $7f, $72, $36, 3767
-  .byte $97, $66, $56, 3768
-  .byte $4f, $71, $52, 3769
-  .byte $4f, $71, $63, 3770
-  .byte $33, $75, $66, 3771
-  .byte $8f, $13, $33, 3772
-  .byte $8f, $16, $26, 3773
-  .byte $8f, $06, $14, 3774
-  .byte $cb, $12, $32, 3775
-  .byte $9f, $36, $25, 3776
-  .byte $d3, $75, $66, 3777
+  .byte $7f, $72, $36, 11
+  .byte $97, $66, $56, 10
+  .byte $4f, $71, $52, 9
+  .byte $4f, $71, $63, 8
+  .byte $33, $75, $66, 7
+  .byte $8f, $13, $33, 6
+  .byte $8f, $16, $26, 5
+  .byte $8f, $06, $14, 4
+  .byte $cb, $12, $32, 3
+  .byte $9f, $36, $25, 2
+  .byte $d3, $75, $66, 1
   .byte $d3, $64, $44, GEN_BOOK_CHAIN_END
   .byte $73, $62, $42, GEN_BOOK_CHAIN_END
-  .byte $6f, $06, $25, 3780
+  .byte $6f, $06, $25, 1
   .byte $27, $52, $44, GEN_BOOK_CHAIN_END
-  .byte $7b, $75, $31, 3782
-  .byte $7b, $75, $42, 3783
-  .byte $7b, $63, $43, 3784
+  .byte $7b, $75, $31, 3
+  .byte $7b, $75, $42, 2
+  .byte $7b, $63, $43, 1
   .byte $57, $31, $22, GEN_BOOK_CHAIN_END
-  .byte $03, $01, $22, 3786
-  .byte $03, $05, $41, 3787
-  .byte $a3, $66, $56, 3788
+  .byte $03, $01, $22, 3
+  .byte $03, $05, $41, 2
+  .byte $a3, $66, $56, 1
   .byte $a3, $72, $61, GEN_BOOK_CHAIN_END
   .byte $93, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $43, $02, $11, 3791
+  .byte $43, $02, $11, 1
   .byte $43, $06, $25, GEN_BOOK_CHAIN_END
-  .byte $ab, $13, $33, 3793
-  .byte $ab, $14, $24, 3794
+  .byte $ab, $13, $33, 2
+  .byte $ab, $14, $24, 1
   .byte $ab, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $3f, $02, $46, 3796
-  .byte $13, $05, $16, 3797
-  .byte $ab, $02, $46, 3798
-  .byte $ab, $02, $35, 3799
+  .byte $3f, $02, $46, 4
+  .byte $13, $05, $16, 3
+  .byte $ab, $02, $46, 2
+  .byte $ab, $02, $35, 1
   .byte $67, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $ef, $16, $26, 3801
+  .byte $ef, $16, $26, 1
   .byte $b7, $25, $13, GEN_BOOK_CHAIN_END
-  .byte $ff, $64, $54, 3803
-  .byte $9b, $05, $16, 3804
-  .byte $9b, $01, $22, 3805
-  .byte $ff, $13, $23, 3806
-  .byte $e3, $67, $57, 3807
+  .byte $9b, $05, $16, 3
+  .byte $9b, $01, $22, 2
+  .byte $e3, $67, $57, 1
   .byte $2f, $75, $66, GEN_BOOK_CHAIN_END
   .byte $e3, $02, $11, GEN_BOOK_CHAIN_END
-  .byte $6b, $14, $24, 3810
-  .byte $6b, $16, $26, 3811
-  .byte $6b, $13, $33, 3812
-  .byte $af, $06, $25, 3813
-  .byte $af, $33, $42, 3814
-  .byte $af, $12, $22, 3815
+  .byte $6b, $14, $24, 6
+  .byte $6b, $16, $26, 5
+  .byte $6b, $13, $33, 4
+  .byte $af, $06, $25, 3
+  .byte $af, $33, $42, 2
+  .byte $af, $12, $22, 1
   .byte $7b, $06, $25, GEN_BOOK_CHAIN_END
   .byte $bf, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $2b, $05, $14, 3818
+  .byte $2b, $05, $14, 1
   .byte $97, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $2f, $12, $22, 3820
+  .byte $2f, $12, $22, 1
   .byte $2f, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $df, $02, $46, 3822
-  .byte $df, $06, $25, 3823
-  .byte $db, $63, $43, 3824
-  .byte $5b, $04, $07, 3825
+  .byte $df, $02, $46, 4
+  .byte $df, $06, $25, 3
+  .byte $db, $63, $43, 2
+  .byte $5b, $04, $07, 1
   .byte $7f, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $b7, $43, $33, 3827
-  .byte $fb, $76, $55, 3828
+  .byte $b7, $43, $33, 2
+  .byte $fb, $76, $55, 1
   .byte $ab, $75, $66, GEN_BOOK_CHAIN_END
   .byte $5b, $01, $13, GEN_BOOK_CHAIN_END
-  .byte $df, $73, $40, 3831
+  .byte $df, $73, $40, 1
   .byte $33, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $eb, $76, $55, 3833
-  .byte $eb, $75, $42, 3834
-  .byte $8f, $14, $24, 3835
-  .byte $8b, $13, $33, 3836
-  .byte $77, $63, $43, 3837
-  .byte $d7, $14, $24, 3838
+  .byte $eb, $76, $55, 6
+  .byte $eb, $75, $42, 5
+  .byte $8f, $14, $24, 4
+  .byte $8b, $13, $33, 3
+  .byte $77, $63, $43, 2
+  .byte $d7, $14, $24, 1
   .byte $d7, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $27, $11, $21, 3840
-  .byte $27, $01, $22, 3841
+  .byte $27, $11, $21, 2
+  .byte $27, $01, $22, 1
   .byte $73, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $f7, $71, $52, 3843
-  .byte $f7, $66, $56, 3844
-  .byte $f7, $72, $36, 3845
-  .byte $cb, $71, $52, 3846
-  .byte $cb, $73, $51, 3847
-  .byte $8b, $71, $52, 3848
-  .byte $8b, $66, $56, 3849
-  .byte $ef, $44, $33, 3850
-  .byte $ef, $55, $43, 3851
+  .byte $f7, $71, $52, 9
+  .byte $f7, $66, $56, 8
+  .byte $f7, $72, $36, 7
+  .byte $cb, $71, $52, 6
+  .byte $cb, $73, $51, 5
+  .byte $8b, $71, $52, 4
+  .byte $8b, $66, $56, 3
+  .byte $ef, $44, $33, 2
+  .byte $ef, $55, $43, 1
   .byte $d3, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $8f, $66, $56, 3853
-  .byte $8f, $71, $52, 3854
-  .byte $8f, $76, $55, 3855
-  .byte $a3, $76, $55, 3856
-  .byte $a3, $66, $56, 3857
-  .byte $2b, $01, $13, 3858
-  .byte $2f, $32, $43, 3859
-  .byte $df, $55, $43, 3860
+  .byte $8f, $66, $56, 8
+  .byte $8f, $71, $52, 7
+  .byte $8f, $76, $55, 6
+  .byte $a3, $76, $55, 5
+  .byte $a3, $66, $56, 4
+  .byte $2b, $01, $13, 3
+  .byte $2f, $32, $43, 2
+  .byte $df, $55, $43, 1
   .byte $df, $73, $43, GEN_BOOK_CHAIN_END
-  .byte $5f, $16, $26, 3862
-  .byte $5f, $01, $22, 3863
-  .byte $5f, $15, $35, 3864
-  .byte $1f, $31, $42, 3865
-  .byte $23, $05, $16, 3866
-  .byte $23, $06, $25, 3867
-  .byte $37, $06, $25, 3868
-  .byte $37, $14, $24, 3869
-  .byte $37, $16, $26, 3870
+  .byte $5f, $16, $26, 7
+  .byte $5f, $01, $22, 6
+  .byte $5f, $15, $35, 5
+  .byte $1f, $31, $42, 4
+  .byte $37, $06, $25, 3
+  .byte $37, $14, $24, 2
+  .byte $37, $16, $26, 1
   .byte $33, $02, $11, GEN_BOOK_CHAIN_END
   .byte $2f, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $43, $13, $33, 3873
-  .byte $43, $05, $41, 3874
-  .byte $43, $11, $21, 3875
+  .byte $43, $13, $33, 3
+  .byte $43, $05, $41, 2
+  .byte $43, $11, $21, 1
   .byte $c7, $52, $44, GEN_BOOK_CHAIN_END
-  .byte $5f, $60, $50, 3877
+  .byte $5f, $60, $50, 1
   .byte $47, $05, $32, GEN_BOOK_CHAIN_END
-  .byte $e3, $05, $41, 3879
-  .byte $ef, $42, $33, 3880
-  .byte $ef, $75, $66, 3881
-  .byte $d7, $76, $55, 3882
-  .byte $93, $75, $66, 3883
+  .byte $e3, $05, $41, 5
+  .byte $ef, $42, $33, 4
+  .byte $ef, $75, $66, 3
+  .byte $d7, $76, $55, 2
+  .byte $93, $75, $66, 1
   .byte $bb, $66, $46, GEN_BOOK_CHAIN_END
-  .byte $db, $11, $31, 3885
-  .byte $a7, $32, $43, 3886
+  .byte $db, $11, $31, 2
+  .byte $a7, $32, $43, 1
   .byte $57, $55, $43, GEN_BOOK_CHAIN_END
   .byte $77, $36, $45, GEN_BOOK_CHAIN_END
-  .byte $33, $64, $54, 3889
-  .byte $13, $75, $66, 3890
-  .byte $13, $61, $51, 3891
-  .byte $13, $62, $42, 3892
-  .byte $d7, $60, $40, 3893
+  .byte $33, $64, $54, 5
+  .byte $13, $75, $66, 4
+  .byte $13, $61, $51, 3
+  .byte $13, $62, $42, 2
+  .byte $d7, $60, $40, 1
   .byte $bb, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $33, $63, $43, 3895
-  .byte $33, $62, $42, 3896
-  .byte $33, $71, $52, 3897
-  .byte $43, $14, $34, 3898
-  .byte $43, $06, $25, 3899
+  .byte $33, $63, $43, 5
+  .byte $33, $62, $42, 4
+  .byte $33, $71, $52, 3
+  .byte $43, $14, $34, 2
+  .byte $43, $06, $25, 1
   .byte $63, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $6f, $22, $34, 3901
-  .byte $33, $16, $26, 3902
-  .byte $3b, $33, $42, 3903
-  .byte $3b, $05, $14, 3904
-  .byte $3b, $05, $41, 3905
-  .byte $2f, $06, $25, 3906
+  .byte $6f, $22, $34, 6
+  .byte $33, $16, $26, 5
+  .byte $3b, $33, $42, 4
+  .byte $3b, $05, $14, 3
+  .byte $3b, $05, $41, 2
+  .byte $2f, $06, $25, 1
   .byte $2f, $14, $24, GEN_BOOK_CHAIN_END
-  .byte $53, $55, $34, 3908
-  .byte $67, $34, $44, 3909
-  .byte $67, $01, $22, 3910
-  .byte $f3, $61, $52, 3911
-  .byte $f7, $73, $55, 3912
+  .byte $53, $55, $34, 5
+  .byte $67, $34, $44, 4
+  .byte $67, $01, $22, 3
+  .byte $f3, $61, $52, 2
+  .byte $f7, $73, $55, 1
   .byte $eb, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $8f, $63, $43, 3914
-  .byte $2f, $12, $22, 3915
-  .byte $8f, $73, $62, 3916
-  .byte $8f, $76, $55, 3917
-  .byte $67, $64, $44, 3918
+  .byte $2f, $12, $22, 2
+  .byte $67, $64, $44, 1
   .byte $67, $71, $63, GEN_BOOK_CHAIN_END
   .byte $23, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $ff, $24, $33, 3921
+  .byte $ff, $24, $33, 1
   .byte $fb, $11, $31, GEN_BOOK_CHAIN_END
-  .byte $57, $42, $33, 3923
+  .byte $57, $42, $33, 1
   .byte $57, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $eb, $05, $16, 3925
-  .byte $eb, $13, $33, 3926
+  .byte $eb, $05, $16, 2
+  .byte $eb, $13, $33, 1
   .byte $07, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $e3, $05, $41, 3928
-  .byte $e3, $13, $33, 3929
-  .byte $e3, $12, $22, 3930
-  .byte $6b, $63, $53, 3931
-  .byte $6b, $67, $57, 3932
-  .byte $cb, $76, $55, 3933
-  .byte $cf, $42, $33, 3934
+  .byte $e3, $05, $41, 7
+  .byte $e3, $13, $33, 6
+  .byte $e3, $12, $22, 5
+  .byte $6b, $63, $53, 4
+  .byte $6b, $67, $57, 3
+  .byte $cb, $76, $55, 2
+  .byte $cf, $42, $33, 1
   .byte $cf, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $bb, $71, $52, 3936
+  .byte $bb, $71, $52, 1
   .byte $27, $35, $44, GEN_BOOK_CHAIN_END
-  .byte $87, $33, $44, 3938
-  .byte $87, $16, $26, 3939
+  .byte $87, $33, $44, 2
+  .byte $87, $16, $26, 1
   .byte $af, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $83, $66, $56, 3941
-  .byte $83, $76, $55, 3942
-  .byte $ef, $63, $43, 3943
-  .byte $1b, $13, $23, 3944
-  .byte $93, $64, $54, 3945
-  .byte $cf, $74, $77, 3946
-  .byte $cf, $71, $52, 3947
-  .byte $cf, $63, $43, 3948
+  .byte $83, $66, $56, 8
+  .byte $83, $76, $55, 7
+  .byte $ef, $63, $43, 6
+  .byte $1b, $13, $23, 5
+  .byte $93, $64, $54, 4
+  .byte $cf, $74, $77, 3
+  .byte $cf, $71, $52, 2
+  .byte $cf, $63, $43, 1
   .byte $8b, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $ff, $63, $43, 3950
-  .byte $ff, $64, $44, 3951
-  .byte $ff, $66, $56, 3952
-  .byte $0f, $62, $52, 3953
-  .byte $0f, $61, $41, 3954
+  .byte $ff, $63, $43, 5
+  .byte $ff, $64, $44, 4
+  .byte $ff, $66, $56, 3
+  .byte $0f, $62, $52, 2
+  .byte $0f, $61, $41, 1
   .byte $0f, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $2f, $76, $55, 3956
-  .byte $2f, $63, $53, 3957
-  .byte $27, $73, $40, 3958
-  .byte $fb, $75, $53, 3959
-  .byte $fb, $43, $34, 3960
-  .byte $fb, $55, $34, 3961
-  .byte $cf, $74, $77, 3962
+  .byte $2f, $76, $55, 7
+  .byte $2f, $63, $53, 6
+  .byte $27, $73, $40, 5
+  .byte $fb, $75, $53, 4
+  .byte $fb, $43, $34, 3
+  .byte $fb, $55, $34, 2
+  .byte $cf, $74, $77, 1
   .byte $73, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $67, $32, $43, 3964
-  .byte $97, $62, $52, 3965
-  .byte $43, $06, $25, 3966
-  .byte $43, $12, $22, 3967
-  .byte $43, $12, $32, 3968
-  .byte $4f, $64, $44, 3969
-  .byte $4f, $66, $56, 3970
+  .byte $67, $32, $43, 7
+  .byte $97, $62, $52, 6
+  .byte $43, $06, $25, 5
+  .byte $43, $12, $22, 4
+  .byte $43, $12, $32, 3
+  .byte $4f, $64, $44, 2
+  .byte $4f, $66, $56, 1
   .byte $4f, $72, $36, GEN_BOOK_CHAIN_END
-  .byte $d7, $13, $33, 3972
-  .byte $d7, $12, $32, 3973
+  .byte $d7, $13, $33, 2
+  .byte $d7, $12, $32, 1
   .byte $d7, $01, $22, GEN_BOOK_CHAIN_END
-  .byte $1b, $13, $23, 3975
-  .byte $cb, $14, $24, 3976
-  .byte $cb, $12, $22, 3977
+  .byte $1b, $13, $23, 3
+  .byte $cb, $14, $24, 2
+  .byte $cb, $12, $22, 1
   .byte $cb, $33, $42, GEN_BOOK_CHAIN_END
   .byte $8f, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $97, $13, $33, 3980
-  .byte $97, $13, $23, 3981
-  .byte $47, $01, $22, 3982
+  .byte $97, $13, $33, 3
+  .byte $97, $13, $23, 2
+  .byte $47, $01, $22, 1
   .byte $47, $16, $26, GEN_BOOK_CHAIN_END
-  .byte $83, $24, $33, 3984
-  .byte $83, $25, $33, 3985
-  .byte $57, $10, $20, 3986
+  .byte $83, $24, $33, 3
+  .byte $83, $25, $33, 2
+  .byte $57, $10, $20, 1
   .byte $47, $25, $44, GEN_BOOK_CHAIN_END
-  .byte $73, $16, $26, 3988
-  .byte $73, $13, $23, 3989
-  .byte $73, $14, $34, 3990
-  .byte $23, $42, $33, 3991
-  .byte $23, $76, $55, 3992
+  .byte $73, $16, $26, 5
+  .byte $73, $13, $23, 4
+  .byte $73, $14, $34, 3
+  .byte $23, $42, $33, 2
+  .byte $23, $76, $55, 1
   .byte $23, $72, $45, GEN_BOOK_CHAIN_END
-  .byte $8f, $62, $42, 3994
+  .byte $8f, $62, $42, 1
   .byte $8f, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $63, $12, $32, 3996
-  .byte $63, $14, $34, 3997
-  .byte $63, $14, $24, 3998
-  .byte $93, $01, $22, 3999
-  .byte $93, $41, $30, 4000
-  .byte $1f, $71, $52, 4001
+  .byte $63, $12, $32, 6
+  .byte $63, $14, $34, 5
+  .byte $63, $14, $24, 4
+  .byte $93, $01, $22, 3
+  .byte $93, $41, $30, 2
+  .byte $1f, $71, $52, 1
   .byte $1f, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $c3, $76, $55, 4003
-  .byte $c3, $66, $56, 4004
+  .byte $c3, $76, $55, 2
+  .byte $c3, $66, $56, 1
   .byte $97, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $4f, $16, $26, 4006
-  .byte $4f, $14, $24, 4007
-  .byte $4f, $13, $23, 4008
-  .byte $93, $03, $14, 4009
-  .byte $93, $41, $63, 4010
+  .byte $4f, $16, $26, 5
+  .byte $4f, $14, $24, 4
+  .byte $4f, $13, $23, 3
+  .byte $93, $03, $14, 2
+  .byte $93, $41, $63, 1
   .byte $93, $10, $30, GEN_BOOK_CHAIN_END
   .byte $67, $72, $61, GEN_BOOK_CHAIN_END
-  .byte $0b, $25, $33, 4013
-  .byte $df, $63, $53, 4014
-  .byte $27, $34, $44, 4015
+  .byte $0b, $25, $33, 3
+  .byte $df, $63, $53, 2
+  .byte $27, $34, $44, 1
   .byte $ab, $60, $40, GEN_BOOK_CHAIN_END
-  .byte $0f, $72, $36, 4017
-  .byte $0f, $42, $33, 4018
-  .byte $0f, $64, $54, 4019
+  .byte $0f, $72, $36, 3
+  .byte $0f, $42, $33, 2
+  .byte $0f, $64, $54, 1
   .byte $73, $73, $51, GEN_BOOK_CHAIN_END
-  .byte $57, $66, $56, 4021
-  .byte $57, $71, $52, 4022
-  .byte $f3, $12, $22, 4023
+  .byte $57, $66, $56, 3
+  .byte $57, $71, $52, 2
+  .byte $f3, $12, $22, 1
   .byte $6b, $64, $54, GEN_BOOK_CHAIN_END
-  .byte $53, $74, $77, 4025
-  .byte $93, $42, $33, 4026
-  .byte $93, $75, $66, 4027
-  .byte $c7, $75, $64, 4028
+  .byte $53, $74, $77, 4
+  .byte $93, $42, $33, 3
+  .byte $93, $75, $66, 2
+  .byte $c7, $75, $64, 1
   .byte $c7, $60, $50, GEN_BOOK_CHAIN_END
-  .byte $fb, $63, $43, 4030
-  .byte $c7, $74, $77, 4031
-  .byte $c7, $71, $52, 4032
-  .byte $db, $63, $43, 4033
+  .byte $fb, $63, $43, 4
+  .byte $c7, $74, $77, 3
+  .byte $c7, $71, $52, 2
+  .byte $db, $63, $43, 1
   .byte $db, $61, $51, GEN_BOOK_CHAIN_END
-  .byte $87, $06, $25, 4035
-  .byte $87, $13, $23, 4036
-  .byte $87, $16, $26, 4037
+  .byte $87, $06, $25, 3
+  .byte $87, $13, $23, 2
+  .byte $87, $16, $26, 1
   .byte $db, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $57, $02, $11, 4039
+  .byte $57, $02, $11, 1
   .byte $57, $05, $41, GEN_BOOK_CHAIN_END
   .byte $47, $02, $11, GEN_BOOK_CHAIN_END
-  .byte $df, $71, $52, 4042
-  .byte $df, $66, $56, 4043
+  .byte $df, $71, $52, 2
+  .byte $df, $66, $56, 1
   .byte $df, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $8b, $42, $33, 4045
-  .byte $8b, $72, $36, 4046
-  .byte $8b, $76, $55, 4047
-  .byte $f7, $76, $55, 4048
-  .byte $f7, $64, $54, 4049
+  .byte $8b, $42, $33, 5
+  .byte $8b, $72, $36, 4
+  .byte $8b, $76, $55, 3
+  .byte $f7, $76, $55, 2
+  .byte $f7, $64, $54, 1
   .byte $97, $44, $34, GEN_BOOK_CHAIN_END
-  .byte $f3, $75, $53, 4051
-  .byte $23, $63, $53, 4052
+  .byte $f3, $75, $53, 2
+  .byte $23, $63, $53, 1
   .byte $2b, $25, $33, GEN_BOOK_CHAIN_END
-  .byte $f3, $13, $33, 4054
-  .byte $f7, $13, $33, 4055
+  .byte $f3, $13, $33, 2
+  .byte $f7, $13, $33, 1
   .byte $ab, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $63, $01, $22, 4057
-  .byte $4f, $75, $66, 4058
-  .byte $4f, $63, $43, 4059
-  .byte $2f, $02, $11, 4060
-  .byte $ab, $73, $55, 4061
+  .byte $63, $01, $22, 5
+  .byte $4f, $75, $66, 4
+  .byte $4f, $63, $43, 3
+  .byte $2f, $02, $11, 2
+  .byte $ab, $73, $55, 1
   .byte $03, $32, $23, GEN_BOOK_CHAIN_END
-  .byte $b3, $16, $26, 4063
+  .byte $b3, $16, $26, 1
   .byte $93, $66, $55, GEN_BOOK_CHAIN_END
-  .byte $07, $64, $54, 4065
+  .byte $07, $64, $54, 1
   .byte $53, $62, $42, GEN_BOOK_CHAIN_END
   .byte $53, $13, $23, GEN_BOOK_CHAIN_END
-  .byte $93, $06, $25, 4068
-  .byte $93, $14, $34, 4069
-  .byte $93, $12, $32, 4070
+  .byte $93, $06, $25, 3
+  .byte $93, $14, $34, 2
+  .byte $93, $12, $32, 1
   .byte $9f, $25, $33, GEN_BOOK_CHAIN_END
-  .byte $6b, $34, $43, 4072
+  .byte $6b, $34, $43, 1
   .byte $a3, $61, $51, GEN_BOOK_CHAIN_END
   .byte $33, $63, $53, GEN_BOOK_CHAIN_END
-  .byte $7f, $13, $33, 4075
-  .byte $7f, $11, $21, 4076
-  .byte $7f, $12, $32, 4077
-  .byte $53, $63, $43, 4078
+  .byte $7f, $13, $33, 4
+  .byte $7f, $11, $21, 3
+  .byte $7f, $12, $32, 2
+  .byte $53, $63, $43, 1
   .byte $57, $02, $11, GEN_BOOK_CHAIN_END
-  .byte $ef, $64, $44, 4080
-  .byte $ef, $76, $55, 4081
-  .byte $ef, $66, $56, 4082
+  .byte $ef, $64, $44, 3
+  .byte $ef, $76, $55, 2
+  .byte $ef, $66, $56, 1
   .byte $fb, $42, $54, GEN_BOOK_CHAIN_END
-  .byte $db, $44, $34, 4084
-  .byte $07, $12, $32, 4085
-  .byte $57, $34, $43, 4086
-  .byte $c7, $73, $63, 4087
+  .byte $db, $44, $34, 4
+  .byte $07, $12, $32, 3
+  .byte $57, $34, $43, 2
+  .byte $c7, $73, $63, 1
   .byte $c7, $71, $63, GEN_BOOK_CHAIN_END
   .byte $93, $16, $26, GEN_BOOK_CHAIN_END
   .byte $fb, $42, $33, GEN_BOOK_CHAIN_END
   .byte $1b, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $73, $75, $66, 4092
-  .byte $0b, $13, $33, 4093
-  .byte $13, $60, $50, 4094
+  .byte $73, $75, $66, 3
+  .byte $0b, $13, $33, 2
+  .byte $13, $60, $50, 1
   .byte $13, $66, $56, GEN_BOOK_CHAIN_END
-  .byte $57, $24, $33, 4096
-  .byte $57, $03, $33, 4097
-  .byte $37, $13, $33, 4098
+  .byte $57, $24, $33, 3
+  .byte $57, $03, $33, 2
+  .byte $37, $13, $33, 1
   .byte $ff, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $5f, $12, $22, 4100
-  .byte $5f, $14, $24, 4101
-  .byte $5f, $33, $43, 4102
-  .byte $0f, $76, $55, 4103
-  .byte $8f, $71, $52, 4104
+  .byte $5f, $12, $22, 5
+  .byte $5f, $14, $24, 4
+  .byte $5f, $33, $43, 3
+  .byte $0f, $76, $55, 2
+  .byte $8f, $71, $52, 1
   .byte $97, $62, $42, GEN_BOOK_CHAIN_END
   .byte $2b, $40, $51, GEN_BOOK_CHAIN_END
-  .byte $ff, $02, $20, 4107
-  .byte $ff, $06, $25, 4108
   .byte $0f, $63, $43, GEN_BOOK_CHAIN_END
-  .byte $1f, $75, $66, 4110
-  .byte $f3, $32, $43, 4111
+  .byte $1f, $75, $66, 2
+  .byte $f3, $32, $43, 1
   .byte $03, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $97, $42, $33, 4113
-  .byte $97, $63, $43, 4114
-  .byte $eb, $66, $56, 4115
-  .byte $0b, $72, $36, 4116
-  .byte $0b, $72, $45, 4117
+  .byte $97, $42, $33, 5
+  .byte $97, $63, $43, 4
+  .byte $eb, $66, $56, 3
+  .byte $0b, $72, $36, 2
+  .byte $0b, $72, $45, 1
   .byte $0b, $42, $33, GEN_BOOK_CHAIN_END
-  .byte $2b, $01, $22, 4119
-  .byte $2b, $12, $22, 4120
-  .byte $2b, $05, $32, 4121
-  .byte $4b, $66, $56, 4122
-  .byte $3f, $04, $07, 4123
-  .byte $3f, $12, $32, 4124
-  .byte $3f, $11, $21, 4125
-  .byte $2f, $72, $36, 4126
-  .byte $4b, $55, $34, 4127
-  .byte $4b, $43, $34, GEN_BOOK_CHAIN_END
-  .byte $d7, $05, $16, 4129
-  .byte $d7, $13, $23, 4130
-  .byte $d7, $12, $22, 4131
-  .byte $83, $13, $33, 4132
-  .byte $83, $14, $34, 4133
-  .byte $83, $14, $24, 4134
+  .byte $2b, $01, $22, 6
+  .byte $2b, $12, $22, 5
+  .byte $2b, $05, $32, 4
+  .byte $3f, $04, $07, 3
+  .byte $3f, $12, $32, 2
+  .byte $3f, $11, $21, 1
+  .byte $2f, $72, $36, GEN_BOOK_CHAIN_END
+  .byte $d7, $05, $16, 6
+  .byte $d7, $13, $23, 5
+  .byte $d7, $12, $22, 4
+  .byte $83, $13, $33, 3
+  .byte $83, $14, $34, 2
+  .byte $83, $14, $24, 1
   .byte $77, $34, $43, GEN_BOOK_CHAIN_END
-  .byte $27, $11, $21, 4136
-  .byte $27, $12, $32, 4137
+  .byte $27, $11, $21, 2
+  .byte $27, $12, $32, 1
   .byte $cf, $05, $16, GEN_BOOK_CHAIN_END
-  .byte $33, $64, $54, 4139
-  .byte $33, $71, $63, 4140
-  .byte $d7, $73, $43, 4141
+  .byte $33, $64, $54, 3
+  .byte $33, $71, $63, 2
+  .byte $d7, $73, $43, 1
   .byte $af, $44, $25, GEN_BOOK_CHAIN_END
-  .byte $d3, $66, $56, 4143
-  .byte $d3, $76, $55, 4144
-  .byte $d3, $64, $54, 4145
-  .byte $db, $75, $66, 4146
-  .byte $db, $43, $33, 4147
+  .byte $d3, $66, $56, 5
+  .byte $d3, $76, $55, 4
+  .byte $d3, $64, $54, 3
+  .byte $db, $75, $66, 2
+  .byte $db, $43, $33, 1
   .byte $db, $71, $52, GEN_BOOK_CHAIN_END
-  .byte $1f, $63, $43, 4149
-  .byte $8f, $75, $66, 4150
-  .byte $4b, $34, $43, 4151
+  .byte $1f, $63, $43, 3
+  .byte $8f, $75, $66, 2
+  .byte $4b, $34, $43, 1
   .byte $57, $75, $66, GEN_BOOK_CHAIN_END
-  .byte $4b, $06, $25, 4153
-  .byte $4b, $16, $26, 4154
-  .byte $4b, $14, $34, 4155
-  .byte $67, $63, $43, 4156
+  .byte $4b, $06, $25, 4
+  .byte $4b, $16, $26, 3
+  .byte $4b, $14, $34, 2
+  .byte $67, $63, $43, 1
   .byte $eb, $02, $13, GEN_BOOK_CHAIN_END
-  .byte $d7, $76, $55, 4158
-  .byte $d7, $71, $52, 4159
-  .byte $d7, $64, $54, 4160
-  .byte $23, $64, $44, 4161
-  .byte $23, $66, $56, 4162
-  .byte $23, $63, $43, 4163
+  .byte $d7, $76, $55, 6
+  .byte $d7, $71, $52, 5
+  .byte $d7, $64, $54, 4
+  .byte $23, $64, $44, 3
+  .byte $23, $66, $56, 2
+  .byte $23, $63, $43, 1
   .byte $17, $71, $63, GEN_BOOK_CHAIN_END
-  .byte $b3, $13, $33, 4165
-  .byte $8b, $76, $55, 4166
-  .byte $8b, $62, $52, 4167
+  .byte $b3, $13, $33, 3
+  .byte $8b, $76, $55, 2
+  .byte $8b, $62, $52, 1
   .byte $b7, $55, $43, GEN_BOOK_CHAIN_END
-  .byte $e7, $63, $43, 4169
-  .byte $e7, $76, $55, 4170
-  .byte $e7, $66, $56, 4171
-  .byte $07, $05, $14, 4172
-  .byte $07, $13, $23, 4173
-  .byte $4f, $62, $42, 4174
-  .byte $4f, $74, $77, 4175
+  .byte $e7, $63, $43, 7
+  .byte $e7, $76, $55, 6
+  .byte $e7, $66, $56, 5
+  .byte $07, $05, $14, 4
+  .byte $07, $13, $23, 3
+  .byte $4f, $62, $42, 2
+  .byte $4f, $74, $77, 1
   .byte $33, $74, $77, GEN_BOOK_CHAIN_END
-  .byte $df, $43, $33, 4177
-  .byte $7b, $75, $66, 4178
-  .byte $57, $55, $43, 4179
+  .byte $df, $43, $33, 3
+  .byte $7b, $75, $66, 2
+  .byte $57, $55, $43, 1
   .byte $c7, $72, $54, GEN_BOOK_CHAIN_END
-  .byte $4b, $14, $24, 4181
-  .byte $4b, $02, $11, 4182
-  .byte $47, $73, $62, 4183
+  .byte $4b, $14, $24, 3
+  .byte $4b, $02, $11, 2
+  .byte $47, $73, $62, 1
   .byte $a7, $76, $55, GEN_BOOK_CHAIN_END
-  .byte $27, $64, $44, 4185
-  .byte $27, $76, $55, 4186
-  .byte $27, $71, $63, 4187
-  .byte $c7, $04, $07, 4188
-  .byte $c7, $13, $23, 4189
+  .byte $27, $64, $44, 5
+  .byte $27, $76, $55, 4
+  .byte $27, $71, $63, 3
+  .byte $c7, $04, $07, 2
+  .byte $c7, $13, $23, 1
   .byte $c7, $12, $32, GEN_BOOK_CHAIN_END
-  .byte $67, $01, $22, 4191
-  .byte $67, $13, $23, 4192
-  .byte $f7, $36, $45, 4193
-  .byte $f7, $36, $47, 4194
-  .byte $f7, $67, $47, 4195
-  .byte $07, $75, $66, 4196
-  .byte $c3, $43, $33, 4197
-  .byte $c3, $64, $54, 4198
-  .byte $c3, $71, $52, 4199
+  .byte $67, $01, $22, 9
+  .byte $67, $13, $23, 8
+  .byte $f7, $36, $45, 7
+  .byte $f7, $36, $47, 6
+  .byte $f7, $67, $47, 5
+  .byte $07, $75, $66, 4
+  .byte $c3, $43, $33, 3
+  .byte $c3, $64, $54, 2
+  .byte $c3, $71, $52, 1
   .byte $6f, $63, $53, GEN_BOOK_CHAIN_END
 
 GeneratedBookEnd:
@@ -11,23 +11,50 @@
 //     .byte Version    (format version)
 //     .word EntryCount (number of positions)
 //     .word TableSize  (hash table slots, power of 2)
-//     .byte Flags      (reserved)
+//     .byte Flags      (bit 0: packed entries, version 4; bit 1: Check byte)
 //   Hash Table (TableSize * 2 bytes):
 //     Each slot is a .word offset to first entry, or $FFFF if empty
-//   Entries (EntryCount * 4 bytes each):
+//   Entries (EntryCount * 4 bytes each, 5 with the Check byte):
 //     .byte HashHi     (upper 8 bits of position hash for verification)
 //     .byte From       (0x88 square)
 //     .byte To         (0x88 square)
-//     .byte Next       (index of next entry in chain, or $FF if end)
+//     .byte Check      (Flags bit 1 only: Board88[From] & $87 | (Board88[To] & $07) << 3)
+//     .byte Next       (entries remaining in this bucket, $00 if end)
+//
+// Version 2: a bucket's entries are contiguous, so Next counts the entries
+// that follow instead of holding an 8-bit entry index (which could not
+// address more than 255 entries).
+//
+// Version 3: adds the optional Check byte (Flags bit 1). The 16-bit hash
+// cannot tell apart every position, so with it an entry is only used if the
+// board agrees with the moving piece (colour and type) and the piece type on
+// the To square. A position that merely shares a hash with a book position
+// then rarely gets a move that is illegal or nonsensical in it. The probe
+// steps 5 bytes per entry instead of 4; the embedded book leaves the byte out
+// to stay below the piece-square tables.
+//
+// Version 4 (Flags bit 0 set): packed 3-byte entries. The table has
+// TableSize + 1 slots holding entry indices, and bucket b is the entries from
+// slot b up to slot b+1, so there is no Next byte and no $FFFF. An entry is
+//     .byte HashHi
+//     .byte From       (0-63) | mover colour << 7 | mover type bit 2 << 6
+//     .byte To         (0-63) | mover type bits 1-0 << 6
+// A 0-63 square becomes 0x88 as sq + (sq & $38). Only the mover part of the
+// Check byte is kept; tools/book_probe.py holds the encoder and decoder.
 
 *=* "Opening Book"
 
 // Book format constants
 .const BOOK_MAGIC       = $B00C
-.const BOOK_VERSION     = $01
+.const BOOK_VERSION     = $03
+.const BOOK_VERSION_PACKED = $04
+.const BOOK_FLAG_PACKED = $01
+.const BOOK_FLAG_CHECK  = $02
 .const BOOK_ENTRY_SIZE  = 4
+.const BOOK_CHECK_ENTRY_SIZE = 5
+.const BOOK_PACKED_ENTRY_SIZE = 3
 .const BOOK_NO_ENTRY    = $FFFF
-.const BOOK_CHAIN_END   = $FF
+.const BOOK_CHAIN_END   = $00
 
 // Header offsets
 .const BOOK_HDR_MAGIC       = 0
@@ -59,6 +86,7 @@ MatchBuffer:
 // Search the opening book for the current position
 // Now supports multiple moves per position with random selection
 // Input: ZobristHash contains current position hash (2 bytes)
+//        Board88 holds the current position (for the Check byte)
 // Output: Carry set = move found
 //           A = from square (0x88)
 //           Y = to square (0x88)
@@ -101,6 +129,33 @@ LookupOpeningMove:
   jmp !not_found+
 !magic_ok:
 
+  // Flags bit 1: unpacked entries carry a Check byte
+  ldx #BOOK_ENTRY_SIZE
+  ldy #BOOK_HDR_FLAGS
+  lda (temp1), y
+  and #BOOK_FLAG_CHECK
+  sta BookHasCheck
+  beq !entry_size_ok+
+  inx                     // X = BOOK_CHECK_ENTRY_SIZE
+!entry_size_ok:
+  stx BookEntrySize
+
+  // Accept version 3, or version 4 with packed entries
+  ldx #$00                // Not packed
+  ldy #BOOK_HDR_VERSION
+  lda (temp1), y
+  cmp #BOOK_VERSION
+  beq !version_ok+
+  cmp #BOOK_VERSION_PACKED
+  bne !bad_magic-
+  ldy #BOOK_HDR_FLAGS
+  lda (temp1), y
+  and #BOOK_FLAG_PACKED
+  beq !bad_magic-
+  tax                     // X = BOOK_FLAG_PACKED
+!version_ok:
+  stx BookPacked
+
   // Get table size into temp2 (for masking)
   ldy #BOOK_HDR_TABLE_SIZE
   lda (temp1), y
@@ -139,13 +194,13 @@ LookupOpeningMove:
   sta HashTablePtr + 1
 
   // Add BookIndex * 2
+  asl BookIndex     // * 2 (16-bit)
+  rol BookIndex + 1
   lda BookIndex
-  asl               // * 2
   clc
   adc HashTablePtr
   sta HashTablePtr
   lda BookIndex + 1
-  rol               // Carry from asl
   adc HashTablePtr + 1
   sta HashTablePtr + 1
 
@@ -157,6 +212,25 @@ LookupOpeningMove:
   lda (HashTablePtr), y
   sta EntryOffset + 1
 
+  lda BookPacked
+  beq !check_empty_slot+
+
+  // Packed: the next slot is where this bucket ends, empty if equal
+  iny
+  lda (HashTablePtr), y
+  sta EntryEnd
+  iny
+  lda (HashTablePtr), y
+  sta EntryEnd + 1
+  lda EntryEnd
+  cmp EntryOffset
+  bne !slot_valid+
+  lda EntryEnd + 1
+  cmp EntryOffset + 1
+  bne !slot_valid+
+  jmp !not_found+
+
+!check_empty_slot:
   // Check if slot is empty ($FFFF)
   lda EntryOffset
   and EntryOffset + 1
@@ -176,38 +250,80 @@ LookupOpeningMove:
   sta EntriesBase + 1
 
   // Add TableSize * 2
-  lda temp2         // TableSize low
-  asl
+  asl temp2         // TableSize * 2 (16-bit)
+  rol temp2 + 1
+  lda temp2
   clc
   adc EntriesBase
   sta EntriesBase
-  lda temp2 + 1     // TableSize high
-  rol
+  lda temp2 + 1
   adc EntriesBase + 1
   sta EntriesBase + 1
 
-  // Walk the ENTIRE chain collecting ALL matches (up to MAX_BOOK_MATCHES)
-!check_entry:
-  // Calculate entry address: EntriesBase + (EntryOffset * 4)
+  lda BookPacked
+  beq !unpacked_entries+
+  jmp !packed_entries+
+!unpacked_entries:
+
+  // Calculate first entry address: EntriesBase + (EntryOffset * BookEntrySize)
+  lda EntryOffset   // Keep EntryOffset * 1 in EntryPtr
+  sta EntryPtr
+  lda EntryOffset + 1
+  sta EntryPtr + 1
+  asl EntryOffset   // * 4 (16-bit)
+  rol EntryOffset + 1
+  asl EntryOffset
+  rol EntryOffset + 1
+  lda BookHasCheck
+  beq !entry_offset_ok+
+  lda EntryOffset   // + * 1 = * 5
+  clc
+  adc EntryPtr
+  sta EntryOffset
+  lda EntryOffset + 1
+  adc EntryPtr + 1
+  sta EntryOffset + 1
+!entry_offset_ok:
   lda EntryOffset
-  asl
-  asl               // * 4
   clc
   adc EntriesBase
   sta EntryPtr
   lda EntryOffset + 1
-  rol
-  rol               // Carry through
   adc EntriesBase + 1
   sta EntryPtr + 1
 
+  // Walk the ENTIRE chain collecting ALL matches (up to MAX_BOOK_MATCHES)
+!check_entry:
   // Compare HashHi byte (upper 8 bits of Zobrist)
   ldy #$00
   lda (EntryPtr), y
   cmp ZobristHash + 1
   bne !next_in_chain+
 
+  // HashHi matches: build the Check byte from the board and compare
+  lda BookHasCheck
+  beq !store_match+       // No Check bytes: the hash decides
+  ldy #$01
+  lda (EntryPtr), y       // From square
+  tax
+  lda Board88, x
+  and #(WHITE_COLOR | $07) // Mover colour and type
+  sta BookCheck
+  iny
+  lda (EntryPtr), y       // To square
+  tax
+  lda Board88, x
+  and #$07                // Type on the To square (0 = empty)
+  asl
+  asl
+  asl
+  ora BookCheck
+  iny
+  cmp (EntryPtr), y
+  bne !next_in_chain+     // Different position with the same hash
+
   // Match found! Store it if we have room
+!store_match:
   lda MatchCount
   cmp #MAX_BOOK_MATCHES
   bcs !next_in_chain+     // Skip if buffer full
@@ -231,19 +347,156 @@ LookupOpeningMove:
   inc MatchCount
 
 !next_in_chain:
-  // Get next entry in chain
-  ldy #$03          // Next byte offset
+  // Next = entries remaining in this bucket (the entry's last byte)
+  ldy BookEntrySize
+  dey
   lda (EntryPtr), y
-  cmp #BOOK_CHAIN_END
-  bne !follow_chain+
+  bne !follow_chain+      // BOOK_CHAIN_END ($00)?
   jmp !select_move+       // End of chain, select from matches
 
 !follow_chain:
-  // Update EntryOffset to next entry
+  // Bucket entries are contiguous: step to the next one
+  lda EntryPtr
+  clc
+  adc BookEntrySize
+  sta EntryPtr
+  bcc !check_entry-
+  inc EntryPtr + 1
+  jmp !check_entry-
+
+!packed_entries:
+  // The end slot moves the entries up by 2 bytes
+  lda EntriesBase
+  clc
+  adc #$02
+  sta EntriesBase
+  bcc !packed_base_ok+
+  inc EntriesBase + 1
+!packed_base_ok:
+
+  // EntryPtr = EntriesBase + EntryOffset * 3
+  lda EntryOffset
+  asl
+  sta EntryPtr
+  lda EntryOffset + 1
+  rol
+  sta EntryPtr + 1
+  lda EntryPtr
+  clc
+  adc EntryOffset
+  sta EntryPtr
+  lda EntryPtr + 1
+  adc EntryOffset + 1
+  sta EntryPtr + 1
+  lda EntryPtr
+  clc
+  adc EntriesBase
+  sta EntryPtr
+  lda EntryPtr + 1
+  adc EntriesBase + 1
+  sta EntryPtr + 1
+
+  // EntryEnd = EntriesBase + EntryEnd * 3 (EntryOffset is free now)
+  lda EntryEnd
+  asl
   sta EntryOffset
-  lda #$00
+  lda EntryEnd + 1
+  rol
   sta EntryOffset + 1
-  jmp !check_entry-
+  lda EntryOffset
+  clc
+  adc EntryEnd
+  sta EntryOffset
+  lda EntryOffset + 1
+  adc EntryEnd + 1
+  sta EntryOffset + 1
+  lda EntryOffset
+  clc
+  adc EntriesBase
+  sta EntryEnd
+  lda EntryOffset + 1
+  adc EntriesBase + 1
+  sta EntryEnd + 1
+
+!packed_entry:
+  ldy #$00
+  lda (EntryPtr), y
+  cmp ZobristHash + 1
+  bne !packed_next+
+
+  // HashHi matches: unpack From and To to 0x88
+  iny
+  lda (EntryPtr), y
+  and #$3F
+  sta BookFrom
+  and #$38                // 0x88 = sq + (sq & $38)
+  clc
+  adc BookFrom
+  sta BookFrom
+  iny
+  lda (EntryPtr), y
+  and #$3F
+  sta BookTo
+  and #$38
+  clc
+  adc BookTo
+  sta BookTo
+
+  // Rebuild the stored mover colour and type and compare with the board
+  lda (EntryPtr), y
+  asl                     // Type bits 1-0 from bits 7-6
+  rol
+  rol
+  and #$03
+  sta BookCheck
+  dey
+  lda (EntryPtr), y
+  and #$40                // Type bit 2 from bit 6
+  lsr
+  lsr
+  lsr
+  lsr
+  ora BookCheck
+  sta BookCheck
+  lda (EntryPtr), y
+  and #WHITE_COLOR        // Colour from bit 7
+  ora BookCheck
+  sta BookCheck
+  ldx BookFrom
+  lda Board88, x
+  and #(WHITE_COLOR | $07)
+  cmp BookCheck
+  bne !packed_next+       // Different position with the same hash
+
+  // Match found! Store it if we have room
+  lda MatchCount
+  cmp #MAX_BOOK_MATCHES
+  bcs !packed_next+
+  asl
+  tax
+  lda BookFrom
+  sta MatchBuffer, x
+  lda BookTo
+  sta MatchBuffer + 1, x
+  inc MatchCount
+
+!packed_next:
+  lda EntryPtr
+  clc
+  adc #BOOK_PACKED_ENTRY_SIZE
+  sta EntryPtr
+  bcc !packed_end_check+
+  inc EntryPtr + 1
+!packed_end_check:
+  lda EntryPtr
+  cmp EntryEnd
+  bne !packed_more+
+  lda EntryPtr + 1
+  cmp EntryEnd + 1
+  bne !packed_more+
+  jmp !select_move+
+!packed_more:
+  jmp !packed_entry-
 
 !select_move:
   // Check if we found any matches
@@ -370,6 +623,13 @@ HashTablePtr:   .word $0000
 EntryOffset:    .word $0000
 EntriesBase:    .word $0000
 EntryPtr:       .word $0000
+EntryEnd:       .word $0000
+BookCheck:      .byte $00
+BookPacked:     .byte $00
+BookHasCheck:   .byte $00
+BookEntrySize:  .byte $00
+BookFrom:       .byte $00
+BookTo:         .byte $00
 
 //
 // Import the generated opening book
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Book Pipeline Benchmark on Synthetic Polyglot Books
+
+Times read_polyglot_book(), build_book(), resolve_collisions() and
+write_asm_book() on Polyglot books of controlled size, and compares the
+results with a stored baseline.
+
+Synthetic books come from random legal games. Move choice is skewed towards
+the first moves python-chess generates, so the first plies form a shared
+opening tree (as in a real book) and later plies fan out. Games are played
+in chunks on a process pool (the chunk seeds depend only on --seed, so the
+book is the same for any --jobs). Each chunk is written as a key-sorted run
+and the runs are merged into the final book by book_merge.py with counts
+summed, so memory stays bounded at 10M entries. Books are kept in tools/.book_cache and only
+generated once per size and seed.
+
+Every case runs in a fresh process, so its peak RSS is its own. With
+--repeat N the fastest wall time per phase is kept.
+
+  book_bench.py                                   10K, 100K and 1M entries
+  book_bench.py --sizes 10k,10m --jobs 8          other sizes
+  book_bench.py --output bench.json               write the results
+  book_bench.py --baseline bench.json             compare; exit 1 on a regression
+  book_bench.py --save-baseline bench.json        store the results as a baseline
+
+The results JSON:
+
+  {"version": 1, "python": ..., "platform": ..., "params": {...},
+   "cases": [{"size", "entries", "positions", "file_bytes", "peak_rss_kb",
+              "phases": {name: {"wall", "cpu"}},
+              "throughput": {"read_entries_per_sec", "build_nodes_per_sec",
+                             "write_entries_per_sec"},
+              "counters": {...}}]}
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import chess
+import chess.polyglot
+
+from book_cache import DEFAULT_CACHE_DIR
+from book_merge import BookSource, merge_books
+from book_metrics import RunMetrics
+from c64_zobrist import ZobristTables
+from generate_book import build_book, read_polyglot_book, resolve_collisions, write_asm_book
+from pgn_book import POLYGLOT_ENTRY, POLYGLOT_MAX_WEIGHT, polyglot_move
+
+
+BENCH_VERSION = 1
+
+# Bump when synthetic games change, so cached books are regenerated
+SYNTHETIC_VERSION = 2
+
+DEFAULT_SIZES = '10k,100k,1m'
+
+# Entries per chunk of games, each written as one sorted run
+SYNTHETIC_CHUNK = 50000
+
+# Longest synthetic game
+SYNTHETIC_MAX_PLY = 80
+
+# Mean index of the chosen move in python-chess move order
+SYNTHETIC_MOVE_SKEW = 2.0
+
+# Default generator parameters: those of `make book`
+BENCH_MAX_PLY = 15
+BENCH_MAX_POSITIONS = 4200
+BENCH_TABLE_SIZE = 1024
+
+# Phase slowdown (fraction) above which --baseline reports a regression, and
+# the absolute difference below which timings count as noise
+REGRESSION_TOLERANCE = 0.10
+NOISE_SECONDS = 0.005
+
+
+# =============================================================================
+# Synthetic Books
+# =============================================================================
+
+def parse_size(text: str) -> int:
+    """'10k', '1M', '250000'."""
+    scale = {'k': 1000, 'm': 1000000}.get(text[-1:].lower(), 1)
+    try:
+        size = int(text[:-1] if scale > 1 else text) * scale
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad size {text!r} (use e.g. 10k, 1m, 250000)")
+    if size < 1:
+        raise argparse.ArgumentTypeError(f"size must be positive: {text!r}")
+    return size
+
+
+def parse_sizes(text: str) -> List[int]:
+    return [parse_size(part.strip()) for part in text.split(',') if part.strip()]
+
+
+def size_name(size: int) -> str:
+    for suffix, scale in (('m', 1000000), ('k', 1000)):
+        if size % scale == 0:
+            return f"{size // scale}{suffix}"
+    return str(size)
+
+
+def synthetic_chunk(seed: int, entries: int) -> List[Tuple[int, int, int]]:
+    """Random games until entries distinct (key, move) pairs are played;
+    returns (key, move, count) sorted by key and move."""
+    rng = random.Random(seed)
+    counts: Dict[Tuple[int, int], int] = {}
+    while len(counts) < entries:
+        board = chess.Board()
+        for _ in range(SYNTHETIC_MAX_PLY):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            move = moves[min(int(rng.expovariate(1 / SYNTHETIC_MOVE_SKEW)), len(moves) - 1)]
+            pair = (chess.polyglot.zobrist_hash(board), polyglot_move(board, move))
+            counts[pair] = counts.get(pair, 0) + 1
+            if len(counts) >= entries:
+                break
+            board.push(move)
+    return sorted((key, move, count) for (key, move), count in counts.items())
+
+
+def _synthetic_chunk_task(task: Tuple[int, int]) -> List[Tuple[int, int, int]]:
+    return synthetic_chunk(*task)
+
+
+def synthetic_book(size: int, seed: int, directory: str, jobs: int = 1) -> str:
+    """The synthetic book of about size entries for seed, generated unless
+    it is already in directory. Chunks that played the same opening pairs
+    are merged, so a book has slightly fewer entries than size."""
+    filename = os.path.join(directory, f"synthetic-v{SYNTHETIC_VERSION}-{size_name(size)}-{seed}.bin")
+    if os.path.exists(filename):
+        return filename
+    os.makedirs(directory, exist_ok=True)
+
+    tasks = [(seed * 1000003 + i, min(SYNTHETIC_CHUNK, size - start))
+             for i, start in enumerate(range(0, size, SYNTHETIC_CHUNK))]
+    print(f"  Generating {filename} ({len(tasks)} chunk(s), {jobs} job(s))...")
+    with tempfile.TemporaryDirectory(dir=directory) as temp:
+        runs = []
+
+        def write_run(records: List[Tuple[int, int, int]]):
+            run = os.path.join(temp, f"run-{len(runs)}.bin")
+            with open(run, 'wb') as f:
+                for key, move, count in records:
+                    f.write(POLYGLOT_ENTRY.pack(key, move, min(count, POLYGLOT_MAX_WEIGHT), 0))
+            runs.append(run)
+            if len(runs) % 10 == 0:
+                print(f"    {len(runs)} of {len(tasks)} chunks...")
+
+        if jobs > 1 and len(tasks) > 1:
+            with multiprocessing.Pool(jobs) as pool:
+                for records in pool.imap(_synthetic_chunk_task, tasks):
+                    write_run(records)
+        else:
+            for task in tasks:
+                write_run(synthetic_chunk(*task))
+
+        partial = filename + '.tmp'
+        entries = merge_books([BookSource(run) for run in runs], partial).entries
+        os.replace(partial, filename)
+    print(f"    {entries} entries")
+    return filename
+
+
+# =============================================================================
+# Cases
+# =============================================================================
+
+def run_case(book_file: str, max_ply: int, max_positions: int, table_size: int) -> Dict[str, Any]:
+    """One pass of the pipeline over book_file; run in a fresh process."""
+    metrics = RunMetrics('book_bench')
+    tables = ZobristTables()
+    with tempfile.TemporaryDirectory() as temp, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        with metrics.phase('read'):
+            poly_book = read_polyglot_book(book_file)
+            positions = poly_book.count_positions()
+        with metrics.phase('build'):
+            entries = build_book(poly_book, tables, max_ply, max_positions, metrics=metrics)
+        poly_book_entries = len(poly_book)
+        poly_book.close()
+        with metrics.phase('collisions'):
+            entries = resolve_collisions(entries, table_size)
+        with metrics.phase('write'):
+            write_asm_book(entries, os.path.join(temp, 'book.asm'), table_size)
+    metrics.counters.update(input_entries=poly_book_entries, input_positions=positions,
+                            entries=len(entries))
+    return metrics.to_dict()
+
+
+def measure(book_file: str, size: int, args) -> Dict[str, Any]:
+    """Best of args.repeat runs of one case, each in a fresh process."""
+    context = multiprocessing.get_context('spawn')
+    runs = []
+    for _ in range(args.repeat):
+        with context.Pool(1) as pool:
+            runs.append(pool.apply(run_case, (book_file, args.max_ply, args.max_positions, args.table_size)))
+
+    phases = {name: {'wall': min(run['phases'][name]['wall'] for run in runs),
+                     'cpu': min(run['phases'][name]['cpu'] for run in runs)}
+              for name in ('read', 'build', 'collisions', 'write')}
+    counters = runs[0]['counters']
+
+    def per_sec(count: int, phase: str) -> Optional[float]:
+        wall = phases[phase]['wall']
+        return round(count / wall, 1) if wall > 0 else None
+
+    return {
+        'size': size,
+        'entries': counters['input_entries'],
+        'positions': counters['input_positions'],
+        'file_bytes': os.path.getsize(book_file),
+        'peak_rss_kb': max(run['peak_rss_kb'] or 0 for run in runs) or None,
+        'phases': phases,
+        'throughput': {
+            'read_entries_per_sec': per_sec(counters['input_entries'], 'read'),
+            'build_nodes_per_sec': per_sec(counters['nodes_expanded'], 'build'),
+            'write_entries_per_sec': per_sec(counters['entries'], 'write'),
+        },
+        'counters': {name: counters[name] for name in
+                     ('bfs_entries', 'book_positions', 'nodes_expanded', 'transpositions',
+                      'frontier_peak', 'entries')},
+    }
+
+
+def print_case(case: Dict[str, Any]) -> None:
+    phases = case['phases']
+    rate = case['throughput']
+    print(f"  {size_name(case['size']):>5s}: {case['entries']} entries, {case['positions']} positions, "
+          f"peak RSS {case['peak_rss_kb'] or '?'} KB")
+    print(f"         read {phases['read']['wall']:8.3f}s ({rate['read_entries_per_sec'] or 0:.0f} entries/s)  "
+          f"build {phases['build']['wall']:8.3f}s ({rate['build_nodes_per_sec'] or 0:.0f} nodes/s)  "
+          f"collisions {phases['collisions']['wall']:6.3f}s  "
+          f"write {phases['write']['wall']:6.3f}s ({rate['write_entries_per_sec'] or 0:.0f} entries/s)")
+
+
+# =============================================================================
+# Baseline
+# =============================================================================
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print each phase against the baseline case of the same size; returns
+    the regressions (phases slower by more than tolerance and noise)."""
+    if baseline.get('params') != results['params']:
+        print(f"  Note: baseline parameters differ: {baseline.get('params')}")
+    base_cases = {case['size']: case for case in baseline.get('cases', [])}
+    regressions = []
+    print(f"Compared with the baseline (tolerance {tolerance:.0%}):")
+    for case in results['cases']:
+        base = base_cases.get(case['size'])
+        if base is None:
+            print(f"  {size_name(case['size']):>5s}: not in the baseline")
+            continue
+        cells = []
+        for name, phase in case['phases'].items():
+            old = base['phases'].get(name, {}).get('wall')
+            if not old:
+                continue
+            new = phase['wall']
+            cells.append(f"{name} {new / old:5.2f}x")
+            if new > old * (1 + tolerance) and new - old > NOISE_SECONDS:
+                regressions.append(f"{size_name(case['size'])} {name}: {old:.3f}s -> {new:.3f}s")
+        old_rss, new_rss = base.get('peak_rss_kb'), case['peak_rss_kb']
+        if old_rss and new_rss:
+            cells.append(f"RSS {new_rss / old_rss:5.2f}x")
+            if new_rss > old_rss * (1 + tolerance):
+                regressions.append(f"{size_name(case['size'])} peak RSS: {old_rss} KB -> {new_rss} KB")
+        print(f"  {size_name(case['size']):>5s}: " + '  '.join(cells))
+    return regressions
+
+
+def write_json(results: Dict[str, Any], filename: str) -> None:
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+    print(f"Wrote {filename}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the book pipeline on synthetic Polyglot books')
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes(DEFAULT_SIZES),
+                        help=f'Comma-separated book sizes in entries (default {DEFAULT_SIZES}; '
+                             f'10m takes minutes to generate once)')
+    parser.add_argument('--seed', type=int, default=1, help='Synthetic game seed (default 1)')
+    parser.add_argument('--books', metavar='DIR', default=DEFAULT_CACHE_DIR,
+                        help='Where synthetic books are kept (default: tools/.book_cache)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for generating synthetic books')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Runs per size; the fastest time per phase is kept')
+    parser.add_argument('--max-ply', type=int, default=BENCH_MAX_PLY)
+    parser.add_argument('--max-positions', type=int, default=BENCH_MAX_POSITIONS)
+    parser.add_argument('--table-size', type=int, default=BENCH_TABLE_SIZE)
+    parser.add_argument('--output', metavar='JSON', help='Write the results here')
+    parser.add_argument('--baseline', metavar='JSON',
+                        help='Compare with these results; exit 1 if a phase regressed')
+    parser.add_argument('--save-baseline', metavar='JSON', help='Write the results as a new baseline')
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help=f'Slowdown counted as a regression (default {REGRESSION_TOLERANCE})')
+    args = parser.parse_args()
+    if args.table_size < 1 or args.table_size & (args.table_size - 1):
+        parser.error("--table-size must be a power of 2")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    # Read first: --output may name the same file
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {
+        'version': BENCH_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'seed': args.seed, 'synthetic_version': SYNTHETIC_VERSION, 'max_ply': args.max_ply,
+                   'max_positions': args.max_positions, 'table_size': args.table_size},
+        'cases': [],
+    }
+    print(f"Synthetic books (seed {args.seed}):")
+    books = [(size, synthetic_book(size, args.seed, args.books, args.jobs)) for size in args.sizes]
+
+    print(f"Benchmark (max_ply={args.max_ply}, max_positions={args.max_positions}, "
+          f"table_size={args.table_size}, best of {args.repeat}):")
+    for size, book_file in books:
+        case = measure(book_file, size, args)
+        print_case(case)
+        results['cases'].append(case)
+
+    if args.output:
+        write_json(results, args.output)
+    if args.save_baseline:
+        write_json(results, args.save_baseline)
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            for regression in regressions:
+                print(f"  Regression: {regression}")
+            sys.exit(1)
+        print("  No regressions")
+
+
+if __name__ == '__main__':
+    main()
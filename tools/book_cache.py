@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Cache for the Book Generators
+
+generate_book.py and create_book_from_openings.py keep two kinds of records
+here, both pickled under a key that is the SHA-1 of what they depend on:
+
+  result  The final book entries of one run, keyed by the input digest, the
+          generator parameters, the Zobrist table fingerprint and the source
+          of the modules involved. An unchanged run skips straight to
+          writing the output.
+  graph   The expanded position/move graph one generator has built so far,
+          keyed by the Zobrist fingerprint and generator source only. Each
+          node remembers what it was expanded from (the Polyglot moves of the
+          position, or the SAN of a line prefix), so a run with a changed
+          input reuses every node that still matches and only expands the
+          new or changed ones.
+
+Records are written through a temporary file and os.replace(), so an
+interrupted run never leaves a truncated record behind. A record that fails
+to load is treated as missing.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Iterable, Optional
+
+from c64_zobrist import ZobristTables
+
+
+# Bump when the layout of any record changes
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.book_cache')
+
+_TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# =============================================================================
+# Keys
+# =============================================================================
+
+def file_digest(filename: str) -> str:
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_digest(modules: Iterable[str]) -> str:
+    """Digest of tool modules (names without .py), so code changes invalidate."""
+    digest = hashlib.sha1()
+    for module in modules:
+        with open(os.path.join(_TOOLS_DIR, module + '.py'), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def zobrist_fingerprint(tables: ZobristTables) -> str:
+    return hashlib.sha1(tables.block.tobytes()).hexdigest()
+
+
+def cache_key(*parts: Any) -> str:
+    """SHA-1 of JSON-serializable parts (dict keys are sorted)."""
+    text = json.dumps([CACHE_VERSION, *parts], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class BookCache:
+    """Records in one directory; a cache without a directory stores nothing."""
+
+    def __init__(self, directory: Optional[str] = DEFAULT_CACHE_DIR):
+        self.directory = directory
+
+    def path(self, kind: str, key: str) -> str:
+        return os.path.join(self.directory, f"{kind}-{key}.pickle")
+
+    def load(self, kind: str, key: str) -> Optional[Any]:
+        if not self.directory:
+            return None
+        try:
+            with open(self.path(kind, key), 'rb') as f:
+                version, record = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+            return None
+        return record if version == CACHE_VERSION else None
+
+    def save(self, kind: str, key: str, record: Any) -> None:
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        filename = self.path(kind, key)
+        temp = filename + '.tmp'
+        with open(temp, 'wb') as f:
+            pickle.dump((CACHE_VERSION, record), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, filename)
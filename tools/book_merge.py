@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Streaming Merge of Polyglot Books
+
+Merges key-sorted Polyglot books into one, each book's weights scaled by a
+multiplier. The books are read in blocks and merged with heapq.merge() on
+the key, so only the moves of the current position are held in memory: a
+merge runs at disk speed in constant memory whatever the size of the books.
+
+Weights of the same (key, move) pair are summed or, with mode 'max', the
+largest is kept. Per position, the merged weights are scaled down to fit
+16 bits if needed and written highest first; moves of equal weight keep
+the order they were first seen in, books in command line order.
+
+  book_merge.py gm2600.bin Elo2400.bin:0.5 merged.bin [--mode max]
+"""
+
+import argparse
+import heapq
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+from pgn_book import POLYGLOT_ENTRY, POLYGLOT_MAX_WEIGHT
+
+
+MERGE_MODES = ['sum', 'max']
+
+# Entries read at a time from each book
+MERGE_READ_ENTRIES = 4096
+
+
+@dataclass
+class BookSource:
+    filename: str
+    weight: float = 1.0     # Multiplier for the book's weights
+
+
+@dataclass
+class MergeStats:
+    read: int = 0           # Entries in all inputs
+    positions: int = 0
+    entries: int = 0        # Entries written
+
+
+def parse_book_source(text: str) -> BookSource:
+    """'book.bin' or 'book.bin:WEIGHT'."""
+    filename, sep, weight = text.rpartition(':')
+    if sep:
+        try:
+            value = float(weight)
+        except ValueError:
+            # A colon in the path, not a weight
+            return BookSource(text)
+        if value < 0:
+            raise argparse.ArgumentTypeError(f"negative weight in {text!r}")
+        return BookSource(filename, value)
+    return BookSource(text)
+
+
+def iter_book(source: BookSource) -> Iterator[Tuple[int, int, float]]:
+    """(key, move, scaled weight) records of one book in file order; raises
+    ValueError if the keys are not sorted."""
+    last_key = 0
+    index = 0
+    with open(source.filename, 'rb') as f:
+        for block in iter(lambda: f.read(MERGE_READ_ENTRIES * POLYGLOT_ENTRY.size), b''):
+            if len(block) % POLYGLOT_ENTRY.size:
+                raise ValueError(f"{source.filename}: size is not a multiple of "
+                                 f"{POLYGLOT_ENTRY.size} bytes")
+            for key, move, weight, _ in POLYGLOT_ENTRY.iter_unpack(block):
+                if key < last_key:
+                    raise ValueError(f"{source.filename}: not sorted by key at entry {index}")
+                last_key = key
+                index += 1
+                yield key, move, weight * source.weight
+
+
+def merge_records(streams: List[Iterator[Tuple[int, int, float]]], outfile: str,
+                  mode: str = 'sum') -> MergeStats:
+    """Merge key-sorted (key, move, weight) streams into a Polyglot book."""
+    if mode not in MERGE_MODES:
+        raise ValueError(f"Unknown merge mode {mode!r}")
+    combine = max if mode == 'max' else lambda a, b: a + b
+    stats = MergeStats()
+    with open(outfile, 'wb') as f:
+        position: Dict[int, float] = {}
+        last_key = None
+
+        def flush():
+            if not position:
+                return
+            top = max(position.values())
+            scale = min(1.0, POLYGLOT_MAX_WEIGHT / top) if top > 0 else 1.0
+            for move, weight in sorted(position.items(), key=lambda m: -m[1]):
+                scaled = round(weight * scale)
+                f.write(POLYGLOT_ENTRY.pack(last_key, move, max(1, scaled) if weight > 0 else 0, 0))
+                stats.entries += 1
+            stats.positions += 1
+            position.clear()
+
+        for key, move, weight in heapq.merge(*streams, key=lambda record: record[0]):
+            stats.read += 1
+            if key != last_key:
+                flush()
+                last_key = key
+            old = position.get(move)
+            position[move] = weight if old is None else combine(old, weight)
+        flush()
+    return stats
+
+
+def merge_books(sources: List[BookSource], outfile: str, mode: str = 'sum') -> MergeStats:
+    """Merge Polyglot books into outfile (which must not be one of them)."""
+    return merge_records([iter_book(source) for source in sources], outfile, mode)
+
+
+def describe_sources(sources: List[BookSource]) -> str:
+    return ', '.join(s.filename if s.weight == 1 else f"{s.filename} x{s.weight:g}" for s in sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge key-sorted Polyglot books')
+    parser.add_argument('books', nargs='+', type=parse_book_source, metavar='BOOK[:WEIGHT]',
+                        help='Input books, each with an optional weight multiplier')
+    parser.add_argument('output', help='Merged Polyglot book')
+    parser.add_argument('--mode', choices=MERGE_MODES, default='sum',
+                        help='Weights of the same move in several books: sum or max (default sum)')
+    args = parser.parse_args()
+
+    print(f"Merging: {describe_sources(args.books)} ({args.mode})")
+    stats = merge_books(args.books, args.output, args.mode)
+    print(f"  {stats.read} entries read, {stats.entries} written for {stats.positions} positions: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Run Metrics and Profiling for the Book Generators
+
+generate_book.py and create_book_from_openings.py take --metrics FILE and
+--profile [N]. A RunMetrics collects wall and CPU time per phase (phases can
+be entered many times and nest, so "hashing" inside "bfs" is part of both),
+plus counters the generators set: entries, nodes expanded per second,
+frontier peak, transpositions, chain length statistics and so on. Peak RSS
+and the CPU time of finished --jobs workers are read at the end (phase CPU
+times cover this process only).
+
+--profile runs the generator under cProfile and prints the top N functions
+by own time; with --metrics they are written to the JSON file as well.
+
+The JSON is meant to be compared between CI runs:
+
+  {"version": 1, "tool": ..., "argv": [...], "wall": s, "cpu": s,
+   "cpu_children": s, "peak_rss_kb": ..., "phases": {name: {"wall", "cpu", "calls"}},
+   "counters": {...}, "profile": [{"function", "calls", "own", "cumulative"}]}
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:     # Not available on Windows
+    resource = None
+
+
+METRICS_VERSION = 1
+
+# Functions listed by --profile when no count is given
+PROFILE_TOP = 25
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+class RunMetrics:
+    """Phase timings and counters for one generator run."""
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, Any] = {}
+        self.profile: List[Dict[str, Any]] = []
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    def add(self, name: str, wall: float, cpu: float, calls: int = 1) -> None:
+        phase = self.phases.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'calls': 0})
+        phase['wall'] += wall
+        phase['cpu'] += cpu
+        phase['calls'] += calls
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def rate(self, name: str, count_key: str, phase: str) -> None:
+        """Set counters[name] to counters[count_key] per second of phase."""
+        wall = self.phases.get(phase, {}).get('wall', 0.0)
+        if wall > 0 and count_key in self.counters:
+            self.counters[name] = round(self.counters[count_key] / wall, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': METRICS_VERSION,
+            'tool': self.tool,
+            'argv': sys.argv[1:],
+            'wall': round(time.perf_counter() - self._start_wall, 4),
+            'cpu': round(time.process_time() - self._start_cpu, 4),
+            'cpu_children': round(os.times().children_user + os.times().children_system, 4),
+            'peak_rss_kb': peak_rss_kb(),
+            'phases': {name: {'wall': round(p['wall'], 4), 'cpu': round(p['cpu'], 4), 'calls': p['calls']}
+                       for name, p in self.phases.items()},
+            'counters': self.counters,
+            'profile': self.profile,
+        }
+
+    def write(self, filename: str) -> None:
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+        print(f"Metrics: {filename}")
+
+    def print_summary(self) -> None:
+        data = self.to_dict()
+        print(f"Metrics ({data['wall']:.2f}s wall, {data['cpu']:.2f}s CPU, "
+              f"peak RSS {data['peak_rss_kb'] or '?'} KB):")
+        for name, p in data['phases'].items():
+            print(f"  {name:14s} {p['wall']:8.3f}s wall {p['cpu']:8.3f}s CPU {p['calls']:8d} calls")
+
+
+@contextmanager
+def optional_phase(metrics: Optional[RunMetrics], name: str) -> Iterator[None]:
+    """metrics.phase(name), or nothing without metrics."""
+    if metrics is None:
+        yield
+    else:
+        with metrics.phase(name):
+            yield
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set of this process plus its largest finished child."""
+    if resource is None:
+        return None
+    scale = 1024 if sys.platform == 'darwin' else 1     # ru_maxrss is bytes on macOS
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale
+    # Linux carries ru_maxrss across exec(), so a spawned process would report
+    # its parent's peak; VmHWM starts afresh
+    try:
+        with open('/proc/self/status') as f:
+            own = next(int(line.split()[1]) for line in f if line.startswith('VmHWM:'))
+    except (OSError, StopIteration, ValueError):
+        pass
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale
+    return own + children
+
+
+def chain_stats(hashes: Iterable[int], table_size: int) -> Dict[str, Any]:
+    """Bucket chain lengths for entries with these hashes in a table of table_size."""
+    lengths = Counter(h & (table_size - 1) for h in hashes)
+    used = len(lengths)
+    total = sum(lengths.values())
+    histogram = Counter(lengths.values())
+    histogram[0] = table_size - used
+    return {
+        'table_size': table_size,
+        'buckets_used': used,
+        'max_chain': max(lengths.values(), default=0),
+        'mean_chain': round(total / used, 3) if used else 0.0,
+        # Entries visited by a hit, averaged over entries: (n+1)/2 per chain of n
+        'mean_hit_visits': round(sum(n * (n + 1) / 2 for n in lengths.values()) / total, 3) if total else 0.0,
+        'histogram': {str(n): histogram[n] for n in sorted(histogram)},
+    }
+
+
+# =============================================================================
+# Profiling
+# =============================================================================
+
+@contextmanager
+def profiled(top: Optional[int], metrics: Optional[RunMetrics] = None) -> Iterator[None]:
+    """Run the block under cProfile if top is set and print the top functions
+    by own time; metrics.profile receives them too."""
+    if not top:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        rows = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:top]
+        print(f"Profile (top {top} by own time):")
+        print("      calls     own s   cumul s  function")
+        for (filename, line, function), (_, calls, own, cumulative, _) in rows:
+            name = f"{filename.rsplit('/', 1)[-1]}:{line}({function})"
+            print(f"  {calls:9d} {own:9.3f} {cumulative:9.3f}  {name}")
+            if metrics is not None:
+                metrics.profile.append({'function': name, 'calls': calls,
+                                        'own': round(own, 4), 'cumulative': round(cumulative, 4)})
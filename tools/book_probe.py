@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+"""
+Opening Book Probe Reference for C64 Chess
+
+Loads a generated opening book (KickAssembler source, raw binary or PRG) and
+probes it exactly like LookupOpeningMove in opening_moves.asm: bucket = hash
+masked by the table size, HashHi compare, Check byte compare against the
+board (books with Flags bit 1), contiguous chain walk and at most
+MAX_BOOK_MATCHES collected moves.
+
+Books in format version 4 (Flags bit 0) pack each entry into 3 bytes and
+keep bucket boundaries in the table instead of Next bytes; the encoder and
+decoder for those entries live here, next to the probe that reads them.
+
+Reports probe lengths per position, a chain length histogram and an estimated
+6502 cycle count per lookup, so --table-size can be chosen from data. sim6502
+cannot run the real probe (it banks out BASIC), so this is the reference.
+"""
+
+import argparse
+import os
+import re
+import struct
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# =============================================================================
+# Book Format (must match opening_moves.asm)
+# =============================================================================
+
+BOOK_MAGIC = 0xB00C
+BOOK_VERSION = 0x03
+BOOK_VERSION_PACKED = 0x04
+BOOK_FLAG_PACKED = 0x01
+BOOK_FLAG_CHECK = 0x02
+BOOK_CHAIN_END = 0x00
+BOOK_HEADER_SIZE = 8
+BOOK_ENTRY_SIZE = 4
+BOOK_CHECK_ENTRY_SIZE = 5
+BOOK_PACKED_ENTRY_SIZE = 3
+BOOK_NO_ENTRY = 0xFFFF
+MAX_BOOK_MATCHES = 4
+
+# Next is one byte counting the entries left in the bucket
+MAX_BUCKET_ENTRIES = 256
+
+# Memory the embedded book may occupy: from $5B00 (BASIC ROM banked out) up
+# to the piece-square tables, which ai/pst.asm pins right after the book and
+# which the rest of the AI code follows
+BOOK_REGION_START = 0x5B00
+PST_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ai', 'pst.asm')
+
+HEADER_FORMAT = struct.Struct('<HBHHB')
+
+
+def read_code_origin(filename: str = PST_SOURCE) -> int:
+    """The fixed origin (*=$xxxx) of ai/pst.asm: where the engine code starts."""
+    with open(filename) as f:
+        m = re.search(r'^\*=\$([0-9A-Fa-f]{4})', f.read(), re.M)
+    if not m:
+        raise ValueError(f"No fixed origin in {filename}")
+    return int(m.group(1), 16)
+
+
+BOOK_REGION_END = read_code_origin()
+
+
+def book_region_budget(load_address: int = BOOK_REGION_START) -> int:
+    """Bytes a book loaded at load_address has before the engine code."""
+    return BOOK_REGION_END - load_address
+
+# Board88 piece codes: colour bit | sprite pointer | piece type (1-6)
+BOARD_WHITE = 0x80
+BOARD_EMPTY = 0x30
+BOARD_TYPE_MASK = 0x07
+
+# Check bits a packed entry keeps: mover colour and type
+BOOK_PACKED_CHECK_MASK = BOARD_WHITE | BOARD_TYPE_MASK
+
+
+def check_byte(mover: int, target: int) -> int:
+    """Entry Check byte from the Board88 values at the From and To squares.
+
+    Mover colour and type in bits 7 and 0-2, the type on the To square (0 if
+    empty) in bits 3-5. Two colliding positions only share a move if both
+    agree on what stands on its squares.
+    """
+    return (mover & (BOARD_WHITE | BOARD_TYPE_MASK)) | ((target & BOARD_TYPE_MASK) << 3)
+
+
+def entry_check(check: int, flags: int) -> int:
+    """The part of a Check byte an entry stores with these header Flags: all
+    of it with BOOK_FLAG_CHECK, the mover bits if packed, otherwise none."""
+    if flags & BOOK_FLAG_PACKED:
+        return check & BOOK_PACKED_CHECK_MASK
+    return check if flags & BOOK_FLAG_CHECK else 0
+
+
+def book_flags(packed: bool = False, check: bool = False) -> int:
+    """Header Flags for a packed (version 4) book or one with Check bytes."""
+    return (BOOK_FLAG_PACKED if packed else 0) | (BOOK_FLAG_CHECK if check else 0)
+
+
+def book_entry_size(flags: int) -> int:
+    if flags & BOOK_FLAG_PACKED:
+        return BOOK_PACKED_ENTRY_SIZE
+    return BOOK_CHECK_ENTRY_SIZE if flags & BOOK_FLAG_CHECK else BOOK_ENTRY_SIZE
+
+
+def book_image_size(entry_count: int, table_size: int, flags: int = 0) -> int:
+    """Bytes of a book image; packed tables carry one extra end slot."""
+    end_slot = 1 if flags & BOOK_FLAG_PACKED else 0
+    return BOOK_HEADER_SIZE + (table_size + end_slot) * 2 + entry_count * book_entry_size(flags)
+
+
+def check_book_fits(size: int, load_address: int = BOOK_REGION_START) -> None:
+    """Raise ValueError unless size bytes at load_address stay inside the book
+    region, below the engine code."""
+    if load_address < BOOK_REGION_START or load_address + size > BOOK_REGION_END:
+        raise ValueError(f"Book of {size} bytes at ${load_address:04X}-${load_address + size - 1:04X} "
+                         f"does not fit in ${BOOK_REGION_START:04X}-${BOOK_REGION_END - 1:04X}: "
+                         f"ai/pst.asm places the engine code at ${BOOK_REGION_END:04X}")
+
+
+# =============================================================================
+# Packed Entries (format version 4)
+# =============================================================================
+#
+# A 0x88 square carries 6 bits, so From and To fit in the low 6 bits of one
+# byte each and leave two bits apiece for the mover part of the Check byte:
+#
+#   HashHi
+#   From (0-63) | mover colour << 7 | mover type bit 2 << 6
+#   To (0-63)   | mover type bits 1-0 << 6
+#
+# The type on the To square is not stored, so resolve_collisions() compares
+# entry_check() values. The table holds TableSize + 1 entry indices: bucket b
+# is entries [slot b, slot b+1), which replaces the Next byte and $FFFF.
+
+def square_to_64(square88: int) -> int:
+    return ((square88 >> 1) & 0x38) | (square88 & 0x07)
+
+
+def square_to_88(square64: int) -> int:
+    return square64 + (square64 & 0x38)
+
+
+def pack_entry(hash_hi: int, from_sq: int, to_sq: int, check: int) -> bytes:
+    """Encode one entry in 3 bytes; the To-square type of check is dropped."""
+    return bytes((hash_hi,
+                  square_to_64(from_sq) | (check & 0x80) | (check & 0x04) << 4,
+                  square_to_64(to_sq) | (check & 0x03) << 6))
+
+
+def unpack_entry(data: bytes, offset: int) -> Tuple[int, int, int, int]:
+    """Decode (hash_hi, from 0x88, to 0x88, check) from a packed entry."""
+    hash_hi, from_byte, to_byte = data[offset:offset + BOOK_PACKED_ENTRY_SIZE]
+    return (hash_hi, square_to_88(from_byte & 0x3F), square_to_88(to_byte & 0x3F),
+            (from_byte & 0x80) | (from_byte & 0x40) >> 4 | to_byte >> 6)
+
+
+# =============================================================================
+# 6502 Cycle Model for LookupOpeningMove
+# =============================================================================
+#
+# Counted from opening_moves.asm, excluding the caller's jsr. Pointer loads
+# are charged as (zp),y and page-crossing penalties are ignored.
+
+# Banking, enable check, header reads (entry size from Flags), mask, slot
+# address and slot read
+CYCLES_TO_SLOT = 266
+# Empty slot: bne not taken + jmp !not_found + clc
+CYCLES_EMPTY_SLOT = 4
+# EntriesBase, TableSize * 2 and EntryOffset * 4 (or * 5 with Check bytes)
+CYCLES_CHAIN_SETUP = 134
+CYCLES_CHECK_CHAIN_SETUP = 159
+# ldy/lda (EntryPtr),y/cmp/bne for an entry whose HashHi differs
+CYCLES_ENTRY_MISS = 14
+# HashHi equal and the move stored in MatchBuffer (no Check bytes)
+CYCLES_ENTRY_STORE = 64
+# HashHi equal but MatchBuffer already full (no Check bytes)
+CYCLES_ENTRY_FULL = 29
+# With Check bytes: HashHi equal but the Check byte differs from the board
+CYCLES_CHECK_ENTRY_CHECK_FAIL = 73
+# With Check bytes: HashHi and Check equal and the move stored in MatchBuffer
+CYCLES_CHECK_ENTRY_STORE = 116
+# With Check bytes: HashHi and Check equal but MatchBuffer already full
+CYCLES_CHECK_ENTRY_FULL = 81
+# Next != 0: step EntryPtr by the entry size (bcc taken; +8 when the low byte wraps)
+CYCLES_NEXT_FOLLOW = 31
+CYCLES_NEXT_PAGE_WRAP = 8
+# Next == 0: bne not taken + jmp !select_move
+CYCLES_NEXT_END = 16
+# !select_move with no matches: lda/beq taken, then !not_found clc
+CYCLES_SELECT_NONE = 9
+# One match: lda/beq/cmp/beq taken and !use_first
+CYCLES_SELECT_ONE = 30
+# Several matches, excluding ModByMatchCount's loop
+CYCLES_SELECT_MANY = 52
+# !restore_exit including rts
+CYCLES_EXIT = 35
+
+# Version 4: as CYCLES_TO_SLOT plus the Flags check and the end slot read
+CYCLES_PACKED_TO_SLOT = 301
+# Empty bucket: start == end, jmp !not_found + clc
+CYCLES_PACKED_EMPTY_SLOT = 25
+# Bucket not empty, EntriesBase + 2, start and end index * 3
+CYCLES_PACKED_BUCKET_SETUP = 243
+# HashHi differs
+CYCLES_PACKED_ENTRY_MISS = 14
+# HashHi equal, From/To unpacked, Check bits differ from the board
+CYCLES_PACKED_ENTRY_CHECK_FAIL = 137
+# Match stored in MatchBuffer
+CYCLES_PACKED_ENTRY_STORE = 172
+# Match but MatchBuffer already full
+CYCLES_PACKED_ENTRY_FULL = 145
+# Step EntryPtr by 3 and compare with the bucket end (last entry: jmp !select_move)
+CYCLES_PACKED_NEXT_FOLLOW = 29
+CYCLES_PACKED_NEXT_PAGE_WRAP = 5
+CYCLES_PACKED_NEXT_END = 38
+
+
+def mod_by_match_count_cycles(count: int) -> float:
+    """Average ModByMatchCount cost (jsr..rts) for a random timer byte."""
+    total = 0
+    for a in range(256):
+        loops = a // count
+        total += 6 + loops * 19 + 11 + 6
+    return total / 256
+
+
+_MOD_CYCLES = {n: mod_by_match_count_cycles(n) for n in range(2, MAX_BOOK_MATCHES + 1)}
+
+
+# =============================================================================
+# Book Image Loading
+# =============================================================================
+
+@dataclass
+class BookImage:
+    data: bytes
+    version: int
+    entry_count: int
+    table_size: int
+    flags: int
+
+    @property
+    def packed(self) -> bool:
+        return bool(self.flags & BOOK_FLAG_PACKED)
+
+    @property
+    def checked(self) -> bool:
+        """Version 3 entries carry a Check byte (Flags bit 1)."""
+        return bool(self.flags & BOOK_FLAG_CHECK)
+
+    @property
+    def entry_size(self) -> int:
+        return book_entry_size(self.flags)
+
+    @property
+    def entries_base(self) -> int:
+        return BOOK_HEADER_SIZE + (self.table_size + self.packed) * 2
+
+    def slot(self, index: int) -> int:
+        return struct.unpack_from('<H', self.data, BOOK_HEADER_SIZE + index * 2)[0]
+
+
+def parse_book_image(data: bytes) -> BookImage:
+    """Validate the header of an in-memory book image."""
+    if len(data) < BOOK_HEADER_SIZE:
+        raise ValueError("Book image is shorter than its header")
+    magic, version, entry_count, table_size, flags = HEADER_FORMAT.unpack_from(data, 0)
+    if magic != BOOK_MAGIC:
+        raise ValueError(f"Bad book magic ${magic:04X}")
+    if version not in (BOOK_VERSION, BOOK_VERSION_PACKED):
+        raise ValueError(f"Unsupported book version ${version:02X} "
+                         f"(expected ${BOOK_VERSION:02X} or ${BOOK_VERSION_PACKED:02X})")
+    if (version == BOOK_VERSION_PACKED) != bool(flags & BOOK_FLAG_PACKED):
+        raise ValueError(f"Version ${version:02X} with Flags ${flags:02X}: only version "
+                         f"${BOOK_VERSION_PACKED:02X} books are packed")
+    if flags & BOOK_FLAG_PACKED and flags & BOOK_FLAG_CHECK:
+        raise ValueError(f"Flags ${flags:02X}: packed entries have no Check byte")
+    if table_size == 0 or table_size & (table_size - 1):
+        raise ValueError(f"Table size {table_size} is not a power of 2")
+    image = BookImage(data, version, entry_count, table_size, flags)
+    if len(data) < image.entries_base + entry_count * image.entry_size:
+        raise ValueError(f"Book image is shorter than its {entry_count} entries")
+    return image
+
+
+def _asm_value(token: str, consts: Dict[str, int]) -> int:
+    token = token.strip()
+    if token in consts:
+        return consts[token]
+    if token.startswith('$'):
+        return int(token[1:], 16)
+    if token.startswith('%'):
+        return int(token[1:], 2)
+    return int(token)
+
+
+def assemble_book_asm(filename: str) -> bytes:
+    """Assemble the .word/.byte directives of a generated book source.
+
+    Understands exactly what the generators emit: .const definitions,
+    .word/.byte lists and .import binary stubs. Everything else is ignored.
+    """
+    consts: Dict[str, int] = {}
+    data = bytearray()
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    with open(filename) as f:
+        for line in f:
+            line = line.split('//')[0].strip()
+            if line.startswith('.const'):
+                name, value = line[len('.const'):].split('=')
+                consts[name.strip()] = _asm_value(value, consts)
+            elif line.startswith('.word'):
+                for token in line[len('.word'):].split(','):
+                    data += struct.pack('<H', _asm_value(token, consts) & 0xFFFF)
+            elif line.startswith('.byte'):
+                for token in line[len('.byte'):].split(','):
+                    data.append(_asm_value(token, consts) & 0xFF)
+            elif line.startswith('.import binary'):
+                m = re.match(r'\.import binary\s+"([^"]+)"\s*(?:,\s*(\w+))?', line)
+                if not m:
+                    raise ValueError(f"Cannot parse: {line}")
+                with open(os.path.join(base_dir, m.group(1)), 'rb') as bf:
+                    blob = bf.read()
+                data += blob[_asm_value(m.group(2), consts) if m.group(2) else 0:]
+    return bytes(data)
+
+
+def load_book(filename: str) -> BookImage:
+    """Load a book from .asm source, a raw binary image or a PRG."""
+    if filename.endswith('.asm'):
+        return parse_book_image(assemble_book_asm(filename))
+
+    with open(filename, 'rb') as f:
+        data = f.read()
+    magic = struct.pack('<H', BOOK_MAGIC)
+    if data[:2] != magic and data[2:4] == magic:
+        data = data[2:]     # PRG: skip load address
+    return parse_book_image(data)
+
+
+# =============================================================================
+# Probe
+# =============================================================================
+
+@dataclass
+class ProbeResult:
+    matches: List[Tuple[int, int]]  # (from 0x88, to 0x88), chain order
+    visited: int                    # Entries compared
+    cycles: float                   # Estimated 6502 cycles (excluding jsr)
+
+
+def probe(image: BookImage, c64_hash: int, board88: Optional[Sequence[int]] = None,
+          base_address: int = 0x5B00) -> ProbeResult:
+    """Probe a book exactly like LookupOpeningMove.
+
+    board88 is the engine's 128-byte board for the Check byte compare; without
+    one every Check byte is taken to match (the cost of a hit is unchanged).
+    Books without Check bytes return every entry whose HashHi matches.
+    base_address only affects the page-wrap cost of stepping EntryPtr.
+    Raises ValueError if the chain walks out of the entry region.
+    """
+    if image.packed:
+        return _probe_packed(image, c64_hash, board88, base_address)
+    data = image.data
+    cycles = CYCLES_TO_SLOT + CYCLES_EXIT
+
+    index = c64_hash & (image.table_size - 1)
+    slot = image.slot(index)
+    if slot == BOOK_NO_ENTRY:
+        return ProbeResult([], 0, cycles + CYCLES_EMPTY_SLOT)
+
+    checked = image.checked
+    size = image.entry_size
+    if checked:
+        cycles += CYCLES_CHECK_CHAIN_SETUP
+        store, full = CYCLES_CHECK_ENTRY_STORE, CYCLES_CHECK_ENTRY_FULL
+    else:
+        cycles += CYCLES_CHAIN_SETUP
+        store, full = CYCLES_ENTRY_STORE, CYCLES_ENTRY_FULL
+    entries_end = image.entries_base + image.entry_count * size
+    ptr = image.entries_base + slot * size
+    hash_hi = (c64_hash >> 8) & 0xFF
+    matches: List[Tuple[int, int]] = []
+    visited = 0
+    while True:
+        if ptr + size > entries_end:
+            raise ValueError(f"Chain for hash ${c64_hash:04X} runs past the last entry")
+        visited += 1
+        if data[ptr] != hash_hi:
+            cycles += CYCLES_ENTRY_MISS
+        elif checked and board88 is not None and \
+                check_byte(board88[data[ptr + 1]], board88[data[ptr + 2]]) != data[ptr + 3]:
+            cycles += CYCLES_CHECK_ENTRY_CHECK_FAIL
+        elif len(matches) < MAX_BOOK_MATCHES:
+            matches.append((data[ptr + 1], data[ptr + 2]))
+            cycles += store
+        else:
+            cycles += full
+        if data[ptr + size - 1] == BOOK_CHAIN_END:
+            cycles += CYCLES_NEXT_END
+            break
+        cycles += CYCLES_NEXT_FOLLOW
+        if ((base_address + ptr) & 0xFF) + size > 0xFF:
+            cycles += CYCLES_NEXT_PAGE_WRAP
+        ptr += size
+
+    return ProbeResult(matches, visited, cycles + _select_cycles(len(matches)))
+
+
+def _probe_packed(image: BookImage, c64_hash: int, board88: Optional[Sequence[int]],
+                  base_address: int) -> ProbeResult:
+    """probe() for version 4: walk bucket b from slot b to slot b+1."""
+    cycles = CYCLES_PACKED_TO_SLOT + CYCLES_EXIT
+    index = c64_hash & (image.table_size - 1)
+    start, end = image.slot(index), image.slot(index + 1)
+    if start == end:
+        return ProbeResult([], 0, cycles + CYCLES_PACKED_EMPTY_SLOT)
+    if start > end or end > image.entry_count:
+        raise ValueError(f"Bucket for hash ${c64_hash:04X} spans entries {start}-{end} "
+                         f"of {image.entry_count}")
+
+    cycles += CYCLES_PACKED_BUCKET_SETUP
+    hash_hi = (c64_hash >> 8) & 0xFF
+    data = image.data
+    base = image.entries_base
+    matches: List[Tuple[int, int]] = []
+    for i in range(start, end):
+        ptr = base + i * BOOK_PACKED_ENTRY_SIZE
+        if data[ptr] != hash_hi:
+            cycles += CYCLES_PACKED_ENTRY_MISS
+        else:
+            _, from_sq, to_sq, check = unpack_entry(data, ptr)
+            if board88 is not None and \
+                    check_byte(board88[from_sq], board88[to_sq]) & BOOK_PACKED_CHECK_MASK != check:
+                cycles += CYCLES_PACKED_ENTRY_CHECK_FAIL
+            elif len(matches) < MAX_BOOK_MATCHES:
+                matches.append((from_sq, to_sq))
+                cycles += CYCLES_PACKED_ENTRY_STORE
+            else:
+                cycles += CYCLES_PACKED_ENTRY_FULL
+        if i == end - 1:
+            cycles += CYCLES_PACKED_NEXT_END
+        else:
+            cycles += CYCLES_PACKED_NEXT_FOLLOW
+            if ((base_address + ptr) & 0xFF) + BOOK_PACKED_ENTRY_SIZE > 0xFF:
+                cycles += CYCLES_PACKED_NEXT_PAGE_WRAP
+
+    return ProbeResult(matches, end - start, cycles + _select_cycles(len(matches)))
+
+
+def _select_cycles(match_count: int) -> float:
+    if not match_count:
+        return CYCLES_SELECT_NONE
+    if match_count == 1:
+        return CYCLES_SELECT_ONE
+    return CYCLES_SELECT_MANY + _MOD_CYCLES[match_count]
+
+
+def probe_book(data: bytes, c64_hash: int,
+               board88: Optional[Sequence[int]] = None) -> Tuple[List[Tuple[int, int]], int]:
+    """Probe a raw book image. Returns (matches, entries_visited)."""
+    result = probe(parse_book_image(data), c64_hash, board88)
+    return result.matches, result.visited
+
+
+# =============================================================================
+# Analysis
+# =============================================================================
+
+def book_entries(image: BookImage) -> List[Tuple[int, int, int, int, int]]:
+    """Recover (bucket, hash_hi, from, to, check) for every entry by walking chains.
+
+    Packed entries decode with the Check byte's To-square type bits clear,
+    entries of books without Check bytes with check 0 (see entry_check()).
+    """
+    entries = []
+    data = image.data
+    if image.packed:
+        for index in range(image.table_size):
+            for i in range(image.slot(index), image.slot(index + 1)):
+                entries.append((index,) + unpack_entry(data, image.entries_base + i * BOOK_PACKED_ENTRY_SIZE))
+        return entries
+    for index in range(image.table_size):
+        slot = image.slot(index)
+        if slot == BOOK_NO_ENTRY:
+            continue
+        size = image.entry_size
+        ptr = image.entries_base + slot * size
+        while True:
+            entries.append((index, data[ptr], data[ptr + 1], data[ptr + 2],
+                            data[ptr + 3] if image.checked else 0))
+            if data[ptr + size - 1] == BOOK_CHAIN_END:
+                break
+            ptr += size
+    return entries
+
+
+def book_hashes(image: BookImage) -> List[int]:
+    """Full 16-bit hashes of the book's positions, in chain order.
+
+    The bucket gives the low bits and HashHi the high byte, so this is exact
+    for tables of 256 slots or more.
+    """
+    if image.table_size < 256:
+        raise ValueError("Hashes can only be recovered from tables of 256+ slots")
+    seen = set()
+    hashes = []
+    for index, hash_hi, _, _, _ in book_entries(image):
+        h = (hash_hi << 8) | (index & 0xFF)
+        if h not in seen:
+            seen.add(h)
+            hashes.append(h)
+    return hashes
+
+
+def build_book_image(entries: Iterable[Tuple[int, int, int, int, int]], table_size: int,
+                     flags: int = 0) -> BookImage:
+    """Lay out (c64_hash, hash_hi, from, to, check) entries as a book image,
+    version 3 (with Check bytes if flags has BOOK_FLAG_CHECK) or, with
+    BOOK_FLAG_PACKED in flags, packed version 4.
+
+    Buckets keep the entries' order, matching the generators' layout.
+    Raises ValueError if a v3 bucket needs more than MAX_BUCKET_ENTRIES.
+    """
+    packed = bool(flags & BOOK_FLAG_PACKED)
+    buckets: Dict[int, List[Tuple[int, int, int, int]]] = {}
+    for c64_hash, hash_hi, from_sq, to_sq, check in entries:
+        buckets.setdefault(c64_hash & (table_size - 1), []).append((hash_hi, from_sq, to_sq, check))
+
+    hash_table = [BOOK_NO_ENTRY] * table_size
+    entry_data = bytearray()
+    count = 0
+    for bucket in range(table_size):
+        chain = buckets.get(bucket)
+        if packed:
+            hash_table[bucket] = count
+            for hash_hi, from_sq, to_sq, check in chain or ():
+                entry_data += pack_entry(hash_hi, from_sq, to_sq, check)
+            count += len(chain or ())
+            continue
+        if not chain:
+            continue
+        if len(chain) > MAX_BUCKET_ENTRIES:
+            raise ValueError(f"Bucket {bucket} has {len(chain)} entries (max {MAX_BUCKET_ENTRIES})")
+        hash_table[bucket] = count
+        for i, (hash_hi, from_sq, to_sq, check) in enumerate(chain):
+            if flags & BOOK_FLAG_CHECK:
+                entry_data += bytes((hash_hi, from_sq, to_sq, check, len(chain) - 1 - i))
+            else:
+                entry_data += bytes((hash_hi, from_sq, to_sq, len(chain) - 1 - i))
+        count += len(chain)
+
+    if packed:
+        hash_table.append(count)
+    data = bytearray(HEADER_FORMAT.pack(BOOK_MAGIC, BOOK_VERSION_PACKED if packed else BOOK_VERSION,
+                                        count, table_size, flags))
+    data += struct.pack(f'<{len(hash_table)}H', *hash_table)
+    data += entry_data
+    return parse_book_image(bytes(data))
+
+
+def relayout(image: BookImage, table_size: int) -> BookImage:
+    """Rebuild the same entries with a different table size."""
+    entries = [((hash_hi << 8) | (index & 0xFF), hash_hi, from_sq, to_sq, check)
+               for index, hash_hi, from_sq, to_sq, check in book_entries(image)]
+    return build_book_image(entries, table_size, image.flags)
+
+
+@dataclass
+class ProbeStats:
+    table_size: int
+    book_bytes: int
+    positions: int
+    chain_histogram: Dict[int, int]    # chain length -> number of buckets (0 = empty)
+    hit_visited_avg: float
+    hit_visited_max: int
+    hit_cycles_avg: float
+    hit_cycles_max: float
+    miss_visited_avg: float
+    miss_cycles_avg: float
+    miss_cycles_max: float
+
+
+def analyze(image: BookImage, hashes: List[int]) -> ProbeStats:
+    """Probe every book position and every other 16-bit hash."""
+    chain_lengths = Counter(probe(image, index).visited for index in range(image.table_size))
+
+    hits = [probe(image, h) for h in hashes]
+    in_book = set(hashes)
+    miss_visited = 0
+    miss_cycles = 0.0
+    miss_cycles_max = 0.0
+    misses = 0
+    for h in range(0x10000):
+        if h in in_book:
+            continue
+        result = probe(image, h)
+        miss_visited += result.visited
+        miss_cycles += result.cycles
+        miss_cycles_max = max(miss_cycles_max, result.cycles)
+        misses += 1
+
+    return ProbeStats(
+        table_size=image.table_size,
+        book_bytes=len(image.data),
+        positions=len(hashes),
+        chain_histogram=dict(sorted(chain_lengths.items())),
+        hit_visited_avg=sum(r.visited for r in hits) / max(1, len(hits)),
+        hit_visited_max=max((r.visited for r in hits), default=0),
+        hit_cycles_avg=sum(r.cycles for r in hits) / max(1, len(hits)),
+        hit_cycles_max=max((r.cycles for r in hits), default=0),
+        miss_visited_avg=miss_visited / max(1, misses),
+        miss_cycles_avg=miss_cycles / max(1, misses),
+        miss_cycles_max=miss_cycles_max,
+    )
+
+
+def print_stats(stats: ProbeStats):
+    end = BOOK_REGION_START + stats.book_bytes
+    fit = "fits below" if end <= BOOK_REGION_END else "OVERRUNS"
+    print(f"Table size {stats.table_size}: {stats.book_bytes} bytes, {stats.positions} positions")
+    print(f"  At ${BOOK_REGION_START:04X}-${end - 1:04X}: {fit} the engine code at ${BOOK_REGION_END:04X}")
+    print(f"  Hits:   {stats.hit_visited_avg:.2f} entries avg, {stats.hit_visited_max} max, "
+          f"{stats.hit_cycles_avg:.0f} cycles avg, {stats.hit_cycles_max:.0f} max")
+    print(f"  Misses: {stats.miss_visited_avg:.2f} entries avg, "
+          f"{stats.miss_cycles_avg:.0f} cycles avg, {stats.miss_cycles_max:.0f} max")
+    print("  Chain length histogram (length: buckets):")
+    for length, count in stats.chain_histogram.items():
+        print(f"    {length:3d}: {count}")
+
+
+# optimize_table_size() takes the smallest table whose average hit costs at
+# most this much more than the fastest one: past a few slots per position a
+# doubled table saves a handful of cycles for thousands of bytes
+LAYOUT_CYCLE_TOLERANCE = 0.05
+
+
+def optimize_table_size(entries: List[Tuple[int, int, int, int, int]], byte_budget: int,
+                        min_size: int = 64, flags: int = 0,
+                        tolerance: float = LAYOUT_CYCLE_TOLERANCE) -> Tuple[Optional[int], List[ProbeStats]]:
+    """Pick the smallest power-of-two table size that probes about as fast as
+    any that fits.
+
+    Sizes are tried from min_size up while the image fits byte_budget, which
+    is capped at the book region below the engine code (packed or not). The
+    winner is the smallest table whose modeled cycles for a book position
+    (hit_cycles_avg) are within tolerance of the fastest. Non-power-of-two sizes are not
+    considered: LookupOpeningMove masks the hash, and a 16-bit modulo on the
+    6502 would cost more than any chain it saves.
+
+    Returns (best size or None if nothing fits, stats for every size tried).
+    """
+    hashes = list(dict.fromkeys(entry[0] for entry in entries))
+    curve: List[ProbeStats] = []
+    byte_budget = min(byte_budget, book_region_budget())
+    size = min_size
+    while book_image_size(len(entries), size, flags) <= byte_budget:
+        try:
+            curve.append(analyze(build_book_image(entries, size, flags), hashes))
+        except ValueError:
+            pass    # A bucket overflowed; larger tables may still work
+        size *= 2
+
+    if not curve:
+        return None, curve
+    fastest = min(st.hit_cycles_avg for st in curve)
+    best = min((st for st in curve if st.hit_cycles_avg <= fastest * (1 + tolerance)),
+               key=lambda st: st.table_size)
+    return best.table_size, curve
+
+
+def print_layout_curve(curve: List[ProbeStats], best: Optional[int], byte_budget: int):
+    print(f"  Layout trade-off (budget {byte_budget} bytes):")
+    print("     slots   bytes  max chain  avg hit  avg miss  hit cycles  miss cycles")
+    for st in curve:
+        mark = "  <-" if st.table_size == best else ""
+        print(f"    {st.table_size:6d}  {st.book_bytes:6d}  {st.hit_visited_max:9d}  "
+              f"{st.hit_visited_avg:7.2f}  {st.miss_visited_avg:8.2f}  "
+              f"{st.hit_cycles_avg:10.0f}  {st.miss_cycles_avg:11.0f}{mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Probe a generated C64 opening book like LookupOpeningMove")
+    parser.add_argument('book', help='Generated book (.asm, raw .bin or .prg)')
+    parser.add_argument('--table-sizes', type=lambda v: [int(x, 0) for x in v.split(',')],
+                        help='Also re-lay out the entries at these table sizes (e.g. 256,512,2048)')
+    parser.add_argument('--per-position', action='store_true',
+                        help='Print hash, entries visited, matches and cycles for each book position')
+    args = parser.parse_args()
+
+    image = load_book(args.book)
+    hashes = book_hashes(image)
+    layout = ', packed' if image.packed else ', Check bytes' if image.checked else ''
+    print(f"Book: {args.book} (v{image.version}{layout}, {image.entry_count} entries, "
+          f"{image.table_size} slots, {len(hashes)} positions)")
+
+    if args.per_position:
+        print("  hash  visited matches cycles")
+        for h in hashes:
+            result = probe(image, h)
+            print(f"  ${h:04X} {result.visited:7d} {len(result.matches):7d} {result.cycles:6.0f}")
+
+    images = [image]
+    for size in args.table_sizes or []:
+        if size & (size - 1) or size < 256:
+            parser.error(f"table size {size} must be a power of 2 >= 256")
+        if size != image.table_size:
+            images.append(relayout(image, size))
+
+    for candidate in sorted(images, key=lambda i: i.table_size):
+        print_stats(analyze(candidate, hashes))
+
+
+if __name__ == '__main__':
+    main()
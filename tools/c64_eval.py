@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+C64 Position Evaluation Reference
+
+Scores positions exactly like EvaluatePosition in ai/eval.asm: material from
+PieceValues (pawn = 10), the ai/pst.asm tables, EvaluatePawnStructure and
+EvaluateKingSafety, summed into the 16-bit signed EvalScore.
+
+Two implementations share the tables parsed from the assembly source:
+
+  evaluate()        a step-by-step port of the 6502 code on one Board88
+  evaluate_batch()  NumPy, one row per position, for millions of positions
+
+Both reproduce the engine's quirks, e.g. EvaluateSingleKingSafety returns a
+byte that EvaluateKingSafety adds unsigned, so a king on the d/e file scores
++226 (256 - KING_CENTER_PENALTY), not -30. --cross-check runs both and
+reports any position where they disagree.
+"""
+
+import argparse
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:     # evaluate() works without it; evaluate_batch() does not
+    np = None
+
+
+# =============================================================================
+# Board88 Encoding (must match constants.asm)
+# =============================================================================
+
+WHITE_COLOR = 0x80
+EMPTY_PIECE = 0x30          # EMPTY_SPR + BLACK_COLOR
+BOARD_SIZE = 0x80
+OFFBOARD_MASK = 0x88
+TYPE_MASK = 0x07
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+PIECE_LETTERS = 'pnbrqk'    # Index + 1 = piece type
+
+
+def piece_code(letter: str) -> int:
+    """Board88 value for a FEN piece letter."""
+    color = WHITE_COLOR if letter.isupper() else 0
+    return color | EMPTY_PIECE | (PIECE_LETTERS.index(letter.lower()) + 1)
+
+
+def board88_from_fen(fen: str) -> bytearray:
+    """Board88 (128 bytes, row 0 = rank 8) from the placement field of a FEN."""
+    board = bytearray([EMPTY_PIECE] * BOARD_SIZE)
+    rows = fen.split()[0].split('/')
+    if len(rows) != 8:
+        raise ValueError(f"Bad FEN placement: {fen}")
+    for row, text in enumerate(rows):
+        col = 0
+        for c in text:
+            if c.isdigit():
+                col += int(c)
+            else:
+                board[row * 16 + col] = piece_code(c)
+                col += 1
+        if col != 8:
+            raise ValueError(f"Bad FEN rank {8 - row}: {text}")
+    return board
+
+
+def board64(board88: Sequence[int]) -> List[int]:
+    """The 64 valid squares of a Board88, row-major from a8 (one batch row)."""
+    return [board88[(sq >> 3) * 16 + (sq & 7)] for sq in range(64)]
+
+
+# =============================================================================
+# Evaluation Tables (parsed from ai/eval.asm and ai/pst.asm)
+# =============================================================================
+
+AI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ai')
+
+# PST_Table_Lo/Hi order: piece types 1-6 (the king always uses PST_KingMid)
+PST_LABELS = ['PST_Pawn', 'PST_Knight', 'PST_Bishop', 'PST_Rook', 'PST_Queen', 'PST_KingMid']
+
+# Shield squares (0x88) checked for a castled king
+WHITE_SHIELD = {6: (0x65, 0x66, 0x67), 2: (0x60, 0x61, 0x62)}
+BLACK_SHIELD = {6: (0x15, 0x16, 0x17), 2: (0x10, 0x11, 0x12)}
+
+
+@dataclass
+class EvalParams:
+    piece_values: List[int]        # PieceValues, indexed by type 0-6
+    pst: List[List[int]]           # Signed PST per type 0-6 (type 0 unused)
+    passed_pawn_bonus: List[int]   # PassedPawnBonus, indexed by row
+    doubled_pawn_penalty: int
+    isolated_pawn_penalty: int
+    castled_bonus: int
+    pawn_shield_bonus: int
+    king_center_penalty: int
+
+
+def _parse_consts(source: str) -> Dict[str, int]:
+    consts = {}
+    for name, value in re.findall(r'^\s*\.const\s+(\w+)\s*=\s*(\$?[0-9A-Fa-f]+)', source, re.M):
+        consts[name] = int(value[1:], 16) if value.startswith('$') else int(value)
+    return consts
+
+
+def _parse_bytes(source: str, label: str, count: int, consts: Dict[str, int]) -> List[int]:
+    """The first count .byte values after label (numbers or .const names)."""
+    match = re.search(rf'^{label}:\s*\n', source, re.M)
+    if not match:
+        raise ValueError(f"Label {label} not found")
+    values: List[int] = []
+    for line in source[match.end():].splitlines():
+        line = line.split('//')[0].strip()
+        if not line.startswith('.byte'):
+            continue
+        for token in line[len('.byte'):].split(','):
+            token = token.strip()
+            values.append(consts[token] if token in consts else int(token))
+        if len(values) >= count:
+            return values[:count]
+    raise ValueError(f"{label} has fewer than {count} bytes")
+
+
+def load_eval_params(ai_dir: str = AI_DIR) -> EvalParams:
+    """Read the evaluation constants and tables from the assembly source."""
+    with open(os.path.join(ai_dir, 'eval.asm')) as f:
+        eval_src = f.read()
+    with open(os.path.join(ai_dir, 'pst.asm')) as f:
+        pst_src = f.read()
+    consts = _parse_consts(eval_src)
+    return EvalParams(
+        piece_values=_parse_bytes(eval_src, 'PieceValues', 7, consts),
+        pst=[[0] * 64] + [_parse_bytes(pst_src, label, 64, consts) for label in PST_LABELS],
+        passed_pawn_bonus=_parse_bytes(eval_src, 'PassedPawnBonus', 8, consts),
+        doubled_pawn_penalty=consts['DOUBLED_PAWN_PENALTY'],
+        isolated_pawn_penalty=consts['ISOLATED_PAWN_PENALTY'],
+        castled_bonus=consts['CASTLED_BONUS'],
+        pawn_shield_bonus=consts['PAWN_SHIELD_BONUS'],
+        king_center_penalty=consts['KING_CENTER_PENALTY'],
+    )
+
+
+# =============================================================================
+# Scalar Evaluation (step-by-step port)
+# =============================================================================
+
+def _is_pawn(board88: Sequence[int], sq: int, white: bool) -> bool:
+    piece = board88[sq]
+    return piece & TYPE_MASK == PAWN and bool(piece & WHITE_COLOR) == white
+
+
+def _passed(board88: Sequence[int], file: int, row: int, white: bool) -> bool:
+    """CheckWhitePassed / CheckBlackPassed: no enemy pawn ahead on file +-1."""
+    rows = range(row - 1, -1, -1) if white else range(row + 1, 8)
+    for r in rows:
+        for f in (file - 1, file, file + 1):
+            if 0 <= f <= 7 and _is_pawn(board88, r * 16 + f, not white):
+                return False
+    return True
+
+
+def _king_safety(board88: Sequence[int], king_sq: int, white: bool, params: EvalParams) -> int:
+    """EvaluateSingleKingSafety: the safety byte (0-255)."""
+    file, row = king_sq & 7, king_sq >> 4
+    score = 0
+    if row == (7 if white else 0) and file in (6, 2):
+        score += params.castled_bonus
+        shield = (WHITE_SHIELD if white else BLACK_SHIELD)[file]
+        for sq in shield:
+            if _is_pawn(board88, sq, white):
+                score += params.pawn_shield_bonus
+    elif file in (3, 4):
+        score -= params.king_center_penalty
+    return score & 0xFF
+
+
+def find_king(board88: Sequence[int], white: bool) -> int:
+    """0x88 square of a king, like whitekingsq / blackkingsq."""
+    code = (WHITE_COLOR if white else 0) | EMPTY_PIECE | KING
+    for sq in range(BOARD_SIZE):
+        if not sq & OFFBOARD_MASK and board88[sq] == code:
+            return sq
+    raise ValueError(f"No {'white' if white else 'black'} king on the board")
+
+
+def evaluate(board88: Sequence[int], params: EvalParams,
+             white_king: Optional[int] = None, black_king: Optional[int] = None) -> int:
+    """EvaluatePosition on one Board88. Returns EvalScore as a signed int."""
+    score = 0   # Kept as the unsigned 16-bit EvalScore
+
+    # EvaluateMaterial and the PST loop
+    for sq in range(BOARD_SIZE):
+        piece = board88[sq]
+        if sq & OFFBOARD_MASK or piece == EMPTY_PIECE:
+            continue
+        piece_type = piece & TYPE_MASK
+        sq64 = (sq >> 4) * 8 + (sq & 7)
+        if piece & WHITE_COLOR:
+            score += params.piece_values[piece_type] + params.pst[piece_type][sq64]
+        else:
+            score -= params.piece_values[piece_type] + params.pst[piece_type][sq64 ^ 0x38]
+        score &= 0xFFFF
+
+    # EvaluatePawnStructure: counts per file, then doubled/isolated per file
+    white_files = [0] * 8
+    black_files = [0] * 8
+    for sq in range(BOARD_SIZE):
+        if not sq & OFFBOARD_MASK and board88[sq] & TYPE_MASK == PAWN:
+            if board88[sq] & WHITE_COLOR:
+                white_files[sq & 7] += 1
+            else:
+                black_files[sq & 7] += 1
+    for f in range(8):
+        if white_files[f] >= 2:
+            score -= params.doubled_pawn_penalty
+        if black_files[f] >= 2:
+            score += params.doubled_pawn_penalty
+    for f in range(8):
+        left = f > 0 and (white_files[f - 1], black_files[f - 1])
+        right = f < 7 and (white_files[f + 1], black_files[f + 1])
+        if white_files[f] and not (left and left[0]) and not (right and right[0]):
+            score -= params.isolated_pawn_penalty
+        if black_files[f] and not (left and left[1]) and not (right and right[1]):
+            score += params.isolated_pawn_penalty
+    for sq in range(BOARD_SIZE):
+        if sq & OFFBOARD_MASK or board88[sq] & TYPE_MASK != PAWN:
+            continue
+        file, row = sq & 7, sq >> 4
+        white = bool(board88[sq] & WHITE_COLOR)
+        if _passed(board88, file, row, white):
+            if white:
+                score += params.passed_pawn_bonus[row]
+            else:
+                score -= params.passed_pawn_bonus[7 - row]
+    score &= 0xFFFF
+
+    # EvaluateKingSafety: the safety bytes are added/subtracted unsigned
+    if white_king is None:
+        white_king = find_king(board88, True)
+    if black_king is None:
+        black_king = find_king(board88, False)
+    score += _king_safety(board88, white_king, True, params)
+    score -= _king_safety(board88, black_king, False, params)
+    score &= 0xFFFF
+
+    return score - 0x10000 if score & 0x8000 else score
+
+
+# =============================================================================
+# Batch Evaluation (NumPy)
+# =============================================================================
+
+def evaluate_batch(boards, params: EvalParams):
+    """EvaluatePosition for N positions at once.
+
+    boards is an N x 64 array of Board88 values (see board64()), row-major
+    from a8. Kings are located on the board. Returns an int16 array of
+    EvalScores.
+    """
+    if np is None:
+        raise RuntimeError("evaluate_batch() needs NumPy (pip install numpy)")
+    boards = np.asarray(boards, dtype=np.uint8).reshape(-1, 64)
+    n = len(boards)
+    types = (boards & TYPE_MASK).astype(np.intp)
+    white = (boards & WHITE_COLOR) != 0
+    occupied = boards != EMPTY_PIECE
+    sq = np.arange(64)
+
+    # Material and PST (black reads the rank-mirrored square)
+    values = np.array(params.piece_values, dtype=np.int64)[types]
+    pst = np.array(params.pst, dtype=np.int64)
+    white_pst = pst[types, sq]
+    black_pst = pst[types, sq ^ 0x38]
+    score = np.where(occupied, np.where(white, values + white_pst, -(values + black_pst)), 0).sum(axis=1)
+
+    # Pawn structure on [row, file] grids
+    pawns = (types == PAWN).reshape(n, 8, 8)
+    white_pawns = pawns & white.reshape(n, 8, 8)
+    black_pawns = pawns & ~white.reshape(n, 8, 8)
+    white_files = white_pawns.sum(axis=1)
+    black_files = black_pawns.sum(axis=1)
+
+    score -= (white_files >= 2).sum(axis=1) * params.doubled_pawn_penalty
+    score += (black_files >= 2).sum(axis=1) * params.doubled_pawn_penalty
+
+    def neighbours(files):
+        padded = np.pad(files, ((0, 0), (1, 1)))
+        return (padded[:, :-2] > 0) | (padded[:, 2:] > 0)
+
+    score -= ((white_files > 0) & ~neighbours(white_files)).sum(axis=1) * params.isolated_pawn_penalty
+    score += ((black_files > 0) & ~neighbours(black_files)).sum(axis=1) * params.isolated_pawn_penalty
+
+    def span(grid):
+        # Pawn on the same or an adjacent file, per [row, file]
+        padded = np.pad(grid, ((0, 0), (0, 0), (1, 1)))
+        return padded[:, :, :-2] | padded[:, :, 1:-1] | padded[:, :, 2:]
+
+    # Enemy pawns strictly ahead: rows above for white, below for black
+    black_span = span(black_pawns)
+    white_span = span(white_pawns)
+    black_above = np.zeros_like(black_span)
+    black_above[:, 1:] = np.logical_or.accumulate(black_span, axis=1)[:, :-1]
+    white_below = np.zeros_like(white_span)
+    white_below[:, :-1] = np.logical_or.accumulate(white_span[:, ::-1], axis=1)[:, ::-1][:, 1:]
+
+    bonus = np.array(params.passed_pawn_bonus, dtype=np.int64)
+    score += ((white_pawns & ~black_above) * bonus[:, None]).sum(axis=(1, 2))
+    score -= ((black_pawns & ~white_below) * bonus[::-1, None]).sum(axis=(1, 2))
+
+    # King safety bytes
+    for color, home_row, shield_rows in ((True, 7, 6), (False, 0, 1)):
+        king_code = (WHITE_COLOR if color else 0) | EMPTY_PIECE | KING
+        is_king = boards == king_code
+        if not is_king.any(axis=1).all():
+            raise ValueError(f"A position has no {'white' if color else 'black'} king")
+        king = is_king.argmax(axis=1)
+        file, row = king & 7, king >> 3
+        own_pawns = (white_pawns if color else black_pawns)[:, shield_rows]
+        kingside = own_pawns[:, 5:8].sum(axis=1)
+        queenside = own_pawns[:, 0:3].sum(axis=1)
+        castled = (row == home_row) & ((file == 6) | (file == 2))
+        shield = np.where(file == 6, kingside, queenside)
+        safety = np.where(castled, params.castled_bonus + shield * params.pawn_shield_bonus,
+                          np.where((file == 3) | (file == 4), -params.king_center_penalty, 0)) & 0xFF
+        score += safety if color else -safety
+
+    return (score & 0xFFFF).astype(np.uint16).view(np.int16)
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def read_fens(filename: str) -> List[str]:
+    with open(filename) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score positions exactly like EvaluatePosition")
+    parser.add_argument('fens', nargs='*', help='Positions to score (FEN)')
+    parser.add_argument('--file', help='Read FENs from a file, one per line')
+    parser.add_argument('--cross-check', action='store_true',
+                        help='Score with both the scalar port and the NumPy batch and compare')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary')
+    args = parser.parse_args()
+
+    fens = list(args.fens)
+    if args.file:
+        fens += read_fens(args.file)
+    if not fens:
+        fens = ['rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1']
+
+    params = load_eval_params()
+    boards = [board88_from_fen(fen) for fen in fens]
+
+    if np is not None:
+        scores = evaluate_batch([board64(board) for board in boards], params).tolist()
+    else:
+        if args.cross_check:
+            parser.error("--cross-check needs NumPy")
+        scores = [evaluate(board, params) for board in boards]
+
+    if not args.quiet:
+        for fen, score in zip(fens, scores):
+            print(f"{score:6d}  {fen}")
+
+    if args.cross_check:
+        mismatches = 0
+        for fen, board, score in zip(fens, boards, scores):
+            scalar = evaluate(board, params)
+            if scalar != score:
+                mismatches += 1
+                print(f"  Mismatch: batch {score}, scalar {scalar}: {fen}")
+        print(f"Cross-check: {len(fens) - mismatches}/{len(fens)} positions agree")
+        if mismatches:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
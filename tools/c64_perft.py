@@ -0,0 +1,624 @@
+#!/usr/bin/env python3
+"""
+Bitboard Perft and C64 Move List Reference
+
+A legal move generator on 64-bit bitboards (a1 = bit 0) for perft, and a
+count of the move list GenerateAllMoves in ai/movegen.asm builds for the
+same position, to find positions that overflow MAX_MOVES or make
+FilterLegalMoves slow.
+
+The engine's list is not the legal move list:
+
+  - it is pseudo-legal: FilterLegalMoves makes and unmakes every entry
+  - a promotion adds two entries, queen and knight (AddPawnMoveWithPromotion)
+  - castling needs the right and empty squares only; the squares crossed
+    are tested by FilterLegalMoves, and the rook is not checked
+  - AddMove does not check for overflow, so entry 129 writes past
+    MoveListFrom
+
+Perft counts leaves with bulk counting (the last ply sums popcounts of the
+target sets instead of making the moves) and caches slider attacks per
+square and relevant occupancy, which stands in for magic bitboards.
+
+Modes:
+
+  c64_perft.py [FEN...] --depth N [--divide]   perft, divide in 0x88 squares
+  c64_perft.py --suite                         standard positions vs. known counts
+  c64_perft.py --scan --book B.bin | --pgn G.pgn[.gz] | --file F
+                                               flag lists over MAX_MOVES
+"""
+
+import argparse
+import gzip
+import heapq
+import sys
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Tuple
+
+from c64_eval import BISHOP, KING, KNIGHT, PAWN, QUEEN, ROOK, read_fens
+from c64_zobrist import CASTLE_BK, CASTLE_BQ, CASTLE_WK, CASTLE_WQ
+
+
+# =============================================================================
+# Engine Limits (ai/movegen.asm)
+# =============================================================================
+
+MAX_MOVES = 128
+
+START_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+# Standard perft positions (chessprogramming.org "Perft Results"):
+# (name, FEN, leaf counts for depth 1, 2, ...)
+PERFT_SUITE = [
+    ('startpos', START_FEN,
+     [20, 400, 8902, 197281, 4865609]),
+    ('kiwipete', 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+     [48, 2039, 97862, 4085603]),
+    ('position3', '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+     [14, 191, 2812, 43238, 674624]),
+    ('position4', 'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+     [6, 264, 9467, 422333]),
+    ('position5', 'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+     [44, 1486, 62379, 2103487]),
+    ('position6', 'r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10',
+     [46, 2079, 89890, 3894594]),
+]
+
+
+# =============================================================================
+# Attack Tables
+# =============================================================================
+
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+RANK_1 = 0xFF
+RANK_8 = RANK_1 << 56
+FULL = (1 << 64) - 1
+
+# (rank step, file step, square step); the first four are increasing rays
+ROOK_DIRECTIONS = ((1, 0, 8), (0, 1, 1), (-1, 0, -8), (0, -1, -1))
+BISHOP_DIRECTIONS = ((1, 1, 9), (1, -1, 7), (-1, 1, -7), (-1, -1, -9))
+
+
+def _ray(sq: int, dr: int, df: int) -> int:
+    bb = 0
+    r, f = (sq >> 3) + dr, (sq & 7) + df
+    while 0 <= r < 8 and 0 <= f < 8:
+        bb |= 1 << (r * 8 + f)
+        r, f = r + dr, f + df
+    return bb
+
+
+def _leaper(sq: int, steps) -> int:
+    bb = 0
+    for dr, df in steps:
+        r, f = (sq >> 3) + dr, (sq & 7) + df
+        if 0 <= r < 8 and 0 <= f < 8:
+            bb |= 1 << (r * 8 + f)
+    return bb
+
+
+KNIGHT_ATTACKS = [_leaper(sq, ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)))
+                  for sq in range(64)]
+KING_ATTACKS = [_leaper(sq, ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)))
+                for sq in range(64)]
+# PAWN_ATTACKS[0][sq]: squares a white pawn on sq attacks; [1] for black
+PAWN_ATTACKS = [[_leaper(sq, ((1, -1), (1, 1))) for sq in range(64)],
+                [_leaper(sq, ((-1, -1), (-1, 1))) for sq in range(64)]]
+
+# RAYS[sq] = [(ray bitboard, increasing), ...] for the rook and bishop directions
+ROOK_RAYS = [[(_ray(sq, dr, df), step > 0) for dr, df, step in ROOK_DIRECTIONS] for sq in range(64)]
+BISHOP_RAYS = [[(_ray(sq, dr, df), step > 0) for dr, df, step in BISHOP_DIRECTIONS] for sq in range(64)]
+
+
+def _relevant(sq: int, directions) -> int:
+    """Squares whose occupancy can change the attack set: the rays without
+    their last square."""
+    bb = 0
+    for dr, df, step in directions:
+        ray = _ray(sq, dr, df)
+        if ray:
+            last = (ray & -ray) if step < 0 else 1 << (ray.bit_length() - 1)
+            bb |= ray ^ last
+    return bb
+
+
+ROOK_MASKS = [_relevant(sq, ROOK_DIRECTIONS) for sq in range(64)]
+BISHOP_MASKS = [_relevant(sq, BISHOP_DIRECTIONS) for sq in range(64)]
+
+# Slider attacks by square and relevant occupancy, filled on first use
+_ROOK_CACHE: List[Dict[int, int]] = [{} for _ in range(64)]
+_BISHOP_CACHE: List[Dict[int, int]] = [{} for _ in range(64)]
+
+
+def _slide(sq: int, occ: int, rays) -> int:
+    attacks = 0
+    for ray, increasing in rays[sq]:
+        blockers = ray & occ
+        if blockers:
+            first = (blockers & -blockers).bit_length() - 1 if increasing else blockers.bit_length() - 1
+            ray ^= _ray_from(first, ray, increasing)
+        attacks |= ray
+    return attacks
+
+
+def _ray_from(sq: int, ray: int, increasing: bool) -> int:
+    """The part of ray beyond sq."""
+    if increasing:
+        return ray & ~((2 << sq) - 1)
+    return ray & ((1 << sq) - 1)
+
+
+def rook_attacks(sq: int, occ: int) -> int:
+    key = occ & ROOK_MASKS[sq]
+    cache = _ROOK_CACHE[sq]
+    attacks = cache.get(key)
+    if attacks is None:
+        attacks = cache[key] = _slide(sq, key, ROOK_RAYS)
+    return attacks
+
+
+def bishop_attacks(sq: int, occ: int) -> int:
+    key = occ & BISHOP_MASKS[sq]
+    cache = _BISHOP_CACHE[sq]
+    attacks = cache.get(key)
+    if attacks is None:
+        attacks = cache[key] = _slide(sq, key, BISHOP_RAYS)
+    return attacks
+
+
+def _between(a: int, b: int) -> int:
+    for directions in (ROOK_DIRECTIONS, BISHOP_DIRECTIONS):
+        for dr, df, _ in directions:
+            ray = _ray(a, dr, df)
+            if ray >> b & 1:
+                return ray & _ray(b, -dr, -df)
+    return 0
+
+
+# Squares strictly between two squares on a line, else 0
+BETWEEN = [[_between(a, b) for b in range(64)] for a in range(64)]
+
+# castling &= CASTLING_MASK[from] & CASTLING_MASK[to]
+CASTLING_MASK = [0x0F] * 64
+CASTLING_MASK[0] &= ~CASTLE_WQ
+CASTLING_MASK[7] &= ~CASTLE_WK
+CASTLING_MASK[4] &= ~(CASTLE_WK | CASTLE_WQ)
+CASTLING_MASK[56] &= ~CASTLE_BQ
+CASTLING_MASK[63] &= ~CASTLE_BK
+CASTLING_MASK[60] &= ~(CASTLE_BK | CASTLE_BQ)
+
+# (right, king from, king to, rook square, squares that must be empty, squares not attacked)
+CASTLING = [
+    [(CASTLE_WK, 4, 6, 7, 0x60, (5, 6)), (CASTLE_WQ, 4, 2, 0, 0x0E, (3, 2))],
+    [(CASTLE_BK, 60, 62, 63, 0x60 << 56, (61, 62)), (CASTLE_BQ, 60, 58, 56, 0x0E << 56, (59, 58))],
+]
+
+
+def bits(bb: int) -> Iterator[int]:
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+# =============================================================================
+# Position
+# =============================================================================
+
+# Move: from | to << 6 | promotion piece << 12
+Move = int
+
+
+class Position:
+    """Piece bitboards by type (pieces[PAWN] .. pieces[KING]) and colour
+    (colors[0] white, colors[1] black), python-chess style."""
+
+    __slots__ = ('pieces', 'colors', 'white', 'castling', 'ep')
+
+    def __init__(self, pieces: List[int], colors: List[int], white: bool, castling: int, ep: int):
+        self.pieces = pieces
+        self.colors = colors
+        self.white = white
+        self.castling = castling
+        self.ep = ep        # En passant target square, -1 if none
+
+    @classmethod
+    def from_fen(cls, fen: str) -> 'Position':
+        fields = fen.split()
+        if len(fields) < 4:
+            raise ValueError(f"Bad FEN: {fen}")
+        pieces = [0] * 7
+        colors = [0, 0]
+        for row, text in enumerate(fields[0].split('/')):
+            file = 0
+            for ch in text:
+                if ch.isdigit():
+                    file += int(ch)
+                    continue
+                sq = (7 - row) * 8 + file
+                pieces['pnbrqk'.index(ch.lower()) + 1] |= 1 << sq
+                colors[0 if ch.isupper() else 1] |= 1 << sq
+                file += 1
+        castling = 0
+        for ch, right in (('K', CASTLE_WK), ('Q', CASTLE_WQ), ('k', CASTLE_BK), ('q', CASTLE_BQ)):
+            if ch in fields[2]:
+                castling |= right
+        ep = -1 if fields[3] == '-' else (int(fields[3][1]) - 1) * 8 + 'abcdefgh'.index(fields[3][0])
+        return cls(pieces, colors, fields[1] == 'w', castling, ep)
+
+    def piece_at(self, sq: int) -> int:
+        bit = 1 << sq
+        for kind in range(PAWN, KING + 1):
+            if self.pieces[kind] & bit:
+                return kind
+        return 0
+
+    def attackers(self, sq: int, them: int, occ: int) -> int:
+        """Pieces of colour them that attack sq with occupancy occ."""
+        pieces = self.pieces
+        queens = pieces[QUEEN]
+        return self.colors[them] & (
+            (KNIGHT_ATTACKS[sq] & pieces[KNIGHT]) |
+            (KING_ATTACKS[sq] & pieces[KING]) |
+            (PAWN_ATTACKS[them ^ 1][sq] & pieces[PAWN]) |
+            (rook_attacks(sq, occ) & (pieces[ROOK] | queens)) |
+            (bishop_attacks(sq, occ) & (pieces[BISHOP] | queens)))
+
+    def targets(self) -> Tuple[List[Tuple[int, int, bool]], List[Move]]:
+        """Legal moves as (from, target set, promotes) plus en passant and
+        castling moves listed one by one."""
+        pieces, colors = self.pieces, self.colors
+        us = 0 if self.white else 1
+        them = us ^ 1
+        own, enemy = colors[us], colors[them]
+        occ = own | enemy
+        king = (pieces[KING] & own).bit_length() - 1
+        checkers = self.attackers(king, them, occ)
+        out: List[Tuple[int, int, bool]] = []
+        special: List[Move] = []
+
+        without_king = occ ^ (1 << king)
+        king_targets = 0
+        for to in bits(KING_ATTACKS[king] & ~own):
+            if not self.attackers(to, them, without_king):
+                king_targets |= 1 << to
+        out.append((king, king_targets, False))
+        if checkers & (checkers - 1):
+            return out, special
+
+        mask = FULL & ~own
+        if checkers:
+            mask &= BETWEEN[king][checkers.bit_length() - 1] | checkers
+
+        queens = pieces[QUEEN]
+        pins: Dict[int, int] = {}
+        snipers = enemy & ((rook_attacks(king, 0) & (pieces[ROOK] | queens)) |
+                           (bishop_attacks(king, 0) & (pieces[BISHOP] | queens)))
+        for sniper in bits(snipers):
+            between = BETWEEN[king][sniper]
+            blockers = between & occ
+            if blockers and not blockers & (blockers - 1) and blockers & own:
+                pins[blockers.bit_length() - 1] = between | (1 << sniper)
+
+        for sq in bits(pieces[KNIGHT] & own):
+            if sq not in pins:
+                out.append((sq, KNIGHT_ATTACKS[sq] & mask, False))
+        for sq in bits((pieces[BISHOP] | queens) & own):
+            t = bishop_attacks(sq, occ) & mask
+            out.append((sq, t & pins[sq] if sq in pins else t, False))
+        for sq in bits((pieces[ROOK] | queens) & own):
+            t = rook_attacks(sq, occ) & mask
+            out.append((sq, t & pins[sq] if sq in pins else t, False))
+
+        push = 8 if us == 0 else -8
+        start_rank, last_rank = (1, 6) if us == 0 else (6, 1)
+        for sq in bits(pieces[PAWN] & own):
+            t = PAWN_ATTACKS[us][sq] & enemy
+            one = sq + push
+            if not occ >> one & 1:
+                t |= 1 << one
+                if sq >> 3 == start_rank and not occ >> (one + push) & 1:
+                    t |= 1 << (one + push)
+            t &= mask
+            if sq in pins:
+                t &= pins[sq]
+            out.append((sq, t, sq >> 3 == last_rank))
+            if self.ep >= 0 and PAWN_ATTACKS[us][sq] >> self.ep & 1:
+                captured = self.ep - push
+                after = occ ^ (1 << sq) ^ (1 << self.ep) ^ (1 << captured)
+                rest = enemy & ~(1 << captured)
+                if not rest & ((rook_attacks(king, after) & (pieces[ROOK] | queens)) |
+                               (bishop_attacks(king, after) & (pieces[BISHOP] | queens)) |
+                               (KNIGHT_ATTACKS[king] & pieces[KNIGHT]) |
+                               (PAWN_ATTACKS[us][king] & pieces[PAWN])):
+                    special.append(sq | self.ep << 6)
+
+        if not checkers:
+            for right, frm, to, rook, empty, crossed in CASTLING[us]:
+                if self.castling & right and not occ & empty and (pieces[ROOK] & own) >> rook & 1 and \
+                        not any(self.attackers(s, them, occ) for s in crossed):
+                    special.append(frm | to << 6)
+        return out, special
+
+    def legal_moves(self) -> List[Move]:
+        out, moves = self.targets()
+        for frm, t, promotes in out:
+            for to in bits(t):
+                if promotes:
+                    moves.extend(frm | to << 6 | promo << 12 for promo in (QUEEN, ROOK, BISHOP, KNIGHT))
+                else:
+                    moves.append(frm | to << 6)
+        return moves
+
+    def count_legal(self) -> int:
+        out, special = self.targets()
+        return len(special) + sum(t.bit_count() * (4 if promotes else 1) for _, t, promotes in out)
+
+    def make(self, move: Move) -> 'Position':
+        """The position after move, as a new Position."""
+        frm, to, promo = move & 63, move >> 6 & 63, move >> 12
+        pieces, colors = self.pieces[:], self.colors[:]
+        us = 0 if self.white else 1
+        from_bit, to_bit = 1 << frm, 1 << to
+        kind = self.piece_at(frm)
+        if colors[us ^ 1] & to_bit:
+            pieces[self.piece_at(to)] ^= to_bit
+            colors[us ^ 1] ^= to_bit
+        pieces[kind] ^= from_bit | to_bit
+        colors[us] ^= from_bit | to_bit
+        ep = -1
+        if kind == PAWN:
+            if to == self.ep:
+                captured = 1 << (to - 8 if us == 0 else to + 8)
+                pieces[PAWN] ^= captured
+                colors[us ^ 1] ^= captured
+            elif promo:
+                pieces[PAWN] ^= to_bit
+                pieces[promo] |= to_bit
+            elif frm - to in (16, -16):
+                ep = (frm + to) >> 1
+        elif kind == KING and frm - to in (2, -2):
+            rook = (1 << (frm + 3)) | (1 << (frm + 1)) if to > frm else (1 << (frm - 4)) | (1 << (frm - 1))
+            pieces[ROOK] ^= rook
+            colors[us] ^= rook
+        return Position(pieces, colors, not self.white, self.castling & CASTLING_MASK[frm] & CASTLING_MASK[to], ep)
+
+    def c64_move_count(self) -> int:
+        """Entries GenerateAllMoves adds to the C64 move list."""
+        pieces, colors = self.pieces, self.colors
+        us = 0 if self.white else 1
+        own, enemy = colors[us], colors[us ^ 1]
+        occ = own | enemy
+        empty = FULL & ~occ
+        pawns = pieces[PAWN] & own
+        last = RANK_8 if us == 0 else RANK_1
+        if us == 0:
+            single = pawns << 8 & empty
+            double = (single & (RANK_1 << 16)) << 8 & empty
+            captures = [(pawns & ~FILE_A) << 7, (pawns & ~FILE_H) << 9]
+        else:
+            single = pawns >> 8 & empty
+            double = (single & (RANK_1 << 40)) >> 8 & empty
+            captures = [(pawns & ~FILE_A) >> 9, (pawns & ~FILE_H) >> 7]
+        victims = enemy | (1 << self.ep if self.ep >= 0 else 0)
+        count = single.bit_count() + (single & last).bit_count() + double.bit_count()
+        for t in captures:
+            t &= victims
+            count += t.bit_count() + (t & last).bit_count()
+
+        not_own = FULL & ~own
+        queens = pieces[QUEEN]
+        for sq in bits(pieces[KNIGHT] & own):
+            count += (KNIGHT_ATTACKS[sq] & not_own).bit_count()
+        for sq in bits((pieces[BISHOP] | queens) & own):
+            count += (bishop_attacks(sq, occ) & not_own).bit_count()
+        for sq in bits((pieces[ROOK] | queens) & own):
+            count += (rook_attacks(sq, occ) & not_own).bit_count()
+        king = (pieces[KING] & own).bit_length() - 1
+        count += (KING_ATTACKS[king] & not_own).bit_count()
+        for right, frm, _, _, squares, _ in CASTLING[us]:
+            if king == frm and self.castling & right and not occ & squares:
+                count += 1
+        return count
+
+
+# =============================================================================
+# Perft
+# =============================================================================
+
+def perft(pos: Position, depth: int) -> int:
+    if depth <= 1:
+        return pos.count_legal() if depth == 1 else 1
+    return sum(perft(pos.make(move), depth - 1) for move in pos.legal_moves())
+
+
+def square_0x88(sq: int) -> int:
+    """Bitboard square (a1 = 0) to the engine's 0x88 index (a8 = $00)."""
+    return (7 - (sq >> 3)) * 16 + (sq & 7)
+
+
+def move_text(move: Move) -> str:
+    frm, to, promo = move & 63, move >> 6 & 63, move >> 12
+    name = ''.join('abcdefgh'[sq & 7] + str((sq >> 3) + 1) for sq in (frm, to))
+    return name + (' pnbrqk'[promo] if promo else '')
+
+
+def divide(pos: Position, depth: int) -> List[Tuple[Move, int]]:
+    return [(move, perft(pos.make(move), depth - 1)) for move in pos.legal_moves()]
+
+
+def run_suite(max_nodes: int) -> bool:
+    """Run each suite position to the deepest known count up to max_nodes."""
+    ok = True
+    total_nodes = 0
+    start = time.perf_counter()
+    for name, fen, counts in PERFT_SUITE:
+        pos = Position.from_fen(fen)
+        for depth, expected in enumerate(counts, 1):
+            if depth > 1 and expected > max_nodes:
+                break
+            t0 = time.perf_counter()
+            nodes = perft(pos, depth)
+            elapsed = time.perf_counter() - t0
+            total_nodes += nodes
+            status = 'ok' if nodes == expected else f'FAIL (expected {expected})'
+            ok &= nodes == expected
+            print(f"  {name:10s} depth {depth}  {nodes:9d}  {elapsed:7.2f}s  "
+                  f"{nodes / max(elapsed, 1e-9):9.0f} nodes/s  {status}")
+    elapsed = time.perf_counter() - start
+    print(f"{total_nodes} nodes in {elapsed:.2f}s ({total_nodes / max(elapsed, 1e-9):.0f} nodes/s)")
+    return ok
+
+
+# =============================================================================
+# Move List Scan
+# =============================================================================
+
+def book_fens(filename: str, max_ply: int) -> Iterator[str]:
+    """Positions reachable through a Polyglot book, breadth first."""
+    import chess
+    import chess.polyglot
+    from generate_book import decode_polyglot_move, read_polyglot_book
+
+    seen = set()
+    queue = deque([(chess.Board(), 0)])
+    with read_polyglot_book(filename) as book:
+        while queue:
+            board, ply = queue.popleft()
+            key = chess.polyglot.zobrist_hash(board)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield board.fen()
+            if ply >= max_ply:
+                continue
+            for move_bits, _ in book.lookup(key):
+                move = decode_polyglot_move(move_bits, board)
+                if board.is_castling(move) or move not in board.legal_moves:
+                    # Polyglot castles king-takes-rook
+                    move = next((m for m in board.legal_moves if board.is_castling(m)
+                                 and m.from_square == move.from_square
+                                 and (m.to_square > m.from_square) == (move.to_square > move.from_square)), None)
+                    if move is None:
+                        continue
+                child = board.copy(stack=False)
+                child.push(move)
+                queue.append((child, ply + 1))
+
+
+def pgn_fens(filename: str) -> Iterator[str]:
+    """Every position in the main line of every game (.gz read directly)."""
+    import chess.pgn
+
+    opener = gzip.open if filename.endswith('.gz') else open
+    with opener(filename, 'rt', errors='replace') as f:
+        while True:
+            game = chess.pgn.read_game(f)
+            if game is None:
+                break
+            board = game.board()
+            yield board.fen()
+            for move in game.mainline_moves():
+                board.push(move)
+                yield board.fen()
+
+
+def scan(fens: Iterator[str], top: int) -> int:
+    """Count the C64 move list for each distinct position; returns how many
+    overflow MAX_MOVES."""
+    seen = set()
+    largest: List[Tuple[int, int, str]] = []
+    overflows = 0
+    positions = 0
+    start = time.perf_counter()
+    for fen in fens:
+        key = ' '.join(fen.split()[:4])
+        if key in seen:
+            continue
+        seen.add(key)
+        pos = Position.from_fen(fen)
+        count = pos.c64_move_count()
+        positions += 1
+        if count > MAX_MOVES:
+            overflows += 1
+            print(f"  OVERFLOW {count} entries ({pos.count_legal()} legal): {key}")
+        if len(largest) < top:
+            heapq.heappush(largest, (count, pos.count_legal(), key))
+        elif count > largest[0][0]:
+            heapq.heapreplace(largest, (count, pos.count_legal(), key))
+        if positions % 100000 == 0:
+            print(f"  {positions} positions...")
+    elapsed = time.perf_counter() - start
+    print(f"Scanned {positions} positions in {elapsed:.2f}s ({positions / max(elapsed, 1e-9):.0f}/s)")
+    print(f"  {overflows} over MAX_MOVES ({MAX_MOVES})")
+    if largest:
+        print(f"  Longest move lists (C64 entries / legal moves):")
+        for count, legal, key in sorted(largest, reverse=True):
+            print(f"    {count:4d} / {legal:3d}  {key}")
+    return overflows
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Bitboard perft and C64 move list reference")
+    parser.add_argument('fens', nargs='*', help='Positions (FEN, default: start position)')
+    parser.add_argument('--file', help='Read FENs from a file, one per line')
+    parser.add_argument('--depth', type=int, default=4, help='Perft depth (default 4)')
+    parser.add_argument('--divide', action='store_true', help='Leaf counts per root move, 0x88 squares')
+    parser.add_argument('--suite', action='store_true', help='Run the standard perft positions')
+    parser.add_argument('--max-nodes', type=int, default=1000000,
+                        help='Deepest suite depth with at most this many leaves (default 1000000)')
+    parser.add_argument('--scan', action='store_true',
+                        help='Count the C64 move list of every position from --book, --pgn or --file')
+    parser.add_argument('--book', help='Polyglot book to walk for --scan')
+    parser.add_argument('--max-ply', type=int, default=20, help='Book depth for --scan (default 20)')
+    parser.add_argument('--pgn', help='PGN file (.pgn or .pgn.gz) for --scan')
+    parser.add_argument('--top', type=int, default=10, help='Longest move lists to list (default 10)')
+    args = parser.parse_args()
+
+    if args.suite:
+        print("Perft suite:")
+        sys.exit(0 if run_suite(args.max_nodes) else 1)
+
+    fens = list(args.fens)
+    if args.file:
+        fens += read_fens(args.file)
+
+    if args.scan:
+        sources: List[Iterator[str]] = []
+        if fens:
+            sources.append(iter(fens))
+        if args.book:
+            sources.append(book_fens(args.book, args.max_ply))
+        if args.pgn:
+            sources.append(pgn_fens(args.pgn))
+        if not sources:
+            parser.error("--scan needs positions: FENs, --file, --book or --pgn")
+        overflows = sum(scan(source, args.top) for source in sources)
+        sys.exit(1 if overflows else 0)
+
+    if args.depth < 1:
+        parser.error("--depth must be at least 1")
+    for fen in fens or [START_FEN]:
+        pos = Position.from_fen(fen)
+        print(f"{fen}  ({pos.c64_move_count()} C64 move list entries)")
+        start = time.perf_counter()
+        if args.divide:
+            results = divide(pos, args.depth)
+            for move, nodes in sorted(results, key=lambda r: (square_0x88(r[0] & 63), square_0x88(r[0] >> 6 & 63))):
+                frm, to = square_0x88(move & 63), square_0x88(move >> 6 & 63)
+                print(f"  ${frm:02X}-${to:02X}  {move_text(move):6s} {nodes}")
+            nodes = sum(n for _, n in results)
+        else:
+            nodes = perft(pos, args.depth)
+        elapsed = time.perf_counter() - start
+        print(f"  perft({args.depth}) = {nodes} in {elapsed:.2f}s ({nodes / max(elapsed, 1e-9):.0f} nodes/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,772 @@
+#!/usr/bin/env python3
+"""
+C64 Engine Cycle Profiler
+
+Runs one engine routine from main.prg on a cycle-counting NMOS 6502 core
+and reports where the cycles go:
+
+  flat profile   cycles and instructions per label: each executed address
+                 is charged to the nearest label at or below it
+  call graph     per JSR target: calls, self and total cycles, and the
+                 caller -> callee edges
+
+The call graph follows JSR/RTS through the 6502 stack. A tail call such as
+Negamax's `jmp Quiesce` stays in the caller's frame, as it would on a real
+profiler; the flat profile shows the cycles under Quiesce. Total cycles of
+a recursive routine count the outermost call only.
+
+Memory is 64K of flat RAM: the $01 banking LookupOpeningMove does (which
+sim6502 cannot follow) just works, and there are no I/O chips or
+interrupts, so anything waiting on a raster line or CIA timer runs until
+--max-cycles.
+
+main.prg and main.sym come from KickAssembler (-symbolfile). A board is set
+up from a FEN in Board88, currentplayer, castlerights, enpassantsq and the
+king squares, after the --setup routines (InitZobristTables by default)
+have run unprofiled:
+
+  c64_profile.py --routine FindBestMove --fen '...'
+  c64_profile.py --routine Negamax -a 3 --poke '$e8=$81' --poke '$e9=$7f' \\
+      --setup InitZobristTables --setup InitSearch --json negamax.json
+
+--self-test profiles a small hand-assembled PRG with a KickAssembler symbol
+file and checks the cycles, instructions and call graph against hand counts.
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from c64_search import C64Search
+
+
+# =============================================================================
+# Machine Parameters
+# =============================================================================
+
+CLOCK_HZ = {'pal': 985248, 'ntsc': 1022727}
+
+# RTS from the profiled routine lands here; the core stops on it
+RETURN_ADDRESS = 0xFFFF
+STACK_TOP = 0xFF
+
+WHITES_TURN = 0x01      # constants.asm
+BLACKS_TURN = 0x00
+
+# Status register bits
+FLAG_C = 0x01
+FLAG_Z = 0x02
+FLAG_I = 0x04
+FLAG_D = 0x08
+FLAG_B = 0x10
+FLAG_U = 0x20
+FLAG_V = 0x40
+FLAG_N = 0x80
+
+
+# =============================================================================
+# Opcode Table
+# =============================================================================
+
+# Addressing modes
+IMP, ACC, IMM, ZP, ZPX, ZPY, ABS, ABX, ABY, IND, IZX, IZY, REL = range(13)
+
+# opcode -> (mnemonic, mode, cycles, +1 cycle on a page crossing)
+OPCODES: Dict[int, Tuple[str, int, int, bool]] = {}
+
+
+def _define_opcodes() -> None:
+    # ORA/AND/EOR/ADC/STA/LDA/CMP/SBC share one layout from their base opcode
+    alu_modes = ((0x09, IMM, 2, False), (0x05, ZP, 3, False), (0x15, ZPX, 4, False),
+                 (0x0D, ABS, 4, False), (0x1D, ABX, 4, True), (0x19, ABY, 4, True),
+                 (0x01, IZX, 6, False), (0x11, IZY, 5, True))
+    for base, name in ((0x00, 'ORA'), (0x20, 'AND'), (0x40, 'EOR'), (0x60, 'ADC'),
+                       (0x80, 'STA'), (0xA0, 'LDA'), (0xC0, 'CMP'), (0xE0, 'SBC')):
+        for offset, mode, cycles, penalty in alu_modes:
+            if name == 'STA':
+                if mode == IMM:
+                    continue
+                if mode in (ABX, ABY, IZY):
+                    cycles, penalty = cycles + 1, False
+            OPCODES[base + offset] = (name, mode, cycles, penalty)
+
+    # Read-modify-write
+    for base, name in ((0x00, 'ASL'), (0x20, 'ROL'), (0x40, 'LSR'), (0x60, 'ROR'),
+                       (0xC0, 'DEC'), (0xE0, 'INC')):
+        if base < 0x80:
+            OPCODES[base + 0x0A] = (name, ACC, 2, False)
+        for offset, mode, cycles in ((0x06, ZP, 5), (0x16, ZPX, 6), (0x0E, ABS, 6), (0x1E, ABX, 7)):
+            OPCODES[base + offset] = (name, mode, cycles, False)
+
+    table = {
+        'LDX': ((0xA2, IMM, 2), (0xA6, ZP, 3), (0xB6, ZPY, 4), (0xAE, ABS, 4), (0xBE, ABY, 4)),
+        'LDY': ((0xA0, IMM, 2), (0xA4, ZP, 3), (0xB4, ZPX, 4), (0xAC, ABS, 4), (0xBC, ABX, 4)),
+        'STX': ((0x86, ZP, 3), (0x96, ZPY, 4), (0x8E, ABS, 4)),
+        'STY': ((0x84, ZP, 3), (0x94, ZPX, 4), (0x8C, ABS, 4)),
+        'CPX': ((0xE0, IMM, 2), (0xE4, ZP, 3), (0xEC, ABS, 4)),
+        'CPY': ((0xC0, IMM, 2), (0xC4, ZP, 3), (0xCC, ABS, 4)),
+        'BIT': ((0x24, ZP, 3), (0x2C, ABS, 4)),
+        'JMP': ((0x4C, ABS, 3), (0x6C, IND, 5)),
+        'JSR': ((0x20, ABS, 6),),
+        'RTS': ((0x60, IMP, 6),), 'RTI': ((0x40, IMP, 6),), 'BRK': ((0x00, IMP, 7),),
+        'PHA': ((0x48, IMP, 3),), 'PHP': ((0x08, IMP, 3),),
+        'PLA': ((0x68, IMP, 4),), 'PLP': ((0x28, IMP, 4),),
+    }
+    for name, entries in table.items():
+        for opcode, mode, cycles in entries:
+            OPCODES[opcode] = (name, mode, cycles, mode in (ABX, ABY) and name in ('LDX', 'LDY'))
+    for opcode, name in ((0x90, 'BCC'), (0xB0, 'BCS'), (0xF0, 'BEQ'), (0x30, 'BMI'),
+                         (0xD0, 'BNE'), (0x10, 'BPL'), (0x50, 'BVC'), (0x70, 'BVS')):
+        OPCODES[opcode] = (name, REL, 2, False)
+    for opcode, name in ((0x18, 'CLC'), (0xD8, 'CLD'), (0x58, 'CLI'), (0xB8, 'CLV'),
+                         (0x38, 'SEC'), (0xF8, 'SED'), (0x78, 'SEI'), (0xCA, 'DEX'),
+                         (0x88, 'DEY'), (0xE8, 'INX'), (0xC8, 'INY'), (0xEA, 'NOP'),
+                         (0xAA, 'TAX'), (0xA8, 'TAY'), (0xBA, 'TSX'), (0x8A, 'TXA'),
+                         (0x9A, 'TXS'), (0x98, 'TYA')):
+        OPCODES[opcode] = (name, IMP, 2, False)
+
+
+_define_opcodes()
+
+# Branch opcode -> (flag, branch when set)
+BRANCHES = {'BCC': (FLAG_C, False), 'BCS': (FLAG_C, True), 'BEQ': (FLAG_Z, True), 'BNE': (FLAG_Z, False),
+            'BMI': (FLAG_N, True), 'BPL': (FLAG_N, False), 'BVS': (FLAG_V, True), 'BVC': (FLAG_V, False)}
+
+FLAG_OPS = {'CLC': (FLAG_C, False), 'SEC': (FLAG_C, True), 'CLD': (FLAG_D, False), 'SED': (FLAG_D, True),
+            'CLI': (FLAG_I, False), 'SEI': (FLAG_I, True), 'CLV': (FLAG_V, False)}
+
+
+class CPUError(Exception):
+    pass
+
+
+# =============================================================================
+# 6502 Core
+# =============================================================================
+
+class CPU6502:
+    """NMOS 6502 with documented opcodes, decimal mode and exact cycle
+    counts (page crossings and taken branches included)."""
+
+    def __init__(self):
+        self.mem = bytearray(0x10000)
+        self.a = self.x = self.y = 0
+        self.sp = STACK_TOP
+        self.p = FLAG_U | FLAG_I
+        self.pc = 0
+        self.cycles = 0
+
+    def load_prg(self, data: bytes) -> int:
+        """Load a PRG (two-byte load address header); returns the address."""
+        address = data[0] | data[1] << 8
+        body = data[2:]
+        self.mem[address:address + len(body)] = body
+        return address
+
+    def _set_nz(self, value: int) -> None:
+        self.p = (self.p & ~(FLAG_N | FLAG_Z)) | (value & FLAG_N) | (0 if value else FLAG_Z)
+
+    def push(self, value: int) -> None:
+        self.mem[0x100 | self.sp] = value
+        self.sp = (self.sp - 1) & 0xFF
+
+    def pull(self) -> int:
+        self.sp = (self.sp + 1) & 0xFF
+        return self.mem[0x100 | self.sp]
+
+    def _address(self, mode: int, penalty: bool) -> Tuple[int, int]:
+        """Effective address and extra cycles; pc points past the opcode."""
+        mem, pc = self.mem, self.pc
+        if mode == ZP:
+            self.pc = pc + 1
+            return mem[pc], 0
+        if mode == ABS:
+            self.pc = pc + 2
+            return mem[pc] | mem[pc + 1] << 8, 0
+        if mode == IMM:
+            self.pc = pc + 1
+            return pc, 0
+        if mode in (ABX, ABY):
+            self.pc = pc + 2
+            base = mem[pc] | mem[pc + 1] << 8
+            address = (base + (self.x if mode == ABX else self.y)) & 0xFFFF
+            return address, 1 if penalty and (base ^ address) & 0xFF00 else 0
+        if mode == ZPX:
+            self.pc = pc + 1
+            return (mem[pc] + self.x) & 0xFF, 0
+        if mode == ZPY:
+            self.pc = pc + 1
+            return (mem[pc] + self.y) & 0xFF, 0
+        if mode == IZY:
+            self.pc = pc + 1
+            zp = mem[pc]
+            base = mem[zp] | mem[(zp + 1) & 0xFF] << 8
+            address = (base + self.y) & 0xFFFF
+            return address, 1 if penalty and (base ^ address) & 0xFF00 else 0
+        if mode == IZX:
+            self.pc = pc + 1
+            zp = (mem[pc] + self.x) & 0xFF
+            return mem[zp] | mem[(zp + 1) & 0xFF] << 8, 0
+        if mode == IND:
+            self.pc = pc + 2
+            pointer = mem[pc] | mem[pc + 1] << 8
+            # NMOS bug: the high byte comes from the same page
+            return mem[pointer] | mem[(pointer & 0xFF00) | ((pointer + 1) & 0xFF)] << 8, 0
+        raise CPUError(f"bad addressing mode {mode}")
+
+    def _adc(self, m: int) -> None:
+        a, carry = self.a, self.p & FLAG_C
+        total = a + m + carry
+        p = self.p & ~(FLAG_N | FLAG_V | FLAG_Z | FLAG_C)
+        if total & 0xFF == 0:
+            p |= FLAG_Z
+        if self.p & FLAG_D:
+            lo = (a & 0x0F) + (m & 0x0F) + carry
+            if lo > 9:
+                lo += 6
+            hi = (a >> 4) + (m >> 4) + (lo > 0x0F)
+            p |= (hi << 4) & FLAG_N
+            if ~(a ^ m) & (a ^ (hi << 4)) & 0x80:
+                p |= FLAG_V
+            if hi > 9:
+                hi += 6
+            if hi > 0x0F:
+                p |= FLAG_C
+            self.a = ((hi << 4) | (lo & 0x0F)) & 0xFF
+        else:
+            if ~(a ^ m) & (a ^ total) & 0x80:
+                p |= FLAG_V
+            if total > 0xFF:
+                p |= FLAG_C
+            self.a = total & 0xFF
+            p |= self.a & FLAG_N
+        self.p = p
+
+    def _sbc(self, m: int) -> None:
+        a, borrow = self.a, 1 - (self.p & FLAG_C)
+        total = a - m - borrow
+        result = total & 0xFF
+        p = self.p & ~(FLAG_N | FLAG_V | FLAG_Z | FLAG_C)
+        p |= (result & FLAG_N) | (0 if result else FLAG_Z)
+        if (a ^ m) & (a ^ total) & 0x80:
+            p |= FLAG_V
+        if total >= 0:
+            p |= FLAG_C
+        if self.p & FLAG_D:
+            lo = (a & 0x0F) - (m & 0x0F) - borrow
+            hi = (a >> 4) - (m >> 4)
+            if lo < 0:
+                lo -= 6
+                hi -= 1
+            if hi < 0:
+                hi -= 6
+            result = ((hi << 4) | (lo & 0x0F)) & 0xFF
+        self.a = result
+        self.p = p
+
+    def _compare(self, register: int, m: int) -> None:
+        self._set_nz((register - m) & 0xFF)
+        self.p = self.p | FLAG_C if register >= m else self.p & ~FLAG_C
+
+    def _shift(self, name: str, value: int) -> int:
+        carry = self.p & FLAG_C
+        if name == 'ASL':
+            out, value = value & 0x80, (value << 1) & 0xFF
+        elif name == 'LSR':
+            out, value = value & 0x01, value >> 1
+        elif name == 'ROL':
+            out, value = value & 0x80, ((value << 1) | carry) & 0xFF
+        else:
+            out, value = value & 0x01, (value >> 1) | (carry << 7)
+        self.p = self.p | FLAG_C if out else self.p & ~FLAG_C
+        self._set_nz(value)
+        return value
+
+    def step(self) -> int:
+        """Execute one instruction; returns its cycles."""
+        mem = self.mem
+        opcode = mem[self.pc]
+        entry = OPCODES.get(opcode)
+        if entry is None:
+            raise CPUError(f"illegal opcode ${opcode:02X} at ${self.pc:04X}")
+        name, mode, cycles, penalty = entry
+        self.pc = (self.pc + 1) & 0xFFFF
+
+        if mode == IMP or mode == ACC:
+            if mode == ACC:
+                self.a = self._shift(name, self.a)
+            elif name in FLAG_OPS:
+                flag, value = FLAG_OPS[name]
+                self.p = self.p | flag if value else self.p & ~flag
+            elif name == 'RTS':
+                lo = self.pull()
+                self.pc = ((self.pull() << 8 | lo) + 1) & 0xFFFF
+            elif name == 'PHA':
+                self.push(self.a)
+            elif name == 'PLA':
+                self.a = self.pull()
+                self._set_nz(self.a)
+            elif name == 'PHP':
+                self.push(self.p | FLAG_B | FLAG_U)
+            elif name == 'PLP':
+                self.p = (self.pull() & ~FLAG_B) | FLAG_U
+            elif name in ('INX', 'DEX', 'INY', 'DEY'):
+                delta = 1 if name[0] == 'I' else -1
+                if name[2] == 'X':
+                    self.x = (self.x + delta) & 0xFF
+                    self._set_nz(self.x)
+                else:
+                    self.y = (self.y + delta) & 0xFF
+                    self._set_nz(self.y)
+            elif name in ('TAX', 'TAY', 'TXA', 'TYA', 'TSX'):
+                value = self.sp if name == 'TSX' else getattr(self, name[1].lower())
+                setattr(self, name[2].lower(), value)
+                self._set_nz(value)
+            elif name == 'TXS':
+                self.sp = self.x
+            elif name == 'RTI':
+                self.p = (self.pull() & ~FLAG_B) | FLAG_U
+                lo = self.pull()
+                self.pc = self.pull() << 8 | lo
+            elif name == 'BRK':
+                raise CPUError(f"BRK at ${(self.pc - 1) & 0xFFFF:04X}")
+            self.cycles += cycles
+            return cycles
+
+        if mode == REL:
+            offset = mem[self.pc]
+            self.pc = (self.pc + 1) & 0xFFFF
+            flag, when_set = BRANCHES[name]
+            if bool(self.p & flag) == when_set:
+                target = (self.pc + offset - (0x100 if offset & 0x80 else 0)) & 0xFFFF
+                cycles += 2 if (target ^ self.pc) & 0xFF00 else 1
+                self.pc = target
+            self.cycles += cycles
+            return cycles
+
+        address, extra = self._address(mode, penalty)
+        cycles += extra
+        if name == 'LDA':
+            self.a = mem[address]
+            self._set_nz(self.a)
+        elif name == 'STA':
+            mem[address] = self.a
+        elif name == 'JSR':
+            return_address = (self.pc - 1) & 0xFFFF
+            self.push(return_address >> 8)
+            self.push(return_address & 0xFF)
+            self.pc = address
+        elif name == 'JMP':
+            self.pc = address
+        elif name in ('ORA', 'AND', 'EOR'):
+            m = mem[address]
+            self.a = self.a | m if name == 'ORA' else self.a & m if name == 'AND' else self.a ^ m
+            self._set_nz(self.a)
+        elif name == 'ADC':
+            self._adc(mem[address])
+        elif name == 'SBC':
+            self._sbc(mem[address])
+        elif name == 'CMP':
+            self._compare(self.a, mem[address])
+        elif name == 'CPX':
+            self._compare(self.x, mem[address])
+        elif name == 'CPY':
+            self._compare(self.y, mem[address])
+        elif name == 'LDX':
+            self.x = mem[address]
+            self._set_nz(self.x)
+        elif name == 'LDY':
+            self.y = mem[address]
+            self._set_nz(self.y)
+        elif name == 'STX':
+            mem[address] = self.x
+        elif name == 'STY':
+            mem[address] = self.y
+        elif name in ('INC', 'DEC'):
+            value = (mem[address] + (1 if name == 'INC' else -1)) & 0xFF
+            mem[address] = value
+            self._set_nz(value)
+        elif name == 'BIT':
+            m = mem[address]
+            self.p = (self.p & ~(FLAG_N | FLAG_V | FLAG_Z)) | (m & (FLAG_N | FLAG_V)) | \
+                (0 if self.a & m else FLAG_Z)
+        else:
+            mem[address] = self._shift(name, mem[address])
+        self.cycles += cycles
+        return cycles
+
+
+# =============================================================================
+# Symbols
+# =============================================================================
+
+LABEL_RE = re.compile(r'^\s*\.label\s+([\w.]+)\s*=\s*(\$[0-9A-Fa-f]+|\d+)')
+NAMESPACE_RE = re.compile(r'^\s*\.namespace\s+(\w+)\s*\{')
+
+
+def parse_number(text: str) -> int:
+    text = text.strip()
+    if text.startswith('$'):
+        return int(text[1:], 16)
+    if text.lower().startswith('0x'):
+        return int(text, 16)
+    return int(text)
+
+
+def load_symbols(filename: str) -> Dict[str, int]:
+    """Labels from a KickAssembler symbol file; labels in a .namespace
+    block get the namespace as a prefix."""
+    symbols: Dict[str, int] = {}
+    namespaces: List[str] = []
+    with open(filename) as f:
+        for line in f:
+            m = NAMESPACE_RE.match(line)
+            if m:
+                namespaces.append(m.group(1))
+                continue
+            if line.strip() == '}' and namespaces:
+                namespaces.pop()
+                continue
+            m = LABEL_RE.match(line)
+            if m:
+                symbols['.'.join(namespaces + [m.group(1)])] = parse_number(m.group(2))
+    return symbols
+
+
+def resolve(expr: str, symbols: Dict[str, int]) -> int:
+    """An address: a number ($hex, 0x hex or decimal) or Label[+/-offset]."""
+    m = re.fullmatch(r'\s*([^+-]+?)\s*(?:([+-])\s*(\S+))?\s*', expr)
+    if not m:
+        raise ValueError(f"bad address: {expr}")
+    base, sign, offset = m.groups()
+    value = symbols[base] if base in symbols else parse_number(base)
+    if offset:
+        value += parse_number(offset) * (1 if sign == '+' else -1)
+    return value & 0xFFFF
+
+
+class LabelMap:
+    """Address -> nearest label at or below it."""
+
+    def __init__(self, symbols: Dict[str, int]):
+        by_address: Dict[int, str] = {}
+        for name, address in symbols.items():
+            # Prefer the shortest (least nested) name for an address
+            if address not in by_address or len(name) < len(by_address[address]):
+                by_address[address] = name
+        self.addresses = sorted(by_address)
+        self.names = [by_address[a] for a in self.addresses]
+
+    def name(self, address: int, exact: bool = False) -> str:
+        i = bisect.bisect_right(self.addresses, address) - 1
+        if i < 0:
+            return f"${address:04X}"
+        if exact and self.addresses[i] != address:
+            return f"{self.names[i]}+{address - self.addresses[i]}"
+        return self.names[i]
+
+
+# =============================================================================
+# Profiler
+# =============================================================================
+
+@dataclass
+class FunctionStats:
+    name: str
+    calls: int = 0
+    self_cycles: int = 0
+    total_cycles: int = 0
+
+
+@dataclass
+class Profile:
+    routine: str
+    cycles: int
+    instructions: int
+    seconds: Dict[str, float]
+    flat: List[Dict] = field(default_factory=list)
+    functions: List[Dict] = field(default_factory=list)
+    edges: List[Dict] = field(default_factory=list)
+
+
+def run_routine(cpu: CPU6502, address: int, max_cycles: int) -> None:
+    """Call a routine to its RTS without profiling (setup code)."""
+    cpu.push(RETURN_ADDRESS - 1 >> 8)
+    cpu.push(RETURN_ADDRESS - 1 & 0xFF)
+    cpu.pc = address
+    limit = cpu.cycles + max_cycles
+    while cpu.pc != RETURN_ADDRESS:
+        cpu.step()
+        if cpu.cycles > limit:
+            raise CPUError(f"no RTS after {max_cycles} cycles")
+
+
+def profile_routine(cpu: CPU6502, address: int, labels: LabelMap, max_cycles: int, repeat: int = 1):
+    """Call a routine repeat times and profile it. Returns per-address
+    (cycles, instructions), per-function stats and edges keyed by
+    (caller, callee) with [calls, cycles]."""
+    address_cycles = [0] * 0x10000
+    address_count = [0] * 0x10000
+    functions: Dict[int, FunctionStats] = {}
+    edges: Dict[Tuple[int, int], List[int]] = {}
+    active: Dict[int, int] = {}
+
+    def enter(target: int, sp: int, caller: Optional[int]) -> list:
+        stats = functions.get(target)
+        if stats is None:
+            stats = functions[target] = FunctionStats(labels.name(target, exact=True))
+        stats.calls += 1
+        active[target] = active.get(target, 0) + 1
+        if caller is not None:
+            edge = edges.setdefault((caller, target), [0, 0])
+            edge[0] += 1
+        # [function, entry cycles, cycles in callees, SP before the JSR, caller]
+        return [target, cpu.cycles, 0, sp, caller]
+
+    def leave(frame: list) -> None:
+        target, entry, children, _, caller = frame
+        total = cpu.cycles - entry
+        stats = functions[target]
+        stats.self_cycles += total - children
+        active[target] -= 1
+        if not active[target]:
+            stats.total_cycles += total
+        if caller is not None:
+            edges[(caller, target)][1] += total
+        if stack:
+            stack[-1][2] += total
+
+    step = cpu.step
+    mem = cpu.mem
+    limit = cpu.cycles + max_cycles
+    for _ in range(repeat):
+        cpu.push(RETURN_ADDRESS - 1 >> 8)
+        cpu.push(RETURN_ADDRESS - 1 & 0xFF)
+        cpu.pc = address
+        stack = [enter(address, (cpu.sp + 2) & 0xFF, None)]
+        while cpu.pc != RETURN_ADDRESS:
+            pc = cpu.pc
+            opcode = mem[pc]
+            sp = cpu.sp
+            cycles = step()
+            address_cycles[pc] += cycles
+            address_count[pc] += 1
+            if opcode == 0x20:
+                stack.append(enter(cpu.pc, sp, stack[-1][0] if stack else None))
+            elif opcode == 0x60:
+                # Pop frames whose return address this RTS consumed
+                while stack and cpu.sp >= stack[-1][3] and sp < stack[-1][3]:
+                    leave(stack.pop())
+            if cpu.cycles > limit:
+                raise CPUError(f"no RTS after {max_cycles} cycles (at ${cpu.pc:04X})")
+    return address_cycles, address_count, functions, edges
+
+
+def build_profile(routine: str, cpu_cycles: int, labels: LabelMap, address_cycles, address_count,
+                  functions: Dict[int, FunctionStats], edges, top: int) -> Profile:
+    flat: Dict[str, List[int]] = {}
+    for address in range(0x10000):
+        if address_count[address]:
+            row = flat.setdefault(labels.name(address), [0, 0])
+            row[0] += address_cycles[address]
+            row[1] += address_count[address]
+    instructions = sum(row[1] for row in flat.values())
+    profile = Profile(routine, cpu_cycles, instructions,
+                      {clock: cpu_cycles / hz for clock, hz in CLOCK_HZ.items()})
+    for name, (cycles, count) in sorted(flat.items(), key=lambda item: -item[1][0])[:top]:
+        profile.flat.append({'label': name, 'cycles': cycles, 'instructions': count,
+                             'percent': 100.0 * cycles / max(cpu_cycles, 1)})
+    for stats in sorted(functions.values(), key=lambda s: -s.total_cycles)[:top]:
+        row = asdict(stats)
+        row['cycles_per_call'] = stats.total_cycles / max(stats.calls, 1)
+        profile.functions.append(row)
+    for (caller, callee), (calls, cycles) in sorted(edges.items(), key=lambda item: -item[1][1])[:top]:
+        profile.edges.append({'caller': functions[caller].name, 'callee': functions[callee].name,
+                              'calls': calls, 'cycles': cycles})
+    return profile
+
+
+def print_profile(profile: Profile, clock: str) -> None:
+    total = max(profile.cycles, 1)
+    print(f"{profile.routine}: {profile.cycles} cycles, {profile.instructions} instructions, "
+          f"{profile.seconds[clock] * 1000:.1f} ms ({clock.upper()})")
+    print("Flat profile:")
+    print(f"  {'Cycles':>11}  {'%':>5}  {'Instrs':>9}  Label")
+    for row in profile.flat:
+        print(f"  {row['cycles']:11d}  {row['percent']:5.1f}  {row['instructions']:9d}  {row['label']}")
+    print("Call graph:")
+    print(f"  {'Calls':>8}  {'Self':>11}  {'Self%':>5}  {'Total':>11}  {'Total%':>6}  {'Per call':>9}  Routine")
+    for row in profile.functions:
+        print(f"  {row['calls']:8d}  {row['self_cycles']:11d}  {100.0 * row['self_cycles'] / total:5.1f}  "
+              f"{row['total_cycles']:11d}  {100.0 * row['total_cycles'] / total:6.1f}  "
+              f"{row['cycles_per_call']:9.0f}  {row['name']}")
+    print("Call edges:")
+    for row in profile.edges:
+        print(f"  {row['calls']:8d}  {row['cycles']:11d}  {row['caller']} -> {row['callee']}")
+
+
+# =============================================================================
+# Board Setup
+# =============================================================================
+
+def setup_board(cpu: CPU6502, symbols: Dict[str, int], fen: str) -> None:
+    """Write a FEN into Board88 and the game state variables (storage.asm)."""
+    position = C64Search()
+    position.set_fen(fen)
+    board = symbols['Board88']
+    cpu.mem[board:board + len(position.board)] = position.board
+    cpu.mem[symbols['currentplayer']] = WHITES_TURN if position.white else BLACKS_TURN
+    cpu.mem[symbols['castlerights']] = position.castlerights
+    cpu.mem[symbols['enpassantsq']] = position.enpassantsq
+    cpu.mem[symbols['whitekingsq']] = position.whitekingsq
+    cpu.mem[symbols['blackkingsq']] = position.blackkingsq
+
+
+# =============================================================================
+# Self Test
+# =============================================================================
+
+# Main calls Sub three times; Sub counts Y down from 2. Cycle counts from the
+# NMOS 6502 tables, with the JSR charged to the caller:
+#   Main     LDX #3 (2) + 3 x (JSR 6 + DEX 2) + BNE 3+3+2 + RTS 6  = 40
+#   Sub      LDY #2 (2)                                   x 3 calls =  6
+#   SubLoop  DEY 2+2 + BNE 3+2 + RTS 6 = 15               x 3 calls = 45
+SELF_TEST_PRG = bytes([
+    0x00, 0x10,                     # Load address $1000
+    0xA2, 0x03,                     # $1000 Main:     ldx #3
+    0x20, 0x10, 0x10,               # $1002 !loop:    jsr Sub
+    0xCA,                           # $1005           dex
+    0xD0, 0xFA,                     # $1006           bne !loop-
+    0x60,                           # $1008           rts
+    0xEA, 0xEA, 0xEA, 0xEA, 0xEA, 0xEA, 0xEA,
+    0xA0, 0x02,                     # $1010 Sub:      ldy #2
+    0x88,                           # $1012 SubLoop:  dey
+    0xD0, 0xFD,                     # $1013           bne SubLoop
+    0x60,                           # $1015           rts
+])
+SELF_TEST_SYM = """.label Main=$1000
+.namespace Helpers {
+  .label Sub=$1010
+  .label SubLoop=$1012
+}
+"""
+SELF_TEST_FLAT = {'Main': (40, 11), 'Helpers.Sub': (6, 3), 'Helpers.SubLoop': (45, 15)}
+SELF_TEST_FUNCTIONS = {'Main': (1, 40, 91), 'Helpers.Sub': (3, 51, 51)}
+SELF_TEST_EDGES = {('Main', 'Helpers.Sub'): (3, 51)}
+
+
+def self_test() -> List[str]:
+    """Profile SELF_TEST_PRG through the same loaders as main(); returns
+    the mismatches (empty if the profiler is right)."""
+    with tempfile.TemporaryDirectory() as directory:
+        sym = os.path.join(directory, 'self_test.sym')
+        with open(sym, 'w') as f:
+            f.write(SELF_TEST_SYM)
+        symbols = load_symbols(sym)
+    labels = LabelMap(symbols)
+    cpu = CPU6502()
+    cpu.load_prg(SELF_TEST_PRG)
+    address_cycles, address_count, functions, edges = profile_routine(
+        cpu, resolve('Main', symbols), labels, 10_000)
+    profile = build_profile('Main', cpu.cycles, labels, address_cycles, address_count, functions, edges, 25)
+
+    errors = []
+    if profile.cycles != 91:
+        errors.append(f"total: {profile.cycles} cycles, expected 91")
+    flat = {row['label']: (row['cycles'], row['instructions']) for row in profile.flat}
+    if flat != SELF_TEST_FLAT:
+        errors.append(f"flat profile: {flat}, expected {SELF_TEST_FLAT}")
+    calls = {row['name']: (row['calls'], row['self_cycles'], row['total_cycles']) for row in profile.functions}
+    if calls != SELF_TEST_FUNCTIONS:
+        errors.append(f"call graph: {calls}, expected {SELF_TEST_FUNCTIONS}")
+    found = {(row['caller'], row['callee']): (row['calls'], row['cycles']) for row in profile.edges}
+    if found != SELF_TEST_EDGES:
+        errors.append(f"call edges: {found}, expected {SELF_TEST_EDGES}")
+    return errors
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Cycle-profile an engine routine on a 6502 core")
+    parser.add_argument('--prg', default='main.prg', help='Program to load (default main.prg)')
+    parser.add_argument('--sym', default='main.sym', help='KickAssembler symbol file (default main.sym)')
+    parser.add_argument('--routine', help='Label or address to call')
+    parser.add_argument('--fen', help='Board to set up before the call')
+    parser.add_argument('--setup', action='append',
+                        help='Routine to call first, unprofiled (repeatable, default InitZobristTables)')
+    parser.add_argument('--poke', action='append', default=[], metavar='ADDR=VALUE',
+                        help='Write a byte before the call, e.g. $e8=$81 or SearchDepth=0 (repeatable)')
+    parser.add_argument('-a', default='0', help='A register on entry')
+    parser.add_argument('-x', default='0', help='X register on entry')
+    parser.add_argument('-y', default='0', help='Y register on entry')
+    parser.add_argument('--repeat', type=int, default=1, help='Calls to profile (default 1)')
+    parser.add_argument('--max-cycles', type=int, default=200_000_000,
+                        help='Give up after this many cycles (default 200000000)')
+    parser.add_argument('--top', type=int, default=25, help='Rows per table (default 25)')
+    parser.add_argument('--clock', choices=sorted(CLOCK_HZ), default='pal', help='Clock for timings')
+    parser.add_argument('--json', metavar='FILE', help='Write the profile as JSON')
+    parser.add_argument('--self-test', action='store_true',
+                        help='Profile a small built-in program against hand-counted cycles and exit')
+    args = parser.parse_args()
+
+    if args.self_test:
+        errors = self_test()
+        for error in errors:
+            print(f"  {error}")
+        print(f"Self test {'failed' if errors else 'passed'}: flat profile, call graph and edges "
+              f"of a 91-cycle program")
+        sys.exit(1 if errors else 0)
+    if not args.routine:
+        parser.error("--routine is required (or --self-test)")
+
+    symbols = load_symbols(args.sym)
+    labels = LabelMap(symbols)
+    cpu = CPU6502()
+    with open(args.prg, 'rb') as f:
+        cpu.load_prg(f.read())
+
+    try:
+        for name in args.setup if args.setup is not None else ['InitZobristTables']:
+            if name:
+                run_routine(cpu, resolve(name, symbols), args.max_cycles)
+        if args.fen:
+            setup_board(cpu, symbols, args.fen)
+        for poke in args.poke:
+            target, _, value = poke.partition('=')
+            cpu.mem[resolve(target, symbols)] = parse_number(value) & 0xFF
+        cpu.a, cpu.x, cpu.y = (parse_number(v) & 0xFF for v in (args.a, args.x, args.y))
+
+        address = resolve(args.routine, symbols)
+        start_cycles = cpu.cycles
+        start = time.perf_counter()
+        address_cycles, address_count, functions, edges = profile_routine(
+            cpu, address, labels, args.max_cycles, args.repeat)
+        elapsed = time.perf_counter() - start
+    except CPUError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    cycles = cpu.cycles - start_cycles
+    profile = build_profile(args.routine, cycles, labels, address_cycles, address_count,
+                            functions, edges, args.top)
+    print_profile(profile, args.clock)
+    print(f"Simulated in {elapsed:.2f}s ({cycles / max(elapsed, 1e-9):.0f} cycles/s)")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(asdict(profile), f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()
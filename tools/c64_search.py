@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+C64 Search Reference
+
+A Python port of FindBestMove: Negamax and Quiesce from ai/search.asm over the
+move generator in ai/movegen.asm, scoring leaves with the EvaluatePosition
+port in c64_eval.py. It works on the engine's own state (Board88,
+castlerights, enpassantsq, the king squares, SearchDepth and SearchSide) and
+keeps its arithmetic:
+
+  - scores are signed bytes and negation wraps, so -(-128) = -128: with
+    FindBestMove's window (-128, 127) the first root move is searched with
+    (-127, -128), every depth 1 root move scores -128, and the iteration
+    stops there (see below)
+  - Evaluate clamps EvalScore to +-120; mate is -MATE_SCORE at any ply
+  - a move is "better" when score >= best, so later moves win ties; since a
+    child that fails high returns exactly beta, a root move that fails low
+    ties with alpha and takes over BestMove (the score is not affected)
+  - moves are generated in Board88 order, captures sorted by the unsigned
+    byte victim*8 - attacker, killers (two per SearchDepth) moved to the
+    front of the quiet moves
+  - Quiesce stands pat, searches legal captures (not en passant) and stops
+    at MAX_QUIESCE_DEPTH
+  - iterative deepening stops once the score is >= MATE_SCORE - 10 compared
+    unsigned, which includes every negative score
+
+Not modelled: the transposition table (TTClear runs before every search, but
+TTStore marks cutoff scores EXACT, so the engine can reuse a bound as a
+score), the time budget, and two state bugs - Quiesce keeps its alpha, beta
+and current move in globals that a recursive call overwrites, and UndoStack
+and NegamaxState hold MAX_DEPTH plies. Here every Quiesce call keeps its own
+state and the stacks grow as needed.
+
+find_best_move() mirrors FindBestMove, quirks included. search() runs one
+Negamax at a fixed depth with the window (-127, 127), which never wraps, and
+is what the book tools use to score positions.
+"""
+
+import argparse
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from c64_eval import (
+    BISHOP, EMPTY_PIECE, KING, KNIGHT, OFFBOARD_MASK, PAWN, QUEEN, ROOK,
+    TYPE_MASK, WHITE_COLOR, EvalParams, board88_from_fen, evaluate,
+    find_king, load_eval_params, read_fens,
+)
+from c64_zobrist import CASTLE_BK, CASTLE_BQ, CASTLE_WK, CASTLE_WQ
+
+
+# =============================================================================
+# Engine Constants (constants.asm, ai/search.asm, ai/movegen.asm)
+# =============================================================================
+
+MATE_SCORE = 120
+DRAW_SCORE = 0
+NEG_INFINITY = -128         # $80
+POS_INFINITY = 127          # $7F, FindBestMove's beta
+MAX_DEPTH = 8
+MAX_KILLER_DEPTH = 16
+MAX_QUIESCE_DEPTH = 6
+EVAL_CLAMP = 120            # Evaluate clamps EvalScore to +-120
+
+NO_EN_PASSANT = 0xFF
+PROMO_FLAG_KNIGHT = 0x80    # Bit 7 of the to square: promote to a knight
+SQUARE_MASK = 0x7F
+
+UNDO_FLAG_CASTLING = 0x01
+UNDO_FLAG_EP_CAPTURE = 0x02
+UNDO_FLAG_PROMOTION = 0x04
+
+# TT flags (ai/tt.asm)
+TT_FLAG_EXACT = 0
+TT_FLAG_ALPHA = 1           # Upper bound: every move failed low
+TT_FLAG_BETA = 2            # Lower bound: a move failed high
+
+# Direction tables from storage.asm, in the order the generators walk them
+ORTHOGONAL_OFFSETS = (-16, 16, -1, 1)
+DIAGONAL_OFFSETS = (-17, -15, 15, 17)
+ALL_DIRECTION_OFFSETS = (-17, -16, -15, -1, 1, 15, 16, 17)
+KNIGHT_OFFSETS = (-33, -31, -18, -14, 14, 18, 31, 33)
+PAWN_CAPTURE_OFFSETS = {True: (-17, -15), False: (15, 17)}
+
+MVV_LVA_VALUES = (0, 10, 32, 33, 50, 90, 0)
+
+# Castling: (king from, king to, rook from, rook to, castlerights bit)
+CASTLING_MOVES = {
+    True: ((0x74, 0x76, 0x77, 0x75, CASTLE_WK), (0x74, 0x72, 0x70, 0x73, CASTLE_WQ)),
+    False: ((0x04, 0x06, 0x07, 0x05, CASTLE_BK), (0x04, 0x02, 0x00, 0x03, CASTLE_BQ)),
+}
+# Squares that must be empty, per castling move above
+CASTLING_EMPTY = {
+    0x76: (0x75, 0x76), 0x72: (0x71, 0x72, 0x73),
+    0x06: (0x05, 0x06), 0x02: (0x01, 0x02, 0x03),
+}
+# A rook leaving or being captured on these squares clears the right
+ROOK_CORNER_RIGHTS = {0x00: CASTLE_BQ, 0x07: CASTLE_BK, 0x70: CASTLE_WQ, 0x77: CASTLE_WK}
+
+Move = Tuple[int, int]      # (from, to) as in MoveListFrom / MoveListTo
+
+# Board88, SearchSide is white, castlerights, enpassantsq
+PositionId = Tuple[bytes, bool, int, int]
+
+# Where Negamax calls TTProbe and TTStore (see C64Search.trace):
+#   ('probe', position, depth, alpha, beta)
+#   ('store', position, depth, flag, score)
+# flag is the bound the score really is; the engine stores TT_FLAG_EXACT
+TraceEvent = Tuple
+
+
+def neg8(score: int) -> int:
+    """Two's complement negation of a signed byte (eor #$FF / adc #$01)."""
+    return -score if score != NEG_INFINITY else NEG_INFINITY
+
+
+def square_name(sq: int) -> str:
+    sq &= SQUARE_MASK
+    return 'abcdefgh'[sq & 7] + str(8 - (sq >> 4))
+
+
+# =============================================================================
+# Search State
+# =============================================================================
+
+@dataclass
+class SearchResult:
+    score: int                  # IterScore, from the side to move
+    best_move: Optional[Move]   # BestMoveFrom / BestMoveTo (None: no legal moves)
+    depth: int                  # Last completed iteration
+    nodes: int                  # Negamax and Quiesce calls
+
+
+class C64Search:
+    """The engine's search state and routines, one method per assembly routine."""
+
+    def __init__(self, params: Optional[EvalParams] = None):
+        self.params = params or load_eval_params()
+        self.board = bytearray([EMPTY_PIECE] * 128)
+        self.white = True           # SearchSide == WHITE_COLOR
+        self.castlerights = 0
+        self.enpassantsq = NO_EN_PASSANT
+        self.whitekingsq = 0
+        self.blackkingsq = 0
+        self.search_depth = 0
+        self.quiesce_depth = 0
+        self.undo: List[Tuple[int, int, int, int, int, int]] = []
+        self.killers = [[(0, 0), (0, 0)] for _ in range(MAX_KILLER_DEPTH)]
+        self.best_move: Optional[Move] = None
+        self.nodes = 0
+        self.trace: Optional[List[TraceEvent]] = None   # Set to a list to record TT calls
+
+    def set_fen(self, fen: str) -> None:
+        """Load a position. The en passant field is taken as enpassantsq
+        whether or not a capture is possible, as MakeMove sets it."""
+        fields = fen.split()
+        self.board = board88_from_fen(fen)
+        self.white = len(fields) < 2 or fields[1] == 'w'
+        castling = fields[2] if len(fields) > 2 else '-'
+        self.castlerights = sum(bit for letter, bit in zip('KQkq', (CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ))
+                                if letter in castling)
+        ep = fields[3] if len(fields) > 3 else '-'
+        self.enpassantsq = NO_EN_PASSANT if ep == '-' else (8 - int(ep[1])) * 16 + 'abcdefgh'.index(ep[0])
+        self.whitekingsq = find_king(self.board, True)
+        self.blackkingsq = find_king(self.board, False)
+        self.search_depth = 0
+
+    def position_id(self) -> PositionId:
+        return bytes(self.board), self.white, self.castlerights, self.enpassantsq
+
+    # -------------------------------------------------------------------------
+    # Move generation (ai/movegen.asm)
+    # -------------------------------------------------------------------------
+
+    def _is_enemy(self, piece: int, white: bool) -> bool:
+        return piece != EMPTY_PIECE and bool(piece & WHITE_COLOR) != white
+
+    def _add_pawn_move(self, moves: List[Move], frm: int, to: int, white: bool) -> None:
+        """AddPawnMoveWithPromotion: queen (plain to) then knight (to | $80)."""
+        moves.append((frm, to))
+        if to & 0x70 == (0x00 if white else 0x70):
+            moves.append((frm, to | PROMO_FLAG_KNIGHT))
+
+    def generate_all_moves(self, white: bool) -> List[Move]:
+        """GenerateAllMoves: pseudo-legal moves, squares $00-$7F in order."""
+        board = self.board
+        moves: List[Move] = []
+        for sq in range(128):
+            piece = board[sq]
+            if sq & OFFBOARD_MASK or piece == EMPTY_PIECE or bool(piece & WHITE_COLOR) != white:
+                continue
+            kind = piece & TYPE_MASK
+            if kind == PAWN:
+                push = -16 if white else 16
+                to = sq + push
+                if not to & OFFBOARD_MASK and board[to] == EMPTY_PIECE:
+                    self._add_pawn_move(moves, sq, to, white)
+                    if sq & 0x70 == (0x60 if white else 0x10):
+                        to += push
+                        if not to & OFFBOARD_MASK and board[to] == EMPTY_PIECE:
+                            moves.append((sq, to))
+                for offset in PAWN_CAPTURE_OFFSETS[white]:
+                    to = sq + offset
+                    if to & OFFBOARD_MASK:
+                        continue
+                    if board[to] == EMPTY_PIECE:
+                        if to == self.enpassantsq:
+                            self._add_pawn_move(moves, sq, to, white)
+                    elif bool(board[to] & WHITE_COLOR) != white:
+                        self._add_pawn_move(moves, sq, to, white)
+            elif kind in (KNIGHT, KING):
+                for offset in KNIGHT_OFFSETS if kind == KNIGHT else ALL_DIRECTION_OFFSETS:
+                    to = sq + offset
+                    if not to & OFFBOARD_MASK and (board[to] == EMPTY_PIECE or
+                                                   bool(board[to] & WHITE_COLOR) != white):
+                        moves.append((sq, to))
+                if kind == KING:
+                    self._generate_castling_moves(moves, sq, white)
+            elif kind in (BISHOP, ROOK, QUEEN):
+                offsets = (DIAGONAL_OFFSETS if kind == BISHOP else
+                           ORTHOGONAL_OFFSETS if kind == ROOK else ALL_DIRECTION_OFFSETS)
+                for offset in offsets:
+                    to = sq + offset
+                    while not to & OFFBOARD_MASK:
+                        if board[to] != EMPTY_PIECE:
+                            if bool(board[to] & WHITE_COLOR) != white:
+                                moves.append((sq, to))
+                            break
+                        moves.append((sq, to))
+                        to += offset
+        return moves
+
+    def _generate_castling_moves(self, moves: List[Move], sq: int, white: bool) -> None:
+        """GenerateCastlingMoves: rights and empty squares only (the rook is
+        not checked, and FilterLegalMoves tests the squares crossed)."""
+        for king_from, king_to, _, _, right in CASTLING_MOVES[white]:
+            if sq == king_from and self.castlerights & right and \
+                    all(self.board[s] == EMPTY_PIECE for s in CASTLING_EMPTY[king_to]):
+                moves.append((king_from, king_to))
+
+    def is_square_attacked(self, sq: int, by_white: bool) -> bool:
+        """IsSquareAttacked: reverse rays from sq for by_white's pieces."""
+        board = self.board
+        for offsets, kinds in ((KNIGHT_OFFSETS, (KNIGHT,)), (ALL_DIRECTION_OFFSETS, (KING,))):
+            for offset in offsets:
+                target = sq + offset
+                if not target & OFFBOARD_MASK and board[target] & TYPE_MASK in kinds and \
+                        board[target] != EMPTY_PIECE and bool(board[target] & WHITE_COLOR) == by_white:
+                    return True
+        for index, offset in enumerate(DIAGONAL_OFFSETS):
+            target = sq + offset
+            first = True
+            while not target & OFFBOARD_MASK:
+                piece = board[target]
+                if piece != EMPTY_PIECE:
+                    kind = piece & TYPE_MASK
+                    mine = bool(piece & WHITE_COLOR) == by_white
+                    if kind in (BISHOP, QUEEN):
+                        if mine:
+                            return True
+                    # A pawn attacks from one step below (white) or above (black)
+                    elif first and kind == PAWN and mine and (index >= 2) == by_white:
+                        return True
+                    break
+                target += offset
+                first = False
+        for offset in ORTHOGONAL_OFFSETS:
+            target = sq + offset
+            while not target & OFFBOARD_MASK:
+                piece = board[target]
+                if piece != EMPTY_PIECE:
+                    if piece & TYPE_MASK in (ROOK, QUEEN) and bool(piece & WHITE_COLOR) == by_white:
+                        return True
+                    break
+                target += offset
+        return False
+
+    # -------------------------------------------------------------------------
+    # Make / unmake (ai/search.asm)
+    # -------------------------------------------------------------------------
+
+    def make_move(self, frm: int, to: int) -> None:
+        """MakeMove, including its quirks: a king move keeps castlerights and
+        enpassantsq, and any king move of two files moves the rook."""
+        promo = to & PROMO_FLAG_KNIGHT
+        to &= SQUARE_MASK
+        board = self.board
+        captured = board[to]
+        flags = extra_from = extra_to = 0
+        prev_rights, prev_ep = self.castlerights, self.enpassantsq
+        piece = board[frm]
+        kind = piece & TYPE_MASK
+        white = bool(piece & WHITE_COLOR)
+
+        if kind == KING:
+            if to - frm in (2, -2):
+                flags |= UNDO_FLAG_CASTLING
+                # The rook squares depend only on colour and direction
+                for king_from, king_to, rook_from, rook_to, _ in CASTLING_MOVES[white]:
+                    if king_to - king_from == to - frm:
+                        extra_from, extra_to = rook_from, rook_to
+                board[extra_to] = board[extra_from]
+                board[extra_from] = EMPTY_PIECE
+            if white:
+                self.whitekingsq = to
+            else:
+                self.blackkingsq = to
+        elif kind == PAWN:
+            if captured == EMPTY_PIECE and to == self.enpassantsq:
+                flags |= UNDO_FLAG_EP_CAPTURE
+                extra_to = to + 16 if white else to - 16
+                captured = board[extra_to]
+                board[extra_to] = EMPTY_PIECE
+                self.enpassantsq = NO_EN_PASSANT
+            elif to - frm in (32, -32):
+                self.enpassantsq = (frm + to) // 2
+            else:
+                self.enpassantsq = NO_EN_PASSANT
+                if to & 0x70 == (0x00 if white else 0x70):
+                    flags |= UNDO_FLAG_PROMOTION
+                    piece = (piece & WHITE_COLOR) | EMPTY_PIECE | (KNIGHT if promo else QUEEN)
+        else:
+            self.enpassantsq = NO_EN_PASSANT
+            if kind == ROOK and frm in ROOK_CORNER_RIGHTS:
+                self.castlerights &= ~ROOK_CORNER_RIGHTS[frm]
+
+        board[frm] = EMPTY_PIECE
+        board[to] = piece
+        if captured != EMPTY_PIECE and captured & TYPE_MASK == ROOK and to in ROOK_CORNER_RIGHTS:
+            self.castlerights &= ~ROOK_CORNER_RIGHTS[to]
+
+        entry = (captured, prev_rights, prev_ep, flags, extra_from, extra_to)
+        if self.search_depth < len(self.undo):
+            self.undo[self.search_depth] = entry
+        else:
+            self.undo.append(entry)
+        self.search_depth += 1
+        self.white = not self.white
+
+    def unmake_move(self, frm: int, to: int) -> None:
+        """UnmakeMove: reverse the move saved at UndoStack[SearchDepth - 1]."""
+        to &= SQUARE_MASK
+        self.search_depth -= 1
+        self.white = not self.white
+        captured, rights, ep, flags, extra_from, extra_to = self.undo[self.search_depth]
+        board = self.board
+        piece = board[to]
+        if flags & UNDO_FLAG_PROMOTION:
+            piece = (piece & WHITE_COLOR) | EMPTY_PIECE | PAWN
+        board[frm] = piece
+        if flags & UNDO_FLAG_EP_CAPTURE:
+            board[extra_to] = captured
+            board[to] = EMPTY_PIECE
+        elif flags & UNDO_FLAG_CASTLING:
+            board[extra_from] = board[extra_to]
+            board[extra_to] = EMPTY_PIECE
+            board[to] = EMPTY_PIECE
+        else:
+            board[to] = captured
+        self.castlerights = rights
+        self.enpassantsq = ep
+        if piece & TYPE_MASK == KING:
+            if piece & WHITE_COLOR:
+                self.whitekingsq = frm
+            else:
+                self.blackkingsq = frm
+
+    # -------------------------------------------------------------------------
+    # Legal moves and ordering
+    # -------------------------------------------------------------------------
+
+    def filter_legal_moves(self, moves: List[Move]) -> List[Move]:
+        """FilterLegalMoves. Any move of two files from e1/e8 counts as
+        castling and must also start and pass over unattacked squares."""
+        legal = []
+        for frm, to in moves:
+            clean = to & SQUARE_MASK
+            if frm in (0x74, 0x04) and clean - frm in (2, -2):
+                step = 1 if clean > frm else -1
+                if self.is_square_attacked(frm, not self.white) or \
+                        self.is_square_attacked(frm + step, not self.white):
+                    continue
+            self.make_move(frm, to)
+            # IsSearchKingInCheck: the side that just moved
+            king = self.blackkingsq if self.white else self.whitekingsq
+            in_check = self.is_square_attacked(king, self.white)
+            self.unmake_move(frm, to)
+            if not in_check:
+                legal.append((frm, to))
+        return legal
+
+    def generate_captures(self) -> List[Move]:
+        """GenerateCaptures: pseudo-legal moves onto enemy pieces."""
+        return [(frm, to) for frm, to in self.generate_all_moves(self.white)
+                if self._is_enemy(self.board[to & SQUARE_MASK], self.white)]
+
+    def is_killer_move(self, frm: int, to: int, depth: int) -> bool:
+        return depth < MAX_KILLER_DEPTH and (frm, to) in self.killers[depth]
+
+    def store_killer(self, frm: int, to: int, depth: int) -> None:
+        """StoreKiller: new killer into slot 0, the old one shifts to slot 1."""
+        if depth >= MAX_KILLER_DEPTH:
+            return
+        slots = self.killers[depth]
+        if slots[0] != (frm, to):
+            slots[1] = slots[0]
+            slots[0] = (frm, to)
+
+    def order_moves_mvv_lva(self, moves: List[Move]) -> List[Move]:
+        """OrderMovesMVVLVA: swap captures to the front, bubble sort them by
+        the byte victim*8 - attacker (unsigned, so a knight victim scores 0),
+        then swap killers to the front of the quiet moves."""
+        moves = list(moves)
+        scores = [0] * len(moves)
+        board = self.board
+        captures = 0
+        for i, (frm, to) in enumerate(moves):
+            victim = board[to & SQUARE_MASK]
+            if victim == EMPTY_PIECE:
+                continue
+            scores[i] = ((MVV_LVA_VALUES[victim & TYPE_MASK] << 3) -
+                         MVV_LVA_VALUES[board[frm] & TYPE_MASK]) & 0xFF
+            moves[i], moves[captures] = moves[captures], moves[i]
+            scores[i], scores[captures] = scores[captures], scores[i]
+            captures += 1
+
+        swapped = captures >= 2
+        while swapped:
+            swapped = False
+            for i in range(captures - 1):
+                if scores[i] < scores[i + 1]:
+                    moves[i], moves[i + 1] = moves[i + 1], moves[i]
+                    scores[i], scores[i + 1] = scores[i + 1], scores[i]
+                    swapped = True
+
+        front = captures
+        for i in range(captures, len(moves)):
+            frm, to = moves[i]
+            if self.is_killer_move(frm, to & SQUARE_MASK, self.search_depth):
+                moves[i], moves[front] = moves[front], moves[i]
+                front += 1
+        return moves
+
+    def generate_legal_moves(self) -> List[Move]:
+        """GenerateLegalMoves: generate, filter, order."""
+        return self.order_moves_mvv_lva(self.filter_legal_moves(self.generate_all_moves(self.white)))
+
+    # -------------------------------------------------------------------------
+    # Search (ai/search.asm)
+    # -------------------------------------------------------------------------
+
+    def evaluate(self) -> int:
+        """Evaluate: EvalScore clamped to +-120, from SearchSide."""
+        score = evaluate(self.board, self.params, self.whitekingsq, self.blackkingsq)
+        score = max(-EVAL_CLAMP, min(EVAL_CLAMP, score))
+        return score if self.white else -score
+
+    def quiesce(self, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        self.quiesce_depth += 1
+        if self.quiesce_depth >= MAX_QUIESCE_DEPTH:
+            self.quiesce_depth -= 1
+            return self.evaluate()
+
+        stand_pat = self.evaluate()
+        if stand_pat >= beta:
+            self.quiesce_depth -= 1
+            return beta
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        for frm, to in self.order_moves_mvv_lva(self.filter_legal_moves(self.generate_captures())):
+            self.make_move(frm, to)
+            score = neg8(self.quiesce(neg8(beta), neg8(alpha)))
+            self.unmake_move(frm, to)
+            if score >= beta:
+                self.quiesce_depth -= 1
+                return beta
+            if score > alpha:
+                alpha = score
+        self.quiesce_depth -= 1
+        return alpha
+
+    def negamax(self, depth: int, alpha: int, beta: int) -> int:
+        if depth == 0:
+            self.quiesce_depth = 0
+            return self.quiesce(alpha, beta)
+        self.nodes += 1
+        trace = self.trace
+        if trace is not None:
+            position = self.position_id()
+            trace.append(('probe', position, depth, alpha, beta))
+        alpha0 = alpha
+
+        # The engine regenerates the list after every child; killers at this
+        # SearchDepth only change on a cutoff, so the order is the same
+        moves = self.generate_legal_moves()
+        if not moves:
+            king = self.whitekingsq if self.white else self.blackkingsq
+            return -MATE_SCORE if self.is_square_attacked(king, not self.white) else DRAW_SCORE
+
+        best = NEG_INFINITY
+        for frm, to in moves:
+            self.make_move(frm, to)
+            score = neg8(self.negamax(depth - 1, neg8(beta), neg8(alpha)))
+            self.unmake_move(frm, to)
+            if score < best:
+                continue
+            best = score
+            if self.search_depth == 0:
+                self.best_move = (frm, to)
+            if best <= alpha:
+                continue
+            alpha = best
+            if alpha >= beta:
+                if self.board[to & SQUARE_MASK] == EMPTY_PIECE:
+                    self.store_killer(frm, to & SQUARE_MASK, self.search_depth)
+                break
+        if trace is not None:
+            flag = TT_FLAG_ALPHA if best <= alpha0 else TT_FLAG_BETA if best >= beta else TT_FLAG_EXACT
+            trace.append(('store', position, depth, flag, best))
+        return best
+
+    def find_best_move(self, max_depth: int) -> SearchResult:
+        """FindBestMove without the book, the TT and the clock: iterative
+        deepening from depth 1 to max_depth (at most MAX_DEPTH - 1).
+
+        With no legal moves the result is the mate or draw score Negamax
+        would return (the engine leaves $FF in A).
+        """
+        self.search_depth = 0
+        self.nodes = 0
+        self.killers = [[(0, 0), (0, 0)] for _ in range(MAX_KILLER_DEPTH)]
+        moves = self.generate_legal_moves()
+        if not moves:
+            king = self.whitekingsq if self.white else self.blackkingsq
+            score = -MATE_SCORE if self.is_square_attacked(king, not self.white) else DRAW_SCORE
+            return SearchResult(score, None, 0, 0)
+
+        self.best_move = moves[0]
+        score = 0
+        depth = 0
+        for depth in range(1, min(max_depth, MAX_DEPTH - 1) + 1):
+            score = self.negamax(depth, NEG_INFINITY, POS_INFINITY)
+            if score & 0xFF >= MATE_SCORE - 10:     # cmp / bcs: unsigned
+                break
+        return SearchResult(score, self.best_move, depth, self.nodes)
+
+
+    def search(self, depth: int, iterate: bool = False) -> SearchResult:
+        """Negamax at depth with the window (-127, 127), killers cleared. With
+        iterate, deepen from depth 1 keeping the killers, as FindBestMove does."""
+        self.search_depth = 0
+        self.nodes = 0
+        self.killers = [[(0, 0), (0, 0)] for _ in range(MAX_KILLER_DEPTH)]
+        self.best_move = None
+        score = 0
+        for iteration in range(1 if iterate else depth, depth + 1):
+            score = self.negamax(iteration, -POS_INFINITY, POS_INFINITY)
+        return SearchResult(score, self.best_move, depth, self.nodes)
+
+
+def search_fen(fen: str, depth: int, params: Optional[EvalParams] = None) -> SearchResult:
+    """Score one position with C64Search.search()."""
+    search = C64Search(params)
+    search.set_fen(fen)
+    return search.search(depth)
+
+
+def search_fingerprint(params: EvalParams) -> str:
+    """Digest of the evaluation tables and this module, for caching scores."""
+    digest = hashlib.sha1(repr(params).encode())
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def move_name(move: Optional[Move], board88) -> str:
+    """UCI-style name of an engine move in the position before it is made."""
+    if move is None:
+        return '(none)'
+    frm, to = move
+    name = square_name(frm) + square_name(to)
+    if board88[frm] & TYPE_MASK == PAWN and (to & 0x70) in (0x00, 0x70):
+        name += 'n' if to & PROMO_FLAG_KNIGHT else 'q'
+    return name
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Search positions like FindBestMove")
+    parser.add_argument('fens', nargs='*', help='Positions to search (FEN)')
+    parser.add_argument('--file', help='Read FENs from a file, one per line')
+    parser.add_argument('--depth', type=int, default=3,
+                        help=f'Search depth (1-{MAX_DEPTH - 1}, default 3)')
+    parser.add_argument('--find-best-move', action='store_true',
+                        help='Iterative deepening from the window (-128, 127) like FindBestMove, '
+                             'instead of one search with (-127, 127)')
+    args = parser.parse_args()
+    if not 1 <= args.depth < MAX_DEPTH:
+        parser.error(f"--depth must be 1-{MAX_DEPTH - 1}")
+
+    fens = list(args.fens)
+    if args.file:
+        fens += read_fens(args.file)
+    if not fens:
+        fens = ['rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1']
+
+    params = load_eval_params()
+    total_nodes = 0
+    start = time.perf_counter()
+    for fen in fens:
+        search = C64Search(params)
+        search.set_fen(fen)
+        board = bytes(search.board)
+        result = search.find_best_move(args.depth) if args.find_best_move else search.search(args.depth)
+        total_nodes += result.nodes
+        print(f"{result.score:5d}  {move_name(result.best_move, board):6s} "
+              f"depth {result.depth}  {result.nodes:8d} nodes  {fen}")
+    elapsed = time.perf_counter() - start
+    print(f"{len(fens)} positions, {total_nodes} nodes in {elapsed:.2f}s "
+          f"({total_nodes / max(elapsed, 1e-9):.0f} nodes/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+C64 Zobrist Hashing for the Book Tools
+
+One definition of the engine's 16-bit Zobrist keys (ai/zobrist.asm), shared
+by generate_book.py and create_book_from_openings.py. The tables are built
+once per process from the same LFSR as InitZobristTables, kept as a single
+array('H') block in the engine's memory order, and checked against the seed,
+feedback mask and step count in the assembly source.
+
+hash_positions() hashes many positions at once from piece-square arrays; with
+NumPy installed it is a gather plus an XOR-reduce per position.
+"""
+
+import os
+import re
+from array import array
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:     # hash_positions() falls back to a Python loop
+    np = None
+
+
+# =============================================================================
+# C64 Zobrist PRNG (must match ai/zobrist.asm)
+# =============================================================================
+
+ZOBRIST_SEED = 0xA7CE       # ZobristSeed: lda #$CE / sta $fb, lda #$A7 / sta $fc
+ZOBRIST_FEEDBACK = 0xB400   # eor #$B4 on the high byte
+ZOBRIST_STEPS = 8           # LFSR steps per output byte (ldx #$08)
+
+# First bytes InitZobristTables stores at ZobristPieces
+ZOBRIST_KNOWN_BYTES = bytes((0x75, 0xDE, 0xDC, 0xC2, 0x9B, 0x26, 0x60, 0x0E))
+
+ZOBRIST_ASM = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'ai', 'zobrist.asm')
+
+
+class C64ZobristPRNG:
+    """16-bit Galois LFSR matching the 6502 implementation with improved mixing."""
+
+    def __init__(self, seed: int = ZOBRIST_SEED):
+        self.state = seed
+
+    def next_byte(self) -> int:
+        # Run 8 LFSR cycles per output byte for better randomness
+        for _ in range(ZOBRIST_STEPS):
+            lsb = self.state & 1
+            self.state >>= 1
+            if lsb:
+                self.state ^= ZOBRIST_FEEDBACK
+        # Return low byte XOR high byte for better distribution
+        return ((self.state & 0xFF) ^ (self.state >> 8)) & 0xFF
+
+
+# =============================================================================
+# Table Layout
+# =============================================================================
+#
+# Word offsets into the table block, in the order InitZobristTables fills
+# ZobristPieces, ZobristSide, ZobristCastling and ZobristEnPassant (each word
+# is stored low byte first).
+
+# Piece indices: 0-5 = white P,N,B,R,Q,K; 6-11 = black P,N,B,R,Q,K
+ZOBRIST_PIECES = 12
+ZOBRIST_SIDE = ZOBRIST_PIECES * 64
+ZOBRIST_CASTLING = ZOBRIST_SIDE + 1
+ZOBRIST_EN_PASSANT = ZOBRIST_CASTLING + 4
+ZOBRIST_WORDS = ZOBRIST_EN_PASSANT + 8
+
+# Empty square in the piece-square arrays given to hash_positions()
+NO_PIECE = ZOBRIST_PIECES
+
+# Castling bits as in castlerights (constants.asm)
+CASTLE_WK = 0x01
+CASTLE_WQ = 0x02
+CASTLE_BK = 0x04
+CASTLE_BQ = 0x08
+
+
+def generate_zobrist_block(seed: int = ZOBRIST_SEED) -> array:
+    """All Zobrist keys as one array('H') block, in the engine's memory order."""
+    prng = C64ZobristPRNG(seed)
+    block = array('H')
+    for _ in range(ZOBRIST_WORDS):
+        lo = prng.next_byte()
+        block.append(lo | (prng.next_byte() << 8))
+    return block
+
+
+def check_asm_source(filename: str = ZOBRIST_ASM) -> List[str]:
+    """Compare the PRNG constants with ai/zobrist.asm.
+
+    Returns a list of mismatches (empty if everything agrees or the source is
+    not available, as when the tools are copied out of the repository).
+    """
+    if not os.path.exists(filename):
+        return []
+    with open(filename) as f:
+        source = f.read()
+
+    errors = []
+    seed = re.search(r'ZobristSeed:\s*lda #\$([0-9A-Fa-f]{2})\s*sta \$fb\s*lda #\$([0-9A-Fa-f]{2})\s*sta \$fc',
+                     source)
+    if not seed or (int(seed.group(2), 16) << 8 | int(seed.group(1), 16)) != ZOBRIST_SEED:
+        errors.append(f"ZobristSeed does not load ${ZOBRIST_SEED:04X}")
+    feedback = re.search(r'eor #\$([0-9A-Fa-f]{2})\s*sta \$fc', source)
+    if not feedback or int(feedback.group(1), 16) << 8 != ZOBRIST_FEEDBACK:
+        errors.append(f"ZobristPRNG does not XOR the feedback mask ${ZOBRIST_FEEDBACK:04X}")
+    steps = re.search(r'ldx #\$([0-9A-Fa-f]{2})\s*// 8 iterations', source)
+    if not steps or int(steps.group(1), 16) != ZOBRIST_STEPS:
+        errors.append(f"ZobristPRNG does not run {ZOBRIST_STEPS} steps per byte")
+    return errors
+
+
+_block: Optional[array] = None
+
+
+def zobrist_block() -> array:
+    """The shared table block, built and self-checked on first use.
+
+    Raises RuntimeError if the generator disagrees with its known output or
+    with the assembly source, since every book hash would then be wrong.
+    """
+    global _block
+    if _block is None:
+        block = generate_zobrist_block()
+        first = bytes(b for word in block[:len(ZOBRIST_KNOWN_BYTES) // 2] for b in (word & 0xFF, word >> 8))
+        errors = check_asm_source()
+        if first != ZOBRIST_KNOWN_BYTES:
+            errors.append(f"PRNG output {first.hex()} != {ZOBRIST_KNOWN_BYTES.hex()}")
+        if errors:
+            raise RuntimeError("C64 Zobrist self-check failed: " + "; ".join(errors))
+        _block = block
+    return _block
+
+
+class ZobristTables:
+    """Views of the shared block: pieces[index][sq64], side, castling, en_passant."""
+
+    def __init__(self):
+        block = zobrist_block()
+        self.block = block
+        self.pieces = [block[p * 64:(p + 1) * 64].tolist() for p in range(ZOBRIST_PIECES)]
+        self.side = block[ZOBRIST_SIDE]
+        self.castling = block[ZOBRIST_CASTLING:ZOBRIST_EN_PASSANT].tolist()   # WK, WQ, BK, BQ
+        self.en_passant = block[ZOBRIST_EN_PASSANT:ZOBRIST_WORDS].tolist()
+
+        # XOR of the castling keys for each castlerights value
+        self.castling_by_rights = [0] * 16
+        for rights in range(16):
+            for i in range(4):
+                if rights & (1 << i):
+                    self.castling_by_rights[rights] ^= self.castling[i]
+
+    def hash_position(self, squares: Sequence[int], white_to_move: bool,
+                      castling: int, ep_file: Optional[int]) -> int:
+        """Hash one position given as 64 piece indices (sq64 order, NO_PIECE = empty)."""
+        h = 0
+        pieces = self.pieces
+        for sq64, piece in enumerate(squares):
+            if piece != NO_PIECE:
+                h ^= pieces[piece][sq64]
+        if white_to_move:
+            h ^= self.side
+        h ^= self.castling_by_rights[castling]
+        if ep_file is not None and ep_file >= 0:
+            h ^= self.en_passant[ep_file]
+        return h
+
+    def hash_positions(self, squares, white_to_move, castling, ep_file):
+        """Hash N positions at once.
+
+        squares is N x 64 piece indices (sq64 order, NO_PIECE = empty),
+        white_to_move N booleans, castling N castlerights values and ep_file
+        N files (-1 = none). Returns N hashes (a uint16 array with NumPy,
+        else a list).
+        """
+        if np is None:
+            return [self.hash_position(sq, w, c, e if e >= 0 else None)
+                    for sq, w, c, e in zip(squares, white_to_move, castling, ep_file)]
+
+        tables = _numpy_tables(self)
+        squares = np.asarray(squares, dtype=np.intp).reshape(-1, 64)
+        h = np.bitwise_xor.reduce(tables['pieces'][squares, np.arange(64)], axis=1)
+        h ^= np.where(np.asarray(white_to_move, dtype=bool), tables['side'], 0).astype(np.uint16)
+        h ^= tables['castling'][np.asarray(castling, dtype=np.intp)]
+        h ^= tables['en_passant'][np.asarray(ep_file, dtype=np.intp)]
+        return h
+
+
+def _numpy_tables(tables: ZobristTables) -> dict:
+    """uint16 gather tables for hash_positions(), built once per ZobristTables."""
+    cached = getattr(tables, '_numpy', None)
+    if cached is None:
+        block = np.frombuffer(tables.block.tobytes(), dtype=np.uint16)
+        pieces = np.zeros((ZOBRIST_PIECES + 1, 64), dtype=np.uint16)    # Row NO_PIECE stays 0
+        pieces[:ZOBRIST_PIECES] = block[:ZOBRIST_SIDE].reshape(ZOBRIST_PIECES, 64)
+        # Index -1 (no en passant) picks the trailing 0
+        en_passant = np.append(block[ZOBRIST_EN_PASSANT:ZOBRIST_WORDS], np.uint16(0))
+        cached = {
+            'pieces': pieces,
+            'side': np.uint16(tables.side),
+            'castling': np.array(tables.castling_by_rights, dtype=np.uint16),
+            'en_passant': en_passant,
+        }
+        tables._numpy = cached
+    return cached
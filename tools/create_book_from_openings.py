@@ -5,76 +5,33 @@ Create opening book from known opening lines.
 This generates a C64 chess opening book directly from opening move sequences,
 computing our custom Zobrist hashes for each position.
 
-No external book file needed - openings are embedded here.
+Built-in lines are embedded here; --lines reads more from files (bare SAN or
+PGN-style movetext, one line per line of text). Lines are merged into a prefix
+trie so shared prefixes are played once, and SAN is resolved against the
+board with precomputed 0x88 attack rays, pins included.
+
+Runs are cached (see book_cache.py): unchanged lines and parameters reuse
+the last entries, and every line prefix that was played before is taken
+from the cached graph, so new lines only play their new moves.
 """
 
+import hashlib
+import re
 import sys
-from typing import Dict, List, Optional, Tuple, Set
+import time
+from typing import Dict, List, Optional, Tuple, Set, Union
 from dataclasses import dataclass
-from collections import defaultdict
 
-
-# =============================================================================
-# C64 Zobrist PRNG (matches ai/zobrist.asm exactly)
-# =============================================================================
-
-class C64ZobristPRNG:
-    """16-bit Galois LFSR matching the 6502 implementation."""
-
-    def __init__(self):
-        self.state = 0xA7CE  # Seed matches ZobristSeed
-
-    def next_byte(self) -> int:
-        """Generate one byte, advancing state."""
-        lsb = self.state & 1
-        self.state >>= 1
-        if lsb:
-            self.state ^= 0xB400
-        return self.state & 0xFF
-
-
-# =============================================================================
-# Zobrist Table Generation
-# =============================================================================
-
-@dataclass
-class ZobristTables:
-    pieces: List[List[int]]
-    side: int
-    castling: List[int]
-    en_passant: List[int]
-
-
-def generate_zobrist_tables() -> ZobristTables:
-    """Generate tables using exact same PRNG as C64."""
-    prng = C64ZobristPRNG()
-
-    pieces = []
-    for _ in range(12):
-        piece_hashes = []
-        for _ in range(64):
-            lo = prng.next_byte()
-            hi = prng.next_byte()
-            piece_hashes.append(lo | (hi << 8))
-        pieces.append(piece_hashes)
-
-    side_lo = prng.next_byte()
-    side_hi = prng.next_byte()
-    side = side_lo | (side_hi << 8)
-
-    castling = []
-    for _ in range(4):
-        lo = prng.next_byte()
-        hi = prng.next_byte()
-        castling.append(lo | (hi << 8))
-
-    en_passant = []
-    for _ in range(8):
-        lo = prng.next_byte()
-        hi = prng.next_byte()
-        en_passant.append(lo | (hi << 8))
-
-    return ZobristTables(pieces, side, castling, en_passant)
+from book_probe import (
+    BOARD_EMPTY, BOARD_WHITE, BOOK_CHAIN_END, BOOK_MAGIC, BOOK_NO_ENTRY, BOOK_REGION_END,
+    BOOK_REGION_START, book_flags, book_region_budget, build_book_image, check_book_fits, check_byte,
+    optimize_table_size, print_layout_curve,
+)
+from book_cache import (
+    DEFAULT_CACHE_DIR, BookCache, cache_key, file_digest, source_digest, zobrist_fingerprint,
+)
+from book_metrics import PROFILE_TOP, RunMetrics, chain_stats, optional_phase, profiled
+from c64_zobrist import NO_PIECE, ZobristTables
 
 
 # =============================================================================
@@ -100,18 +57,70 @@ def parse_square(s: str) -> int:
     return sq_to_0x88(ord(s[0]) - ord('a'), int(s[1]) - 1)
 
 
+# (from 0x88, to 0x88, promotion letter or None)
+Move = Tuple[int, int, Optional[str]]
+
+# Position.push() record: previous contents of the squares the move may
+# change, castling rights, en passant file and hash
+Undo = Tuple[Dict[int, Optional[str]], List[bool], Optional[int], int]
+
+ROOK_OFFSETS = (-16, 16, -1, 1)
+BISHOP_OFFSETS = (-17, -15, 15, 17)
+KNIGHT_OFFSETS = (-33, -31, -18, -14, 14, 18, 31, 33)
+
+
+def _on_board(sq88: int) -> bool:
+    return 0 <= sq88 < 128 and not sq88 & 0x88
+
+
+def _ray(sq88: int, offset: int) -> Tuple[int, ...]:
+    squares = []
+    sq88 += offset
+    while _on_board(sq88):
+        squares.append(sq88)
+        sq88 += offset
+    return tuple(squares)
+
+
+# Attack rays and leaper targets per 0x88 square, built once
+RAYS = {offset: [_ray(sq, offset) if _on_board(sq) else () for sq in range(128)]
+        for offset in ROOK_OFFSETS + BISHOP_OFFSETS}
+KNIGHT_TARGETS = [frozenset(sq + o for o in KNIGHT_OFFSETS if _on_board(sq + o)) for sq in range(128)]
+KING_TARGETS = [frozenset(sq + o for o in ROOK_OFFSETS + BISHOP_OFFSETS if _on_board(sq + o))
+                for sq in range(128)]
+
+# Castling right (index into Position.castling) lost when a corner is left or captured
+CORNER_RIGHTS = {sq_to_0x88(7, 0): 0, sq_to_0x88(0, 0): 1, sq_to_0x88(7, 7): 2, sq_to_0x88(0, 7): 3}
+
+# Piece, from file, from rank, capture, to file, to rank, promotion
+SAN_RE = re.compile(r'^([NBRQK])?([a-h])?([1-8])?(x)?([a-h])([1-8])(?:=?([NBRQ]))?$')
+
+
+def _touched_squares(from_sq: int, to_sq: int, piece: str) -> List[int]:
+    """Squares a move can change: en passant victim and castling rook included."""
+    squares = [from_sq, to_sq]
+    if piece in 'Pp':
+        squares.append((from_sq & 0x70) | (to_sq & 7))
+    elif piece in 'Kk':
+        row = from_sq & 0x70
+        squares += [row, row | 3, row | 5, row | 7]
+    return squares
+
+
 class Position:
     zobrist_tables: ZobristTables = None  # Shared across all instances
 
     def __init__(self):
         if Position.zobrist_tables is None:
-            Position.zobrist_tables = generate_zobrist_tables()
+            Position.zobrist_tables = ZobristTables()
 
         self.board: Dict[int, str] = {}
         self.white_to_move = True
         self.castling = [True, True, True, True]  # WK, WQ, BK, BQ
         self.ep_file: Optional[int] = None
         self._setup_initial()
+        # Hash is carried with the position and updated incrementally by make_move()
+        self.hash = self.compute_hash()
 
     def _setup_initial(self):
         back_rank = 'RNBQKBNR'
@@ -128,49 +137,69 @@ class Position:
         pos.white_to_move = self.white_to_move
         pos.castling = self.castling.copy()
         pos.ep_file = self.ep_file
+        pos.hash = self.hash
         return pos
 
-    def compute_hash(self) -> int:
-        """Compute 16-bit Zobrist hash."""
-        tables = Position.zobrist_tables
-        h = 0
-
+    def squares(self) -> List[int]:
+        """Zobrist piece index per square in the engine's 0-63 order."""
+        squares = [NO_PIECE] * 64
         for sq88, piece in self.board.items():
-            piece_idx = PIECE_TO_ZOBRIST[piece]
-            file, rank = sq_from_0x88(sq88)
-            sq64 = sq_to_64(file, rank)
-            h ^= tables.pieces[piece_idx][sq64]
-
-        if self.white_to_move:
-            h ^= tables.side
-
-        for i, has_right in enumerate(self.castling):
-            if has_right:
-                h ^= tables.castling[i]
-
-        if self.ep_file is not None:
-            h ^= tables.en_passant[self.ep_file]
+            squares[sq_to_64(*sq_from_0x88(sq88))] = PIECE_TO_ZOBRIST[piece]
+        return squares
 
-        return h & 0xFFFF
+    def castling_bits(self) -> int:
+        """Castling rights as the engine's castlerights bits (WK, WQ, BK, BQ)."""
+        return sum(1 << i for i, has_right in enumerate(self.castling) if has_right)
 
-    def make_move(self, from_sq: int, to_sq: int, promo: Optional[str] = None) -> 'Position':
-        pos = self.copy()
-        piece = pos.board.get(from_sq)
+    def compute_hash(self) -> int:
+        """Compute 16-bit Zobrist hash from scratch (reference for self.hash)."""
+        return Position.zobrist_tables.hash_position(
+            self.squares(), self.white_to_move, self.castling_bits(), self.ep_file)
+
+    def _piece_hash(self, sq88: int, piece: str) -> int:
+        file, rank = sq_from_0x88(sq88)
+        return Position.zobrist_tables.pieces[PIECE_TO_ZOBRIST[piece]][sq_to_64(file, rank)]
+
+    def _remove(self, sq88: int) -> str:
+        piece = self.board.pop(sq88)
+        self.hash ^= self._piece_hash(sq88, piece)
+        return piece
+
+    def _place(self, sq88: int, piece: str):
+        captured = self.board.get(sq88)
+        if captured is not None:
+            self.hash ^= self._piece_hash(sq88, captured)
+        self.board[sq88] = piece
+        self.hash ^= self._piece_hash(sq88, piece)
+
+    def _clear_castling(self, index: int):
+        if self.castling[index]:
+            self.castling[index] = False
+            self.hash ^= Position.zobrist_tables.castling[index]
+
+    def push(self, from_sq: int, to_sq: int, promo: Optional[str] = None) -> Undo:
+        """Make a move in place; pop() with the returned record takes it back."""
+        tables = Position.zobrist_tables
+        piece = self.board.get(from_sq)
         if piece is None:
             raise ValueError(f"No piece at {from_sq:#x}")
+        undo = (dict((sq, self.board.get(sq)) for sq in _touched_squares(from_sq, to_sq, piece)),
+                self.castling.copy(), self.ep_file, self.hash)
 
-        captured = pos.board.get(to_sq)
-        pos.ep_file = None
+        captured = self.board.get(to_sq)
+        if self.ep_file is not None:
+            self.hash ^= tables.en_passant[self.ep_file]
+        self.ep_file = None
         piece_type = piece.upper()
         from_file, from_rank = sq_from_0x88(from_sq)
         to_file, to_rank = sq_from_0x88(to_sq)
 
         if piece_type == 'P':
             if abs(from_rank - to_rank) == 2:
-                pos.ep_file = from_file
+                self.ep_file = from_file
+                self.hash ^= tables.en_passant[from_file]
             if to_file != from_file and captured is None:
-                ep_sq = sq_to_0x88(to_file, from_rank)
-                del pos.board[ep_sq]
+                self._remove(sq_to_0x88(to_file, from_rank))
             if to_rank == 0 or to_rank == 7:
                 promo_piece = promo or 'Q'
                 piece = promo_piece if piece.isupper() else promo_piece.lower()
@@ -178,111 +207,148 @@ class Position:
         if piece_type == 'K':
             if from_file == 4:
                 if to_file == 6:
-                    rook_from = sq_to_0x88(7, from_rank)
-                    rook_to = sq_to_0x88(5, from_rank)
-                    pos.board[rook_to] = pos.board[rook_from]
-                    del pos.board[rook_from]
+                    self._place(sq_to_0x88(5, from_rank), self._remove(sq_to_0x88(7, from_rank)))
                 elif to_file == 2:
-                    rook_from = sq_to_0x88(0, from_rank)
-                    rook_to = sq_to_0x88(3, from_rank)
-                    pos.board[rook_to] = pos.board[rook_from]
-                    del pos.board[rook_from]
+                    self._place(sq_to_0x88(3, from_rank), self._remove(sq_to_0x88(0, from_rank)))
             if piece.isupper():
-                pos.castling[0] = False
-                pos.castling[1] = False
+                self._clear_castling(0)
+                self._clear_castling(1)
             else:
-                pos.castling[2] = False
-                pos.castling[3] = False
-
-        if piece_type == 'R':
-            if piece.isupper():
-                if from_sq == sq_to_0x88(7, 0):
-                    pos.castling[0] = False
-                elif from_sq == sq_to_0x88(0, 0):
-                    pos.castling[1] = False
+                self._clear_castling(2)
+                self._clear_castling(3)
+
+        # A rook leaving or captured on its corner
+        for sq in (from_sq, to_sq):
+            if sq in CORNER_RIGHTS:
+                self._clear_castling(CORNER_RIGHTS[sq])
+
+        self._remove(from_sq)
+        self._place(to_sq, piece)
+        self.white_to_move = not self.white_to_move
+        self.hash ^= tables.side
+        return undo
+
+    def pop(self, undo: Undo):
+        squares, self.castling, self.ep_file, self.hash = undo
+        for sq, piece in squares.items():
+            if piece is None:
+                self.board.pop(sq, None)
             else:
-                if from_sq == sq_to_0x88(7, 7):
-                    pos.castling[2] = False
-                elif from_sq == sq_to_0x88(0, 7):
-                    pos.castling[3] = False
-
-        if to_sq == sq_to_0x88(7, 0):
-            pos.castling[0] = False
-        elif to_sq == sq_to_0x88(0, 0):
-            pos.castling[1] = False
-        elif to_sq == sq_to_0x88(7, 7):
-            pos.castling[2] = False
-        elif to_sq == sq_to_0x88(0, 7):
-            pos.castling[3] = False
-
-        del pos.board[from_sq]
-        pos.board[to_sq] = piece
-        pos.white_to_move = not pos.white_to_move
+                self.board[sq] = piece
+        self.white_to_move = not self.white_to_move
+
+    def make_move(self, from_sq: int, to_sq: int, promo: Optional[str] = None) -> 'Position':
+        """The position after a move, as a copy."""
+        pos = self.copy()
+        pos.push(from_sq, to_sq, promo)
         return pos
 
-    def make_move_san(self, san: str) -> 'Position':
-        """Make a move from SAN notation (simplified parser)."""
-        # Handle castling
-        if san in ('O-O', '0-0'):
-            from_sq = sq_to_0x88(4, 0 if self.white_to_move else 7)
-            to_sq = sq_to_0x88(6, 0 if self.white_to_move else 7)
-            return self.make_move(from_sq, to_sq)
-        if san in ('O-O-O', '0-0-0'):
-            from_sq = sq_to_0x88(4, 0 if self.white_to_move else 7)
-            to_sq = sq_to_0x88(2, 0 if self.white_to_move else 7)
-            return self.make_move(from_sq, to_sq)
-
-        # Parse piece type
-        san = san.replace('+', '').replace('#', '').replace('x', '')
-        promo = None
-        if '=' in san:
-            san, promo = san.split('=')
-            promo = promo[0]
-
-        if san[0] in 'NBRQK':
-            piece_type = san[0]
-            san = san[1:]
+    def king_square(self, white: bool) -> int:
+        king = 'K' if white else 'k'
+        return next(sq for sq, piece in self.board.items() if piece == king)
+
+    def attacked(self, sq: int, by_white: bool) -> bool:
+        """Whether a piece of by_white attacks sq."""
+        board = self.board
+        case = str.upper if by_white else str.lower
+        for piece, targets in (('N', KNIGHT_TARGETS), ('K', KING_TARGETS)):
+            if any(board.get(s) == case(piece) for s in targets[sq]):
+                return True
+        pawn = case('P')
+        # White pawns move towards row 0, so they attack sq from row + 1
+        for offset in ((15, 17) if by_white else (-15, -17)):
+            if board.get(sq + offset) == pawn and not (sq + offset) & 0x88:
+                return True
+        for offsets, pieces in ((ROOK_OFFSETS, case('RQ')), (BISHOP_OFFSETS, case('BQ'))):
+            for offset in offsets:
+                for s in RAYS[offset][sq]:
+                    piece = board.get(s)
+                    if piece is not None:
+                        if piece in pieces:
+                            return True
+                        break
+        return False
+
+    def reaches(self, piece_type: str, from_sq: int, to_sq: int) -> bool:
+        """Whether a knight, bishop, rook, queen or king on from_sq moves to
+        to_sq on this board (pins are checked separately)."""
+        if piece_type == 'N':
+            return to_sq in KNIGHT_TARGETS[from_sq]
+        if piece_type == 'K':
+            return to_sq in KING_TARGETS[from_sq]
+        offsets = (ROOK_OFFSETS if piece_type == 'R' else BISHOP_OFFSETS if piece_type == 'B'
+                   else ROOK_OFFSETS + BISHOP_OFFSETS)
+        for offset in offsets:
+            for s in RAYS[offset][from_sq]:
+                if s == to_sq:
+                    return True
+                if s in self.board:
+                    break
+        return False
+
+    def leaves_king_safe(self, from_sq: int, to_sq: int) -> bool:
+        white = self.white_to_move
+        undo = self.push(from_sq, to_sq)
+        safe = not self.attacked(self.king_square(white), not white)
+        self.pop(undo)
+        return safe
+
+    def parse_san(self, san: str) -> Move:
+        """Resolve a SAN move to (from, to, promotion) for this position."""
+        text = san.rstrip('+#!?')
+        rank = 0 if self.white_to_move else 7
+        if text in ('O-O', '0-0'):
+            return sq_to_0x88(4, rank), sq_to_0x88(6, rank), None
+        if text in ('O-O-O', '0-0-0'):
+            return sq_to_0x88(4, rank), sq_to_0x88(2, rank), None
+
+        m = SAN_RE.match(text)
+        if not m:
+            raise ValueError(f"Cannot parse move: {san}")
+        piece_type, from_file, from_rank, _, to_file, to_rank, promo = m.groups()
+        piece_type = piece_type or 'P'
+        to_sq = parse_square(to_file + to_rank)
+        target = self.board.get(to_sq)
+        if target is not None and target.isupper() == self.white_to_move:
+            raise ValueError(f"{san}: own piece on {to_file}{to_rank}")
+        mover = piece_type if self.white_to_move else piece_type.lower()
+
+        if piece_type == 'P':
+            forward = -16 if self.white_to_move else 16
+            if from_file:
+                # Capture: the pawn is one rank back on the given file
+                from_sq = sq_to_0x88(ord(from_file) - ord('a'), sq_from_0x88(to_sq - forward)[1])
+                ep_sq = None if self.ep_file is None else sq_to_0x88(self.ep_file, 5 if self.white_to_move else 2)
+                if target is None and to_sq != ep_sq:
+                    raise ValueError(f"{san}: nothing to capture")
+                candidates = [from_sq] if self.board.get(from_sq) == mover and \
+                    abs((from_sq & 7) - (to_sq & 7)) == 1 else []
+            elif target is not None:
+                candidates = []
+            elif self.board.get(to_sq - forward) == mover:
+                candidates = [to_sq - forward]
+            elif to_sq - forward not in self.board and self.board.get(to_sq - 2 * forward) == mover \
+                    and to_rank == ('4' if self.white_to_move else '5'):
+                candidates = [to_sq - 2 * forward]
+            else:
+                candidates = []
         else:
-            piece_type = 'P'
-
-        # Parse destination
-        to_file = ord(san[-2]) - ord('a')
-        to_rank = int(san[-1]) - 1
-        to_sq = sq_to_0x88(to_file, to_rank)
-
-        # Parse disambiguation
-        disambig = san[:-2]
-        disambig_file = disambig_rank = None
-        for c in disambig:
-            if c in 'abcdefgh':
-                disambig_file = ord(c) - ord('a')
-            elif c in '12345678':
-                disambig_rank = int(c) - 1
-
-        # Find the piece
-        target_piece = piece_type if self.white_to_move else piece_type.lower()
-        candidates = []
-        for sq88, piece in self.board.items():
-            if piece == target_piece:
-                file, rank = sq_from_0x88(sq88)
-                if disambig_file is not None and file != disambig_file:
-                    continue
-                if disambig_rank is not None and rank != disambig_rank:
-                    continue
-                candidates.append(sq88)
-
-        if len(candidates) == 1:
-            return self.make_move(candidates[0], to_sq, promo)
-
-        # Try to validate which candidate can reach the square
-        for from_sq in candidates:
-            try:
-                # Simple validation - just try the move
-                return self.make_move(from_sq, to_sq, promo)
-            except:
-                continue
+            candidates = [sq for sq, piece in self.board.items()
+                          if piece == mover
+                          and (not from_file or sq & 7 == ord(from_file) - ord('a'))
+                          and (not from_rank or sq_from_0x88(sq)[1] == int(from_rank) - 1)
+                          and self.reaches(piece_type, sq, to_sq)]
+
+        if len(candidates) > 1:
+            candidates = [sq for sq in candidates if self.leaves_king_safe(sq, to_sq)]
+        if len(candidates) != 1:
+            raise ValueError(f"{san}: {'no' if not candidates else 'ambiguous'} {piece_type} move "
+                             f"to {to_file}{to_rank}")
+        return candidates[0], to_sq, promo
 
-        raise ValueError(f"Cannot parse move: {san}")
+    def make_move_san(self, san: str) -> 'Position':
+        """The position after a SAN move, as a copy."""
+        return self.make_move(*self.parse_san(san))
 
 
 # =============================================================================
@@ -392,103 +458,215 @@ class BookEntry:
     hash_hi: int
     from_sq: int
     to_sq: int
+    check: int
 
 
-def generate_book() -> List[Tuple[int, BookEntry]]:
-    """Generate book entries from opening lines."""
-    entries: List[Tuple[int, BookEntry]] = []
-    visited: Set[int] = set()
+def board88_value(piece: Optional[str]) -> int:
+    """Board88 byte for a piece letter (None = empty square)."""
+    if piece is None:
+        return BOARD_EMPTY
+    color = BOARD_WHITE if piece.isupper() else 0
+    return color | BOARD_EMPTY | ('PNBRQK'.index(piece.upper()) + 1)
+
+
+# Tokens in a line file that are not moves: move numbers, results, ECO codes
+MOVE_NUMBER_RE = re.compile(r'(?<!\S)\d+\.+')
+NON_MOVE_RE = re.compile(r'^(1-0|0-1|1/2-1/2|\*|[A-E]\d\d)$')
+
+
+def parse_line(text: str) -> List[str]:
+    """SAN moves of one opening line. Accepts bare SAN ("e4 e5 Nf3") and
+    PGN-style text with move numbers, an ECO code, a quoted name, {comments}
+    and a trailing result."""
+    text = re.sub(r'\{[^}]*\}|"[^"]*"', ' ', text.split('#')[0])
+    return [token for token in MOVE_NUMBER_RE.sub('', text).split() if not NON_MOVE_RE.match(token)]
+
+
+def read_lines(filename: str) -> List[List[str]]:
+    """Opening lines from a file, one per line; blank and # lines are skipped."""
+    with open(filename) as f:
+        return [moves for moves in map(parse_line, f) if moves]
 
-    print(f"Processing {len(OPENINGS)} opening lines...")
 
-    for line_num, line in enumerate(OPENINGS):
-        pos = Position()
-        moves = line.split()
+# Prefix trie of opening lines: {san: subtree}, children in the order the
+# lines first use them
+Trie = Dict[str, 'Trie']
 
-        for move_num, san in enumerate(moves):
-            our_hash = pos.compute_hash()
 
-            try:
-                new_pos = pos.make_move_san(san)
-            except Exception as e:
-                print(f"Warning: Line {line_num+1}, move {move_num+1} '{san}' failed: {e}")
-                break
+def build_trie(lines: List[List[str]]) -> Trie:
+    root: Trie = {}
+    for moves in lines:
+        node = root
+        for san in moves:
+            node = node.setdefault(san, {})
+    return root
+
+
+def count_nodes(trie: Trie) -> int:
+    return sum(1 + count_nodes(child) for child in trie.values())
+
+
+# Position before a move: (squares, white to move, castling bits, en passant
+# file or -1), as ZobristTables.hash_positions() takes it
+Source = Tuple[List[int], bool, int, int]
+
+# Cached graph: {SAN path from the start position: record of its last move}.
+# A record is (hash before the move, from, to, promotion, check, source with
+# squares as bytes), or the error text if the move cannot be played.
+NodeRecord = Union[str, Tuple[int, int, int, Optional[str], int, Tuple[bytes, bool, int, int]]]
+OpeningGraph = Dict[Tuple[str, ...], NodeRecord]
+
+
+def generate_book(lines: List[List[str]], graph: Optional[OpeningGraph] = None,
+                  metrics: Optional[RunMetrics] = None) -> List[Tuple[int, BookEntry]]:
+    """Generate book entries from opening lines.
+
+    The lines are merged into a prefix trie and walked depth first on one
+    Position with push()/pop(), so a prefix shared by many lines is played
+    once. The first line to reach a position gives its book move.
+
+    With a graph, moves it has a record for are not resolved again, and the
+    Position only catches up (replaying recorded moves) when a move without
+    a record is reached. New records are added to the graph.
+
+    With metrics, SAN resolution is timed as "legality", catching up and the
+    final rehash as "hashing", and the walk counters are recorded there.
+    """
+    entries: List[Tuple[int, BookEntry]] = []
+    visited: Set[int] = set()
+    # Positions behind the entries, rehashed in one batch at the end
+    sources: List[Source] = []
+    failures = 0
+    reused = resolved = 0
+    transpositions = 0
+    max_depth = 0
+
+    with optional_phase(metrics, 'trie'):
+        trie = build_trie(lines)
+        nodes = count_nodes(trie)
+    print(f"Processing {len(lines)} opening lines "
+          f"({sum(map(len, lines))} moves, {nodes} after merging shared prefixes)...")
+
+    pos = Position()
+    path: List[str] = []
+    # Moves along path, and undo records for the ones pos has played
+    played: List[Tuple[int, int, Optional[str]]] = []
+    undos: List[Undo] = []
+
+    def resolve(san: str) -> NodeRecord:
+        if len(undos) < len(played):
+            with optional_phase(metrics, 'hashing'):
+                while len(undos) < len(played):
+                    undos.append(pos.push(*played[len(undos)]))
+        if metrics is not None:
+            wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            from_sq, to_sq, promo = pos.parse_san(san)
+        except ValueError as e:
+            return str(e)
+        finally:
+            if metrics is not None:
+                metrics.add('legality', time.perf_counter() - wall, time.process_time() - cpu)
+        # The source is only needed for a first visit, unless the graph keeps it
+        source = None
+        if graph is not None or pos.hash not in visited:
+            source = (bytes(pos.squares()), pos.white_to_move, pos.castling_bits(),
+                      -1 if pos.ep_file is None else pos.ep_file)
+        return (pos.hash, from_sq, to_sq, promo,
+                check_byte(board88_value(pos.board.get(from_sq)), board88_value(pos.board.get(to_sq))), source)
+
+    def walk(node: Trie):
+        nonlocal failures, reused, resolved, transpositions, max_depth
+        max_depth = max(max_depth, len(path))
+        for san, child in node.items():
+            record = None
+            if graph is not None:
+                key = tuple(path) + (san,)
+                record = graph.get(key)
+            if record is None:
+                record = resolve(san)
+                resolved += 1
+                if graph is not None:
+                    graph[key] = record
+            else:
+                reused += 1
+            if isinstance(record, str):
+                failures += 1
+                print(f"Warning: {' '.join(path + [san])}: {record}")
+                continue
+            our_hash, from_sq, to_sq, promo, check, source = record
 
             # Record this position -> move mapping
             if our_hash not in visited:
                 visited.add(our_hash)
-
-                # Find the actual move (from_sq, to_sq)
-                # By comparing boards before and after
-                from_sq = to_sq = None
-                for sq in pos.board:
-                    if sq not in new_pos.board or new_pos.board.get(sq) != pos.board[sq]:
-                        from_sq = sq
-                        break
-
-                for sq in new_pos.board:
-                    if sq not in pos.board or pos.board.get(sq) != new_pos.board[sq]:
-                        # Could be destination or castling rook
-                        piece = new_pos.board[sq]
-                        if piece.upper() != 'R' or from_sq is None:
-                            to_sq = sq
-                            break
-                        # Check if this is the king's destination
-                        from_piece = pos.board.get(from_sq)
-                        if from_piece and from_piece.upper() == 'K':
-                            to_sq = sq
-                            break
-
-                if from_sq is not None and to_sq is not None:
-                    entry = BookEntry(
-                        hash_hi=(our_hash >> 8) & 0xFF,
-                        from_sq=from_sq,
-                        to_sq=to_sq
-                    )
-                    entries.append((our_hash, entry))
-
-            pos = new_pos
-
-    print(f"Generated {len(entries)} unique positions")
+                entries.append((our_hash, BookEntry(hash_hi=(our_hash >> 8) & 0xFF,
+                                                    from_sq=from_sq, to_sq=to_sq, check=check)))
+                squares, white_to_move, castling, ep_file = source
+                sources.append((list(squares), white_to_move, castling, ep_file))
+            else:
+                transpositions += 1
+
+            if child:
+                path.append(san)
+                played.append((from_sq, to_sq, promo))
+                walk(child)
+                path.pop()
+                played.pop()
+                if len(undos) > len(played):
+                    pos.pop(undos.pop())
+
+    walk(trie)
+    if graph is not None:
+        print(f"  Graph cache: {reused} moves reused, {resolved} resolved")
+
+    # The incremental hashes must agree with hashing from scratch
+    with optional_phase(metrics, 'hashing'):
+        rehashed = Position.zobrist_tables.hash_positions(*zip(*sources)) if sources else []
+    mismatches = sum(1 for (our_hash, _), h in zip(entries, rehashed) if our_hash != h)
+    if mismatches:
+        raise RuntimeError(f"{mismatches} incremental hashes differ from a full rehash")
+
+    print(f"Generated {len(entries)} unique positions"
+          + (f" ({failures} unplayable moves skipped)" if failures else ""))
+    if metrics is not None:
+        # The depth-first walk's frontier is the path from the root
+        metrics.counters.update(lines=len(lines), moves=sum(map(len, lines)), trie_nodes=nodes,
+                                nodes_expanded=reused + resolved, graph_reused=reused,
+                                graph_resolved=resolved, transpositions=transpositions,
+                                frontier_peak=max_depth, failures=failures)
     return entries
 
 
-def write_asm_book(entries: List[Tuple[int, BookEntry]], outfile: str, table_size: int = 256):
-    """Write book as assembly file."""
-    hash_table = [0xFFFF] * table_size
-    entry_data: List[BookEntry] = []
-    chains: List[int] = []
-
-    buckets: Dict[int, List[Tuple[int, BookEntry]]] = defaultdict(list)
-    for our_hash, entry in entries:
-        bucket = our_hash % table_size
-        buckets[bucket].append((our_hash, entry))
-
-    entry_idx = 0
-    for bucket in range(table_size):
-        if bucket not in buckets or not buckets[bucket]:
-            continue
-        hash_table[bucket] = entry_idx
-        bucket_entries = buckets[bucket]
-        for i, (our_hash, entry) in enumerate(bucket_entries):
-            entry_data.append(entry)
-            chains.append(entry_idx + 1 if i < len(bucket_entries) - 1 else 0xFF)
-            entry_idx += 1
+def write_asm_book(entries: List[Tuple[int, BookEntry]], outfile: str, table_size: int = 256,
+                   line_count: int = len(OPENINGS), flags: int = 0):
+    """Write book as assembly file at BOOK_REGION_START; raises ValueError
+    if it would not fit below the engine code.
+
+    The buckets, chains and Next bytes come from book_probe.build_book_image(),
+    the layout generate_book.py's output is verified against.
+    """
+    image = build_book_image([(our_hash, e.hash_hi, e.from_sq, e.to_sq, e.check) for our_hash, e in entries],
+                             table_size, flags)
+    check_book_fits(len(image.data), BOOK_REGION_START)
+    slot_count = table_size + image.packed
+    entry_size = image.entry_size
+    entry_bytes = image.entry_count * entry_size
 
     with open(outfile, 'w') as f:
         f.write(f"""// Auto-generated Opening Book Data
 // Generated by tools/create_book_from_openings.py
-// {len(entry_data)} positions from {len(OPENINGS)} opening lines
+// {image.entry_count} positions from {line_count} opening lines
 // DO NOT EDIT - regenerate from source
 
 #importonce
 
-*=* "Generated Opening Book"
+// Place book after code (${BOOK_REGION_START:04X}), below the piece-square tables at ${BOOK_REGION_END:04X}
+*=${BOOK_REGION_START:04X} "Generated Opening Book"
 
 // Book format constants (must match opening_moves.asm)
-.const GEN_BOOK_MAGIC = $B00C
-.const GEN_BOOK_VERSION = $01
-.const GEN_BOOK_CHAIN_END = $FF
+.const GEN_BOOK_MAGIC = ${BOOK_MAGIC:04X}
+.const GEN_BOOK_VERSION = ${image.version:02X}
+.const GEN_BOOK_CHAIN_END = ${BOOK_CHAIN_END:02X}
 
 //
 // Generated Opening Book Data
@@ -497,40 +675,125 @@ GeneratedBook:
   // Header (8 bytes)
   .word GEN_BOOK_MAGIC    // Magic number
   .byte GEN_BOOK_VERSION  // Version
-  .word {len(entry_data)}             // Entry count ({len(entry_data)} positions)
+  .word {image.entry_count}             // Entry count ({image.entry_count} positions)
   .word {table_size}                 // Table size ({table_size} slots)
-  .byte $00               // Flags (reserved)
+  .byte ${flags:02X}               // Flags (bit 0: packed, bit 1: Check byte)
 
-// Hash table ({table_size} slots * 2 bytes = {table_size * 2} bytes)
+// Hash table ({slot_count} slots * 2 bytes = {slot_count * 2} bytes)
 GeneratedBookHashTable:
 """)
 
-        for i, slot in enumerate(hash_table):
-            if slot == 0xFFFF:
-                f.write(f"  .word $FFFF\n")
-            else:
-                f.write(f"  .word {slot}\n")
+        for i in range(slot_count):
+            slot = image.slot(i)
+            f.write("  .word $FFFF\n" if slot == BOOK_NO_ENTRY and not image.packed else f"  .word {slot}\n")
 
+        fields = ("HashHi, From (0-63) | colour << 7 | type bit 2 << 6, To (0-63) | type bits 1-0 << 6"
+                  if image.packed else
+                  f"HashHi, From (0x88), To (0x88), {'Check, ' if image.checked else ''}"
+                  f"Next (entries left in bucket)")
         f.write(f"""
-// Entries ({len(entry_data)} entries * 4 bytes = {len(entry_data) * 4} bytes)
-// Format: HashHi, From (0x88), To (0x88), Next
+// Entries ({image.entry_count} entries * {entry_size} bytes = {entry_bytes} bytes)
+// Format: {fields}
 GeneratedBookEntries:
 """)
 
-        for i, entry in enumerate(entry_data):
-            chain = chains[i]
-            chain_str = "GEN_BOOK_CHAIN_END" if chain == 0xFF else f"{chain}"
-            f.write(f"  .byte ${entry.hash_hi:02x}, ${entry.from_sq:02x}, ${entry.to_sq:02x}, {chain_str}\n")
+        for offset in range(image.entries_base, image.entries_base + entry_bytes, entry_size):
+            row = image.data[offset:offset + entry_size]
+            if image.packed:
+                f.write("  .byte " + ", ".join(f"${b:02x}" for b in row) + "\n")
+                continue
+            chain_str = "GEN_BOOK_CHAIN_END" if row[-1] == BOOK_CHAIN_END else f"{row[-1]}"
+            f.write("  .byte " + "".join(f"${b:02x}, " for b in row[:-1]) + chain_str + "\n")
 
         f.write("""
 GeneratedBookEnd:
 """)
 
-    total_bytes = 8 + table_size * 2 + len(entry_data) * 4
     print(f"Wrote {outfile}")
-    print(f"  Hash table: {table_size} slots ({table_size * 2} bytes)")
-    print(f"  Entries: {len(entry_data)} ({len(entry_data) * 4} bytes)")
-    print(f"  Total: {total_bytes} bytes ({total_bytes / 1024:.1f} KB)")
+    print(f"  Hash table: {table_size} slots ({slot_count * 2} bytes)")
+    print(f"  Entries: {image.entry_count} ({entry_bytes} bytes)")
+    print(f"  Total: {len(image.data)} bytes ({len(image.data) / 1024:.1f} KB)")
+
+
+def graph_code_digest() -> str:
+    """Digest of this module without OPENINGS, so that editing the built-in
+    lines keeps the graph while code changes discard it."""
+    with open(__file__) as f:
+        text = f.read()
+    text = re.sub(r'^OPENINGS = \[.*?^\]$', '', text, flags=re.M | re.S)
+    return hashlib.sha1(text.encode()).hexdigest() + source_digest(['book_probe'])
+
+
+def generate(args, metrics: Optional[RunMetrics] = None):
+    """The run after argument checks: cache lookup or generation, layout
+    choice and writing."""
+    # The built-in lines are part of this module's source
+    cache = BookCache(None if args.no_cache else args.cache)
+    tables = Position.zobrist_tables or ZobristTables()
+    flags = book_flags(args.packed, args.check_byte)
+    params = {'no_builtin': args.no_builtin, 'table_size': args.table_size,
+              'optimize_layout': args.optimize_layout, 'byte_budget': args.byte_budget,
+              'packed': args.packed, 'check_byte': args.check_byte}
+    result_key = None
+    record = None
+    if cache.directory:
+        with optional_phase(metrics, 'cache'):
+            result_key = cache_key('create_book_from_openings', [file_digest(f) for f in args.lines], params,
+                                   zobrist_fingerprint(tables),
+                                   source_digest(['create_book_from_openings', 'book_probe', 'c64_zobrist']))
+            record = cache.load('result', result_key)
+    if record is not None:
+        entries = [(our_hash, BookEntry(*fields)) for our_hash, fields in record['entries']]
+        print(f"Cached: {len(entries)} positions from {record['lines']} lines for these inputs and parameters")
+        with optional_phase(metrics, 'write'):
+            write_asm_book(entries, args.output, record['table_size'], record['lines'], flags)
+        if metrics is not None:
+            metrics.counters.update(cached=True, entries=len(entries),
+                                    chains=chain_stats((h for h, _ in entries), record['table_size']))
+        return
+
+    with optional_phase(metrics, 'read'):
+        lines = [] if args.no_builtin else [parse_line(line) for line in OPENINGS]
+        for filename in args.lines:
+            file_lines = read_lines(filename)
+            print(f"Read {len(file_lines)} lines from {filename}")
+            lines += file_lines
+    if not lines:
+        print("No opening lines")
+        sys.exit(1)
+
+    graph_key = cache_key('create_book_from_openings graph', zobrist_fingerprint(tables), graph_code_digest())
+    graph = None
+    if cache.directory:
+        with optional_phase(metrics, 'cache'):
+            graph = cache.load('graph', graph_key) or {}
+        size = len(graph)
+    with optional_phase(metrics, 'walk'):
+        entries = generate_book(lines, graph, metrics)
+    if graph is not None and len(graph) != size:
+        with optional_phase(metrics, 'cache'):
+            cache.save('graph', graph_key, graph)
+    if args.optimize_layout:
+        flat = [(h, e.hash_hi, e.from_sq, e.to_sq, e.check) for h, e in entries]
+        with optional_phase(metrics, 'layout'):
+            best, curve = optimize_table_size(flat, args.byte_budget, flags=flags)
+        print_layout_curve(curve, best, args.byte_budget)
+        if best is None:
+            print(f"No table size fits {len(entries)} entries in {args.byte_budget} bytes")
+            sys.exit(1)
+        args.table_size = best
+    if cache.directory:
+        with optional_phase(metrics, 'cache'):
+            cache.save('result', result_key, {
+                'entries': [(our_hash, (e.hash_hi, e.from_sq, e.to_sq, e.check)) for our_hash, e in entries],
+                'table_size': args.table_size, 'lines': len(lines)})
+    # write_asm_book() lays out the buckets as it writes
+    with optional_phase(metrics, 'write'):
+        write_asm_book(entries, args.output, args.table_size, len(lines), flags)
+    if metrics is not None:
+        metrics.counters.update(cached=False, entries=len(entries),
+                                chains=chain_stats((h for h, _ in entries), args.table_size))
+        metrics.rate('nodes_per_sec', 'nodes_expanded', 'walk')
 
 
 def main():
@@ -538,10 +801,50 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('output', nargs='?', default='book_data.asm')
     parser.add_argument('--table-size', type=int, default=256)
+    parser.add_argument('--optimize-layout', action='store_true',
+                        help='Choose the smallest table size within 5%% of the fastest probe that fits --byte-budget')
+    parser.add_argument('--byte-budget', type=lambda v: int(v, 0), default=book_region_budget(),
+                        help=f'Bytes available for the book (default: $5B00 up to the engine '
+                             f'code at ${BOOK_REGION_END:04X})')
+    parser.add_argument('--packed', action='store_true',
+                        help='Write format version 4: 3-byte entries (Flags bit 0)')
+    parser.add_argument('--check-byte', action='store_true',
+                        help='Add a Check byte to every entry (5 bytes, Flags bit 1)')
+    parser.add_argument('--lines', action='append', default=[], metavar='FILE',
+                        help='Read opening lines from a file, one per line (repeatable)')
+    parser.add_argument('--no-builtin', action='store_true',
+                        help='Leave out the built-in OPENINGS (use only --lines files)')
+    parser.add_argument('--cache', metavar='DIR', default=DEFAULT_CACHE_DIR,
+                        help='Generation cache directory (default: tools/.book_cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Neither read nor write the generation cache')
+    parser.add_argument('--metrics', metavar='JSON',
+                        help='Write wall and CPU time per phase, walk counters, peak RSS and '
+                             'chain length statistics to this file (see book_metrics.py)')
+    parser.add_argument('--profile', type=int, nargs='?', const=PROFILE_TOP, default=None, metavar='N',
+                        help=f'Run under cProfile and print the N functions with the most own time '
+                             f'(default {PROFILE_TOP})')
     args = parser.parse_args()
-
-    entries = generate_book()
-    write_asm_book(entries, args.output, args.table_size)
+    if args.table_size < 1 or args.table_size & (args.table_size - 1):
+        parser.error("--table-size must be a power of 2 (LookupOpeningMove masks the hash)")
+
+    if not 0 < args.byte_budget <= book_region_budget():
+        parser.error(f"--byte-budget must be 1-{book_region_budget()}: the engine code starts "
+                     f"at ${BOOK_REGION_END:04X}")
+
+    if args.packed and args.check_byte:
+        parser.error("--packed entries keep the mover part of the Check byte; drop --check-byte")
+
+    if args.no_builtin and not args.lines:
+        parser.error("no opening lines (--no-builtin needs --lines)")
+
+    metrics = RunMetrics('create_book_from_openings') if args.metrics or args.profile else None
+    with profiled(args.profile, metrics):
+        generate(args, metrics)
+    if metrics is not None:
+        metrics.print_summary()
+        if args.metrics:
+            metrics.write(args.metrics)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Engine Benchmark Corpus
+
+Extracts a reproducible set of positions just beyond the book horizon - where
+FindBestMove stops finding book moves and starts searching - and records
+reference results for each from the Python mirror of the search
+(c64_search.py):
+
+  - legal move count, python-chess and GenerateLegalMoves
+  - Evaluate's score from the side to move
+  - best move, score and node count of one Negamax at a fixed depth
+
+Positions come from a Polyglot book or from PGN games:
+
+  - a .bin book is walked from the start position by seeded random walks,
+    each move picked with the book's weights, until the book runs out or
+    --max-ply is reached (the book generators' horizon)
+  - a .pgn or .pgn.gz file gives the position at ply --max-ply of games
+    sampled with a seeded reservoir
+
+--beyond N plays N more plies first: the engine's depth 1 move after a book
+walk, the game's own moves in a PGN.
+
+With a built main.prg and main.sym (--prg, --sym), every position is also
+run on the engine itself, on c64_profile.py's 6502 core: MoveCount, Evaluate
+and the cycles of the Negamax call are measured there.
+
+The results go to JSON (--json) and to a sim6502 suite (--tests) with one
+test per position. Each test sets up Board88, the king squares, castling and
+en passant rights, checks MoveCount and Evaluate, then runs Negamax at the
+same depth. With measurements the expected values are the engine's, and the
+test asserts that Negamax stays under its measured cycles plus --margin.
+Without main.prg the suite checks the mirror's values and has no cycle
+ceiling; node counts are no stand-in, as the engine's differ.
+
+The engine has no node counter, so node counts are reference values only.
+Negamax also stores cutoff scores in the transposition table as exact, which
+the mirror does not model, so the best move and score can differ from the
+reference; they are written as comments, not asserted. FindBestMove itself
+stops on the clock, so the suite calls Negamax at a fixed depth instead.
+
+  engine_bench.py tools/books/gm2600.bin --json tests/ai_bench.json --tests tests/ai_bench.6502
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import chess
+import chess.pgn
+import chess.polyglot
+
+from c64_eval import EMPTY_PIECE, OFFBOARD_MASK, load_eval_params
+from c64_profile import CPU6502, CPUError, load_symbols, run_routine, setup_board
+from c64_search import MAX_DEPTH, C64Search, move_name, search_fingerprint
+from generate_book import decode_polyglot_move, read_polyglot_book
+from pgn_book import iter_game_texts
+
+
+BENCH_VERSION = 2
+
+# Cycle ceiling over the measured cycles of a test (search and setup)
+CYCLE_MARGIN = 0.15
+
+# Give up on a measured search after this many cycles
+MEASURE_MAX_CYCLES = 2_000_000_000
+
+# Book walks tried per position asked for before giving up on duplicates
+WALK_ATTEMPTS = 50
+
+START_FEN = chess.STARTING_FEN
+
+
+@dataclass
+class BenchPosition:
+    fen: str
+    line: str               # SAN moves from the start position
+    ply: int
+    legal_moves: int        # python-chess
+    engine_moves: int       # GenerateLegalMoves
+    eval: int               # Evaluate, side to move
+    best_move: str
+    best_from: Optional[int]
+    best_to: Optional[int]
+    score: int
+    nodes: int
+    # Measured on main.prg (None without it)
+    measured_moves: Optional[int] = None
+    measured_eval: Optional[int] = None
+    cycles: Optional[int] = None            # The Negamax call
+    setup_cycles: Optional[int] = None      # Everything before it in the test
+
+
+# =============================================================================
+# Position Extraction
+# =============================================================================
+
+def engine_fen(board: chess.Board) -> str:
+    """FEN with the en passant square after every double push, as MakeMove
+    sets enpassantsq whether or not a capture is possible."""
+    return board.fen(en_passant='fen')
+
+
+def play_beyond(board: chess.Board, plies: int, params) -> bool:
+    """Play plies engine moves (depth 1); False if the game ends first."""
+    for _ in range(plies):
+        if board.is_game_over():
+            return False
+        search = C64Search(params)
+        search.set_fen(engine_fen(board))
+        result = search.search(1)
+        move = chess.Move.from_uci(move_name(result.best_move, search.board))
+        if move not in board.legal_moves:
+            raise ValueError(f"Engine move {move} is illegal in {board.fen()}")
+        board.push(move)
+    return True
+
+
+def walk_book(filename: str, count: int, max_ply: int, beyond: int, seed: int) -> List[chess.Board]:
+    """Positions at the end of seeded, weighted random walks through a book."""
+    rng = random.Random(seed)
+    params = load_eval_params()
+    boards: Dict[str, chess.Board] = {}
+    with read_polyglot_book(filename) as book:
+        for _ in range(count * WALK_ATTEMPTS):
+            if len(boards) >= count:
+                break
+            board = chess.Board()
+            while board.ply() < max_ply:
+                # Polyglot castling is king takes rook, which python-chess accepts
+                moves = [(move, weight) for move, weight in
+                         ((decode_polyglot_move(bits, board), weight)
+                          for bits, weight in book.lookup(chess.polyglot.zobrist_hash(board)))
+                         if weight > 0 and board.is_legal(move)]
+                if not moves:
+                    break
+                board.push(rng.choices([m for m, _ in moves], [w for _, w in moves])[0])
+            if board.ply() == 0 or not play_beyond(board, beyond, params) or board.is_game_over():
+                continue
+            boards.setdefault(engine_fen(board), board)
+    return list(boards.values())
+
+
+def sample_games(filename: str, count: int, max_ply: int, beyond: int, seed: int) -> List[chess.Board]:
+    """Positions at ply max_ply + beyond of games sampled with a seeded reservoir."""
+    rng = random.Random(seed)
+    target = max_ply + beyond
+    reservoir: List[chess.Board] = []
+    seen = set()
+    candidates = 0
+    for text in iter_game_texts(filename):
+        game = chess.pgn.read_game(io.StringIO(text))
+        if game is None or game.errors:
+            continue
+        board = game.board()
+        if board.fen() != START_FEN:
+            continue
+        for move in game.mainline_moves():
+            if board.ply() == target:
+                break
+            board.push(move)
+        if board.ply() != target or board.is_game_over():
+            continue
+        fen = engine_fen(board)
+        if fen in seen:
+            continue
+        seen.add(fen)
+        candidates += 1
+        if len(reservoir) < count:
+            reservoir.append(board)
+        else:
+            index = rng.randrange(candidates)
+            if index < count:
+                reservoir[index] = board
+    return reservoir
+
+
+def extract_positions(source: str, count: int, max_ply: int, beyond: int, seed: int) -> List[chess.Board]:
+    if source.endswith('.pgn') or source.endswith('.pgn.gz'):
+        return sample_games(source, count, max_ply, beyond, seed)
+    return walk_book(source, count, max_ply, beyond, seed)
+
+
+def board_line(board: chess.Board) -> str:
+    return chess.Board().variation_san(board.move_stack)
+
+
+# =============================================================================
+# Reference Results
+# =============================================================================
+
+# Per-process state for --jobs workers
+_worker_params = None
+_worker_depth = 0
+
+
+def _init_worker(depth: int):
+    global _worker_params, _worker_depth
+    _worker_params = load_eval_params()
+    _worker_depth = depth
+
+
+def _reference(item: Tuple[str, str, int, int]) -> Tuple[BenchPosition, float]:
+    fen, line, ply, legal_moves = item
+    search = C64Search(_worker_params)
+    search.set_fen(fen)
+    engine_moves = len(search.generate_legal_moves())
+    score = search.evaluate()
+    board = bytes(search.board)
+    start = time.perf_counter()
+    result = search.search(_worker_depth)
+    elapsed = time.perf_counter() - start
+    best = result.best_move
+    return BenchPosition(
+        fen=fen, line=line, ply=ply, legal_moves=legal_moves, engine_moves=engine_moves,
+        eval=score, best_move=move_name(best, board),
+        best_from=best[0] if best else None, best_to=best[1] if best else None,
+        score=result.score, nodes=result.nodes,
+    ), elapsed
+
+
+def reference_results(boards: Sequence[chess.Board], depth: int, jobs: int = 1) -> Tuple[List[BenchPosition], float]:
+    """Reference results for each position, plus the total search time."""
+    items = [(engine_fen(b), board_line(b), b.ply(), b.legal_moves.count()) for b in boards]
+    if jobs > 1 and len(items) > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(depth,)) as pool:
+            results = list(pool.map(_reference, items))
+    else:
+        _init_worker(depth)
+        results = [_reference(item) for item in items]
+    return [position for position, _ in results], sum(elapsed for _, elapsed in results)
+
+
+# =============================================================================
+# Engine Measurement
+# =============================================================================
+
+_worker_program = None
+
+
+def _init_measure_worker(prg: str, sym: str, depth: int):
+    global _worker_program, _worker_depth
+    with open(prg, 'rb') as f:
+        _worker_program = (f.read(), load_symbols(sym))
+    _worker_depth = depth
+
+
+def _measure(fen: str) -> Tuple[int, int, int, int]:
+    """Run the steps of a generated test on a fresh machine: (MoveCount,
+    Evaluate, Negamax cycles, cycles of the other calls)."""
+    data, symbols = _worker_program
+    cpu = CPU6502()
+    cpu.load_prg(data)
+    search = C64Search()
+    search.set_fen(fen)
+
+    def call(name: str) -> int:
+        start = cpu.cycles
+        run_routine(cpu, symbols[name], MEASURE_MAX_CYCLES)
+        return cpu.cycles - start
+
+    setup = call('InitZobristTables')
+    cpu.mem[symbols['currentplayer']] = 1 if search.white else 0
+    setup += call('InitSearch')
+    setup_board(cpu, symbols, fen)
+    setup += call('GenerateLegalMoves')
+    moves = cpu.mem[symbols['MoveCount']]
+    setup += call('Evaluate')
+    score = cpu.a - 256 if cpu.a & 0x80 else cpu.a
+    setup += call('ClearKillers') + call('TTClear')
+    cpu.mem[0xE8] = 0x81
+    cpu.mem[0xE9] = 0x7F
+    cpu.a = _worker_depth
+    return moves, score, call('Negamax'), setup
+
+
+def measure_engine(positions: List[BenchPosition], prg: str, sym: str, depth: int, jobs: int = 1) -> None:
+    """Fill in the measured fields of every position from main.prg."""
+    fens = [p.fen for p in positions]
+    if jobs > 1 and len(fens) > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_measure_worker,
+                                 initargs=(prg, sym, depth)) as pool:
+            results = list(pool.map(_measure, fens))
+    else:
+        _init_measure_worker(prg, sym, depth)
+        results = [_measure(fen) for fen in fens]
+    for position, (moves, score, cycles, setup) in zip(positions, results):
+        position.measured_moves, position.measured_eval = moves, score
+        position.cycles, position.setup_cycles = cycles, setup
+
+
+def cycle_ceiling(cycles: int, margin: float) -> int:
+    return int(cycles * (1 + margin)) + 1
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+def write_json(filename: str, positions: List[BenchPosition], params: Dict[str, object]) -> None:
+    data = {
+        'version': BENCH_VERSION,
+        'fingerprint': search_fingerprint(load_eval_params()),
+        'params': params,
+        'totals': {
+            'positions': len(positions),
+            'nodes': sum(p.nodes for p in positions),
+            'cycles': sum(p.cycles for p in positions) if all(p.cycles is not None for p in positions) else None,
+        },
+        'positions': [asdict(p) for p in positions],
+    }
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+
+def test_name(index: int, position: BenchPosition) -> str:
+    return f"bench-{index + 1:02d}-ply{position.ply}"
+
+
+def position_setup(search: C64Search) -> List[str]:
+    """sim6502 statements that load the engine state of search."""
+    lines = [
+        "jsr([InitZobristTables], stop_on_rts = true, fail_on_brk = true)",
+        f"[currentplayer] = {1 if search.white else 0}",
+        "jsr([InitSearch], stop_on_rts = true, fail_on_brk = true)",
+        "",
+        f"memfill([Board88], 128, ${EMPTY_PIECE:02x})",
+    ]
+    for sq, piece in enumerate(search.board):
+        if not sq & OFFBOARD_MASK and piece != EMPTY_PIECE:
+            lines.append(f"[Board88] + ${sq:02x} = ${piece:02x}")
+    lines += [
+        f"[whitekingsq] = ${search.whitekingsq:02x}",
+        f"[blackkingsq] = ${search.blackkingsq:02x}",
+        f"[castlerights] = ${search.castlerights:02x}",
+        f"[enpassantsq] = ${search.enpassantsq:02x}",
+    ]
+    return lines
+
+
+def write_tests(filename: str, positions: List[BenchPosition], depth: int, margin: float,
+                source: str) -> None:
+    measured = all(p.cycles is not None for p in positions)
+    if measured:
+        about = [
+            "; Move counts, Evaluate scores and cycles were measured on main.prg;",
+            f"; the cycle limits are the measured cycles plus {margin:.0%}. The engine's TT",
+            "; can return a stored bound as exact, so the best move and score are",
+            "; the Python mirror's (tools/c64_search.py), for reference only.",
+        ]
+    else:
+        about = [
+            "; Move counts and Evaluate scores are the Python mirror's (tools/c64_search.py).",
+            "; Not measured on main.prg, so there are no cycle limits yet: build it and",
+            "; run make bench-corpus. The best move and score are reference values.",
+        ]
+    out = [
+        "; Engine Benchmark: Negamax on positions just beyond the book horizon",
+        f"; Generated by tools/engine_bench.py from {os.path.basename(source)} - do not edit",
+        ";",
+    ] + about + [
+        "",
+        "suites {",
+        '  suite("Engine Benchmark") {',
+        '    symbols("/code/main.sym")',
+        '    load("/code/main.prg", strip_header = true)',
+    ]
+    for index, position in enumerate(positions):
+        search = C64Search()
+        search.set_fen(position.fen)
+        side = 'White' if search.white else 'Black'
+        moves = position.measured_moves if measured else position.engine_moves
+        score = position.measured_eval if measured else position.eval
+        timeout = ""
+        if measured:
+            budget = cycle_ceiling(position.cycles, margin)
+            timeout = f", timeout = {cycle_ceiling(position.cycles + position.setup_cycles, margin)}"
+        out += [
+            "",
+            f'    test("{test_name(index, position)}", "Depth {depth} search, {side} to move",'
+            f' tags = "search,benchmark,performance"{timeout}) {{',
+            f"      ; {position.fen}",
+            f"      ; {position.line}",
+        ]
+        out += [f"      {line}" if line else "" for line in position_setup(search)]
+        out += [
+            "",
+            "      jsr([GenerateLegalMoves], stop_on_rts = true, fail_on_brk = true)",
+            f'      assert(peekbyte([MoveCount]) == ${moves:02x}, "{moves} legal moves")',
+            "      jsr([Evaluate], stop_on_rts = true, fail_on_brk = true)",
+            f'      assert(a == ${score & 0xFF:02x}, "Evaluate should be {score}")',
+            "",
+            f"      ; Reference: {position.best_move} score {position.score}, {position.nodes} nodes",
+            "      jsr([ClearKillers], stop_on_rts = true, fail_on_brk = true)",
+            "      jsr([TTClear], stop_on_rts = true, fail_on_brk = true)",
+            "      $e8 = $81",
+            "      $e9 = $7f",
+            f"      a = {depth}",
+            "      jsr([Negamax], stop_on_rts = true, fail_on_brk = true)",
+        ]
+        if measured:
+            out.append(f'      assert(cycles < {budget}, "Depth {depth} search under {budget} cycles '
+                       f'(measured {position.cycles})")')
+        out.append("    }")
+    out += ["  }", "}"]
+    with open(filename, 'w') as f:
+        f.write('\n'.join(out) + '\n')
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract an engine benchmark corpus beyond the book horizon')
+    parser.add_argument('source', help='Polyglot book (.bin) or PGN file (.pgn, .pgn.gz)')
+    parser.add_argument('--count', type=int, default=20, help='Positions to extract (default 20)')
+    parser.add_argument('--max-ply', type=int, default=15, help='Book horizon in plies (default 15)')
+    parser.add_argument('--beyond', type=int, default=0, metavar='N',
+                        help='Plies to play past the horizon before sampling (default 0)')
+    parser.add_argument('--depth', type=int, default=3,
+                        help=f'Reference search depth (1-{MAX_DEPTH - 1}, default 3)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed (default 1)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for the reference searches (default: all CPUs)')
+    parser.add_argument('--json', metavar='FILE', help='Write the corpus and reference results as JSON')
+    parser.add_argument('--tests', metavar='FILE', help='Write a sim6502 benchmark suite (.6502)')
+    parser.add_argument('--prg', default='main.prg',
+                        help='Built engine to measure on (default main.prg; skipped if missing)')
+    parser.add_argument('--sym', default='main.sym', help='Its KickAssembler symbol file (default main.sym)')
+    parser.add_argument('--margin', type=float, default=CYCLE_MARGIN,
+                        help=f'Cycle limit over the measured cycles in the tests (default {CYCLE_MARGIN})')
+    args = parser.parse_args()
+
+    if not 1 <= args.depth < MAX_DEPTH:
+        parser.error(f"--depth must be 1-{MAX_DEPTH - 1}")
+    if args.count < 1 or args.max_ply < 1 or args.beyond < 0:
+        parser.error("--count and --max-ply must be positive, --beyond not negative")
+    if args.margin < 0:
+        parser.error("--margin must not be negative")
+
+    print(f"Extracting {args.count} positions from {args.source} "
+          f"(ply {args.max_ply} + {args.beyond}, seed {args.seed})...")
+    boards = extract_positions(args.source, args.count, args.max_ply, args.beyond, args.seed)
+    if not boards:
+        print("No positions found")
+        raise SystemExit(1)
+    print(f"  {len(boards)} positions")
+
+    print(f"Searching at depth {args.depth}...")
+    positions, elapsed = reference_results(boards, args.depth, args.jobs)
+    for index, p in enumerate(positions):
+        print(f"  {index + 1:3d}  {p.fen:72s} {p.engine_moves:3d} moves  eval {p.eval:4d}  "
+              f"{p.best_move:6s} {p.score:4d}  {p.nodes:6d} nodes")
+    nodes = sum(p.nodes for p in positions)
+    rate = f", {nodes / elapsed:.0f} nodes/s" if elapsed > 0 else ""
+    print(f"  {nodes} nodes in {elapsed:.2f}s{rate} (mean {nodes / len(positions):.0f} per position)")
+
+    if os.path.exists(args.prg) and os.path.exists(args.sym):
+        print(f"Measuring on {args.prg}...")
+        try:
+            measure_engine(positions, args.prg, args.sym, args.depth, args.jobs)
+        except (CPUError, KeyError) as e:
+            print(f"Error: {e}")
+            raise SystemExit(1)
+        for index, p in enumerate(positions):
+            differs = " (mirror differs)" if (p.measured_moves, p.measured_eval) != (p.engine_moves, p.eval) else ""
+            print(f"  {index + 1:3d}  {p.measured_moves:3d} moves  eval {p.measured_eval:4d}  "
+                  f"{p.cycles:11d} cycles{differs}")
+    else:
+        print(f"No {args.prg} / {args.sym}: not measured, the tests get no cycle limits")
+
+    params = {
+        'source': os.path.basename(args.source), 'count': args.count, 'max_ply': args.max_ply,
+        'beyond': args.beyond, 'depth': args.depth, 'seed': args.seed,
+        'margin': args.margin,
+    }
+    if args.json:
+        write_json(args.json, positions, params)
+        print(f"Wrote {args.json}")
+    if args.tests:
+        write_tests(args.tests, positions, args.depth, args.margin, args.source)
+        print(f"Wrote {args.tests}")
+
+
+if __name__ == '__main__':
+    main()
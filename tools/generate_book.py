@@ -6,71 +6,44 @@ Generates a C64-format opening book from Polyglot format books.
 
 The key insight: Polyglot uses standard Zobrist keys, but we use a custom LFSR.
 We traverse positions from the start, look up moves in Polyglot, and compute
-our own Zobrist hashes for each position.
+our own Zobrist hashes for each position. Several Polyglot books, each
+with a weight multiplier, are merged into one input first (book_merge.py).
+
+Runs are cached in tools/.book_cache (see book_cache.py): an unchanged input
+with unchanged parameters goes straight to writing the output, and the BFS
+reuses every position whose Polyglot moves have not changed.
 """
 
 import argparse
+import json
+import mmap
+import multiprocessing
+import os
 import struct
 import sys
-from collections import defaultdict
+import tempfile
+import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterator, List, Optional, Tuple, Set
 
 import chess
 import chess.polyglot
 
-
-# =============================================================================
-# C64 Zobrist PRNG (matches ai/zobrist.asm exactly)
-# =============================================================================
-
-class C64ZobristPRNG:
-    """16-bit Galois LFSR matching the 6502 implementation with improved mixing."""
-
-    def __init__(self):
-        self.state = 0xA7CE  # Seed matches ZobristSeed
-
-    def next_byte(self) -> int:
-        # Run 8 LFSR cycles per output byte for better randomness
-        for _ in range(8):
-            lsb = self.state & 1
-            self.state >>= 1
-            if lsb:
-                self.state ^= 0xB400
-        # Return low byte XOR high byte for better distribution
-        return ((self.state & 0xFF) ^ ((self.state >> 8) & 0xFF)) & 0xFF
-
-
-# =============================================================================
-# Zobrist Table Generation
-# =============================================================================
-
-class ZobristTables:
-    def __init__(self):
-        prng = C64ZobristPRNG()
-
-        # Piece-square table: 12 pieces x 64 squares x 2 bytes
-        self.pieces = []
-        for _ in range(12):
-            piece_hashes = []
-            for _ in range(64):
-                lo = prng.next_byte()
-                hi = prng.next_byte()
-                piece_hashes.append(lo | (hi << 8))
-            self.pieces.append(piece_hashes)
-
-        # Side to move: 2 bytes
-        self.side = prng.next_byte() | (prng.next_byte() << 8)
-
-        # Castling rights: 4 flags x 2 bytes
-        self.castling = []
-        for _ in range(4):
-            self.castling.append(prng.next_byte() | (prng.next_byte() << 8))
-
-        # En passant files: 8 files x 2 bytes
-        self.en_passant = []
-        for _ in range(8):
-            self.en_passant.append(prng.next_byte() | (prng.next_byte() << 8))
+from book_probe import (
+    BOARD_EMPTY, BOARD_WHITE, BOOK_CHAIN_END, BOOK_FLAG_CHECK, BOOK_FLAG_PACKED, BOOK_HEADER_SIZE,
+    BOOK_MAGIC, BOOK_NO_ENTRY, BOOK_REGION_END, BOOK_REGION_START, BOOK_VERSION, BOOK_VERSION_PACKED,
+    MAX_BOOK_MATCHES, MAX_BUCKET_ENTRIES, book_entries, book_entry_size, book_flags, book_image_size,
+    book_region_budget, check_book_fits, check_byte, entry_check, optimize_table_size, pack_entry,
+    parse_book_image, print_layout_curve, probe,
+)
+from book_cache import DEFAULT_CACHE_DIR, BookCache, cache_key, file_digest, source_digest, zobrist_fingerprint
+from book_merge import MERGE_MODES, describe_sources, merge_books, parse_book_source
+from book_metrics import PROFILE_TOP, RunMetrics, chain_stats, optional_phase, profiled
+from c64_search import MAX_DEPTH, search_fen, search_fingerprint
+from c64_eval import load_eval_params
+from c64_zobrist import CASTLE_BK, CASTLE_BQ, CASTLE_WK, CASTLE_WQ, NO_PIECE, ZobristTables
+from pgn_book import MIN_MOVE_GAMES, RESULTS, PgnFilter, parse_results, pgn_to_polyglot
 
 
 # =============================================================================
@@ -96,41 +69,93 @@ PIECE_INDEX = {
 }
 
 
+# python-chess square (a1=0) -> our 0-63 index ((7-rank)*8+file)
+C64_SQUARE = [(7 - chess.square_rank(sq)) * 8 + chess.square_file(sq) for sq in chess.SQUARES]
+
+# Castling rook squares in the same order as ZobristTables.castling (WK, WQ, BK, BQ)
+CASTLING_ROOK_SQUARES = [chess.H1, chess.A1, chess.H8, chess.A8]
+
+
+def board_squares(board: chess.Board) -> List[int]:
+    """Zobrist piece index per square in the engine's 0-63 order (NO_PIECE = empty)."""
+    squares = [NO_PIECE] * 64
+    for square, piece in board.piece_map().items():
+        squares[C64_SQUARE[square]] = PIECE_INDEX[(piece.piece_type, piece.color)]
+    return squares
+
+
+def board_castling(board: chess.Board) -> int:
+    """Castling rights as the engine's castlerights bits."""
+    rights = 0
+    for bit, rook in zip((CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ), CASTLING_ROOK_SQUARES):
+        if board.clean_castling_rights() & chess.BB_SQUARES[rook]:
+            rights |= bit
+    return rights
+
+
 def compute_c64_hash(board: chess.Board, tables: ZobristTables) -> int:
     """Compute C64 Zobrist hash for a python-chess board."""
-    h = 0
-
-    # Pieces on board
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece is not None:
-            piece_idx = PIECE_INDEX[(piece.piece_type, piece.color)]
-            # Convert python-chess square to our 0-63 indexing
-            # python-chess: a1=0, h1=7, a8=56, h8=63
-            # Our indexing: same row order but we use (7-rank)*8+file
-            file = chess.square_file(square)
-            rank = chess.square_rank(square)
-            sq64 = (7 - rank) * 8 + file
-            h ^= tables.pieces[piece_idx][sq64]
-
-    # Side to move (XOR if white to move)
-    if board.turn == chess.WHITE:
-        h ^= tables.side
-
-    # Castling rights
-    if board.has_kingside_castling_rights(chess.WHITE):
-        h ^= tables.castling[0]
-    if board.has_queenside_castling_rights(chess.WHITE):
-        h ^= tables.castling[1]
-    if board.has_kingside_castling_rights(chess.BLACK):
-        h ^= tables.castling[2]
-    if board.has_queenside_castling_rights(chess.BLACK):
-        h ^= tables.castling[3]
-
-    # En passant
+    ep_file = chess.square_file(board.ep_square) if board.ep_square is not None else None
+    return tables.hash_position(board_squares(board), board.turn == chess.WHITE,
+                                board_castling(board), ep_file)
+
+
+def compute_c64_hashes(boards: List[chess.Board], tables: ZobristTables) -> List[int]:
+    """compute_c64_hash() for many boards in one vectorized call."""
+    hashes = tables.hash_positions(
+        [board_squares(board) for board in boards],
+        [board.turn == chess.WHITE for board in boards],
+        [board_castling(board) for board in boards],
+        [chess.square_file(board.ep_square) if board.ep_square is not None else -1 for board in boards])
+    return [int(h) for h in hashes]
+
+
+def _c64_piece_hash(board: chess.Board, square: int, tables: ZobristTables) -> int:
+    piece = board.piece_at(square)
+    if piece is None:
+        return 0
+    return tables.pieces[PIECE_INDEX[(piece.piece_type, piece.color)]][C64_SQUARE[square]]
+
+
+def _c64_castling_hash(board: chess.Board, tables: ZobristTables) -> int:
+    return tables.castling_by_rights[board_castling(board)]
+
+
+def push_c64_hash(board: chess.Board, move: chess.Move, h: int, tables: ZobristTables) -> int:
+    """Push move onto board and return the incrementally updated C64 hash.
+
+    Only the squares the move touches (plus the castling rook and en passant
+    victim), the castling-rights delta, the en passant delta and the side bit
+    are XORed in, so the cost is independent of the number of pieces.
+    Equivalent to compute_c64_hash() on the resulting board.
+    """
+    touched = [move.from_square, move.to_square]
+    if board.is_castling(move):
+        rank = chess.square_rank(move.from_square)
+        if board.is_kingside_castling(move):
+            touched = [chess.square(4, rank), chess.square(7, rank),
+                       chess.square(6, rank), chess.square(5, rank)]
+        else:
+            touched = [chess.square(4, rank), chess.square(0, rank),
+                       chess.square(2, rank), chess.square(3, rank)]
+    elif board.is_en_passant(move):
+        touched.append(chess.square(chess.square_file(move.to_square),
+                                    chess.square_rank(move.from_square)))
+
+    for square in touched:
+        h ^= _c64_piece_hash(board, square, tables)
+    h ^= _c64_castling_hash(board, tables)
     if board.ep_square is not None:
-        ep_file = chess.square_file(board.ep_square)
-        h ^= tables.en_passant[ep_file]
+        h ^= tables.en_passant[chess.square_file(board.ep_square)]
+
+    board.push(move)
+
+    for square in touched:
+        h ^= _c64_piece_hash(board, square, tables)
+    h ^= _c64_castling_hash(board, tables)
+    if board.ep_square is not None:
+        h ^= tables.en_passant[chess.square_file(board.ep_square)]
+    h ^= tables.side
 
     return h & 0xFFFF
 
@@ -142,6 +167,11 @@ def square_to_0x88(square: int) -> int:
     return (7 - rank) * 16 + file
 
 
+def square_from_0x88(square88: int) -> int:
+    """Convert a 0x88 square back to python-chess format."""
+    return chess.square(square88 & 0x07, 7 - (square88 >> 4))
+
+
 # =============================================================================
 # Polyglot Book Reader
 # =============================================================================
@@ -170,141 +200,894 @@ def decode_polyglot_move(move_bits: int, board: chess.Board) -> chess.Move:
     return chess.Move(from_sq, to_sq, promotion=promo)
 
 
-def read_polyglot_book(filename: str) -> Dict[int, List[Tuple[int, int]]]:
-    """Read Polyglot book. Returns {key: [(move_bits, weight), ...]}"""
-    entries = defaultdict(list)
-    with open(filename, 'rb') as f:
-        while True:
-            data = f.read(16)
-            if len(data) < 16:
+class PolyglotBook:
+    """Read-only, memory-mapped view of a Polyglot book.
+
+    Polyglot files are 16-byte big-endian records (key, move, weight, learn)
+    sorted by key, so lookups bisect the key column directly in the mapped
+    file instead of loading every entry into a dict. Memory use stays flat
+    regardless of book size.
+    """
+
+    ENTRY_SIZE = 16
+    ENTRY_FORMAT = struct.Struct('>QHHi')
+    KEY_FORMAT = struct.Struct('>Q')
+    MOVE_FORMAT = struct.Struct('>HH')
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._count = size // self.ENTRY_SIZE
+        if self._count:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)[:self._count * self.ENTRY_SIZE]
+        else:
+            # mmap refuses zero-length files; an empty view behaves the same
+            self._map = None
+            self._view = memoryview(b'')
+
+    def __len__(self) -> int:
+        """Total number of entries in the file."""
+        return self._count
+
+    def __enter__(self) -> 'PolyglotBook':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def key_at(self, index: int) -> int:
+        return self.KEY_FORMAT.unpack_from(self._view, index * self.ENTRY_SIZE)[0]
+
+    def _lower_bound(self, key: int) -> int:
+        lo, hi = 0, self._count
+        unpack_key = self.KEY_FORMAT.unpack_from
+        view = self._view
+        size = self.ENTRY_SIZE
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if unpack_key(view, mid * size)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def lookup(self, key: int) -> List[Tuple[int, int]]:
+        """Return [(move_bits, weight), ...] for key in file order."""
+        index = self._lower_bound(key)
+        moves = []
+        unpack_key = self.KEY_FORMAT.unpack_from
+        unpack_move = self.MOVE_FORMAT.unpack_from
+        view = self._view
+        size = self.ENTRY_SIZE
+        while index < self._count:
+            offset = index * size
+            if unpack_key(view, offset)[0] != key:
                 break
-            key, move, weight, learn = struct.unpack('>QHHi', data)
-            entries[key].append((move, weight))
-    return entries
+            moves.append(unpack_move(view, offset + 8))
+            index += 1
+        return moves
+
+    def __contains__(self, key: int) -> bool:
+        index = self._lower_bound(key)
+        return index < self._count and self.key_at(index) == key
+
+    def iter_entries(self) -> Iterator[Tuple[int, int, int, int]]:
+        """Stream (key, move_bits, weight, learn) records in file order."""
+        return self.ENTRY_FORMAT.iter_unpack(self._view)
+
+    def count_positions(self) -> int:
+        """Number of distinct keys (one streaming pass, constant memory)."""
+        positions = 0
+        last_key = None
+        for key, _, _, _ in self.iter_entries():
+            if key != last_key:
+                positions += 1
+                last_key = key
+        return positions
+
+
+def read_polyglot_book(filename: str) -> PolyglotBook:
+    """Open a Polyglot book for key lookups without loading it into memory."""
+    return PolyglotBook(filename)
 
 
 # =============================================================================
 # Book Generation
 # =============================================================================
 
+# Compact frontier node state: piece bitboards, colour occupancy, turn,
+# castling rights and en passant square (-1 if none). A few ints per node
+# instead of a chess.Board with its move stack.
+PackedBoard = Tuple[int, int, int, int, int, int, int, int, bool, int, int]
+
+
+def pack_board(board: chess.Board) -> PackedBoard:
+    """Pack the hash-relevant state of a board into a tuple of ints."""
+    return (
+        board.pawns, board.knights, board.bishops, board.rooks,
+        board.queens, board.kings,
+        board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK],
+        board.turn, board.castling_rights,
+        -1 if board.ep_square is None else board.ep_square,
+    )
+
+
+def unpack_board(state: PackedBoard) -> chess.Board:
+    """Rebuild a chess.Board (with an empty move stack) from pack_board()."""
+    (pawns, knights, bishops, rooks, queens, kings,
+     white, black, turn, castling_rights, ep_square) = state
+    board = chess.Board(None)
+    board.pawns = pawns
+    board.knights = knights
+    board.bishops = bishops
+    board.rooks = rooks
+    board.queens = queens
+    board.kings = kings
+    board.occupied_co[chess.WHITE] = white
+    board.occupied_co[chess.BLACK] = black
+    board.occupied = white | black
+    board.turn = turn
+    board.castling_rights = castling_rights
+    board.ep_square = None if ep_square < 0 else ep_square
+    return board
+
+
+def state_pieces(state: PackedBoard) -> Iterator[Tuple[int, int, bool]]:
+    """(square, piece type, white) for each piece, read off the bitboards."""
+    white = state[6]
+    for piece_type, pieces in enumerate(state[:6], chess.PAWN):
+        while pieces:
+            square = (pieces & -pieces).bit_length() - 1
+            pieces &= pieces - 1
+            yield square, piece_type, bool(white >> square & 1)
+
+
+def state_c64_hashes(states: List[PackedBoard], tables: ZobristTables) -> List[int]:
+    """compute_c64_hashes() for pack_board() states, without building boards.
+
+    Castling rights are taken as stored: board.push() clears them as kings
+    and rooks move, so they equal clean_castling_rights() for played games.
+    """
+    squares = []
+    for state in states:
+        row = [NO_PIECE] * 64
+        for square, piece_type, white in state_pieces(state):
+            row[C64_SQUARE[square]] = PIECE_INDEX[(piece_type, white)]
+        squares.append(row)
+    castling = [sum(bit for bit, rook in zip((CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ), CASTLING_ROOK_SQUARES)
+                    if state[9] & chess.BB_SQUARES[rook]) for state in states]
+    hashes = tables.hash_positions(squares, [state[8] == chess.WHITE for state in states], castling,
+                                   [chess.square_file(state[10]) if state[10] >= 0 else -1 for state in states])
+    return [int(h) for h in hashes]
+
+
 @dataclass
 class BookEntry:
     hash_hi: int      # Upper 8 bits of C64 hash
     from_sq: int      # 0x88 from square
     to_sq: int        # 0x88 to square
+    check: int = 0    # Check byte (see book_probe.check_byte())
+    poly_key: int = 0                     # Polyglot key of the source position
+    state: Optional[PackedBoard] = None   # Source position, for collision checks
+
+
+def board_to_0x88(board: chess.Board) -> List[int]:
+    """The position as the engine's Board88 (128 bytes, row 0 = rank 8)."""
+    board88 = [BOARD_EMPTY] * 128
+    for square, piece in board.piece_map().items():
+        color = BOARD_WHITE if piece.color == chess.WHITE else 0
+        board88[square_to_0x88(square)] = color | BOARD_EMPTY | piece.piece_type
+    return board88
+
+
+# python-chess square -> 0x88 square
+SQUARE_0x88 = [square_to_0x88(sq) for sq in chess.SQUARES]
+
+
+def state_to_0x88(state: PackedBoard) -> List[int]:
+    """board_to_0x88() of a pack_board() state."""
+    board88 = [BOARD_EMPTY] * 128
+    for square, piece_type, white in state_pieces(state):
+        board88[SQUARE_0x88[square]] = (BOARD_WHITE if white else 0) | BOARD_EMPTY | piece_type
+    return board88
+
+
+def move_check_byte(board: chess.Board, move: chess.Move) -> int:
+    """Check byte for a book move, as LookupOpeningMove derives it from Board88."""
+    mover = board.piece_at(move.from_square)
+    color = BOARD_WHITE if mover.color == chess.WHITE else 0
+    return check_byte(color | mover.piece_type, board.piece_type_at(move.to_square) or 0)
 
 
 # Maximum number of alternative moves to store per position
 MAX_MOVES_PER_POSITION = 3
 
+# Frontier nodes handed to a worker process per task in --jobs mode
+EXPAND_CHUNK_SIZE = 64
+
+# BFS frontier node: (packed board, ply, c64_hash, poly_key)
+Node = Tuple[PackedBoard, int, int, int]
+
+# Expansion of one node: [(from 0x88, to 0x88, check, child node or None), ...]
+# in book weight order, or None if the position is not in the book
+Expansion = Optional[List[Tuple[int, int, int, Optional[Node]]]]
+
+# The same for a position at any ply: children as (packed board, c64_hash,
+# poly_key), or None where they were not built
+Edges = List[Tuple[int, int, int, Optional[Tuple[PackedBoard, int, int]]]]
+
+
+def expand_position(state: PackedBoard, c64_hash: int, book_moves: List[Tuple[int, int]],
+                    tables: ZobristTables, children: bool = True,
+                    metrics: Optional[RunMetrics] = None) -> Edges:
+    """The legal book moves of a position, best weight first, with their
+    Check bytes and (if children) the position after each. With metrics, the
+    legality checks and child hashing are timed as phases of their own."""
+    board = unpack_board(state)
+
+    # Get moves sorted by weight (best moves first)
+    moves = sorted(book_moves, key=lambda x: x[1], reverse=True)
+
+    edges = []
+    for move_bits, weight in moves:
+        if metrics is not None:
+            wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            move = decode_polyglot_move(move_bits, board)
+            legal = move in board.legal_moves
+        except:
+            legal = False
+        if metrics is not None:
+            metrics.add('legality', time.perf_counter() - wall, time.process_time() - cpu)
+        if not legal:
+            continue
+
+        child = None
+        if children:
+            if metrics is not None:
+                wall, cpu = time.perf_counter(), time.process_time()
+            new_board = board.copy(stack=False)
+            new_hash = push_c64_hash(new_board, move, c64_hash, tables)
+            new_key = chess.polyglot.zobrist_hash(new_board)
+            child = (pack_board(new_board), new_hash, new_key)
+            if metrics is not None:
+                metrics.add('hashing', time.perf_counter() - wall, time.process_time() - cpu)
+
+        # Entry uses 0x88 coordinates
+        edges.append((square_to_0x88(move.from_square), square_to_0x88(move.to_square),
+                      move_check_byte(board, move), child))
+    return edges
+
+
+def edges_to_expansion(edges: Edges, ply: int, max_ply: int) -> Expansion:
+    # Children at max_ply would be dequeued and dropped; don't queue them
+    if ply + 1 >= max_ply:
+        return [(from_sq, to_sq, check, None) for from_sq, to_sq, check, _ in edges]
+    return [(from_sq, to_sq, check, (child[0], ply + 1, child[1], child[2]))
+            for from_sq, to_sq, check, child in edges]
+
+
+def expand_node(node: Node, poly_book: PolyglotBook, tables: ZobristTables, max_ply: int,
+                metrics: Optional[RunMetrics] = None) -> Expansion:
+    """Look up a frontier node in the book and generate its children.
+
+    Depends only on the node itself, so nodes can be expanded in any order or
+    process; build_book() applies the results in queue order.
+    """
+    state, ply, c64_hash, poly_key = node
+    if ply >= max_ply:
+        return None
+
+    # Look up position in Polyglot book
+    book_moves = poly_book.lookup(poly_key)
+    if not book_moves:
+        return None
+    # Children at max_ply would be dropped; don't build them
+    return edges_to_expansion(expand_position(state, c64_hash, book_moves, tables, ply + 1 < max_ply, metrics),
+                              ply, max_ply)
+
+
+class GraphCache:
+    """Expanded positions kept between runs (see book_cache.py).
+
+    nodes maps (Polyglot key, C64 hash) to the Polyglot moves the position
+    was expanded from and its Edges, children always built. A node is reused
+    while the input book still has exactly those moves for the position, so
+    a changed book only re-expands the positions whose moves changed.
+    """
+
+    def __init__(self, nodes: Optional[Dict[Tuple[int, int], Tuple[Tuple, Edges]]] = None):
+        self.nodes = nodes if nodes is not None else {}
+        self.reused = 0
+        self.expanded = 0
+
+    def lookup(self, node: Node, book_moves: List[Tuple[int, int]]) -> Optional[Edges]:
+        cached = self.nodes.get((node[3], node[2]))
+        if cached is not None and cached[0] == tuple(book_moves):
+            self.reused += 1
+            return cached[1]
+        return None
+
+    def store(self, node: Node, book_moves: List[Tuple[int, int]], edges: Edges) -> None:
+        self.nodes[(node[3], node[2])] = (tuple(book_moves), edges)
+        self.expanded += 1
+
+
+# Per-process state for --jobs workers (each maps the same book file read-only)
+_worker_book: Optional[PolyglotBook] = None
+_worker_tables: Optional[ZobristTables] = None
+_worker_max_ply = 0
+
+
+def _init_worker(book_filename: str, max_ply: int):
+    global _worker_book, _worker_tables, _worker_max_ply
+    _worker_book = read_polyglot_book(book_filename)
+    _worker_tables = ZobristTables()
+    _worker_max_ply = max_ply
+
+
+def _expand_chunk(chunk: List[Node]) -> List[Expansion]:
+    return [expand_node(node, _worker_book, _worker_tables, _worker_max_ply) for node in chunk]
+
+
+def _expand_positions_chunk(chunk: List[Tuple[PackedBoard, int, List[Tuple[int, int]]]]) -> List[Edges]:
+    return [expand_position(state, c64_hash, book_moves, _worker_tables) for state, c64_hash, book_moves in chunk]
+
+
+def expand_batch_cached(batch: List[Node], poly_book: PolyglotBook, tables: ZobristTables, max_ply: int,
+                        graph: GraphCache, pool=None, metrics: Optional[RunMetrics] = None) -> List[Expansion]:
+    """expand_node() for a batch, taking positions from the graph where their
+    book moves are unchanged and expanding (on the pool, if any) the rest."""
+    expansions: List[Expansion] = [None] * len(batch)
+    missing = []
+    for i, node in enumerate(batch):
+        if node[1] >= max_ply:
+            continue
+        book_moves = poly_book.lookup(node[3])
+        if not book_moves:
+            continue
+        edges = graph.lookup(node, book_moves)
+        if edges is None:
+            missing.append((i, book_moves))
+        else:
+            expansions[i] = edges_to_expansion(edges, node[1], max_ply)
+
+    work = [(batch[i][0], batch[i][2], book_moves) for i, book_moves in missing]
+    if pool and len(work) > EXPAND_CHUNK_SIZE:
+        chunks = [work[i:i + EXPAND_CHUNK_SIZE] for i in range(0, len(work), EXPAND_CHUNK_SIZE)]
+        fresh = [edges for chunk in pool.map(_expand_positions_chunk, chunks) for edges in chunk]
+    else:
+        fresh = [expand_position(state, c64_hash, book_moves, tables, metrics=metrics)
+                 for state, c64_hash, book_moves in work]
+    for (i, book_moves), edges in zip(missing, fresh):
+        graph.store(batch[i], book_moves, edges)
+        expansions[i] = edges_to_expansion(edges, batch[i][1], max_ply)
+    return expansions
+
 
 def build_book(
-    poly_book: Dict[int, List[Tuple[int, int]]],
+    poly_book: PolyglotBook,
     tables: ZobristTables,
     max_ply: int,
-    max_positions: int
+    max_positions: int,
+    jobs: int = 1,
+    graph: Optional[GraphCache] = None,
+    metrics: Optional[RunMetrics] = None
 ) -> List[Tuple[int, BookEntry]]:
     """Build C64 book by BFS traversal from starting position.
 
     Now stores up to MAX_MOVES_PER_POSITION moves per position for variety.
+
+    The frontier is transposition-aware: each position is expanded once, at
+    the shallowest ply it is reached (BFS order guarantees that). Positions
+    are identified by (Polyglot key, C64 hash) - the C64 hash also carries
+    the en passant file after every double push, which Polyglot omits when no
+    capture is possible, and entries are stored per C64 hash.
+
+    With jobs > 1, consecutive runs of the queue are expanded on a process
+    pool and their results merged back in queue order. Appending children
+    after a whole run has been dequeued leaves the FIFO order unchanged, so
+    the output is identical to jobs=1.
+
+    With a graph, positions it already holds are not expanded again; the
+    output is the same as without one.
+
+    With metrics, the traversal counters are recorded there. Legality and
+    hashing times only cover expansions done in this process, not on the
+    --jobs pool.
     """
 
     entries: List[Tuple[int, BookEntry]] = []
-    # Track (hash, from, to) tuples to allow multiple moves per position
-    visited_moves: Set[Tuple[int, int, int]] = set()
-    # Track how many moves we've stored per position hash
-    moves_per_hash: Dict[int, int] = defaultdict(int)
-
-    # BFS queue: (board, ply)
-    queue: List[Tuple[chess.Board, int]] = [(chess.Board(), 0)]
+    # Track (hash, from, to, check) tuples to allow multiple moves per position.
+    # Colliding positions that share an identical entry can share its bytes.
+    visited_moves: Set[Tuple[int, int, int, int]] = set()
+    # Track how many moves we've stored per position (polyglot key, c64 hash)
+    moves_per_position: Dict[Tuple[int, int], int] = defaultdict(int)
+    # Positions already queued or expanded: (polyglot key, c64 hash)
+    seen: Set[Tuple[int, int]] = set()
+    transpositions = 0
+    frontier_peak = 1
+    nodes_dequeued = 0
+    nodes_expanded = 0
+
+    # BFS queue of Nodes - hashes are carried per node and a full board is
+    # only rebuilt when the node is expanded
+    root = chess.Board()
+    root_hash = compute_c64_hash(root, tables)
+    root_key = chess.polyglot.zobrist_hash(root)
+    seen.add((root_key, root_hash))
+    queue: deque = deque([(pack_board(root), 0, root_hash, root_key)])
     positions_added = 0
 
-    print(f"  Starting BFS traversal (up to {MAX_MOVES_PER_POSITION} moves per position)...")
+    pool = None
+    if jobs > 1:
+        pool = multiprocessing.Pool(jobs, initializer=_init_worker,
+                                    initargs=(poly_book.filename, max_ply))
+    batch_size = jobs * EXPAND_CHUNK_SIZE if pool else 1
+
+    print(f"  Starting BFS traversal (up to {MAX_MOVES_PER_POSITION} moves per position, {jobs} job(s))...")
+
+    try:
+        while queue and positions_added < max_positions:
+            batch = [queue.popleft() for _ in range(min(batch_size, len(queue)))]
+            nodes_dequeued += len(batch)
+            if graph is not None:
+                expansions = expand_batch_cached(batch, poly_book, tables, max_ply, graph, pool, metrics)
+            elif pool:
+                chunks = [batch[i:i + EXPAND_CHUNK_SIZE] for i in range(0, len(batch), EXPAND_CHUNK_SIZE)]
+                expansions = [e for chunk in pool.map(_expand_chunk, chunks) for e in chunk]
+            else:
+                expansions = [expand_node(node, poly_book, tables, max_ply, metrics) for node in batch]
+
+            for node, expansion in zip(batch, expansions):
+                if expansion is None:
+                    continue
+                nodes_expanded += 1
+                state, _, c64_hash, poly_key = node
+                position_id = (poly_key, c64_hash)
+
+                for from_sq, to_sq, check, child in expansion:
+                    # Store this move unless it is a duplicate or the position
+                    # is full. Either way the child is still explored below.
+                    move_key = (c64_hash, from_sq, to_sq, check)
+                    if move_key not in visited_moves and moves_per_position[position_id] < MAX_MOVES_PER_POSITION:
+                        visited_moves.add(move_key)
+                        moves_per_position[position_id] += 1
+
+                        entry = BookEntry(
+                            hash_hi=(c64_hash >> 8) & 0xFF,
+                            from_sq=from_sq,
+                            to_sq=to_sq,
+                            check=check,
+                            poly_key=poly_key,
+                            state=state
+                        )
+                        entries.append((c64_hash, entry))
+                        positions_added += 1
+
+                        if positions_added % 500 == 0:
+                            print(f"  Added {positions_added} entries...")
+
+                        if positions_added >= max_positions:
+                            break
+
+                    if child is None:
+                        continue
+
+                    # Explore each distinct position once
+                    child_id = (child[3], child[2])
+                    if child_id in seen:
+                        transpositions += 1
+                        continue
+                    seen.add(child_id)
+                    queue.append(child)
+                    frontier_peak = max(frontier_peak, len(queue))
+
+                if positions_added >= max_positions:
+                    break
+    finally:
+        if pool:
+            pool.terminate()
+
+    unique_positions = len(moves_per_position)
+    multi_move_positions = sum(1 for count in moves_per_position.values() if count > 1)
+    print(f"  BFS complete: {positions_added} entries for {unique_positions} positions")
+    print(f"  Positions with multiple moves: {multi_move_positions}")
+    print(f"  Stats: {len(seen)} distinct positions queued, "
+          f"{transpositions} transpositions collapsed, frontier peak {frontier_peak}")
+    if graph is not None:
+        print(f"  Graph cache: {graph.reused} positions reused, {graph.expanded} expanded")
+    if metrics is not None:
+        metrics.counters.update(
+            bfs_entries=positions_added, book_positions=unique_positions,
+            multi_move_positions=multi_move_positions, nodes_dequeued=nodes_dequeued,
+            nodes_expanded=nodes_expanded, positions_queued=len(seen),
+            transpositions=transpositions, frontier_peak=frontier_peak)
+        if graph is not None:
+            metrics.counters.update(graph_reused=graph.reused, graph_expanded=graph.expanded)
+    return entries
 
-    while queue and positions_added < max_positions:
-        board, ply = queue.pop(0)
 
-        if ply >= max_ply:
+# =============================================================================
+# Leaf Search
+# =============================================================================
+#
+# --verify-depth scores every book leaf (a position reached by a book move but
+# not itself in the book) with the C64Search port of Negamax/Quiesce, and drops
+# the book moves whose leaf scores below --verify-threshold for the side that
+# played them. Scores are cached on disk per depth and Polyglot key.
+
+# Default --verify-threshold: five pawns down (PieceValues pawn = 10); the PSTs
+# alone move opening scores by two or three pawns
+VERIFY_THRESHOLD = -50
+
+# Leaf positions handed to a worker process per task
+SEARCH_CHUNK_SIZE = 8
+
+SEARCH_CACHE_VERSION = 1
+
+
+def book_move(board: chess.Board, from_sq: int, to_sq: int) -> chess.Move:
+    """The legal move a book entry stands for (castling is stored king to rook,
+    promotions as the queen promotion)."""
+    squares = {square_to_0x88(sq): sq for sq in chess.SQUARES}
+    move = chess.Move(squares[from_sq], squares[to_sq])
+    if board.piece_type_at(move.from_square) == chess.PAWN and chess.square_rank(move.to_square) in (0, 7):
+        move.promotion = chess.QUEEN
+    if move not in board.legal_moves:
+        raise ValueError(f"Book move {chess.square_name(move.from_square)}{chess.square_name(move.to_square)} "
+                         f"is not legal in {board.fen()}")
+    return move
+
+
+def find_leaves(entries: List[Tuple[int, BookEntry]], tables: ZobristTables) -> List[Tuple[int, str]]:
+    """(Polyglot key, FEN) of the leaf each entry leads to, or (0, '') if the
+    entry leads to a book position. The FEN keeps the en passant square after
+    every double push, as MakeMove sets enpassantsq."""
+    sources = {(entry.poly_key, c64_hash) for c64_hash, entry in entries}
+    leaves = []
+    for _, entry in entries:
+        board = unpack_board(entry.state)
+        board.push(book_move(board, entry.from_sq, entry.to_sq))
+        key = chess.polyglot.zobrist_hash(board)
+        if (key, compute_c64_hash(board, tables)) in sources:
+            leaves.append((0, ''))
+        else:
+            leaves.append((key, board.fen(en_passant='fen')))
+    return leaves
+
+
+def load_search_cache(filename: str, fingerprint: str) -> Dict[str, int]:
+    """Cached leaf scores, keyed "depth:polyglot key". Empty if the file is
+    missing or was written for other evaluation tables or search code."""
+    if not filename or not os.path.exists(filename):
+        return {}
+    with open(filename) as f:
+        cache = json.load(f)
+    if cache.get('version') != SEARCH_CACHE_VERSION or cache.get('fingerprint') != fingerprint:
+        print(f"  Search cache {filename} is out of date, starting afresh")
+        return {}
+    return cache['scores']
+
+
+def save_search_cache(filename: str, fingerprint: str, scores: Dict[str, int]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    temp = filename + '.tmp'
+    with open(temp, 'w') as f:
+        json.dump({'version': SEARCH_CACHE_VERSION, 'fingerprint': fingerprint, 'scores': scores},
+                  f, sort_keys=True, separators=(',', ':'))
+    os.replace(temp, filename)
+
+
+# Per-process state for --verify-depth workers
+_worker_params = None
+_worker_depth = 0
+
+
+def _init_search_worker(depth: int):
+    global _worker_params, _worker_depth
+    _worker_params = load_eval_params()
+    _worker_depth = depth
+
+
+def _search_chunk(fens: List[str]) -> List[int]:
+    return [search_fen(fen, _worker_depth, _worker_params).score for fen in fens]
+
+
+def prune_book_lines(entries: List[Tuple[int, BookEntry]], tables: ZobristTables, depth: int,
+                     threshold: int, jobs: int = 1,
+                     cache_file: Optional[str] = None) -> List[Tuple[int, BookEntry]]:
+    """Search every leaf at depth and drop the entries whose leaf scores below
+    threshold for the side that played the move."""
+    leaves = find_leaves(entries, tables)
+    fingerprint = search_fingerprint(load_eval_params())
+    scores = load_search_cache(cache_file, fingerprint)
+
+    pending: Dict[str, str] = {}
+    for key, fen in leaves:
+        score_key = f"{depth}:{key:016x}"
+        if fen and score_key not in scores:
+            pending[score_key] = fen
+    unique = len({key for key, fen in leaves if fen})
+    print(f"  Searching {unique} leaf positions at depth {depth} "
+          f"({unique - len(pending)} cached, {jobs} job(s))...")
+
+    if pending:
+        keys = list(pending)
+        chunks = [[pending[k] for k in keys[i:i + SEARCH_CHUNK_SIZE]]
+                  for i in range(0, len(keys), SEARCH_CHUNK_SIZE)]
+        if jobs > 1:
+            with multiprocessing.Pool(jobs, initializer=_init_search_worker, initargs=(depth,)) as pool:
+                results = pool.imap(_search_chunk, chunks)
+                found = [score for chunk in results for score in chunk]
+        else:
+            _init_search_worker(depth)
+            found = [score for chunk in chunks for score in _search_chunk(chunk)]
+        scores.update(zip(keys, found))
+        if cache_file:
+            save_search_cache(cache_file, fingerprint, scores)
+
+    kept = []
+    dropped = 0
+    for (c64_hash, entry), (key, fen) in zip(entries, leaves):
+        # The leaf is scored for the side to move there, the opponent of the mover
+        if fen and -scores[f"{depth}:{key:016x}"] < threshold:
+            dropped += 1
             continue
+        kept.append((c64_hash, entry))
+    print(f"  Leaf search: dropped {dropped} entries scoring below {threshold} for the mover")
+    return kept
 
-        # Look up position in Polyglot book
-        poly_key = chess.polyglot.zobrist_hash(board)
-        if poly_key not in poly_book:
-            continue
 
-        # Get moves sorted by weight (best moves first)
-        moves = sorted(poly_book[poly_key], key=lambda x: x[1], reverse=True)
+# =============================================================================
+# Budget Selection
+# =============================================================================
+#
+# --select-budget fills --byte-budget with the entries a game is most likely to
+# use instead of the first --max-positions entries in BFS order. Both sides are
+# assumed to pick book moves in proportion to their Polyglot weights, which
+# gives every position an expected number of visits per game (reach). An entry
+# is worth reach x its move's share of the position's weight: the chance that
+# a game reaches the position and continues with that book move. All entries
+# cost the same, so the best set for a table size is the top of that ranking;
+# the table size is chosen for the largest total once its 2 bytes per slot
+# are paid.
+#
+# Tables start at 256 slots, where LookupOpeningMove compares the full 16-bit
+# hash: hash collisions are then the same for every size, so they are resolved
+# once over all candidate entries before the selection spends bytes on them.
+
+MIN_SELECT_TABLE_SIZE = 256
+
+
+def reach_probabilities(poly_book: PolyglotBook, max_ply: int) -> Tuple[Dict[int, float],
+                                                                         Dict[Tuple[int, int, int], float]]:
+    """Expected visits per game for each book position up to max_ply, and
+    each book move's weight share, keyed by (Polyglot key, from, to).
+
+    Probability flows ply by ply, so transpositions add up and positions
+    repeated at different plies (Nf3 Nf6 Ng1 Ng8) are counted once per visit.
+    """
+    reach: Dict[int, float] = defaultdict(float)
+    shares: Dict[Tuple[int, int, int], float] = {}
+    root = chess.Board()
+    layer: Dict[int, Tuple[PackedBoard, float]] = {chess.polyglot.zobrist_hash(root): (pack_board(root), 1.0)}
+    for _ in range(max_ply):
+        next_layer: Dict[int, Tuple[PackedBoard, float]] = {}
+        for key, (state, probability) in layer.items():
+            reach[key] += probability
+            board = unpack_board(state)
+            moves = []
+            for move_bits, weight in poly_book.lookup(key):
+                move = decode_polyglot_move(move_bits, board)
+                if move in board.legal_moves:
+                    moves.append((move, weight))
+            total = sum(weight for _, weight in moves)
+            for move, weight in moves:
+                share = weight / total if total else 1 / len(moves)
+                shares[(key, square_to_0x88(move.from_square), square_to_0x88(move.to_square))] = share
+                child = board.copy(stack=False)
+                child.push(move)
+                child_key = chess.polyglot.zobrist_hash(child)
+                child_state, child_probability = next_layer.get(child_key, (None, 0.0))
+                next_layer[child_key] = (child_state or pack_board(child), child_probability + probability * share)
+        layer = next_layer
+    return reach, shares
 
-        # Compute C64 hash for this position
-        c64_hash = compute_c64_hash(board, tables)
 
-        # Process moves in book for this position (up to MAX_MOVES_PER_POSITION)
-        for move_bits, weight in moves:
-            try:
-                move = decode_polyglot_move(move_bits, board)
-                if move not in board.legal_moves:
-                    continue
-            except:
-                continue
-
-            # Create entry with 0x88 coordinates
-            from_sq = square_to_0x88(move.from_square)
-            to_sq = square_to_0x88(move.to_square)
-
-            # Check if we've already stored this exact move
-            move_key = (c64_hash, from_sq, to_sq)
-            if move_key in visited_moves:
-                # Still explore the move even if already stored
-                new_board = board.copy()
-                new_board.push(move)
-                queue.append((new_board, ply + 1))
-                continue
-
-            # Check if we have room for more moves at this position
-            if moves_per_hash[c64_hash] >= MAX_MOVES_PER_POSITION:
-                # Still explore the move even if we can't store it
-                new_board = board.copy()
-                new_board.push(move)
-                queue.append((new_board, ply + 1))
-                continue
-
-            # Store this move
-            visited_moves.add(move_key)
-            moves_per_hash[c64_hash] += 1
-
-            entry = BookEntry(
-                hash_hi=(c64_hash >> 8) & 0xFF,
-                from_sq=from_sq,
-                to_sq=to_sq
-            )
-            entries.append((c64_hash, entry))
-            positions_added += 1
-
-            if positions_added % 500 == 0:
-                print(f"  Added {positions_added} entries...")
-
-            if positions_added >= max_positions:
-                break
+@dataclass
+class BudgetChoice:
+    table_size: int
+    entries: int
+    book_bytes: int
+    expected_hits: float
+
+
+def select_by_budget(entries: List[Tuple[int, BookEntry]], values: List[float], byte_budget: int,
+                     min_size: int = MIN_SELECT_TABLE_SIZE,
+                     flags: int = 0) -> Tuple[Optional[int], List[int], List[BudgetChoice]]:
+    """Best table size and the indices of the entries to keep (in their
+    original order), plus the trade-off for every size tried."""
+    ranked = sorted(range(len(entries)), key=lambda i: -values[i])
+    curve: List[BudgetChoice] = []
+    best: Optional[BudgetChoice] = None
+    best_indices: List[int] = []
+    entry_size = book_entry_size(flags)
+    size = min_size
+    while book_image_size(0, size, flags) <= byte_budget:
+        capacity = (byte_budget - book_image_size(0, size, flags)) // entry_size
+        chosen = ranked[:capacity]
+        buckets = defaultdict(int)
+        for i in chosen:
+            buckets[entries[i][0] & (size - 1)] += 1
+        if flags & BOOK_FLAG_PACKED or not buckets or max(buckets.values()) <= MAX_BUCKET_ENTRIES:
+            choice = BudgetChoice(size, len(chosen), book_image_size(len(chosen), size, flags),
+                                  sum(values[i] for i in chosen))
+            curve.append(choice)
+            # Ties (everything fits) go to the larger table: shorter chains
+            if best is None or choice.expected_hits >= best.expected_hits - 1e-12:
+                best, best_indices = choice, sorted(chosen)
+        size *= 2
+    return (best.table_size if best else None), best_indices, curve
+
+
+def print_budget_curve(curve: List[BudgetChoice], best: Optional[int], byte_budget: int):
+    print(f"  Budget trade-off ({byte_budget} bytes, expected book hits per game):")
+    print("     slots  entries   bytes  expected hits")
+    for choice in curve:
+        mark = "  <-" if choice.table_size == best else ""
+        print(f"    {choice.table_size:6d}  {choice.entries:7d}  {choice.book_bytes:6d}  "
+              f"{choice.expected_hits:13.3f}{mark}")
 
-            # Make the move and explore further
-            new_board = board.copy()
-            new_board.push(move)
-            queue.append((new_board, ply + 1))
 
-        if positions_added >= max_positions:
-            break
+# =============================================================================
+# Hash Collisions
+# =============================================================================
 
-    unique_positions = len(moves_per_hash)
-    multi_move_positions = sum(1 for count in moves_per_hash.values() if count > 1)
-    print(f"  BFS complete: {positions_added} entries for {unique_positions} positions")
-    print(f"  Positions with multiple moves: {multi_move_positions}")
-    return entries
+# --collisions modes: drop what the probe cannot tell apart (with Check bytes,
+# less), or drop every entry at a colliding hash
+COLLISION_MODES = ['verify', 'drop']
+
+
+def probe_key(c64_hash: int, table_size: int) -> int:
+    """The bits LookupOpeningMove compares: bucket index plus HashHi.
+
+    The full 16-bit hash for tables of 256+ slots; smaller tables leave bits
+    of the low byte unchecked.
+    """
+    return (c64_hash & (table_size - 1)) | (c64_hash & 0xFF00)
+
+
+def resolve_collisions(entries: List[Tuple[int, BookEntry]], table_size: int,
+                       mode: str = 'verify', flags: int = 0) -> List[Tuple[int, BookEntry]]:
+    """Report true collisions and drop the entries they would misplay.
+
+    A true collision is two book positions (different Polyglot keys) that
+    LookupOpeningMove cannot tell apart by hash. In 'verify' mode an entry is
+    dropped if its Check byte also matches in a colliding position that does
+    not have the same move in the book; in 'drop' mode every entry of a
+    colliding hash goes. Packed books compare only the Check bits they store,
+    and books without Check bytes (flags) none, so 'verify' keeps only the
+    moves the colliding positions share.
+    """
+    # probe key -> polyglot key -> entries of that position
+    groups: Dict[int, Dict[int, List[Tuple[int, BookEntry]]]] = defaultdict(lambda: defaultdict(list))
+    for item in entries:
+        c64_hash, entry = item
+        groups[probe_key(c64_hash, table_size)][entry.poly_key].append(item)
+    colliding = {key: positions for key, positions in groups.items() if len(positions) > 1}
+
+    colliding_entries = sum(len(items) for positions in colliding.values() for items in positions.values())
+    print(f"  Collisions: {len(colliding)} hashes shared by "
+          f"{sum(len(positions) for positions in colliding.values())} positions ({colliding_entries} entries)")
+    for key, positions in list(colliding.items())[:10]:
+        fens = [unpack_board(items[0][1].state).fen() for items in positions.values()]
+        print(f"    ${key:04X}: {' | '.join(fens)}")
+
+    if not colliding:
+        return entries
+
+    dropped: Set[int] = set()
+    for positions in colliding.values():
+        if mode == 'drop':
+            dropped.update(id(entry) for items in positions.values() for _, entry in items)
+            continue
+        boards = {poly_key: state_to_0x88(items[0][1].state)
+                  for poly_key, items in positions.items()}
+        moves = {poly_key: {(entry.from_sq, entry.to_sq) for _, entry in items}
+                 for poly_key, items in positions.items()}
+        for poly_key, items in positions.items():
+            for _, entry in items:
+                for other, board88 in boards.items():
+                    if other == poly_key or (entry.from_sq, entry.to_sq) in moves[other]:
+                        continue
+                    if entry_check(check_byte(board88[entry.from_sq], board88[entry.to_sq]), flags) == \
+                            entry_check(entry.check, flags):
+                        dropped.add(id(entry))
+                        break
+
+    print(f"  Collisions ({mode}): dropped {len(dropped)} of {colliding_entries} colliding entries")
+    # Entries are in BFS order, so the first dropped are the most played lines
+    lost = [entry for _, entry in entries if id(entry) in dropped]
+    for entry in lost[:10]:
+        move = chess.square_name(square_from_0x88(entry.from_sq)) + chess.square_name(square_from_0x88(entry.to_sq))
+        print(f"    dropped {move}: {unpack_board(entry.state).fen()}")
+    if len(lost) > 10:
+        print(f"    ... and {len(lost) - 10} more")
+    if lost and mode == 'verify' and not flags & (BOOK_FLAG_CHECK | BOOK_FLAG_PACKED):
+        print("    (--check-byte tells more of them apart, at 1 byte per entry)")
+    return [item for item in entries if id(item[1]) not in dropped]
+
+
+# Default book location (the start of the book region, see book_probe.py)
+BOOK_LOAD_ADDRESS = BOOK_REGION_START
 
 
-def write_asm_book(entries: List[Tuple[int, BookEntry]], outfile: str, table_size: int):
-    """Write book as assembly file."""
+@dataclass
+class BookLayout:
+    table_size: int
+    hash_table: List[int]         # First entry index per bucket, or $FFFF
+    entry_data: List[BookEntry]   # Entries grouped by bucket
+    chains: List[int]             # Entries left in the bucket (BOOK_CHAIN_END = last)
+    flags: int = 0                # BOOK_FLAG_PACKED (version 4) or BOOK_FLAG_CHECK
+
+    @property
+    def packed(self) -> bool:
+        """Version 4: 3-byte entries, bucket ends in the table."""
+        return bool(self.flags & BOOK_FLAG_PACKED)
+
+    @property
+    def version(self) -> int:
+        return BOOK_VERSION_PACKED if self.packed else BOOK_VERSION
+
+    @property
+    def entry_size(self) -> int:
+        return book_entry_size(self.flags)
+
+    def slots(self) -> List[int]:
+        """The table as written: v3 first entries ($FFFF if empty), or for
+        packed books the first entry of every bucket plus the entry count."""
+        if not self.packed:
+            return self.hash_table
+        slots = []
+        count = 0
+        for first in self.hash_table:
+            slots.append(count)
+            if first != BOOK_NO_ENTRY:
+                count += self.chains[first] + 1
+        return slots + [count]
+
+    def entry_bytes(self, index: int) -> bytes:
+        entry = self.entry_data[index]
+        if self.packed:
+            return pack_entry(entry.hash_hi, entry.from_sq, entry.to_sq, entry.check)
+        if self.flags & BOOK_FLAG_CHECK:
+            return bytes((entry.hash_hi, entry.from_sq, entry.to_sq, entry.check, self.chains[index]))
+        return bytes((entry.hash_hi, entry.from_sq, entry.to_sq, self.chains[index]))
+
+
+def layout_book(entries: List[Tuple[int, BookEntry]], table_size: int, flags: int = 0) -> BookLayout:
+    """Group entries by bucket and build the hash table and chains.
+
+    Since format version 2 a bucket's entries are contiguous, so each entry's
+    Next byte counts the entries that follow it in the bucket. Packed books
+    (version 4) drop Next, and with it the bucket size limit.
+    """
+    packed = bool(flags & BOOK_FLAG_PACKED)
+    if table_size & (table_size - 1):
+        raise ValueError(f"Table size {table_size} is not a power of 2 (LookupOpeningMove masks the hash)")
+
     # Build hash table with chaining
-    hash_table = [0xFFFF] * table_size
+    hash_table = [BOOK_NO_ENTRY] * table_size
     entry_data: List[BookEntry] = []
     chains: List[int] = []
 
@@ -320,86 +1103,546 @@ def write_asm_book(entries: List[Tuple[int, BookEntry]], outfile: str, table_siz
         if bucket not in buckets or not buckets[bucket]:
             continue
 
+        bucket_entries = buckets[bucket]
+        if not packed and len(bucket_entries) > MAX_BUCKET_ENTRIES:
+            raise ValueError(f"Bucket {bucket} has {len(bucket_entries)} entries "
+                             f"(max {MAX_BUCKET_ENTRIES}); use a larger table")
+
         hash_table[bucket] = entry_idx
 
-        for i, (c64_hash, entry) in enumerate(buckets[bucket]):
+        for i, (c64_hash, entry) in enumerate(bucket_entries):
             entry_data.append(entry)
-            if i < len(buckets[bucket]) - 1:
-                chains.append(entry_idx + 1)
-            else:
-                chains.append(0xFF)
+            chains.append(len(bucket_entries) - 1 - i)
             entry_idx += 1
 
+    return BookLayout(table_size, hash_table, entry_data, chains, flags)
+
+
+def book_bytes(layout: BookLayout) -> bytes:
+    """Serialize a layout exactly as it sits in C64 memory (little-endian)."""
+    data = bytearray(struct.pack('<HBHHB', BOOK_MAGIC, layout.version,
+                                 len(layout.entry_data), layout.table_size, layout.flags))
+    for slot in layout.slots():
+        data += struct.pack('<H', slot)
+    for index in range(len(layout.entry_data)):
+        data += layout.entry_bytes(index)
+    return bytes(data)
+
+
+def verify_book(data: bytes, entries: List[Tuple[int, BookEntry]],
+                tables: Optional[ZobristTables] = None,
+                load_address: int = BOOK_LOAD_ADDRESS) -> List[str]:
+    """Walk every chain like LookupOpeningMove and check each entry is found.
+
+    The image must fit between load_address and the engine code. The entries
+    decoded back from it must equal the ones encoded, in layout order (with
+    the Check bits the format keeps). With tables, also rehash every source
+    position from scratch (in one batch) to catch drift in the incremental
+    hashes the BFS carries.
+    Returns a list of problems (empty if the book is consistent).
+    """
+    errors = []
+    try:
+        check_book_fits(len(data), load_address)
+        image = parse_book_image(data)
+    except ValueError as e:
+        return [str(e)]
+
+    # Every non-empty slot must start a chain that ends inside the entries,
+    # and together the chains must cover each entry exactly once
+    walked = 0
+    for index in range(image.table_size):
+        try:
+            walked += probe(image, index).visited
+        except ValueError as e:
+            errors.append(f"Slot {index}: {e}")
+    if walked != image.entry_count:
+        errors.append(f"Chains cover {walked} entries, header says {image.entry_count}")
+    if errors:
+        return errors
+
+    # Round trip: decode every entry and compare with what was encoded
+    mask = image.table_size - 1
+    encoded = [(c64_hash & mask, entry.hash_hi, entry.from_sq, entry.to_sq, entry_check(entry.check, image.flags))
+               for c64_hash, entry in sorted(entries, key=lambda item: item[0] & mask)]
+    decoded = book_entries(image)
+    if len(decoded) != len(encoded):
+        errors.append(f"Decoded {len(decoded)} entries, encoded {len(encoded)}")
+    for i, (want, got) in enumerate(zip(encoded, decoded)):
+        if want != got:
+            errors.append(f"Entry {i}: encoded {want}, decoded {got}")
+            break
+
+    # Every stored move must be returned by a probe of its own position,
+    # Check bytes (if any) included
+    boards: Dict[PackedBoard, List[int]] = {}
+    for c64_hash, entry in entries:
+        board88 = None
+        if entry.state is not None:
+            if entry.state not in boards:
+                boards[entry.state] = state_to_0x88(entry.state)
+            board88 = boards[entry.state]
+        try:
+            matches = probe(image, c64_hash, board88).matches
+        except ValueError as e:
+            errors.append(str(e))
+            continue
+        if (entry.from_sq, entry.to_sq) not in matches:
+            errors.append(f"Hash ${c64_hash:04X}: move ${entry.from_sq:02x}-${entry.to_sq:02x} "
+                          f"not returned (HashHi collision beyond {MAX_BOOK_MATCHES} matches?)")
+
+    if tables is not None:
+        sources = list(dict.fromkeys((entry.state, c64_hash) for c64_hash, entry in entries
+                                     if entry.state is not None))
+        rehashed = state_c64_hashes([state for state, _ in sources], tables)
+        for (_, c64_hash), full_hash in zip(sources, rehashed):
+            if c64_hash != full_hash:
+                errors.append(f"Hash ${c64_hash:04X}: position hashes to ${full_hash:04X} from scratch")
+    return errors
+
+
+def write_binary_book(layout: BookLayout, outfile: str, prg: bool, load_address: int = BOOK_LOAD_ADDRESS):
+    """Write the raw book image, or a PRG with a 2-byte load address."""
+    data = book_bytes(layout)
+    check_book_fits(len(data), load_address)
+    with open(outfile, 'wb') as f:
+        if prg:
+            f.write(struct.pack('<H', load_address))
+        f.write(data)
+
+    print(f"Output: {outfile} ({'PRG' if prg else 'raw binary'})")
+    print(f"  Entries: {len(layout.entry_data)}")
+    print(f"  Hash table: {layout.table_size} slots ({len(layout.slots()) * 2} bytes)")
+    print(f"  Total: {len(data)} bytes ({len(data) / 1024:.1f} KB){' packed' if layout.packed else ''}")
+
+
+def write_asm_stub(layout: BookLayout, binfile: str, outfile: str, prg: bool,
+                   load_address: int = BOOK_LOAD_ADDRESS, source: str = ''):
+    """Write a small assembly file that imports a binary book image.
+
+    Defines the same labels and constants as write_asm_book() so it can
+    replace book_data.asm without touching opening_moves.asm.
+    """
+    rel_path = os.path.relpath(binfile, os.path.dirname(os.path.abspath(outfile)))
+    skip = ", 2" if prg else ""
+    table_bytes = len(layout.slots()) * 2
+    with open(outfile, 'w') as f:
+        f.write(f"""// Auto-generated Opening Book Stub
+// Source: {source}
+// Generated by tools/generate_book.py
+// Positions: {len(layout.entry_data)} | Table: {layout.table_size} slots
+// Data: {rel_path}
+// DO NOT EDIT - regenerate from source
+
+#importonce
+
+*=${load_address:04X} "Generated Opening Book"
+
+.const GEN_BOOK_MAGIC = ${BOOK_MAGIC:04X}
+.const GEN_BOOK_VERSION = ${layout.version:02X}
+.const GEN_BOOK_CHAIN_END = ${BOOK_CHAIN_END:02X}
+
+GeneratedBook:
+  .import binary "{rel_path}"{skip}
+GeneratedBookEnd:
+
+.label GeneratedBookHashTable = GeneratedBook + {BOOK_HEADER_SIZE}
+.label GeneratedBookEntries = GeneratedBookHashTable + {table_bytes}
+""")
+    print(f"Stub: {outfile} -> {rel_path}")
+
+
+def write_asm_book(entries: List[Tuple[int, BookEntry]], outfile: str, table_size: int, flags: int = 0,
+                   load_address: int = BOOK_LOAD_ADDRESS, source: str = ''):
+    """Write book as assembly file; raises ValueError if it would not fit
+    below the engine code."""
+    layout = layout_book(entries, table_size, flags)
+    hash_table = layout.slots()
+    entry_data = layout.entry_data
+    chains = layout.chains
+    entry_size = layout.entry_size
+    packed = layout.packed
+    total = book_image_size(len(entry_data), table_size, flags)
+    check_book_fits(total, load_address)
+
     # Write assembly
     with open(outfile, 'w') as f:
         f.write(f"""// Auto-generated Opening Book Data
-// Source: Polyglot GM2600 opening book
+// Source: {source}
 // Generated by tools/generate_book.py
 // Positions: {len(entry_data)} | Table: {table_size} slots
 // DO NOT EDIT - regenerate from source
 
 #importonce
 
-// Place book after code ($5B00) extending into banked BASIC area if needed
-// $5B00-$9FFF = ~18KB, $A000-$BFFF = 8KB = 26KB total available
-*=$5B00 "Generated Opening Book"
+// Place book after code (${BOOK_REGION_START:04X}) extending into banked BASIC area if needed,
+// up to the piece-square tables at ${BOOK_REGION_END:04X} ({BOOK_REGION_END - BOOK_REGION_START} bytes)
+*=${load_address:04X} "Generated Opening Book"
 
-.const GEN_BOOK_MAGIC = $B00C
-.const GEN_BOOK_VERSION = $01
-.const GEN_BOOK_CHAIN_END = $FF
+.const GEN_BOOK_MAGIC = ${BOOK_MAGIC:04X}
+.const GEN_BOOK_VERSION = ${layout.version:02X}
+.const GEN_BOOK_CHAIN_END = ${BOOK_CHAIN_END:02X}
 
 GeneratedBook:
   .word GEN_BOOK_MAGIC
   .byte GEN_BOOK_VERSION
   .word {len(entry_data)}
   .word {table_size}
-  .byte $00
+  .byte ${layout.flags:02X}
 
-// Hash table ({table_size} * 2 = {table_size * 2} bytes)
+""")
+        if packed:
+            f.write(f"""// Bucket starts ({table_size} + 1 end * 2 = {len(hash_table) * 2} bytes): bucket b is
+// entries [slot b, slot b+1)
+GeneratedBookHashTable:
+""")
+        else:
+            f.write(f"""// Hash table ({table_size} * 2 = {table_size * 2} bytes)
 GeneratedBookHashTable:
 """)
 
         for slot in hash_table:
             f.write(f"  .word ${slot:04x}\n")
 
-        f.write(f"""
-// Entries ({len(entry_data)} * 4 = {len(entry_data) * 4} bytes)
+        if packed:
+            f.write(f"""
+// Entries ({len(entry_data)} * {entry_size} = {len(entry_data) * entry_size} bytes)
+// Format: HashHi, From (0-63) | colour << 7 | type bit 2 << 6, To (0-63) | type bits 1-0 << 6
 GeneratedBookEntries:
 """)
-
-        for i, entry in enumerate(entry_data):
-            chain = "GEN_BOOK_CHAIN_END" if chains[i] == 0xFF else f"{chains[i]}"
-            f.write(f"  .byte ${entry.hash_hi:02x}, ${entry.from_sq:02x}, ${entry.to_sq:02x}, {chain}\n")
+            for i in range(len(entry_data)):
+                f.write("  .byte " + ", ".join(f"${b:02x}" for b in layout.entry_bytes(i)) + "\n")
+        else:
+            f.write(f"""
+// Entries ({len(entry_data)} * {entry_size} = {len(entry_data) * entry_size} bytes)
+// Format: HashHi, From (0x88), To (0x88), {'Check, ' if flags & BOOK_FLAG_CHECK else ''}Next (entries left in bucket)
+GeneratedBookEntries:
+""")
+            for i, entry in enumerate(entry_data):
+                chain = "GEN_BOOK_CHAIN_END" if chains[i] == BOOK_CHAIN_END else f"{chains[i]}"
+                check = f"${entry.check:02x}, " if flags & BOOK_FLAG_CHECK else ""
+                f.write(f"  .byte ${entry.hash_hi:02x}, ${entry.from_sq:02x}, ${entry.to_sq:02x}, "
+                        f"{check}{chain}\n")
 
         f.write("\nGeneratedBookEnd:\n")
 
-    total = 8 + table_size * 2 + len(entry_data) * 4
     print(f"Output: {outfile}")
     print(f"  Entries: {len(entry_data)}")
-    print(f"  Hash table: {table_size} slots ({table_size * 2} bytes)")
-    print(f"  Entry data: {len(entry_data) * 4} bytes")
+    print(f"  Hash table: {table_size} slots ({len(hash_table) * 2} bytes)")
+    print(f"  Entry data: {len(entry_data) * entry_size} bytes{' (packed)' if packed else ''}")
     print(f"  Total: {total} bytes ({total / 1024:.1f} KB)")
 
+# =============================================================================
+# Pipeline and Cache
+# =============================================================================
+
+def generate_entries(args, tables: ZobristTables, graph: Optional[GraphCache] = None,
+                     metrics: Optional[RunMetrics] = None) -> List[Tuple[int, BookEntry]]:
+    """Everything from the input to the final entries: PGN counting, BFS,
+    leaf search and budget or layout selection. May set args.table_size."""
+    flags = book_flags(args.packed, args.check_byte)
+    temp_book = None
+    if args.pgn or len(args.books) > 1:
+        # The counted or merged moves go to a Polyglot book, kept if asked for
+        kept = args.pgn_book if args.pgn else args.merged_book
+        if kept:
+            args.input = kept
+        else:
+            handle, temp_book = tempfile.mkstemp(suffix='.bin', dir=os.path.dirname(os.path.abspath(args.output)))
+            os.close(handle)
+            args.input = temp_book
+
+    try:
+        if args.pgn:
+            pgn_filter = PgnFilter(args.max_ply, args.min_elo, args.results)
+            with optional_phase(metrics, 'pgn'):
+                pgn_to_polyglot(args.pgn, args.input, pgn_filter, args.jobs, args.min_games)
+        elif len(args.books) > 1:
+            print(f"Merging: {describe_sources(args.books)} ({args.merge_mode} of weights)")
+            with optional_phase(metrics, 'merge'):
+                try:
+                    stats = merge_books(args.books, args.input, args.merge_mode)
+                except ValueError as e:
+                    print(f"Cannot merge: {e}")
+                    sys.exit(1)
+            print(f"  {stats.read} entries read, {stats.entries} written for {stats.positions} positions")
+
+        print(f"Reading: {args.input}")
+        with optional_phase(metrics, 'read'):
+            poly_book = read_polyglot_book(args.input)
+            positions = poly_book.count_positions()
+        print(f"  {positions} unique positions, {len(poly_book)} total entries")
+        if metrics is not None:
+            metrics.counters.update(input_positions=positions, input_entries=len(poly_book))
+
+        if args.select_budget:
+            print(f"Generating C64 book (max_ply={args.max_ply}, every position for --select-budget)...")
+        else:
+            print(f"Generating C64 book (max_ply={args.max_ply}, max_positions={args.max_positions})...")
+        max_positions = sys.maxsize if args.select_budget else args.max_positions
+        with optional_phase(metrics, 'bfs'):
+            entries = build_book(poly_book, tables, args.max_ply, max_positions, args.jobs, graph, metrics)
+        if args.select_budget:
+            with optional_phase(metrics, 'reach'):
+                reach, shares = reach_probabilities(poly_book, args.max_ply)
+
+        poly_book.close()
+    finally:
+        if temp_book:
+            os.remove(temp_book)
+
+    if args.verify_depth:
+        cache_file = args.verify_cache
+        if not cache_file and not args.no_cache:
+            cache_file = os.path.join(args.cache, os.path.splitext(os.path.basename(args.output))[0] + '.search.json')
+        with optional_phase(metrics, 'leaf_search'):
+            entries = prune_book_lines(entries, tables, args.verify_depth, args.verify_threshold,
+                                       args.jobs, cache_file)
+
+    if args.select_budget:
+        byte_budget = args.byte_budget or book_region_budget(args.load_address)
+        values = [reach.get(e.poly_key, 0.0) * shares.get((e.poly_key, e.from_sq, e.to_sq), 0.0)
+                  for _, e in entries]
+        value_of = {id(e): v for (_, e), v in zip(entries, values)}
+        with optional_phase(metrics, 'collisions'):
+            entries = resolve_collisions(entries, MIN_SELECT_TABLE_SIZE, args.collisions, flags)
+        values = [value_of[id(e)] for _, e in entries]
+        with optional_phase(metrics, 'selection'):
+            best, keep, curve = select_by_budget(entries, values, byte_budget, flags=flags)
+        print_budget_curve(curve, best, byte_budget)
+        print(f"  All {len(entries)} candidate entries: {sum(values):.3f} expected hits")
+        if best is None:
+            print(f"No table size fits in {byte_budget} bytes")
+            sys.exit(1)
+        # The budget ends at the engine code: the chosen layout must fit below it
+        assert book_image_size(len(keep), best, flags) <= byte_budget
+        check_book_fits(book_image_size(len(keep), best, flags), args.load_address)
+        print(f"  Chose table size {best}: {len(keep)} of {len(entries)} entries")
+        # Baseline: the same table filled with entries in BFS order instead
+        first = (byte_budget - book_image_size(0, best, flags)) // book_entry_size(flags)
+        print(f"  (first {min(first, len(entries))} entries in BFS order: "
+              f"{sum(values[:first]):.3f} expected hits)")
+        entries = [entries[i] for i in keep]
+        args.table_size = best
+        if metrics is not None:
+            metrics.counters['expected_hits'] = round(sum(values[i] for i in keep), 4)
+
+    if args.optimize_layout:
+        byte_budget = args.byte_budget or book_region_budget(args.load_address)
+        flat = [(h, e.hash_hi, e.from_sq, e.to_sq, e.check) for h, e in entries]
+        with optional_phase(metrics, 'selection'):
+            best, curve = optimize_table_size(flat, byte_budget, flags=flags)
+        print_layout_curve(curve, best, byte_budget)
+        if best is None:
+            print(f"No table size fits {len(entries)} entries in {byte_budget} bytes")
+            sys.exit(1)
+        print(f"  Chose table size {best}")
+        args.table_size = best
+    return entries
+
+
+# Modules whose code decides the expanded graph, and the final entries
+GRAPH_MODULES = ['generate_book', 'c64_zobrist']
+RESULT_MODULES = GRAPH_MODULES + ['book_probe', 'pgn_book', 'book_merge']
+
+# Arguments that only choose where and how the output is written
+OUTPUT_ARGS = {'input', 'books', 'output', 'pgn', 'pgn_book', 'merged_book', 'format', 'stub', 'jobs',
+               'verify_cache', 'cache', 'no_cache', 'metrics', 'profile'}
+
+
+def book_source(args) -> str:
+    """The inputs as the header of a generated book names them."""
+    if args.pgn:
+        return f"PGN {args.pgn}"
+    return f"Polyglot {describe_sources(args.books)}"
+
+
+def result_cache_key(args, tables: ZobristTables) -> str:
+    """Key for the final entries: input digests (and weights), generator
+    parameters, Zobrist fingerprint and code (with the search fingerprint when
+    leaves are searched)."""
+    params = {name: value for name, value in vars(args).items() if name not in OUTPUT_ARGS}
+    search = search_fingerprint(load_eval_params()) if args.verify_depth else None
+    inputs = file_digest(args.pgn) if args.pgn else [(file_digest(s.filename), s.weight) for s in args.books]
+    return cache_key('generate_book', inputs, params,
+                     zobrist_fingerprint(tables), source_digest(RESULT_MODULES), search)
+
+
+def entries_to_record(entries: List[Tuple[int, BookEntry]]) -> list:
+    return [(c64_hash, e.hash_hi, e.from_sq, e.to_sq, e.check, e.poly_key, e.state) for c64_hash, e in entries]
+
+
+def entries_from_record(record: list) -> List[Tuple[int, BookEntry]]:
+    return [(c64_hash, BookEntry(hash_hi, from_sq, to_sq, check, poly_key, state))
+            for c64_hash, hash_hi, from_sq, to_sq, check, poly_key, state in record]
+
+
+def generate(args, metrics: Optional[RunMetrics] = None):
+    """The run after argument checks: cache lookup or generation, collision
+    handling, layout, verification and writing."""
+    tables = ZobristTables()
+    cache = BookCache(None if args.no_cache else args.cache)
+    result_key = None
+    record = None
+    if cache.directory:
+        with optional_phase(metrics, 'cache'):
+            result_key = result_cache_key(args, tables)
+            # A cached run would not write the counted PGN moves or merged books
+            kept = args.pgn_book if args.pgn else args.merged_book if len(args.books) > 1 else None
+            if not (kept and not os.path.exists(kept)):
+                record = cache.load('result', result_key)
+
+    if record is not None:
+        entries = entries_from_record(record['entries'])
+        args.table_size = record['table_size']
+        print(f"Cached: {len(entries)} entries for this input and these parameters "
+              f"({os.path.relpath(cache.path('result', result_key))})")
+    else:
+        graph = None
+        graph_key = cache_key('generate_book graph', zobrist_fingerprint(tables), source_digest(GRAPH_MODULES))
+        if cache.directory:
+            with optional_phase(metrics, 'cache'):
+                graph = GraphCache(cache.load('graph', graph_key))
+            print(f"Graph cache: {len(graph.nodes)} positions from earlier runs")
+        entries = generate_entries(args, tables, graph, metrics)
+        if cache.directory:
+            with optional_phase(metrics, 'cache'):
+                if graph is not None and graph.expanded:
+                    cache.save('graph', graph_key, graph.nodes)
+                cache.save('result', result_key, {'entries': entries_to_record(entries),
+                                                  'table_size': args.table_size})
+
+    flags = book_flags(args.packed, args.check_byte)
+    with optional_phase(metrics, 'collisions'):
+        entries = resolve_collisions(entries, args.table_size, args.collisions, flags)
+    with optional_phase(metrics, 'layout'):
+        layout = layout_book(entries, args.table_size, flags)
+        data = book_bytes(layout)
+    # Cached entries had their hashes rechecked from scratch when generated
+    with optional_phase(metrics, 'verify'):
+        errors = verify_book(data, entries, None if record is not None else tables, args.load_address)
+    if errors:
+        for error in errors[:20]:
+            print(f"  Verify: {error}")
+        print(f"Book verification failed ({len(errors)} problems)")
+        sys.exit(1)
+    print(f"  Verified: every chain ends in its bucket, all {len(entries)} entries reachable and "
+          f"decoded as encoded{', hashes match' if record is None else ''}")
+
+    print(f"Writing: {args.output}")
+    with optional_phase(metrics, 'write'):
+        if args.format == 'asm':
+            write_asm_book(entries, args.output, args.table_size, flags, args.load_address, book_source(args))
+        else:
+            prg = args.format == 'prg'
+            write_binary_book(layout, args.output, prg, args.load_address)
+            if args.stub:
+                write_asm_stub(layout, args.output, args.stub, prg, args.load_address, book_source(args))
+
+    if metrics is not None:
+        metrics.counters.update(cached=record is not None, entries=len(entries), book_bytes=len(data),
+                                packed=args.packed, check_byte=args.check_byte,
+                                chains=chain_stats((h for h, _ in entries), args.table_size))
+        metrics.rate('nodes_per_sec', 'nodes_expanded', 'bfs')
+
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('input', help='Polyglot book (.bin)')
-    parser.add_argument('output', help='Output assembly (.asm)')
+    parser.add_argument('books', nargs='*', type=parse_book_source, metavar='BOOK[:WEIGHT]',
+                        help='Polyglot book (.bin); several are merged with their weights scaled by '
+                             'the optional multipliers (see book_merge.py). Omit with --pgn')
+    parser.add_argument('output', help='Output file (.asm, .bin or .prg, see --format)')
+    parser.add_argument('--merge-mode', choices=MERGE_MODES, default='sum',
+                        help='With several books, sum the weights of a move found in more than '
+                             'one or keep the largest (default sum)')
+    parser.add_argument('--merged-book', metavar='BIN',
+                        help='With several books, keep the merged Polyglot book')
+    parser.add_argument('--pgn', metavar='PGN',
+                        help='Build from a game collection (.pgn or .pgn.gz) instead of a Polyglot book')
+    parser.add_argument('--min-elo', type=int, default=0,
+                        help='With --pgn, only games where both players are rated at least this')
+    parser.add_argument('--results', type=parse_results, default=RESULTS,
+                        help=f'With --pgn, game results to keep (default {",".join(RESULTS)})')
+    parser.add_argument('--min-games', type=int, default=MIN_MOVE_GAMES,
+                        help=f'With --pgn, leave out moves played fewer times (default {MIN_MOVE_GAMES})')
+    parser.add_argument('--pgn-book', metavar='BIN',
+                        help='With --pgn, keep the counted moves as this Polyglot book')
     parser.add_argument('--max-ply', type=int, default=15)
     parser.add_argument('--max-positions', type=int, default=8000)
     parser.add_argument('--table-size', type=int, default=512)
+    parser.add_argument('--optimize-layout', action='store_true',
+                        help='Choose the smallest table size within 5%% of the fastest probe that fits --byte-budget')
+    parser.add_argument('--byte-budget', type=lambda v: int(v, 0), default=None,
+                        help=f'Bytes available for the book (default: load address up to the '
+                             f'engine code at ${BOOK_REGION_END:04X})')
+    parser.add_argument('--select-budget', action='store_true',
+                        help='Fill --byte-budget with the entries most likely to be reached, by '
+                             'Polyglot weights along the path (explores every position up to '
+                             '--max-ply; --max-positions and --table-size are ignored)')
+    parser.add_argument('--packed', action='store_true',
+                        help='Write format version 4: 3-byte entries instead of 4 (Flags bit 0)')
+    parser.add_argument('--check-byte', action='store_true',
+                        help='Add a Check byte to every entry (5 bytes, Flags bit 1) so that a '
+                             'position sharing a hash with a book position rarely gets its moves')
+    parser.add_argument('--format', choices=['asm', 'bin', 'prg'], default='asm',
+                        help='asm: KickAssembler source; bin: raw memory image; prg: image with load address')
+    parser.add_argument('--stub', metavar='ASM',
+                        help='With bin/prg, also write an assembly stub that imports the image')
+    parser.add_argument('--load-address', type=lambda v: int(v, 0), default=BOOK_LOAD_ADDRESS,
+                        help='Load address (default: 0x5B00); the book must end below the engine code')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes for PGN parsing, BFS expansion and the leaf search (output is identical for any value)')
+    parser.add_argument('--verify-depth', type=int, default=None, metavar='N',
+                        help='Search every book leaf N plies deep and drop lines that score '
+                             'below --verify-threshold (uses --jobs worker processes)')
+    parser.add_argument('--verify-threshold', type=int, default=VERIFY_THRESHOLD,
+                        help=f'Lowest leaf score kept, for the side that played the book move, '
+                             f'pawn = 10 (default {VERIFY_THRESHOLD})')
+    parser.add_argument('--verify-cache', metavar='JSON',
+                        help='Leaf score cache (default: output name with .search.json in the '
+                             '--cache directory; none with --no-cache)')
+    parser.add_argument('--collisions', choices=COLLISION_MODES, default='verify',
+                        help='Positions sharing a hash: verify (drop entries the probe cannot '
+                             'tell apart, fewer with --check-byte) or drop (drop all their entries)')
+    parser.add_argument('--cache', metavar='DIR', default=DEFAULT_CACHE_DIR,
+                        help='Generation cache: final entries per input and parameters, and the '
+                             'expanded position graph (default: tools/.book_cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Neither read nor write the generation cache')
+    parser.add_argument('--metrics', metavar='JSON',
+                        help='Write wall and CPU time per phase, BFS counters, peak RSS and '
+                             'chain length statistics to this file (see book_metrics.py)')
+    parser.add_argument('--profile', type=int, nargs='?', const=PROFILE_TOP, default=None, metavar='N',
+                        help=f'Run under cProfile and print the N functions with the most own time '
+                             f'(default {PROFILE_TOP})')
     args = parser.parse_args()
-
-    print(f"Reading: {args.input}")
-    poly_book = read_polyglot_book(args.input)
-    print(f"  {len(poly_book)} unique positions, {sum(len(v) for v in poly_book.values())} total entries")
-
-    print(f"Generating C64 book (max_ply={args.max_ply}, max_positions={args.max_positions})...")
-    tables = ZobristTables()
-    entries = build_book(poly_book, tables, args.max_ply, args.max_positions)
-
-    print(f"Writing: {args.output}")
-    write_asm_book(entries, args.output, args.table_size)
+    if bool(args.pgn) == bool(args.books):
+        parser.error("give Polyglot books and an output file, or --pgn and an output file")
+    if args.merged_book and os.path.abspath(args.merged_book) in {os.path.abspath(s.filename) for s in args.books}:
+        parser.error("--merged-book must not be one of the input books")
+    args.input = args.books[0].filename if len(args.books) == 1 else None
+    if args.table_size < 1 or args.table_size & (args.table_size - 1):
+        parser.error("--table-size must be a power of 2 (LookupOpeningMove masks the hash)")
+    if args.byte_budget is not None and not 0 < args.byte_budget <= book_region_budget(args.load_address):
+        parser.error(f"--byte-budget must be 1-{book_region_budget(args.load_address)}: the engine "
+                     f"code starts at ${BOOK_REGION_END:04X}")
+    if args.packed and args.check_byte:
+        parser.error("--packed entries keep the mover part of the Check byte; drop --check-byte")
+    if not BOOK_REGION_START <= args.load_address < BOOK_REGION_END:
+        parser.error(f"--load-address must be in the book region "
+                     f"${BOOK_REGION_START:04X}-${BOOK_REGION_END - 1:04X}")
+    if args.select_budget and args.optimize_layout:
+        parser.error("--select-budget chooses the table size itself; drop --optimize-layout")
+    if args.verify_depth is not None and not 1 <= args.verify_depth < MAX_DEPTH:
+        parser.error(f"--verify-depth must be 1-{MAX_DEPTH - 1}")
+
+    metrics = RunMetrics('generate_book') if args.metrics or args.profile else None
+    with profiled(args.profile, metrics):
+        generate(args, metrics)
+    if metrics is not None:
+        metrics.print_summary()
+        if args.metrics:
+            metrics.write(args.metrics)
 
 
 if __name__ == '__main__':
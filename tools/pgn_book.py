@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+PGN Game Collections as Opening Book Input
+
+Streams a PGN file (plain or .gz) game by game, keeps the games that pass
+the Elo and result filters, and counts for every position up to --max-ply
+how often each move was played and how it scored for the side that played
+it. The counts become a Polyglot book (weight = 2 x wins + draws, as
+polyglot make-book does), so generate_book.py builds the C64 book from a
+game collection through the same BFS, C64 hashing and write_asm_book()
+stage as from a .bin.
+
+Games are read in chunks of raw text and parsed on a process pool; at most
+two chunks per worker are in flight and each chunk comes back as per
+position move counts, so memory grows with the number of distinct
+positions, not with the number of games.
+"""
+
+import argparse
+import gzip
+import io
+import multiprocessing
+import re
+import struct
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import chess
+import chess.pgn
+import chess.polyglot
+
+
+# =============================================================================
+# Parameters
+# =============================================================================
+
+# Games per chunk handed to a worker process
+PGN_CHUNK_SIZE = 500
+
+# Moves played fewer times than this are left out of the book
+MIN_MOVE_GAMES = 3
+
+POLYGLOT_ENTRY = struct.Struct('>QHHi')
+POLYGLOT_MAX_WEIGHT = 0xFFFF
+
+RESULTS = ('1-0', '0-1', '1/2-1/2')
+
+HEADER_RE = re.compile(r'^\[(\w+)\s+"(.*)"\]\s*$')
+
+# Move counts per position: {polyglot key: {polyglot move: [games, wins, draws]}}
+# with wins and draws for the side that played the move
+MoveStats = Dict[int, Dict[int, List[int]]]
+
+
+@dataclass
+class PgnFilter:
+    max_ply: int
+    min_elo: int = 0              # Both players at least this rated (0 = any)
+    results: Tuple[str, ...] = RESULTS
+
+
+@dataclass
+class PgnStats:
+    games: int = 0
+    kept: int = 0
+    moves: Optional[MoveStats] = None
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+def open_pgn(filename: str):
+    opener = gzip.open if filename.endswith('.gz') else open
+    return opener(filename, 'rt', encoding='utf-8', errors='replace')
+
+
+def iter_game_texts(filename: str) -> Iterator[str]:
+    """Raw text of each game; a header line after movetext starts the next."""
+    lines: List[str] = []
+    in_moves = False
+    with open_pgn(filename) as f:
+        for line in f:
+            if line.startswith('['):
+                if in_moves:
+                    yield ''.join(lines)
+                    lines = []
+                    in_moves = False
+            elif line.strip():
+                in_moves = True
+            lines.append(line)
+    if in_moves:
+        yield ''.join(lines)
+
+
+def iter_chunks(texts: Iterator[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def game_headers(text: str) -> Dict[str, str]:
+    """The tag pairs, without parsing the movetext."""
+    headers = {}
+    for line in text.splitlines():
+        if not line.startswith('['):
+            break
+        m = HEADER_RE.match(line)
+        if m:
+            headers[m.group(1)] = m.group(2)
+    return headers
+
+
+def passes(headers: Dict[str, str], pgn_filter: PgnFilter) -> bool:
+    if headers.get('Result') not in pgn_filter.results:
+        return False
+    if headers.get('Variant', 'Standard').lower() not in ('standard', 'chess') or 'FEN' in headers:
+        return False
+    if pgn_filter.min_elo:
+        for tag in ('WhiteElo', 'BlackElo'):
+            try:
+                if int(headers.get(tag, '0')) < pgn_filter.min_elo:
+                    return False
+            except ValueError:
+                return False
+    return True
+
+
+# =============================================================================
+# Counting
+# =============================================================================
+
+def polyglot_move(board: chess.Board, move: chess.Move) -> int:
+    """Polyglot move bits; castling is encoded king-takes-rook."""
+    to_sq = move.to_square
+    if board.is_castling(move):
+        to_sq = chess.square(7 if chess.square_file(to_sq) > 4 else 0, chess.square_rank(to_sq))
+    promo = move.promotion - 1 if move.promotion else 0
+    return (chess.square_file(to_sq) | chess.square_rank(to_sq) << 3 |
+            chess.square_file(move.from_square) << 6 | chess.square_rank(move.from_square) << 9 |
+            promo << 12)
+
+
+def count_games(texts: List[str], pgn_filter: PgnFilter) -> PgnStats:
+    """Move counts for one chunk of games."""
+    stats = PgnStats(moves={})
+    moves = stats.moves
+    for text in texts:
+        stats.games += 1
+        headers = game_headers(text)
+        if not passes(headers, pgn_filter):
+            continue
+        game = chess.pgn.read_game(io.StringIO(text))
+        if game is None or game.errors:
+            continue
+        stats.kept += 1
+        result = headers['Result']
+        board = game.board()
+        for ply, move in enumerate(game.mainline_moves()):
+            if ply >= pgn_filter.max_ply:
+                break
+            key = chess.polyglot.zobrist_hash(board)
+            counts = moves.setdefault(key, {}).setdefault(polyglot_move(board, move), [0, 0, 0])
+            counts[0] += 1
+            if result == '1/2-1/2':
+                counts[2] += 1
+            elif (result == '1-0') == board.turn:
+                counts[1] += 1
+            board.push(move)
+    return stats
+
+
+def merge_stats(total: PgnStats, part: PgnStats) -> None:
+    total.games += part.games
+    total.kept += part.kept
+    for key, part_moves in part.moves.items():
+        position = total.moves.setdefault(key, {})
+        for move, counts in part_moves.items():
+            merged = position.get(move)
+            if merged is None:
+                position[move] = counts
+            else:
+                merged[0] += counts[0]
+                merged[1] += counts[1]
+                merged[2] += counts[2]
+
+
+_worker_filter: Optional[PgnFilter] = None
+
+
+def _init_pgn_worker(pgn_filter: PgnFilter):
+    global _worker_filter
+    _worker_filter = pgn_filter
+
+
+def _count_chunk(texts: List[str]) -> PgnStats:
+    return count_games(texts, _worker_filter)
+
+
+def collect_pgn_stats(filename: str, pgn_filter: PgnFilter, jobs: int = 1,
+                      chunk_size: int = PGN_CHUNK_SIZE) -> PgnStats:
+    """Count moves over a whole PGN file, with jobs worker processes."""
+    total = PgnStats(moves={})
+    chunks = iter_chunks(iter_game_texts(filename), chunk_size)
+    reported = 0
+
+    def report():
+        nonlocal reported
+        if total.games - reported >= 10000:
+            reported = total.games
+            print(f"  {total.games} games, {total.kept} kept, {len(total.moves)} positions...")
+
+    if jobs <= 1:
+        for chunk in chunks:
+            merge_stats(total, count_games(chunk, pgn_filter))
+            report()
+        return total
+
+    # A bounded window of chunks in flight: Pool.imap would read ahead
+    # through the whole file
+    with multiprocessing.Pool(jobs, initializer=_init_pgn_worker, initargs=(pgn_filter,)) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.apply_async(_count_chunk, (chunk,)))
+            if len(pending) >= 2 * jobs:
+                merge_stats(total, pending.pop(0).get())
+                report()
+        for result in pending:
+            merge_stats(total, result.get())
+    return total
+
+
+# =============================================================================
+# Polyglot Output
+# =============================================================================
+
+def move_weight(counts: List[int]) -> int:
+    games, wins, draws = counts
+    return 2 * wins + draws
+
+
+def write_polyglot(moves: MoveStats, filename: str, min_games: int = MIN_MOVE_GAMES) -> Tuple[int, int]:
+    """Write the counts as a key-sorted Polyglot book. Moves seen fewer than
+    min_games times or that never scored are left out; weights are scaled
+    per position to fit 16 bits. Returns (positions, entries) written."""
+    positions = entries = 0
+    with open(filename, 'wb') as f:
+        for key in sorted(moves):
+            kept = [(move, move_weight(counts)) for move, counts in moves[key].items()
+                    if counts[0] >= min_games and move_weight(counts) > 0]
+            if not kept:
+                continue
+            top = max(weight for _, weight in kept)
+            scale = min(1.0, POLYGLOT_MAX_WEIGHT / top)
+            for move, weight in sorted(kept, key=lambda m: -m[1]):
+                f.write(POLYGLOT_ENTRY.pack(key, move, max(1, int(weight * scale)), 0))
+                entries += 1
+            positions += 1
+    return positions, entries
+
+
+def print_position_summary(moves: MoveStats, board: chess.Board, limit: int = 8) -> None:
+    """Most played moves from a position with their score for the mover."""
+    position = moves.get(chess.polyglot.zobrist_hash(board), {})
+    rows = sorted(position.items(), key=lambda m: -m[1][0])[:limit]
+    for move_bits, (games, wins, draws) in rows:
+        promo = move_bits >> 12 & 7
+        move = chess.Move(move_bits >> 6 & 63, move_bits & 63, promo + 1 if promo else None)
+        print(f"    {board.san(move):7s} {games:8d} games  {100.0 * (wins + draws / 2) / games:5.1f}% score")
+
+
+def pgn_to_polyglot(pgn_file: str, book_file: str, pgn_filter: PgnFilter, jobs: int = 1,
+                    min_games: int = MIN_MOVE_GAMES) -> PgnStats:
+    print(f"Reading PGN: {pgn_file} (max_ply={pgn_filter.max_ply}, min_elo={pgn_filter.min_elo or 'any'}, "
+          f"results={','.join(pgn_filter.results)}, {jobs} job(s))")
+    stats = collect_pgn_stats(pgn_file, pgn_filter, jobs)
+    pairs = sum(len(position) for position in stats.moves.values())
+    print(f"  {stats.games} games, {stats.kept} kept: {len(stats.moves)} positions, {pairs} position/move pairs")
+    print("  From the start position:")
+    print_position_summary(stats.moves, chess.Board())
+    positions, entries = write_polyglot(stats.moves, book_file, min_games)
+    print(f"  Wrote {book_file}: {entries} entries for {positions} positions (moves played {min_games}+ times)")
+    return stats
+
+
+def parse_results(text: str) -> Tuple[str, ...]:
+    results = tuple(r.strip() for r in text.split(',') if r.strip())
+    for result in results:
+        if result not in RESULTS:
+            raise argparse.ArgumentTypeError(f"unknown result {result!r} (use {', '.join(RESULTS)})")
+    return results
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+C64 Transposition Table Simulator
+
+Replays the TTProbe / TTStore calls of C64Search (c64_search.py) against
+models of ai/tt.asm and alternatives, to size the table and pick a
+replacement policy before spending C64 RAM on it.
+
+The engine's table is 512 entries of 8 bytes at $C000, indexed by
+ZobristHash & $1FF, checked against the full 16-bit hash, always replaced,
+and cleared by FindBestMove before every move. Two engine details matter:
+
+  - ComputeZobristHash takes the side to move from currentplayer, the side
+    at the root, so inside a search a position and the same position with
+    the other side to move share a key
+  - Negamax stores every score as TT_FLAG_EXACT, cutoffs included, and
+    returns any hit with enough depth
+
+The trace comes from a search without a table, so a hit does not prune the
+subtree that follows it in the replay; the numbers are upper bounds on what
+the table can save, not a re-run of the search.
+
+For each table size, policy (always, depth, two-tier) and lifetime (cleared
+per move or kept across moves) it reports:
+
+  Hit%      probes that find the 16-bit key with at least the depth asked for
+  Useful%   hits on the same position whose real bound decides the window
+  False     hits on another position (16-bit collision or side to move)
+  Unsound   hits the engine returns that are wrong: false hits plus bounds
+            stored as EXACT that do not decide the window
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from c64_eval import EMPTY_PIECE, OFFBOARD_MASK, TYPE_MASK, WHITE_COLOR, load_eval_params, read_fens
+from c64_search import (
+    MAX_DEPTH, NO_EN_PASSANT, TT_FLAG_ALPHA, TT_FLAG_BETA, TT_FLAG_EXACT, C64Search,
+    PositionId, move_name,
+)
+from c64_zobrist import ZobristTables
+
+
+# =============================================================================
+# Table Parameters (ai/tt.asm)
+# =============================================================================
+
+TT_SIZE = 512
+TT_ENTRY_SIZE = 8
+
+POLICIES = ['always', 'depth', 'two-tier']
+DEFAULT_SIZES = [256, 512, 1024, 2048]
+
+TRACE_VERSION = 1
+
+START_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+
+# =============================================================================
+# Traces
+# =============================================================================
+#
+# A trace is a list of searches, one per move. Each search is a list of events
+#   ('p', hash, board, white, depth, alpha, beta)   TTProbe
+#   ('s', hash, board, white, depth, flag, score)   TTStore
+# hash is ZobristHash as the engine computes it; board is a 64-bit digest of
+# Board88, castlerights and enpassantsq and white is SearchSide, which
+# together identify the position.
+
+Event = Tuple[str, int, int, bool, int, int, int]
+
+
+def engine_hash(position: PositionId, root_white: bool, tables: ZobristTables) -> int:
+    """ComputeZobristHash: the side key follows currentplayer (the root)."""
+    board, _, castlerights, enpassantsq = position
+    h = 0
+    for sq in range(128):
+        piece = board[sq]
+        if sq & OFFBOARD_MASK or piece == EMPTY_PIECE:
+            continue
+        index = (piece & TYPE_MASK) - 1 + (0 if piece & WHITE_COLOR else 6)
+        h ^= tables.pieces[index][(sq >> 4) * 8 + (sq & 7)]
+    if root_white:
+        h ^= tables.side
+    h ^= tables.castling_by_rights[castlerights & 0x0F]
+    if enpassantsq != NO_EN_PASSANT:
+        h ^= tables.en_passant[enpassantsq & 7]
+    return h
+
+
+def board_digest(position: PositionId) -> int:
+    board, _, castlerights, enpassantsq = position
+    digest = hashlib.blake2b(board + bytes((castlerights, enpassantsq)), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def record_searches(fens: Sequence[str], depth: int, self_play: int) -> Tuple[List[List[Event]], List[str]]:
+    """Search each position (iterative deepening to depth), then play
+    self_play more moves from it with the search's best move."""
+    params = load_eval_params()
+    tables = ZobristTables()
+    searches: List[List[Event]] = []
+    labels: List[str] = []
+    for fen in fens:
+        search = C64Search(params)
+        search.set_fen(fen)
+        for ply in range(self_play + 1):
+            search.trace = []
+            root_white = search.white
+            board = bytes(search.board)
+            result = search.search(depth, iterate=True)
+            events: List[Event] = []
+            hashes: Dict[PositionId, Tuple[int, int]] = {}
+            for kind, position, event_depth, a, b in search.trace:
+                if position not in hashes:
+                    hashes[position] = (engine_hash(position, root_white, tables), board_digest(position))
+                h, digest = hashes[position]
+                events.append((kind[0], h, digest, position[1], event_depth, a, b))
+            searches.append(events)
+            labels.append(f"{fen} +{ply}")
+            print(f"  {fen} +{ply}: {move_name(result.best_move, board)} score {result.score}, "
+                  f"{result.nodes} nodes, {len(events)} TT calls")
+            search.trace = None
+            if result.best_move is None:
+                break
+            search.make_move(*result.best_move)
+    return searches, labels
+
+
+def save_trace(filename: str, searches: List[List[Event]], labels: List[str], depth: int) -> None:
+    with open(filename, 'w') as f:
+        json.dump({'version': TRACE_VERSION, 'depth': depth,
+                   'searches': [{'label': label, 'events': events} for label, events in zip(labels, searches)]},
+                  f, separators=(',', ':'))
+
+
+def load_trace(filename: str) -> Tuple[List[List[Event]], List[str]]:
+    with open(filename) as f:
+        trace = json.load(f)
+    if trace.get('version') != TRACE_VERSION:
+        raise ValueError(f"{filename}: unsupported trace version {trace.get('version')}")
+    searches = [[tuple(event) for event in search['events']] for search in trace['searches']]
+    return searches, [search['label'] for search in trace['searches']]
+
+
+# =============================================================================
+# Table Models
+# =============================================================================
+
+# Table entry: (hash, depth, flag, score, board digest, white, generation)
+Entry = Tuple[int, int, int, int, int, bool, int]
+
+
+class TTModel:
+    """A table of size entries with one replacement policy.
+
+    always    TTStore as written: the new entry replaces the slot
+    depth     keep the slot if it holds a deeper entry from this search
+    two-tier  buckets of two: a depth-preferred slot, and an always-replace
+              slot that also takes what the first one evicts
+    """
+
+    def __init__(self, size: int, policy: str):
+        self.size = size
+        self.policy = policy
+        self.slots: List[Optional[Entry]] = [None] * size
+        self.generation = 0
+
+    def new_search(self, keep: bool) -> None:
+        """TTClear, unless the table is kept across moves."""
+        if not keep:
+            self.slots = [None] * self.size
+        self.generation += 1
+
+    def _indices(self, h: int) -> Tuple[int, ...]:
+        if self.policy == 'two-tier':
+            base = (h & (self.size // 2 - 1)) * 2
+            return base, base + 1
+        return (h & (self.size - 1),)
+
+    def probe(self, h: int, depth: int) -> Optional[Entry]:
+        """TTProbe: full 16-bit key match with at least the required depth."""
+        for index in self._indices(h):
+            entry = self.slots[index]
+            if entry is not None and entry[0] == h and entry[1] >= depth:
+                return entry
+        return None
+
+    def _keeps(self, old: Optional[Entry], depth: int) -> bool:
+        """Depth-preferred: the old entry stays if it is deeper and current."""
+        return old is not None and old[6] == self.generation and old[1] > depth
+
+    def store(self, entry: Entry) -> Optional[Entry]:
+        """Store an entry; returns the entry it overwrote, if any."""
+        indices = self._indices(entry[0])
+        if self.policy == 'always':
+            old, self.slots[indices[0]] = self.slots[indices[0]], entry
+            return old
+        if self.policy == 'depth':
+            old = self.slots[indices[0]]
+            if self._keeps(old, entry[1]):
+                return None
+            self.slots[indices[0]] = entry
+            return old
+        first, second = indices
+        old = self.slots[first]
+        if self._keeps(old, entry[1]):
+            old, self.slots[second] = self.slots[second], entry
+            return old
+        self.slots[first] = entry
+        if old is not None and old[0] != entry[0]:
+            old, self.slots[second] = self.slots[second], old
+            return old
+        return None
+
+
+@dataclass
+class TTStats:
+    entries: int
+    bytes: int
+    policy: str
+    keep: bool
+    probes: int = 0
+    hits: int = 0
+    useful: int = 0
+    false_hits: int = 0
+    side_false_hits: int = 0      # Same board, other side to move
+    unsound: int = 0
+    stores: int = 0
+    overwrites: int = 0           # Stores that evicted another position
+
+    def percent(self, count: int) -> float:
+        return 100.0 * count / self.probes if self.probes else 0.0
+
+
+def decides(flag: int, score: int, alpha: int, beta: int) -> bool:
+    """Whether a stored bound settles a node searched with (alpha, beta)."""
+    if flag == TT_FLAG_EXACT:
+        return True
+    if flag == TT_FLAG_BETA:
+        return score >= beta
+    return flag == TT_FLAG_ALPHA and score <= alpha
+
+
+def simulate(searches: List[List[Event]], size: int, policy: str, keep: bool) -> TTStats:
+    model = TTModel(size, policy)
+    stats = TTStats(size, size * TT_ENTRY_SIZE, policy, keep)
+    for events in searches:
+        model.new_search(keep)
+        for kind, h, board, white, depth, a, b in events:
+            if kind == 'p':
+                stats.probes += 1
+                entry = model.probe(h, depth)
+                if entry is None:
+                    continue
+                stats.hits += 1
+                if entry[4] != board or entry[5] != white:
+                    stats.false_hits += 1
+                    stats.unsound += 1
+                    if entry[4] == board:
+                        stats.side_false_hits += 1
+                    continue
+                if decides(entry[2], entry[3], a, b):
+                    stats.useful += 1
+                else:
+                    stats.unsound += 1
+            else:
+                stats.stores += 1
+                old = model.store((h, depth, a, b, board, white, model.generation))
+                if old is not None and (old[4] != board or old[5] != white):
+                    stats.overwrites += 1
+    return stats
+
+
+def print_stats(results: List[TTStats]) -> None:
+    print(f"  {'Entries':>7}  {'Bytes':>5}  {'Policy':8}  {'Keep':4}  {'Probes':>7}  {'Hit%':>5}  "
+          f"{'Useful%':>7}  {'False':>6}  {'(side)':>6}  {'Unsound':>7}  {'Overwrites':>10}")
+    for r in results:
+        marker = '*' if (r.entries, r.policy, r.keep) == (TT_SIZE, 'always', False) else ' '
+        print(f" {marker}{r.entries:7d}  {r.bytes:5d}  {r.policy:8}  {'yes' if r.keep else 'no':4}  "
+              f"{r.probes:7d}  {r.percent(r.hits):5.1f}  {r.percent(r.useful):7.1f}  {r.false_hits:6d}  "
+              f"{r.side_false_hits:6d}  {r.unsound:7d}  {r.overwrites:10d}")
+    print("  * = ai/tt.asm as it is")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay C64 search TT calls against table models")
+    parser.add_argument('fens', nargs='*', help='Positions to search (FEN, default: start position)')
+    parser.add_argument('--file', help='Read FENs from a file, one per line')
+    parser.add_argument('--depth', type=int, default=3, help='Iterative deepening depth (default 3)')
+    parser.add_argument('--self-play', type=int, default=5, metavar='N',
+                        help='Moves to play on from each position, one search each (default 5)')
+    parser.add_argument('--trace', help='Replay a saved trace instead of searching')
+    parser.add_argument('--save-trace', metavar='JSON', help='Write the recorded trace')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Table sizes in entries, powers of 2 (default %(default)s)')
+    parser.add_argument('--policies', default=','.join(POLICIES),
+                        help='Replacement policies (default %(default)s)')
+    parser.add_argument('--json', metavar='FILE', help='Write the results as JSON')
+    args = parser.parse_args()
+
+    sizes = [int(v) for v in args.sizes.split(',')]
+    if any(size < 2 or size & (size - 1) or size > 0x10000 for size in sizes):
+        parser.error("--sizes must be powers of 2 from 2 to 65536 (the index masks the 16-bit hash)")
+    policies = args.policies.split(',')
+    if any(policy not in POLICIES for policy in policies):
+        parser.error(f"--policies must be from {', '.join(POLICIES)}")
+    if not 1 <= args.depth < MAX_DEPTH:
+        parser.error(f"--depth must be 1-{MAX_DEPTH - 1}")
+
+    if args.trace:
+        print(f"Reading trace: {args.trace}")
+        searches, labels = load_trace(args.trace)
+    else:
+        fens = list(args.fens)
+        if args.file:
+            fens += read_fens(args.file)
+        print(f"Recording TT calls (depth {args.depth}, {args.self_play} self-play moves per position)...")
+        searches, labels = record_searches(fens or [START_FEN], args.depth, args.self_play)
+        if args.save_trace:
+            save_trace(args.save_trace, searches, labels, args.depth)
+            print(f"  Wrote {args.save_trace}")
+
+    probes = sum(1 for events in searches for event in events if event[0] == 'p')
+    print(f"Simulating {len(searches)} searches, {probes} probes...")
+    results = [simulate(searches, size, policy, keep)
+               for size in sizes for policy in policies for keep in (False, True)]
+    print_stats(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()